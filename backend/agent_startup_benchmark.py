@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+AFW - Agent Startup Benchmark
+=============================
+
+Mide el arranque en frío (proceso nuevo por medición) con el registro de
+agentes perezoso frente a la carga ansiosa de los 120 módulos:
+- Registro: metadata de todos los agentes disponible
+- app.main: la aplicación FastAPI completa importada
+
+Reporta la mediana del tiempo de import y de la memoria máxima (RSS).
+
+Uso: python agent_startup_benchmark.py [repeticiones]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+
+# Cada escenario corre en su propio intérprete; imprime "segundos rss_kb"
+_PROBE = """
+import asyncio, resource, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+
+async def load():
+    {body}
+
+asyncio.run(load())
+elapsed = time.perf_counter() - start
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+SCENARIOS = [
+    ("Registro perezoso (manifiesto)",
+     "from app.agents.agent_registry import AGENT_REGISTRY; assert len(AGENT_REGISTRY) == 120"),
+    ("Registro + 120 módulos (ansioso)",
+     "from app.agents.agent_registry import load_all_agents; load_all_agents()"),
+    ("app.main perezoso",
+     "import app.main"),
+    ("app.main + 120 módulos (ansioso)",
+     "import app.main; from app.agents.agent_registry import load_all_agents; load_all_agents()"),
+]
+
+
+def measure(body, repeats):
+    """Mediana de (ms, MB) sobre `repeats` procesos nuevos."""
+    root = os.path.dirname(os.path.abspath(__file__))
+    code = _PROBE.format(root=root, body=body)
+    times, memory = [], []
+    for _ in range(repeats):
+        output = subprocess.run(
+            [sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True
+        ).stdout.strip().splitlines()[-1]
+        elapsed, rss_kb = output.split()
+        times.append(float(elapsed) * 1000)
+        memory.append(int(rss_kb) / 1024)
+    return statistics.median(times), statistics.median(memory)
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    print("🚀 AFW - Agent Startup Benchmark")
+    print("=" * 72)
+    print(f"📅 Fecha: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"🔁 Repeticiones por escenario: {repeats} (proceso nuevo cada vez)")
+    print("=" * 72)
+
+    results = {}
+    for label, body in SCENARIOS:
+        ms, mb = measure(body, repeats)
+        results[label] = (ms, mb)
+        print(f"{label:.<45} {ms:9.1f} ms {mb:8.1f} MB RSS")
+
+    lazy_ms, lazy_mb = results["Registro perezoso (manifiesto)"]
+    eager_ms, eager_mb = results["Registro + 120 módulos (ansioso)"]
+    print(f"\n⚡ Registro: {eager_ms / lazy_ms:.1f}x más rápido, {eager_mb - lazy_mb:.1f} MB menos")
+    lazy_ms, lazy_mb = results["app.main perezoso"]
+    eager_ms, eager_mb = results["app.main + 120 módulos (ansioso)"]
+    print(f"⚡ app.main: {eager_ms - lazy_ms:.1f} ms y {eager_mb - lazy_mb:.1f} MB menos al arrancar")
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,18 +4,9 @@ Sistema de Categorías de Agentes Profesionales
 120 Agentes Especializados en 12 Categorías
 """
 
-from .software_development import *
-from .marketing import *
-from .finance import *
-from .legal import *
-from .human_resources import *
-from .sales import *
-from .operations import *
-from .education import *
-from .creative import *
-from .project_management import *
-from .mercadolibre import *
-from .youtube import *
+# Los 120 módulos de agentes no se importan aquí: el registro conoce su
+# metadata por el manifiesto y cada clase se carga al primer uso
+# (app.agents.agent_registry). `from app.agents import XAgent` sigue funcionando.
 
 # Categorías disponibles
 AGENT_CATEGORIES = [
@@ -48,3 +39,12 @@ CATEGORY_NAMES = {
     "mercadolibre": "Mercado Libre",
     "youtube": "YouTube"
 }
+
+
+def __getattr__(name: str):
+    from .agent_manifest import AGENT_MANIFEST
+    for entry in AGENT_MANIFEST.values():
+        if entry["class"] == name:
+            import importlib
+            return getattr(importlib.import_module(entry["module"]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
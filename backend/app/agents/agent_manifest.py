@@ -0,0 +1,1690 @@
+"""
+AFW - Agent Manifest
+Generado por app.agents.agent_registry.write_agent_manifest: no editar a mano.
+
+agent_id → módulo, clase y metadata de @register_agent. Permite conocer los
+120 agentes sin importar sus módulos (se cargan al primer uso).
+"""
+
+AGENT_MANIFEST = {
+    'backend_architect': {
+        'module': 'app.agents.software_development.backend_architect',
+        'class': 'BackendArchitectAgent',
+        'metadata': {
+            'agent_id': 'backend_architect',
+            'name': 'Backend Architect',
+            'category': 'software_development',
+            'description': 'Arquitecto de software senior especializado en diseño de sistemas backend escalables, microservicios, arquitecturas distribuidas y optimización de rendimiento',
+            'emoji': '🏗️',
+            'capabilities': ['system_design', 'microservices', 'scalability', 'distributed_systems', 'api_architecture', 'performance_optimization', 'security_architecture', 'cloud_native'],
+            'specialization': 'Arquitectura de Sistemas Backend y Cloud Native',
+            'complexity': 'expert',
+        },
+    },
+    'code_reviewer': {
+        'module': 'app.agents.software_development.code_reviewer',
+        'class': 'CodeReviewerAgent',
+        'metadata': {
+            'agent_id': 'code_reviewer',
+            'name': 'Code Reviewer',
+            'category': 'software_development',
+            'description': 'Experto senior en revisión de código, arquitectura de software, identificación de problemas y mentoring técnico',
+            'emoji': '🔍',
+            'capabilities': ['code_review', 'architecture_review', 'best_practices', 'refactoring', 'code_quality', 'security_review', 'performance_analysis', 'mentoring'],
+            'specialization': 'Revisión de Código y Arquitectura',
+            'complexity': 'advanced',
+        },
+    },
+    'database_expert': {
+        'module': 'app.agents.software_development.database_expert',
+        'class': 'DatabaseExpertAgent',
+        'metadata': {
+            'agent_id': 'database_expert',
+            'name': 'Database Expert',
+            'category': 'software_development',
+            'description': 'Experto senior en diseno, optimizacion y administracion de bases de datos SQL/NoSQL, sharding, replicas y data pipelines',
+            'emoji': '🗄️',
+            'capabilities': ['database_design', 'query_optimization', 'data_modeling', 'replication', 'sharding', 'indexing', 'data_security', 'backup_strategy', 'migration_planning', 'data_warehouse'],
+            'specialization': 'Bases de Datos, Escalabilidad y Data Engineering',
+            'complexity': 'expert',
+        },
+    },
+    'devops_engineer': {
+        'module': 'app.agents.software_development.devops_engineer',
+        'class': 'DevOpsEngineerAgent',
+        'metadata': {
+            'agent_id': 'devops_engineer',
+            'name': 'DevOps Engineer',
+            'category': 'software_development',
+            'description': 'Ingeniero DevOps senior experto en CI/CD, Kubernetes, Cloud Native, infraestructura como código, automatización y observabilidad',
+            'emoji': '🚀',
+            'capabilities': ['ci_cd', 'docker', 'kubernetes', 'terraform', 'monitoring', 'cloud_platforms', 'gitops', 'devsecops', 'sre'],
+            'specialization': 'DevOps, Cloud Native y SRE',
+            'complexity': 'expert',
+        },
+    },
+    'frontend_specialist': {
+        'module': 'app.agents.software_development.frontend_specialist',
+        'class': 'FrontendSpecialistAgent',
+        'metadata': {
+            'agent_id': 'frontend_specialist',
+            'name': 'Frontend Specialist',
+            'category': 'software_development',
+            'description': 'Especialista senior en frontend moderno, performance web, accesibilidad, UX y arquitectura de UI a gran escala',
+            'emoji': '🎨',
+            'capabilities': ['react', 'vue', 'angular', 'css_advanced', 'performance', 'accessibility', 'design_systems', 'frontend_architecture', 'state_management'],
+            'specialization': 'Frontend Avanzado, Performance y UX',
+            'complexity': 'expert',
+        },
+    },
+    'fullstack_developer': {
+        'module': 'app.agents.software_development.fullstack_developer',
+        'class': 'FullstackDeveloperAgent',
+        'metadata': {
+            'agent_id': 'fullstack_developer',
+            'name': 'Fullstack Developer',
+            'category': 'software_development',
+            'description': 'Desarrollador fullstack senior en arquitectura end-to-end, frontend moderno, backend escalable y data persistence',
+            'emoji': '💻',
+            'capabilities': ['web_development', 'api_design', 'database_integration', 'responsive_design', 'performance_optimization', 'system_design', 'testing', 'devops_basics'],
+            'specialization': 'Desarrollo Web End-to-End',
+            'complexity': 'expert',
+        },
+    },
+    'mobile_developer': {
+        'module': 'app.agents.software_development.mobile_developer',
+        'class': 'MobileDeveloperAgent',
+        'metadata': {
+            'agent_id': 'mobile_developer',
+            'name': 'Mobile Developer',
+            'category': 'software_development',
+            'description': 'Desarrollador mobile senior en iOS/Android, React Native, Flutter, arquitectura, performance y publicación',
+            'emoji': '📱',
+            'capabilities': ['react_native', 'flutter', 'swift', 'kotlin', 'mobile_ui', 'app_store', 'performance', 'offline_first', 'push_notifications', 'mobile_security'],
+            'specialization': 'Desarrollo Mobile y Performance',
+            'complexity': 'expert',
+        },
+    },
+    'qa_automation': {
+        'module': 'app.agents.software_development.qa_automation',
+        'class': 'QAAutomationAgent',
+        'metadata': {
+            'agent_id': 'qa_automation',
+            'name': 'QA Automation Engineer',
+            'category': 'software_development',
+            'description': 'Ingeniero QA senior especializado en automatizacion de pruebas, E2E, performance y estrategia de calidad',
+            'emoji': '🧪',
+            'capabilities': ['test_automation', 'e2e_testing', 'unit_testing', 'performance_testing', 'test_strategy', 'qa_metrics', 'ci_testing'],
+            'specialization': 'Testing Automatizado y Calidad',
+            'complexity': 'expert',
+        },
+    },
+    'security_specialist': {
+        'module': 'app.agents.software_development.security_specialist',
+        'class': 'SecuritySpecialistAgent',
+        'metadata': {
+            'agent_id': 'security_specialist',
+            'name': 'Security Specialist',
+            'category': 'software_development',
+            'description': 'Especialista senior en seguridad de aplicaciones, pentesting, auditoría de código, criptografía, DevSecOps y compliance',
+            'emoji': '🔐',
+            'capabilities': ['security_audit', 'penetration_testing', 'secure_coding', 'authentication', 'encryption', 'threat_modeling', 'compliance', 'incident_response'],
+            'specialization': 'AppSec, Pentesting y Compliance',
+            'complexity': 'expert',
+        },
+    },
+    'tech_lead': {
+        'module': 'app.agents.software_development.tech_lead',
+        'class': 'TechLeadAgent',
+        'metadata': {
+            'agent_id': 'tech_lead',
+            'name': 'Tech Lead',
+            'category': 'software_development',
+            'description': 'Líder técnico senior experto en gestión de equipos de alto rendimiento, arquitectura de sistemas, mentoring técnico y transformación digital',
+            'emoji': '👨\u200d💼',
+            'capabilities': ['technical_leadership', 'team_management', 'architecture_decisions', 'mentoring', 'strategic_planning', 'talent_development', 'technical_debt_management', 'innovation'],
+            'specialization': 'Liderazgo Técnico y Transformación Digital',
+            'complexity': 'expert',
+        },
+    },
+    'analytics_expert': {
+        'module': 'app.agents.marketing.analytics_expert',
+        'class': 'AnalyticsExpertAgent',
+        'metadata': {
+            'agent_id': 'analytics_expert',
+            'name': 'Analytics Expert',
+            'category': 'marketing',
+            'description': 'Experto senior en analítica digital, GA4, attribution y data-driven marketing',
+            'emoji': '📊',
+            'capabilities': ['google_analytics', 'data_analysis', 'attribution', 'reporting', 'conversion_optimization'],
+            'specialization': 'Analítica Digital',
+            'complexity': 'expert',
+        },
+    },
+    'brand_strategist': {
+        'module': 'app.agents.marketing.brand_strategist',
+        'class': 'BrandStrategistAgent',
+        'metadata': {
+            'agent_id': 'brand_strategist',
+            'name': 'Brand Strategist',
+            'category': 'marketing',
+            'description': 'Estratega senior de marca experto en posicionamiento, identidad y arquitectura de marca',
+            'emoji': '🎯',
+            'capabilities': ['brand_strategy', 'positioning', 'brand_identity', 'brand_architecture', 'rebranding'],
+            'specialization': 'Estrategia de Marca',
+            'complexity': 'expert',
+        },
+    },
+    'content_strategist': {
+        'module': 'app.agents.marketing.content_strategist',
+        'class': 'ContentStrategistAgent',
+        'metadata': {
+            'agent_id': 'content_strategist',
+            'name': 'Content Strategist',
+            'category': 'marketing',
+            'description': 'Estratega de contenido senior experto en content marketing, storytelling y estrategias editoriales',
+            'emoji': '📝',
+            'capabilities': ['content_strategy', 'editorial_planning', 'storytelling', 'content_audit', 'brand_voice'],
+            'specialization': 'Estrategia de Contenido',
+            'complexity': 'expert',
+        },
+    },
+    'copywriter': {
+        'module': 'app.agents.marketing.copywriter',
+        'class': 'CopywriterAgent',
+        'metadata': {
+            'agent_id': 'copywriter',
+            'name': 'Copywriter',
+            'category': 'marketing',
+            'description': 'Copywriter senior experto en textos persuasivos, conversión y storytelling de marca',
+            'emoji': '✍️',
+            'capabilities': ['copywriting', 'persuasion', 'brand_voice', 'conversion_copy', 'storytelling'],
+            'specialization': 'Copywriting y Persuasión',
+            'complexity': 'expert',
+        },
+    },
+    'email_marketer': {
+        'module': 'app.agents.marketing.email_marketer',
+        'class': 'EmailMarketerAgent',
+        'metadata': {
+            'agent_id': 'email_marketer',
+            'name': 'Email Marketer',
+            'category': 'marketing',
+            'description': 'Especialista senior en email marketing, automatización y nurturing de leads',
+            'emoji': '📧',
+            'capabilities': ['email_marketing', 'automation', 'segmentation', 'deliverability', 'analytics'],
+            'specialization': 'Email Marketing y Automatización',
+            'complexity': 'expert',
+        },
+    },
+    'growth_hacker': {
+        'module': 'app.agents.marketing.growth_hacker',
+        'class': 'GrowthHackerAgent',
+        'metadata': {
+            'agent_id': 'growth_hacker',
+            'name': 'Growth Hacker',
+            'category': 'marketing',
+            'description': 'Growth hacker senior experto en experimentación, viral loops y crecimiento acelerado',
+            'emoji': '🚀',
+            'capabilities': ['growth_strategy', 'experimentation', 'viral_loops', 'product_led_growth', 'acquisition'],
+            'specialization': 'Growth Hacking',
+            'complexity': 'expert',
+        },
+    },
+    'influencer_coordinator': {
+        'module': 'app.agents.marketing.influencer_coordinator',
+        'class': 'InfluencerCoordinatorAgent',
+        'metadata': {
+            'agent_id': 'influencer_coordinator',
+            'name': 'Influencer Coordinator',
+            'category': 'marketing',
+            'description': 'Coordinador senior de influencer marketing, partnerships y campañas con creadores',
+            'emoji': '🤝',
+            'capabilities': ['influencer_marketing', 'partnership_management', 'campaign_coordination', 'creator_relations'],
+            'specialization': 'Influencer Marketing',
+            'complexity': 'expert',
+        },
+    },
+    'ppc_specialist': {
+        'module': 'app.agents.marketing.ppc_specialist',
+        'class': 'PPCSpecialistAgent',
+        'metadata': {
+            'agent_id': 'ppc_specialist',
+            'name': 'PPC Specialist',
+            'category': 'marketing',
+            'description': 'Especialista senior en PPC, Google Ads, Meta Ads y optimización de campañas paid',
+            'emoji': '💰',
+            'capabilities': ['google_ads', 'meta_ads', 'campaign_optimization', 'bid_management', 'conversion_tracking'],
+            'specialization': 'PPC y Paid Media',
+            'complexity': 'expert',
+        },
+    },
+    'seo_specialist': {
+        'module': 'app.agents.marketing.seo_specialist',
+        'class': 'SEOSpecialistAgent',
+        'metadata': {
+            'agent_id': 'seo_specialist',
+            'name': 'SEO Specialist',
+            'category': 'marketing',
+            'description': 'Especialista senior en SEO técnico, contenido optimizado, link building y estrategias de posicionamiento orgánico',
+            'emoji': '🔎',
+            'capabilities': ['seo_technical', 'keyword_research', 'content_optimization', 'link_building', 'analytics', 'local_seo', 'ecommerce_seo'],
+            'specialization': 'SEO y Posicionamiento Web',
+            'complexity': 'expert',
+        },
+    },
+    'social_media_manager': {
+        'module': 'app.agents.marketing.social_media_manager',
+        'class': 'SocialMediaManagerAgent',
+        'metadata': {
+            'agent_id': 'social_media_manager',
+            'name': 'Social Media Manager',
+            'category': 'marketing',
+            'description': 'Gestor senior de redes sociales experto en estrategia, contenido y community management',
+            'emoji': '📱',
+            'capabilities': ['social_strategy', 'community_management', 'content_creation', 'paid_social', 'analytics'],
+            'specialization': 'Gestión de Redes Sociales',
+            'complexity': 'expert',
+        },
+    },
+    'accountant': {
+        'module': 'app.agents.finance.accountant',
+        'class': 'AccountantAgent',
+        'metadata': {
+            'agent_id': 'accountant',
+            'name': 'Accountant',
+            'category': 'finance',
+            'description': 'Contador público senior CPA experto en contabilidad, GAAP/IFRS, reportes y cumplimiento',
+            'emoji': '📒',
+            'capabilities': ['accounting', 'gaap', 'ifrs', 'financial_reporting', 'reconciliation', 'compliance'],
+            'specialization': 'Contabilidad y Reportes Financieros',
+            'complexity': 'expert',
+        },
+    },
+    'auditor': {
+        'module': 'app.agents.finance.auditor',
+        'class': 'AuditorAgent',
+        'metadata': {
+            'agent_id': 'auditor',
+            'name': 'Auditor',
+            'category': 'finance',
+            'description': 'Auditor senior CPA experto en auditoría financiera, controles internos y SOX compliance',
+            'emoji': '🔍',
+            'capabilities': ['financial_audit', 'internal_controls', 'sox_compliance', 'risk_assessment', 'fraud_detection'],
+            'specialization': 'Auditoría y Control Interno',
+            'complexity': 'expert',
+        },
+    },
+    'budget_planner': {
+        'module': 'app.agents.finance.budget_planner',
+        'class': 'BudgetPlannerAgent',
+        'metadata': {
+            'agent_id': 'budget_planner',
+            'name': 'Budget Planner',
+            'category': 'finance',
+            'description': 'Planificador presupuestario senior experto en FP&A, forecasting y planificación financiera corporativa',
+            'emoji': '📉',
+            'capabilities': ['budgeting', 'forecasting', 'variance_analysis', 'fpa', 'financial_planning'],
+            'specialization': 'FP&A y Presupuestos',
+            'complexity': 'expert',
+        },
+    },
+    'financial_analyst': {
+        'module': 'app.agents.finance.financial_analyst',
+        'class': 'FinancialAnalystAgent',
+        'metadata': {
+            'agent_id': 'financial_analyst',
+            'name': 'Financial Analyst',
+            'category': 'finance',
+            'description': 'Analista financiero senior CFA experto en modelado, valuación, DCF y análisis de inversiones',
+            'emoji': '📈',
+            'capabilities': ['financial_modeling', 'valuation', 'forecasting', 'investment_analysis', 'reporting', 'dcf', 'lbo'],
+            'specialization': 'Análisis Financiero y Valuación',
+            'complexity': 'expert',
+        },
+    },
+    'financial_controller': {
+        'module': 'app.agents.finance.financial_controller',
+        'class': 'FinancialControllerAgent',
+        'metadata': {
+            'agent_id': 'financial_controller',
+            'name': 'Financial Controller',
+            'category': 'finance',
+            'description': 'Controller financiero senior experto en reporting, controles internos, cierre y consolidación',
+            'emoji': '📊',
+            'capabilities': ['financial_reporting', 'close_process', 'consolidation', 'internal_controls', 'compliance'],
+            'specialization': 'Controlling y Reporting',
+            'complexity': 'expert',
+        },
+    },
+    'investment_advisor': {
+        'module': 'app.agents.finance.investment_advisor',
+        'class': 'InvestmentAdvisorAgent',
+        'metadata': {
+            'agent_id': 'investment_advisor',
+            'name': 'Investment Advisor',
+            'category': 'finance',
+            'description': 'Asesor de inversiones senior CFP experto en gestión de portafolios, asset allocation y wealth management',
+            'emoji': '💹',
+            'capabilities': ['portfolio_management', 'asset_allocation', 'risk_management', 'wealth_planning', 'investment_strategy'],
+            'specialization': 'Gestión de Inversiones',
+            'complexity': 'expert',
+        },
+    },
+    'payroll_specialist': {
+        'module': 'app.agents.finance.payroll_specialist',
+        'class': 'PayrollSpecialistAgent',
+        'metadata': {
+            'agent_id': 'payroll_specialist',
+            'name': 'Payroll Specialist',
+            'category': 'finance',
+            'description': 'Especialista senior en nómina, compensaciones, cumplimiento laboral y sistemas de payroll',
+            'emoji': '💵',
+            'capabilities': ['payroll_processing', 'tax_withholding', 'benefits_admin', 'compliance', 'payroll_systems'],
+            'specialization': 'Nómina y Compensaciones',
+            'complexity': 'expert',
+        },
+    },
+    'risk_analyst': {
+        'module': 'app.agents.finance.risk_analyst',
+        'class': 'RiskAnalystAgent',
+        'metadata': {
+            'agent_id': 'risk_analyst',
+            'name': 'Risk Analyst',
+            'category': 'finance',
+            'description': 'Analista de riesgo senior FRM experto en gestión de riesgos financieros, ERM y modelado',
+            'emoji': '⚠️',
+            'capabilities': ['risk_assessment', 'erm', 'market_risk', 'credit_risk', 'operational_risk'],
+            'specialization': 'Gestión de Riesgos',
+            'complexity': 'expert',
+        },
+    },
+    'tax_specialist': {
+        'module': 'app.agents.finance.tax_specialist',
+        'class': 'TaxSpecialistAgent',
+        'metadata': {
+            'agent_id': 'tax_specialist',
+            'name': 'Tax Specialist',
+            'category': 'finance',
+            'description': 'Especialista fiscal senior experto en impuestos corporativos, planeación tributaria y compliance',
+            'emoji': '📋',
+            'capabilities': ['tax_planning', 'corporate_tax', 'tax_compliance', 'transfer_pricing', 'international_tax'],
+            'specialization': 'Impuestos y Planeación Fiscal',
+            'complexity': 'expert',
+        },
+    },
+    'treasury_manager': {
+        'module': 'app.agents.finance.treasury_manager',
+        'class': 'TreasuryManagerAgent',
+        'metadata': {
+            'agent_id': 'treasury_manager',
+            'name': 'Treasury Manager',
+            'category': 'finance',
+            'description': 'Tesorero senior CTP experto en gestión de liquidez, cash management, FX y riesgo financiero',
+            'emoji': '🏦',
+            'capabilities': ['cash_management', 'liquidity', 'fx_management', 'bank_relations', 'debt_management'],
+            'specialization': 'Tesorería y Cash Management',
+            'complexity': 'expert',
+        },
+    },
+    'compliance_officer': {
+        'module': 'app.agents.legal.compliance_officer',
+        'class': 'ComplianceOfficerAgent',
+        'metadata': {
+            'agent_id': 'compliance_officer',
+            'name': 'Compliance Officer',
+            'category': 'legal',
+            'description': 'Oficial de cumplimiento senior experto en compliance regulatorio, anticorrupción y ética empresarial',
+            'emoji': '🛡️',
+            'capabilities': ['regulatory_compliance', 'anti_corruption', 'aml', 'ethics', 'risk_assessment'],
+            'specialization': 'Compliance y Ética',
+            'complexity': 'expert',
+        },
+    },
+    'contract_specialist': {
+        'module': 'app.agents.legal.contract_specialist',
+        'class': 'ContractSpecialistAgent',
+        'metadata': {
+            'agent_id': 'contract_specialist',
+            'name': 'Contract Specialist',
+            'category': 'legal',
+            'description': 'Especialista senior en redacción, revisión y negociación de contratos comerciales',
+            'emoji': '📝',
+            'capabilities': ['contract_drafting', 'contract_review', 'negotiation', 'risk_allocation', 'templates'],
+            'specialization': 'Contratos Comerciales',
+            'complexity': 'expert',
+        },
+    },
+    'corporate_lawyer': {
+        'module': 'app.agents.legal.corporate_lawyer',
+        'class': 'CorporateLawyerAgent',
+        'metadata': {
+            'agent_id': 'corporate_lawyer',
+            'name': 'Corporate Lawyer',
+            'category': 'legal',
+            'description': 'Abogado corporativo senior experto en derecho mercantil, M&A, governance y estructuras societarias',
+            'emoji': '⚖️',
+            'capabilities': ['corporate_law', 'ma', 'governance', 'company_formation', 'shareholders'],
+            'specialization': 'Derecho Corporativo y M&A',
+            'complexity': 'expert',
+        },
+    },
+    'data_privacy_officer': {
+        'module': 'app.agents.legal.data_privacy_officer',
+        'class': 'DataPrivacyOfficerAgent',
+        'metadata': {
+            'agent_id': 'data_privacy_officer',
+            'name': 'Data Privacy Officer',
+            'category': 'legal',
+            'description': 'DPO senior experto en protección de datos, GDPR, LFPDPPP y compliance de privacidad',
+            'emoji': '🔒',
+            'capabilities': ['data_privacy', 'gdpr', 'lfpdppp', 'privacy_program', 'data_breach'],
+            'specialization': 'Protección de Datos',
+            'complexity': 'expert',
+        },
+    },
+    'intellectual_property': {
+        'module': 'app.agents.legal.intellectual_property',
+        'class': 'IntellectualPropertyAgent',
+        'metadata': {
+            'agent_id': 'intellectual_property',
+            'name': 'IP Specialist',
+            'category': 'legal',
+            'description': 'Especialista senior en propiedad intelectual: marcas, patentes, derechos de autor y trade secrets',
+            'emoji': '💡',
+            'capabilities': ['trademarks', 'patents', 'copyright', 'trade_secrets', 'ip_licensing'],
+            'specialization': 'Propiedad Intelectual',
+            'complexity': 'expert',
+        },
+    },
+    'labor_law_expert': {
+        'module': 'app.agents.legal.labor_law_expert',
+        'class': 'LaborLawExpertAgent',
+        'metadata': {
+            'agent_id': 'labor_law_expert',
+            'name': 'Labor Law Expert',
+            'category': 'legal',
+            'description': 'Experto senior en derecho laboral, relaciones de trabajo, litigio laboral y seguridad social',
+            'emoji': '👷',
+            'capabilities': ['labor_law', 'employment_contracts', 'terminations', 'labor_litigation', 'social_security'],
+            'specialization': 'Derecho Laboral',
+            'complexity': 'expert',
+        },
+    },
+    'legal_researcher': {
+        'module': 'app.agents.legal.legal_researcher',
+        'class': 'LegalResearcherAgent',
+        'metadata': {
+            'agent_id': 'legal_researcher',
+            'name': 'Legal Researcher',
+            'category': 'legal',
+            'description': 'Investigador jurídico senior experto en análisis legal, jurisprudencia y opiniones legales',
+            'emoji': '📚',
+            'capabilities': ['legal_research', 'case_law', 'statutory_analysis', 'legal_opinions', 'comparative_law'],
+            'specialization': 'Investigación Jurídica',
+            'complexity': 'expert',
+        },
+    },
+    'litigation_specialist': {
+        'module': 'app.agents.legal.litigation_specialist',
+        'class': 'LitigationSpecialistAgent',
+        'metadata': {
+            'agent_id': 'litigation_specialist',
+            'name': 'Litigation Specialist',
+            'category': 'legal',
+            'description': 'Litigante senior experto en controversias comerciales, arbitraje y resolución de disputas',
+            'emoji': '⚔️',
+            'capabilities': ['commercial_litigation', 'arbitration', 'mediation', 'dispute_resolution', 'appeals'],
+            'specialization': 'Litigio y Arbitraje',
+            'complexity': 'expert',
+        },
+    },
+    'paralegal_assistant': {
+        'module': 'app.agents.legal.paralegal_assistant',
+        'class': 'ParalegalAssistantAgent',
+        'metadata': {
+            'agent_id': 'paralegal_assistant',
+            'name': 'Paralegal Assistant',
+            'category': 'legal',
+            'description': 'Asistente legal senior experto en gestión de casos, documentación y procesos legales',
+            'emoji': '📂',
+            'capabilities': ['case_management', 'document_preparation', 'legal_admin', 'filing', 'discovery'],
+            'specialization': 'Asistencia Legal',
+            'complexity': 'advanced',
+        },
+    },
+    'regulatory_advisor': {
+        'module': 'app.agents.legal.regulatory_advisor',
+        'class': 'RegulatoryAdvisorAgent',
+        'metadata': {
+            'agent_id': 'regulatory_advisor',
+            'name': 'Regulatory Advisor',
+            'category': 'legal',
+            'description': 'Asesor regulatorio senior experto en sectores regulados, permisos, licencias y relación con autoridades',
+            'emoji': '🏛️',
+            'capabilities': ['regulatory_affairs', 'licensing', 'permits', 'government_relations', 'sector_regulations'],
+            'specialization': 'Asuntos Regulatorios',
+            'complexity': 'expert',
+        },
+    },
+    'benefits_administrator': {
+        'module': 'app.agents.human_resources.benefits_administrator',
+        'class': 'BenefitsAdministratorAgent',
+        'metadata': {
+            'agent_id': 'benefits_administrator',
+            'name': 'Benefits Administrator',
+            'category': 'human_resources',
+            'description': 'Administrador de beneficios senior experto en programas de beneficios, seguros y bienestar',
+            'emoji': '🏥',
+            'capabilities': ['benefits_admin', 'insurance', 'wellness', 'retirement', 'vendor_management'],
+            'specialization': 'Administración de Beneficios',
+            'complexity': 'advanced',
+        },
+    },
+    'compensation_analyst': {
+        'module': 'app.agents.human_resources.compensation_analyst',
+        'class': 'CompensationAnalystAgent',
+        'metadata': {
+            'agent_id': 'compensation_analyst',
+            'name': 'Compensation Analyst',
+            'category': 'human_resources',
+            'description': 'Analista de compensaciones senior experto en estructuras salariales, benchmarking y total rewards',
+            'emoji': '💵',
+            'capabilities': ['compensation_analysis', 'salary_structures', 'benchmarking', 'incentives', 'equity'],
+            'specialization': 'Compensaciones y Beneficios',
+            'complexity': 'expert',
+        },
+    },
+    'culture_champion': {
+        'module': 'app.agents.human_resources.culture_champion',
+        'class': 'CultureChampionAgent',
+        'metadata': {
+            'agent_id': 'culture_champion',
+            'name': 'Culture Champion',
+            'category': 'human_resources',
+            'description': 'Campeón de cultura senior experto en cultura organizacional, valores y engagement',
+            'emoji': '🌟',
+            'capabilities': ['culture_development', 'engagement', 'dei', 'recognition', 'change_management'],
+            'specialization': 'Cultura Organizacional',
+            'complexity': 'expert',
+        },
+    },
+    'employee_relations': {
+        'module': 'app.agents.human_resources.employee_relations',
+        'class': 'EmployeeRelationsAgent',
+        'metadata': {
+            'agent_id': 'employee_relations',
+            'name': 'Employee Relations',
+            'category': 'human_resources',
+            'description': 'Especialista senior en relaciones laborales, clima organizacional e investigaciones',
+            'emoji': '🤝',
+            'capabilities': ['employee_relations', 'investigations', 'conflict_resolution', 'engagement', 'policies'],
+            'specialization': 'Relaciones Laborales',
+            'complexity': 'expert',
+        },
+    },
+    'hr_analytics': {
+        'module': 'app.agents.human_resources.hr_analytics',
+        'class': 'HRAnalyticsAgent',
+        'metadata': {
+            'agent_id': 'hr_analytics',
+            'name': 'HR Analytics',
+            'category': 'human_resources',
+            'description': 'Analista de HR senior experto en people analytics, workforce planning y HR metrics',
+            'emoji': '📈',
+            'capabilities': ['people_analytics', 'workforce_planning', 'hr_metrics', 'predictive_analytics', 'dashboards'],
+            'specialization': 'People Analytics',
+            'complexity': 'expert',
+        },
+    },
+    'onboarding_specialist': {
+        'module': 'app.agents.human_resources.onboarding_specialist',
+        'class': 'OnboardingSpecialistAgent',
+        'metadata': {
+            'agent_id': 'onboarding_specialist',
+            'name': 'Onboarding Specialist',
+            'category': 'human_resources',
+            'description': 'Especialista senior en onboarding, experiencia del empleado y programas de integración',
+            'emoji': '🚀',
+            'capabilities': ['onboarding', 'employee_experience', 'orientation', 'preboarding', 'retention'],
+            'specialization': 'Onboarding y Experiencia',
+            'complexity': 'advanced',
+        },
+    },
+    'performance_manager': {
+        'module': 'app.agents.human_resources.performance_manager',
+        'class': 'PerformanceManagerAgent',
+        'metadata': {
+            'agent_id': 'performance_manager',
+            'name': 'Performance Manager',
+            'category': 'human_resources',
+            'description': 'Gestor de desempeño senior experto en evaluación, OKRs, feedback y planes de mejora',
+            'emoji': '📊',
+            'capabilities': ['performance_reviews', 'okrs', 'feedback', 'pip', 'goal_setting'],
+            'specialization': 'Gestión del Desempeño',
+            'complexity': 'expert',
+        },
+    },
+    'recruiter': {
+        'module': 'app.agents.human_resources.recruiter',
+        'class': 'RecruiterAgent',
+        'metadata': {
+            'agent_id': 'recruiter',
+            'name': 'Recruiter',
+            'category': 'human_resources',
+            'description': 'Reclutador senior experto en adquisición de talento, sourcing y employer branding',
+            'emoji': '🎯',
+            'capabilities': ['talent_acquisition', 'sourcing', 'interviewing', 'employer_branding', 'ats'],
+            'specialization': 'Reclutamiento y Selección',
+            'complexity': 'expert',
+        },
+    },
+    'talent_development': {
+        'module': 'app.agents.human_resources.talent_development',
+        'class': 'TalentDevelopmentAgent',
+        'metadata': {
+            'agent_id': 'talent_development',
+            'name': 'Talent Development',
+            'category': 'human_resources',
+            'description': 'Especialista senior en desarrollo de talento, planes de carrera y sucesión',
+            'emoji': '🌱',
+            'capabilities': ['talent_development', 'career_planning', 'succession', 'leadership_development', 'competencies'],
+            'specialization': 'Desarrollo de Talento',
+            'complexity': 'expert',
+        },
+    },
+    'training_coordinator': {
+        'module': 'app.agents.human_resources.training_coordinator',
+        'class': 'TrainingCoordinatorAgent',
+        'metadata': {
+            'agent_id': 'training_coordinator',
+            'name': 'Training Coordinator',
+            'category': 'human_resources',
+            'description': 'Coordinador de capacitación senior experto en programas de formación, LMS y desarrollo de habilidades',
+            'emoji': '📚',
+            'capabilities': ['training_programs', 'lms', 'needs_analysis', 'facilitation', 'evaluation'],
+            'specialization': 'Capacitación y Formación',
+            'complexity': 'advanced',
+        },
+    },
+    'account_manager': {
+        'module': 'app.agents.sales.account_manager',
+        'class': 'AccountManagerAgent',
+        'metadata': {
+            'agent_id': 'account_manager',
+            'name': 'Account Manager',
+            'category': 'sales',
+            'description': 'Account Manager senior experto en gestión de cuentas clave, retention y expansion',
+            'emoji': '🤝',
+            'capabilities': ['account_management', 'retention', 'upsell', 'customer_success', 'qbrs'],
+            'specialization': 'Gestión de Cuentas',
+            'complexity': 'expert',
+        },
+    },
+    'business_development': {
+        'module': 'app.agents.sales.business_development',
+        'class': 'BusinessDevelopmentAgent',
+        'metadata': {
+            'agent_id': 'business_development',
+            'name': 'Business Development',
+            'category': 'sales',
+            'description': 'BDR/SDR senior experto en prospección outbound, cold calling y generación de pipeline',
+            'emoji': '📞',
+            'capabilities': ['prospecting', 'cold_calling', 'cold_email', 'lead_qualification', 'pipeline_generation'],
+            'specialization': 'Desarrollo de Negocio',
+            'complexity': 'advanced',
+        },
+    },
+    'channel_manager': {
+        'module': 'app.agents.sales.channel_manager',
+        'class': 'ChannelManagerAgent',
+        'metadata': {
+            'agent_id': 'channel_manager',
+            'name': 'Channel Manager',
+            'category': 'sales',
+            'description': 'Gestor de canales senior experto en partners, alianzas y ventas indirectas',
+            'emoji': '🤝',
+            'capabilities': ['channel_sales', 'partner_management', 'alliances', 'reseller_programs', 'co_selling'],
+            'specialization': 'Ventas de Canal',
+            'complexity': 'expert',
+        },
+    },
+    'crm_specialist': {
+        'module': 'app.agents.sales.crm_specialist',
+        'class': 'CRMSpecialistAgent',
+        'metadata': {
+            'agent_id': 'crm_specialist',
+            'name': 'CRM Specialist',
+            'category': 'sales',
+            'description': 'Especialista CRM senior experto en Salesforce, HubSpot, automatización y data quality',
+            'emoji': '💾',
+            'capabilities': ['crm_management', 'salesforce', 'hubspot', 'automation', 'data_quality'],
+            'specialization': 'CRM y Automatización',
+            'complexity': 'advanced',
+        },
+    },
+    'customer_success': {
+        'module': 'app.agents.sales.customer_success',
+        'class': 'CustomerSuccessAgent',
+        'metadata': {
+            'agent_id': 'customer_success',
+            'name': 'Customer Success',
+            'category': 'sales',
+            'description': 'CSM senior experto en adopción de producto, value realization y customer outcomes',
+            'emoji': '🌟',
+            'capabilities': ['customer_success', 'adoption', 'value_realization', 'onboarding', 'churn_prevention'],
+            'specialization': 'Customer Success',
+            'complexity': 'expert',
+        },
+    },
+    'proposal_writer': {
+        'module': 'app.agents.sales.proposal_writer',
+        'class': 'ProposalWriterAgent',
+        'metadata': {
+            'agent_id': 'proposal_writer',
+            'name': 'Proposal Writer',
+            'category': 'sales',
+            'description': 'Redactor de propuestas senior experto en propuestas comerciales, RFPs y presentaciones de ventas',
+            'emoji': '📄',
+            'capabilities': ['proposal_writing', 'rfp_response', 'sales_presentations', 'executive_summaries', 'pricing'],
+            'specialization': 'Propuestas Comerciales',
+            'complexity': 'advanced',
+        },
+    },
+    'sales_analyst': {
+        'module': 'app.agents.sales.sales_analyst',
+        'class': 'SalesAnalystAgent',
+        'metadata': {
+            'agent_id': 'sales_analyst',
+            'name': 'Sales Analyst',
+            'category': 'sales',
+            'description': 'Analista de ventas senior experto en sales analytics, forecasting y revenue operations',
+            'emoji': '📊',
+            'capabilities': ['sales_analytics', 'forecasting', 'pipeline_analysis', 'quota_planning', 'rev_ops'],
+            'specialization': 'Sales Analytics',
+            'complexity': 'expert',
+        },
+    },
+    'sales_engineer': {
+        'module': 'app.agents.sales.sales_engineer',
+        'class': 'SalesEngineerAgent',
+        'metadata': {
+            'agent_id': 'sales_engineer',
+            'name': 'Sales Engineer',
+            'category': 'sales',
+            'description': 'Sales Engineer senior experto en demos técnicas, POCs y arquitectura de soluciones',
+            'emoji': '🔧',
+            'capabilities': ['technical_demos', 'poc', 'solution_architecture', 'rfp_response', 'technical_sales'],
+            'specialization': 'Ingeniería de Ventas',
+            'complexity': 'expert',
+        },
+    },
+    'sales_executive': {
+        'module': 'app.agents.sales.sales_executive',
+        'class': 'SalesExecutiveAgent',
+        'metadata': {
+            'agent_id': 'sales_executive',
+            'name': 'Sales Executive',
+            'category': 'sales',
+            'description': 'Ejecutivo de ventas senior experto en ventas B2B, enterprise sales y negociación de alto valor',
+            'emoji': '💼',
+            'capabilities': ['b2b_sales', 'enterprise_sales', 'negotiation', 'prospecting', 'closing'],
+            'specialization': 'Ventas B2B Enterprise',
+            'complexity': 'expert',
+        },
+    },
+    'sales_trainer': {
+        'module': 'app.agents.sales.sales_trainer',
+        'class': 'SalesTrainerAgent',
+        'metadata': {
+            'agent_id': 'sales_trainer',
+            'name': 'Sales Trainer',
+            'category': 'sales',
+            'description': 'Formador de ventas senior experto en sales enablement, coaching y desarrollo de equipos',
+            'emoji': '🎓',
+            'capabilities': ['sales_training', 'enablement', 'coaching', 'onboarding', 'methodology'],
+            'specialization': 'Sales Enablement',
+            'complexity': 'expert',
+        },
+    },
+    'distribution_planner': {
+        'module': 'app.agents.operations.distribution_planner',
+        'class': 'DistributionPlannerAgent',
+        'metadata': {
+            'agent_id': 'distribution_planner',
+            'name': 'Distribution Planner',
+            'category': 'operations',
+            'description': 'Planificador de distribución senior experto en network design, fulfillment y planificación',
+            'emoji': '🗺️',
+            'capabilities': ['distribution_planning', 'network_design', 'fulfillment', 'allocation', 'optimization'],
+            'specialization': 'Planificación de Distribución',
+            'complexity': 'expert',
+        },
+    },
+    'inventory_specialist': {
+        'module': 'app.agents.operations.inventory_specialist',
+        'class': 'InventorySpecialistAgent',
+        'metadata': {
+            'agent_id': 'inventory_specialist',
+            'name': 'Inventory Specialist',
+            'category': 'operations',
+            'description': 'Especialista en inventarios senior experto en gestión de stock, WMS y control de inventarios',
+            'emoji': '📦',
+            'capabilities': ['inventory_management', 'wms', 'cycle_counting', 'stock_control', 'replenishment'],
+            'specialization': 'Gestión de Inventarios',
+            'complexity': 'advanced',
+        },
+    },
+    'lean_specialist': {
+        'module': 'app.agents.operations.lean_specialist',
+        'class': 'LeanSpecialistAgent',
+        'metadata': {
+            'agent_id': 'lean_specialist',
+            'name': 'Lean Specialist',
+            'category': 'operations',
+            'description': 'Especialista Lean senior experto en manufactura esbelta, TPS y transformación lean',
+            'emoji': '🎯',
+            'capabilities': ['lean_manufacturing', 'tps', 'kaizen', 'value_stream', 'continuous_flow'],
+            'specialization': 'Lean Manufacturing',
+            'complexity': 'expert',
+        },
+    },
+    'logistics_coordinator': {
+        'module': 'app.agents.operations.logistics_coordinator',
+        'class': 'LogisticsCoordinatorAgent',
+        'metadata': {
+            'agent_id': 'logistics_coordinator',
+            'name': 'Logistics Coordinator',
+            'category': 'operations',
+            'description': 'Coordinador de logística senior experto en transporte, distribución y última milla',
+            'emoji': '🚚',
+            'capabilities': ['logistics', 'transportation', 'distribution', 'last_mile', 'carrier_management'],
+            'specialization': 'Logística y Transporte',
+            'complexity': 'expert',
+        },
+    },
+    'operations_manager': {
+        'module': 'app.agents.operations.operations_manager',
+        'class': 'OperationsManagerAgent',
+        'metadata': {
+            'agent_id': 'operations_manager',
+            'name': 'Operations Manager',
+            'category': 'operations',
+            'description': 'Gerente de operaciones senior experto en gestión operativa, eficiencia y mejora continua',
+            'emoji': '⚙️',
+            'capabilities': ['operations_management', 'process_improvement', 'kpi_management', 'resource_planning', 'efficiency'],
+            'specialization': 'Gestión de Operaciones',
+            'complexity': 'expert',
+        },
+    },
+    'process_optimizer': {
+        'module': 'app.agents.operations.process_optimizer',
+        'class': 'ProcessOptimizerAgent',
+        'metadata': {
+            'agent_id': 'process_optimizer',
+            'name': 'Process Optimizer',
+            'category': 'operations',
+            'description': 'Optimizador de procesos senior experto en Lean Six Sigma, BPM y transformación operativa',
+            'emoji': '📈',
+            'capabilities': ['process_optimization', 'lean', 'six_sigma', 'bpm', 'automation'],
+            'specialization': 'Optimización de Procesos',
+            'complexity': 'expert',
+        },
+    },
+    'procurement_specialist': {
+        'module': 'app.agents.operations.procurement_specialist',
+        'class': 'ProcurementSpecialistAgent',
+        'metadata': {
+            'agent_id': 'procurement_specialist',
+            'name': 'Procurement Specialist',
+            'category': 'operations',
+            'description': 'Especialista en compras senior experto en strategic sourcing, negociación y supplier management',
+            'emoji': '🛒',
+            'capabilities': ['procurement', 'sourcing', 'negotiation', 'supplier_management', 'contracts'],
+            'specialization': 'Compras y Sourcing',
+            'complexity': 'expert',
+        },
+    },
+    'quality_assurance': {
+        'module': 'app.agents.operations.quality_assurance',
+        'class': 'QualityAssuranceAgent',
+        'metadata': {
+            'agent_id': 'quality_assurance',
+            'name': 'Quality Assurance',
+            'category': 'operations',
+            'description': 'Especialista en calidad senior experto en QA, QC, ISO y mejora de calidad',
+            'emoji': '✅',
+            'capabilities': ['quality_assurance', 'quality_control', 'iso', 'audits', 'continuous_improvement'],
+            'specialization': 'Aseguramiento de Calidad',
+            'complexity': 'expert',
+        },
+    },
+    'supply_chain_analyst': {
+        'module': 'app.agents.operations.supply_chain_analyst',
+        'class': 'SupplyChainAnalystAgent',
+        'metadata': {
+            'agent_id': 'supply_chain_analyst',
+            'name': 'Supply Chain Analyst',
+            'category': 'operations',
+            'description': 'Analista de supply chain senior experto en S&OP, demand planning y analytics',
+            'emoji': '🔗',
+            'capabilities': ['supply_chain', 'demand_planning', 'sop', 'analytics', 'forecasting'],
+            'specialization': 'Supply Chain Analytics',
+            'complexity': 'expert',
+        },
+    },
+    'warehouse_manager': {
+        'module': 'app.agents.operations.warehouse_manager',
+        'class': 'WarehouseManagerAgent',
+        'metadata': {
+            'agent_id': 'warehouse_manager',
+            'name': 'Warehouse Manager',
+            'category': 'operations',
+            'description': 'Gerente de almacén senior experto en operaciones de warehouse, fulfillment y productividad',
+            'emoji': '🏭',
+            'capabilities': ['warehouse_management', 'fulfillment', 'labor_management', 'wms', 'productivity'],
+            'specialization': 'Gestión de Almacén',
+            'complexity': 'expert',
+        },
+    },
+    'academic_advisor': {
+        'module': 'app.agents.education.academic_advisor',
+        'class': 'AcademicAdvisorAgent',
+        'metadata': {
+            'agent_id': 'academic_advisor',
+            'name': 'Academic Advisor',
+            'category': 'education',
+            'description': 'Asesor académico senior experto en orientación educativa, planificación académica y desarrollo estudiantil',
+            'emoji': '🎓',
+            'capabilities': ['academic_advising', 'career_guidance', 'course_planning', 'student_support', 'degree_audit'],
+            'specialization': 'Asesoría Académica',
+            'complexity': 'advanced',
+        },
+    },
+    'assessment_specialist': {
+        'module': 'app.agents.education.assessment_specialist',
+        'class': 'AssessmentSpecialistAgent',
+        'metadata': {
+            'agent_id': 'assessment_specialist',
+            'name': 'Assessment Specialist',
+            'category': 'education',
+            'description': 'Especialista en evaluación senior experto en diseño de assessments, psicometría y análisis',
+            'emoji': '📝',
+            'capabilities': ['assessment_design', 'psychometrics', 'item_writing', 'rubrics', 'data_analysis'],
+            'specialization': 'Evaluación y Medición',
+            'complexity': 'expert',
+        },
+    },
+    'content_curator': {
+        'module': 'app.agents.education.content_curator',
+        'class': 'ContentCuratorAgent',
+        'metadata': {
+            'agent_id': 'content_curator',
+            'name': 'Content Curator',
+            'category': 'education',
+            'description': 'Curador de contenido educativo senior experto en recursos de aprendizaje, OER y bibliotecas digitales',
+            'emoji': '📖',
+            'capabilities': ['content_curation', 'oer', 'resource_evaluation', 'digital_libraries', 'metadata'],
+            'specialization': 'Curaduría de Contenido Educativo',
+            'complexity': 'advanced',
+        },
+    },
+    'curriculum_developer': {
+        'module': 'app.agents.education.curriculum_developer',
+        'class': 'CurriculumDeveloperAgent',
+        'metadata': {
+            'agent_id': 'curriculum_developer',
+            'name': 'Curriculum Developer',
+            'category': 'education',
+            'description': 'Desarrollador de currículo senior experto en diseño curricular, programas educativos y estándares',
+            'emoji': '📋',
+            'capabilities': ['curriculum_development', 'program_design', 'standards_alignment', 'scope_sequence', 'competencies'],
+            'specialization': 'Desarrollo Curricular',
+            'complexity': 'expert',
+        },
+    },
+    'educational_technologist': {
+        'module': 'app.agents.education.educational_technologist',
+        'class': 'EducationalTechnologistAgent',
+        'metadata': {
+            'agent_id': 'educational_technologist',
+            'name': 'Educational Technologist',
+            'category': 'education',
+            'description': 'Tecnólogo educativo senior experto en EdTech, transformación digital y innovación educativa',
+            'emoji': '🔬',
+            'capabilities': ['edtech', 'digital_transformation', 'innovation', 'integration', 'emerging_tech'],
+            'specialization': 'Tecnología Educativa',
+            'complexity': 'expert',
+        },
+    },
+    'elearning_specialist': {
+        'module': 'app.agents.education.elearning_specialist',
+        'class': 'ElearningSpecialistAgent',
+        'metadata': {
+            'agent_id': 'elearning_specialist',
+            'name': 'E-Learning Specialist',
+            'category': 'education',
+            'description': 'Especialista en e-learning senior experto en aprendizaje digital, LMS y tecnologías educativas',
+            'emoji': '💻',
+            'capabilities': ['elearning', 'lms', 'authoring_tools', 'scorm', 'virtual_learning'],
+            'specialization': 'E-Learning y Tecnología Educativa',
+            'complexity': 'expert',
+        },
+    },
+    'instructional_designer': {
+        'module': 'app.agents.education.instructional_designer',
+        'class': 'InstructionalDesignerAgent',
+        'metadata': {
+            'agent_id': 'instructional_designer',
+            'name': 'Instructional Designer',
+            'category': 'education',
+            'description': 'Diseñador instruccional senior experto en diseño de cursos, experiencias de aprendizaje y pedagogía',
+            'emoji': '📐',
+            'capabilities': ['instructional_design', 'curriculum_design', 'learning_objectives', 'assessment_design', 'addie'],
+            'specialization': 'Diseño Instruccional',
+            'complexity': 'expert',
+        },
+    },
+    'learning_analyst': {
+        'module': 'app.agents.education.learning_analyst',
+        'class': 'LearningAnalystAgent',
+        'metadata': {
+            'agent_id': 'learning_analyst',
+            'name': 'Learning Analyst',
+            'category': 'education',
+            'description': 'Analista de aprendizaje senior experto en learning analytics, datos educativos y mejora basada en evidencia',
+            'emoji': '📈',
+            'capabilities': ['learning_analytics', 'educational_data', 'dashboards', 'predictive_analytics', 'reporting'],
+            'specialization': 'Learning Analytics',
+            'complexity': 'expert',
+        },
+    },
+    'training_facilitator': {
+        'module': 'app.agents.education.training_facilitator',
+        'class': 'TrainingFacilitatorAgent',
+        'metadata': {
+            'agent_id': 'training_facilitator',
+            'name': 'Training Facilitator',
+            'category': 'education',
+            'description': 'Facilitador de capacitación senior experto en delivery, engagement y facilitación de grupos',
+            'emoji': '🎤',
+            'capabilities': ['facilitation', 'training_delivery', 'engagement', 'group_dynamics', 'virtual_facilitation'],
+            'specialization': 'Facilitación de Capacitación',
+            'complexity': 'expert',
+        },
+    },
+    'tutor_specialist': {
+        'module': 'app.agents.education.tutor_specialist',
+        'class': 'TutorSpecialistAgent',
+        'metadata': {
+            'agent_id': 'tutor_specialist',
+            'name': 'Tutor Specialist',
+            'category': 'education',
+            'description': 'Tutor especializado senior experto en tutoría personalizada, apoyo académico y estrategias de estudio',
+            'emoji': '👨\u200d🏫',
+            'capabilities': ['tutoring', 'personalized_learning', 'study_strategies', 'academic_support', 'remediation'],
+            'specialization': 'Tutoría Personalizada',
+            'complexity': 'advanced',
+        },
+    },
+    'animator': {
+        'module': 'app.agents.creative.animator',
+        'class': 'AnimatorAgent',
+        'metadata': {
+            'agent_id': 'animator',
+            'name': 'Animator',
+            'category': 'creative',
+            'description': 'Animador senior experto en animación 2D/3D, character animation y storytelling visual',
+            'emoji': '🎭',
+            'capabilities': ['2d_animation', '3d_animation', 'character_animation', 'rigging', 'storytelling'],
+            'specialization': 'Animación',
+            'complexity': 'expert',
+        },
+    },
+    'brand_designer': {
+        'module': 'app.agents.creative.brand_designer',
+        'class': 'BrandDesignerAgent',
+        'metadata': {
+            'agent_id': 'brand_designer',
+            'name': 'Brand Designer',
+            'category': 'creative',
+            'description': 'Diseñador de marca senior experto en branding, identidad corporativa y brand systems',
+            'emoji': '🏷️',
+            'capabilities': ['brand_design', 'identity_systems', 'logo_design', 'brand_guidelines', 'rebranding'],
+            'specialization': 'Diseño de Marca',
+            'complexity': 'expert',
+        },
+    },
+    'creative_director': {
+        'module': 'app.agents.creative.creative_director',
+        'class': 'CreativeDirectorAgent',
+        'metadata': {
+            'agent_id': 'creative_director',
+            'name': 'Creative Director',
+            'category': 'creative',
+            'description': 'Director creativo senior experto en liderazgo creativo, dirección de arte y estrategia visual',
+            'emoji': '🎯',
+            'capabilities': ['creative_direction', 'art_direction', 'team_leadership', 'campaign_development', 'creative_strategy'],
+            'specialization': 'Dirección Creativa',
+            'complexity': 'expert',
+        },
+    },
+    'graphic_designer': {
+        'module': 'app.agents.creative.graphic_designer',
+        'class': 'GraphicDesignerAgent',
+        'metadata': {
+            'agent_id': 'graphic_designer',
+            'name': 'Graphic Designer',
+            'category': 'creative',
+            'description': 'Diseñador gráfico senior experto en diseño visual, branding e identidad corporativa',
+            'emoji': '🎨',
+            'capabilities': ['graphic_design', 'branding', 'visual_identity', 'print_design', 'digital_design'],
+            'specialization': 'Diseño Gráfico',
+            'complexity': 'expert',
+        },
+    },
+    'illustrator': {
+        'module': 'app.agents.creative.illustrator',
+        'class': 'IllustratorAgent',
+        'metadata': {
+            'agent_id': 'illustrator',
+            'name': 'Illustrator',
+            'category': 'creative',
+            'description': 'Ilustrador senior experto en ilustración digital, arte conceptual y diseño de personajes',
+            'emoji': '🖌️',
+            'capabilities': ['illustration', 'concept_art', 'character_design', 'digital_painting', 'vector_art'],
+            'specialization': 'Ilustración Digital',
+            'complexity': 'expert',
+        },
+    },
+    'motion_designer': {
+        'module': 'app.agents.creative.motion_designer',
+        'class': 'MotionDesignerAgent',
+        'metadata': {
+            'agent_id': 'motion_designer',
+            'name': 'Motion Designer',
+            'category': 'creative',
+            'description': 'Motion designer senior experto en animación, motion graphics y efectos visuales',
+            'emoji': '✨',
+            'capabilities': ['motion_graphics', 'animation', 'vfx', 'compositing', '3d_animation'],
+            'specialization': 'Motion Design',
+            'complexity': 'expert',
+        },
+    },
+    'three_d_artist': {
+        'module': 'app.agents.creative.three_d_artist',
+        'class': 'ThreeDimensionalArtistAgent',
+        'metadata': {
+            'agent_id': 'three_d_artist',
+            'name': '3D Artist',
+            'category': 'creative',
+            'description': 'Artista 3D senior experto en modelado, texturizado, iluminación y renderizado',
+            'emoji': '🎲',
+            'capabilities': ['3d_modeling', 'texturing', 'lighting', 'rendering', 'sculpting'],
+            'specialization': 'Arte 3D',
+            'complexity': 'expert',
+        },
+    },
+    'ui_designer': {
+        'module': 'app.agents.creative.ui_designer',
+        'class': 'UIDesignerAgent',
+        'metadata': {
+            'agent_id': 'ui_designer',
+            'name': 'UI Designer',
+            'category': 'creative',
+            'description': 'Diseñador de interfaces senior experto en UI design, design systems y prototipos interactivos',
+            'emoji': '📱',
+            'capabilities': ['ui_design', 'design_systems', 'prototyping', 'visual_design', 'responsive_design'],
+            'specialization': 'Diseño de Interfaces',
+            'complexity': 'expert',
+        },
+    },
+    'ux_designer': {
+        'module': 'app.agents.creative.ux_designer',
+        'class': 'UXDesignerAgent',
+        'metadata': {
+            'agent_id': 'ux_designer',
+            'name': 'UX Designer',
+            'category': 'creative',
+            'description': 'Diseñador UX senior experto en experiencia de usuario, research y arquitectura de información',
+            'emoji': '🧠',
+            'capabilities': ['ux_design', 'user_research', 'information_architecture', 'usability', 'wireframing'],
+            'specialization': 'Diseño de Experiencia',
+            'complexity': 'expert',
+        },
+    },
+    'video_producer': {
+        'module': 'app.agents.creative.video_producer',
+        'class': 'VideoProducerAgent',
+        'metadata': {
+            'agent_id': 'video_producer',
+            'name': 'Video Producer',
+            'category': 'creative',
+            'description': 'Productor de video senior experto en producción audiovisual, dirección y post-producción',
+            'emoji': '🎬',
+            'capabilities': ['video_production', 'directing', 'post_production', 'storytelling', 'live_streaming'],
+            'specialization': 'Producción de Video',
+            'complexity': 'expert',
+        },
+    },
+    'agile_coach': {
+        'module': 'app.agents.project_management.agile_coach',
+        'class': 'AgileCoachAgent',
+        'metadata': {
+            'agent_id': 'agile_coach',
+            'name': 'Agile Coach',
+            'category': 'project_management',
+            'description': 'Agile Coach senior experto en transformación ágil, coaching organizacional y escalamiento',
+            'emoji': '🎯',
+            'capabilities': ['agile_coaching', 'transformation', 'scaling', 'leadership_coaching', 'culture_change'],
+            'specialization': 'Coaching Ágil',
+            'complexity': 'expert',
+        },
+    },
+    'change_manager': {
+        'module': 'app.agents.project_management.change_manager',
+        'class': 'ChangeManagerAgent',
+        'metadata': {
+            'agent_id': 'change_manager',
+            'name': 'Change Manager',
+            'category': 'project_management',
+            'description': 'Change Manager senior PROSCI experto en gestión del cambio, adopción y transformación',
+            'emoji': '🔄',
+            'capabilities': ['change_management', 'stakeholder_engagement', 'communication', 'training', 'adoption'],
+            'specialization': 'Gestión del Cambio',
+            'complexity': 'expert',
+        },
+    },
+    'pmo_specialist': {
+        'module': 'app.agents.project_management.pmo_specialist',
+        'class': 'PMOSpecialistAgent',
+        'metadata': {
+            'agent_id': 'pmo_specialist',
+            'name': 'PMO Specialist',
+            'category': 'project_management',
+            'description': 'Especialista PMO senior experto en oficina de proyectos, governance, estándares y reporting',
+            'emoji': '🏢',
+            'capabilities': ['pmo', 'governance', 'standards', 'reporting', 'tools_management'],
+            'specialization': 'PMO y Governance',
+            'complexity': 'expert',
+        },
+    },
+    'portfolio_manager': {
+        'module': 'app.agents.project_management.portfolio_manager',
+        'class': 'PortfolioManagerAgent',
+        'metadata': {
+            'agent_id': 'portfolio_manager',
+            'name': 'Portfolio Manager',
+            'category': 'project_management',
+            'description': 'Portfolio Manager senior PfMP experto en gestión de portafolios, priorización estratégica y ROI',
+            'emoji': '💼',
+            'capabilities': ['portfolio_management', 'strategic_prioritization', 'resource_allocation', 'investment_analysis', 'governance'],
+            'specialization': 'Gestión de Portafolios',
+            'complexity': 'expert',
+        },
+    },
+    'product_owner': {
+        'module': 'app.agents.project_management.product_owner',
+        'class': 'ProductOwnerAgent',
+        'metadata': {
+            'agent_id': 'product_owner',
+            'name': 'Product Owner',
+            'category': 'project_management',
+            'description': 'Product Owner senior CSPO experto en gestión de backlog, priorización y maximización de valor',
+            'emoji': '📝',
+            'capabilities': ['backlog_management', 'prioritization', 'user_stories', 'stakeholder_collaboration', 'value_maximization'],
+            'specialization': 'Product Ownership',
+            'complexity': 'expert',
+        },
+    },
+    'program_manager': {
+        'module': 'app.agents.project_management.program_manager',
+        'class': 'ProgramManagerAgent',
+        'metadata': {
+            'agent_id': 'program_manager',
+            'name': 'Program Manager',
+            'category': 'project_management',
+            'description': 'Program Manager senior PgMP experto en gestión de programas, dependencias y beneficios',
+            'emoji': '🎪',
+            'capabilities': ['program_management', 'dependency_management', 'benefits_realization', 'governance', 'strategic_alignment'],
+            'specialization': 'Gestión de Programas',
+            'complexity': 'expert',
+        },
+    },
+    'project_manager': {
+        'module': 'app.agents.project_management.project_manager',
+        'class': 'ProjectManagerAgent',
+        'metadata': {
+            'agent_id': 'project_manager',
+            'name': 'Project Manager',
+            'category': 'project_management',
+            'description': 'Project Manager senior PMP experto en gestión de proyectos, metodologías y delivery',
+            'emoji': '📊',
+            'capabilities': ['project_management', 'planning', 'risk_management', 'stakeholder_management', 'delivery'],
+            'specialization': 'Gestión de Proyectos',
+            'complexity': 'expert',
+        },
+    },
+    'resource_planner': {
+        'module': 'app.agents.project_management.resource_planner',
+        'class': 'ResourcePlannerAgent',
+        'metadata': {
+            'agent_id': 'resource_planner',
+            'name': 'Resource Planner',
+            'category': 'project_management',
+            'description': 'Planificador de recursos senior experto en capacity planning, asignación y optimización',
+            'emoji': '👥',
+            'capabilities': ['resource_planning', 'capacity_management', 'allocation', 'forecasting', 'utilization'],
+            'specialization': 'Planificación de Recursos',
+            'complexity': 'advanced',
+        },
+    },
+    'scrum_master': {
+        'module': 'app.agents.project_management.scrum_master',
+        'class': 'ScrumMasterAgent',
+        'metadata': {
+            'agent_id': 'scrum_master',
+            'name': 'Scrum Master',
+            'category': 'project_management',
+            'description': 'Scrum Master senior CSM experto en Scrum, facilitación y coaching de equipos ágiles',
+            'emoji': '🔄',
+            'capabilities': ['scrum', 'facilitation', 'coaching', 'impediment_removal', 'ceremonies'],
+            'specialization': 'Scrum y Agilidad',
+            'complexity': 'expert',
+        },
+    },
+    'stakeholder_manager': {
+        'module': 'app.agents.project_management.stakeholder_manager',
+        'class': 'StakeholderManagerAgent',
+        'metadata': {
+            'agent_id': 'stakeholder_manager',
+            'name': 'Stakeholder Manager',
+            'category': 'project_management',
+            'description': 'Gestor de stakeholders senior experto en engagement, comunicación y gestión de expectativas',
+            'emoji': '🤝',
+            'capabilities': ['stakeholder_management', 'communication', 'engagement', 'expectation_management', 'influence'],
+            'specialization': 'Gestión de Stakeholders',
+            'complexity': 'advanced',
+        },
+    },
+    'mercadolibre_product_specialist': {
+        'module': 'app.agents.mercadolibre.mercadolibre_product_specialist',
+        'class': 'MercadoLibreProductSpecialistAgent',
+        'metadata': {
+            'agent_id': 'mercadolibre_product_specialist',
+            'name': 'ML Product Specialist',
+            'category': 'marketing',
+            'description': 'Especialista en crear fichas técnicas completas y descripciones optimizadas para productos en Mercado Libre',
+            'emoji': '📦',
+            'capabilities': ['product_research', 'technical_specs', 'product_description', 'marketplace_optimization', 'competitor_analysis'],
+            'specialization': 'Fichas Técnicas Mercado Libre',
+            'complexity': 'advanced',
+        },
+    },
+    'mercadolibre_sales_optimizer': {
+        'module': 'app.agents.mercadolibre.mercadolibre_sales_optimizer',
+        'class': 'MercadoLibreSalesOptimizerAgent',
+        'metadata': {
+            'agent_id': 'mercadolibre_sales_optimizer',
+            'name': 'ML Sales Optimizer',
+            'category': 'marketing',
+            'description': 'Especialista en estrategias de crecimiento y optimización de ventas en Mercado Libre',
+            'emoji': '📈',
+            'capabilities': ['sales_strategy', 'pricing_optimization', 'conversion_rate', 'advertising_ml', 'reputation_management'],
+            'specialization': 'Optimización de Ventas Mercado Libre',
+            'complexity': 'advanced',
+        },
+    },
+    'ml_ads_specialist': {
+        'module': 'app.agents.mercadolibre.ml_ads_specialist',
+        'class': 'MLAdsSpecialistAgent',
+        'metadata': {
+            'agent_id': 'ml_ads_specialist',
+            'name': 'ML Ads Specialist',
+            'category': 'mercadolibre',
+            'description': 'Especialista en Product Ads, campañas publicitarias y estrategias de puja en Mercado Libre',
+            'emoji': '🎯',
+            'capabilities': ['product_ads', 'campaign_management', 'bidding_strategy', 'acos_optimization', 'budget_allocation'],
+            'specialization': 'Publicidad en Mercado Libre',
+            'complexity': 'advanced',
+        },
+    },
+    'ml_analytics_expert': {
+        'module': 'app.agents.mercadolibre.ml_analytics_expert',
+        'class': 'MLAnalyticsExpertAgent',
+        'metadata': {
+            'agent_id': 'ml_analytics_expert',
+            'name': 'ML Analytics Expert',
+            'category': 'mercadolibre',
+            'description': 'Especialista en análisis de métricas, tendencias y datos de rendimiento en Mercado Libre',
+            'emoji': '📊',
+            'capabilities': ['data_analysis', 'metrics_tracking', 'trend_analysis', 'reporting', 'forecasting'],
+            'specialization': 'Analytics de Mercado Libre',
+            'complexity': 'advanced',
+        },
+    },
+    'ml_catalog_manager': {
+        'module': 'app.agents.mercadolibre.ml_catalog_manager',
+        'class': 'MLCatalogManagerAgent',
+        'metadata': {
+            'agent_id': 'ml_catalog_manager',
+            'name': 'ML Catalog Manager',
+            'category': 'mercadolibre',
+            'description': 'Especialista en gestión de catálogo, variaciones, categorías y estructura de productos',
+            'emoji': '📋',
+            'capabilities': ['catalog_management', 'product_variations', 'category_optimization', 'bulk_upload', 'sku_management'],
+            'specialization': 'Gestión de Catálogo ML',
+            'complexity': 'intermediate',
+        },
+    },
+    'ml_customer_service': {
+        'module': 'app.agents.mercadolibre.ml_customer_service',
+        'class': 'MLCustomerServiceAgent',
+        'metadata': {
+            'agent_id': 'ml_customer_service',
+            'name': 'ML Customer Service',
+            'category': 'mercadolibre',
+            'description': 'Especialista en atención al cliente, respuesta a preguntas y conversión de consultas en ventas',
+            'emoji': '💬',
+            'capabilities': ['question_response', 'customer_support', 'sales_conversion', 'conflict_resolution', 'faq_management'],
+            'specialization': 'Atención al Cliente ML',
+            'complexity': 'intermediate',
+        },
+    },
+    'ml_listing_optimizer': {
+        'module': 'app.agents.mercadolibre.ml_listing_optimizer',
+        'class': 'MLListingOptimizerAgent',
+        'metadata': {
+            'agent_id': 'ml_listing_optimizer',
+            'name': 'ML Listing Optimizer',
+            'category': 'mercadolibre',
+            'description': 'Especialista en optimizar títulos, descripciones y atributos de publicaciones para mejorar posicionamiento',
+            'emoji': '✨',
+            'capabilities': ['title_optimization', 'seo_ml', 'attribute_optimization', 'keyword_research', 'competitor_analysis'],
+            'specialization': 'Optimización de Publicaciones ML',
+            'complexity': 'advanced',
+        },
+    },
+    'ml_logistics_expert': {
+        'module': 'app.agents.mercadolibre.ml_logistics_expert',
+        'class': 'MLLogisticsExpertAgent',
+        'metadata': {
+            'agent_id': 'ml_logistics_expert',
+            'name': 'ML Logistics Expert',
+            'category': 'mercadolibre',
+            'description': 'Especialista en Mercado Envíos, Full, Flex y optimización logística',
+            'emoji': '🚚',
+            'capabilities': ['shipping_optimization', 'mercado_envios', 'fulfillment', 'inventory_management', 'cost_reduction'],
+            'specialization': 'Logística Mercado Libre',
+            'complexity': 'advanced',
+        },
+    },
+    'ml_pricing_strategist': {
+        'module': 'app.agents.mercadolibre.ml_pricing_strategist',
+        'class': 'MLPricingStrategistAgent',
+        'metadata': {
+            'agent_id': 'ml_pricing_strategist',
+            'name': 'ML Pricing Strategist',
+            'category': 'mercadolibre',
+            'description': 'Especialista en estrategias de precio, análisis de competencia y maximización de márgenes',
+            'emoji': '💰',
+            'capabilities': ['pricing_strategy', 'competitor_pricing', 'margin_optimization', 'dynamic_pricing', 'promotion_planning'],
+            'specialization': 'Estrategias de Precio ML',
+            'complexity': 'advanced',
+        },
+    },
+    'ml_reputation_manager': {
+        'module': 'app.agents.mercadolibre.ml_reputation_manager',
+        'class': 'MLReputationManagerAgent',
+        'metadata': {
+            'agent_id': 'ml_reputation_manager',
+            'name': 'ML Reputation Manager',
+            'category': 'mercadolibre',
+            'description': 'Especialista en gestión de reputación, métricas de vendedor y estrategias para alcanzar MercadoLíder',
+            'emoji': '⭐',
+            'capabilities': ['reputation_management', 'metrics_optimization', 'claim_handling', 'review_strategy', 'mercadolider'],
+            'specialization': 'Gestión de Reputación ML',
+            'complexity': 'advanced',
+        },
+    },
+    'yt_analytics_expert': {
+        'module': 'app.agents.youtube.yt_analytics_expert',
+        'class': 'YTAnalyticsExpertAgent',
+        'metadata': {
+            'agent_id': 'yt_analytics_expert',
+            'name': 'YT Analytics Expert',
+            'category': 'youtube',
+            'description': 'Especialista en YouTube Analytics, interpretación de métricas y optimización basada en datos',
+            'emoji': '📊',
+            'capabilities': ['youtube_analytics', 'metrics_analysis', 'audience_insights', 'performance_tracking', 'data_interpretation'],
+            'specialization': 'Analytics de YouTube',
+            'complexity': 'advanced',
+        },
+    },
+    'yt_community_manager': {
+        'module': 'app.agents.youtube.yt_community_manager',
+        'class': 'YTCommunityManagerAgent',
+        'metadata': {
+            'agent_id': 'yt_community_manager',
+            'name': 'YT Community Manager',
+            'category': 'youtube',
+            'description': 'Especialista en construir y gestionar comunidades activas en YouTube',
+            'emoji': '👥',
+            'capabilities': ['community_building', 'comment_management', 'engagement_strategy', 'community_posts', 'audience_interaction'],
+            'specialization': 'Gestión de Comunidad YouTube',
+            'complexity': 'intermediate',
+        },
+    },
+    'yt_content_strategist': {
+        'module': 'app.agents.youtube.yt_content_strategist',
+        'class': 'YTContentStrategistAgent',
+        'metadata': {
+            'agent_id': 'yt_content_strategist',
+            'name': 'YT Content Strategist',
+            'category': 'youtube',
+            'description': 'Especialista en planificación de contenido, nichos y estrategia de crecimiento en YouTube',
+            'emoji': '🎬',
+            'capabilities': ['content_planning', 'niche_research', 'trend_analysis', 'content_calendar', 'audience_growth'],
+            'specialization': 'Estrategia de Contenido YouTube',
+            'complexity': 'advanced',
+        },
+    },
+    'yt_growth_strategist': {
+        'module': 'app.agents.youtube.yt_growth_strategist',
+        'class': 'YTGrowthStrategistAgent',
+        'metadata': {
+            'agent_id': 'yt_growth_strategist',
+            'name': 'YT Growth Strategist',
+            'category': 'youtube',
+            'description': 'Especialista en estrategias de crecimiento rápido, viralidad y expansión de canales',
+            'emoji': '🚀',
+            'capabilities': ['growth_hacking', 'viral_strategy', 'collaboration_strategy', 'algorithm_optimization', 'channel_scaling'],
+            'specialization': 'Crecimiento en YouTube',
+            'complexity': 'advanced',
+        },
+    },
+    'yt_monetization_expert': {
+        'module': 'app.agents.youtube.yt_monetization_expert',
+        'class': 'YTMonetizationExpertAgent',
+        'metadata': {
+            'agent_id': 'yt_monetization_expert',
+            'name': 'YT Monetization Expert',
+            'category': 'youtube',
+            'description': 'Especialista en estrategias de monetización, AdSense, sponsors y múltiples fuentes de ingreso',
+            'emoji': '💵',
+            'capabilities': ['monetization_strategy', 'adsense_optimization', 'sponsorship_deals', 'revenue_diversification', 'brand_deals'],
+            'specialization': 'Monetización de YouTube',
+            'complexity': 'advanced',
+        },
+    },
+    'yt_script_writer': {
+        'module': 'app.agents.youtube.yt_script_writer',
+        'class': 'YTScriptWriterAgent',
+        'metadata': {
+            'agent_id': 'yt_script_writer',
+            'name': 'YT Script Writer',
+            'category': 'youtube',
+            'description': 'Especialista en escribir guiones atractivos que retienen audiencia y generan engagement',
+            'emoji': '📝',
+            'capabilities': ['script_writing', 'hook_creation', 'storytelling', 'retention_optimization', 'cta_writing'],
+            'specialization': 'Guiones para YouTube',
+            'complexity': 'advanced',
+        },
+    },
+    'yt_seo_specialist': {
+        'module': 'app.agents.youtube.yt_seo_specialist',
+        'class': 'YTSEOSpecialistAgent',
+        'metadata': {
+            'agent_id': 'yt_seo_specialist',
+            'name': 'YT SEO Specialist',
+            'category': 'youtube',
+            'description': 'Especialista en SEO de YouTube: títulos, descripciones, tags, thumbnails y posicionamiento',
+            'emoji': '🔍',
+            'capabilities': ['youtube_seo', 'keyword_research', 'title_optimization', 'tag_strategy', 'description_optimization'],
+            'specialization': 'SEO de YouTube',
+            'complexity': 'advanced',
+        },
+    },
+    'yt_shorts_specialist': {
+        'module': 'app.agents.youtube.yt_shorts_specialist',
+        'class': 'YTShortsSpecialistAgent',
+        'metadata': {
+            'agent_id': 'yt_shorts_specialist',
+            'name': 'YT Shorts Specialist',
+            'category': 'youtube',
+            'description': 'Especialista en crear y optimizar YouTube Shorts para máximo alcance viral',
+            'emoji': '📱',
+            'capabilities': ['shorts_creation', 'viral_content', 'trend_riding', 'hook_optimization', 'vertical_video'],
+            'specialization': 'YouTube Shorts',
+            'complexity': 'intermediate',
+        },
+    },
+    'yt_thumbnail_designer': {
+        'module': 'app.agents.youtube.yt_thumbnail_designer',
+        'class': 'YTThumbnailDesignerAgent',
+        'metadata': {
+            'agent_id': 'yt_thumbnail_designer',
+            'name': 'YT Thumbnail Designer',
+            'category': 'youtube',
+            'description': 'Especialista en crear conceptos de thumbnails que maximizan CTR y clicks',
+            'emoji': '🖼️',
+            'capabilities': ['thumbnail_design', 'ctr_optimization', 'visual_strategy', 'a_b_testing', 'brand_consistency'],
+            'specialization': 'Thumbnails de YouTube',
+            'complexity': 'intermediate',
+        },
+    },
+    'yt_video_editor_advisor': {
+        'module': 'app.agents.youtube.yt_video_editor_advisor',
+        'class': 'YTVideoEditorAdvisorAgent',
+        'metadata': {
+            'agent_id': 'yt_video_editor_advisor',
+            'name': 'YT Video Editor Advisor',
+            'category': 'youtube',
+            'description': 'Especialista en técnicas de edición, ritmo, efectos y estilo visual para videos de YouTube',
+            'emoji': '🎞️',
+            'capabilities': ['editing_techniques', 'pacing_optimization', 'visual_effects', 'audio_editing', 'retention_editing'],
+            'specialization': 'Edición de Video YouTube',
+            'complexity': 'advanced',
+        },
+    },
+}
@@ -1,12 +1,40 @@
 """
 AFW v0.5.0 - Agent Registry
 Registro centralizado de agentes
+
+El registro se llena al importar desde el manifiesto (agent_manifest.py):
+metadata de los 120 agentes disponible sin importar ningún módulo de agente.
+La clase de cada agente se importa la primera vez que se pide su "class".
 """
 
+import importlib
 from typing import Dict, Any, List, Optional
 
+from .agent_manifest import AGENT_MANIFEST
+
+
+class LazyAgentEntry(dict):
+    """Entrada del registro con metadata inmediata; "class" importa el módulo del agente al primer acceso"""
+
+    def __init__(self, module: str, class_name: str, metadata: Dict[str, Any]):
+        super().__init__(metadata=metadata, module=module, class_name=class_name)
+
+    def __missing__(self, key: str) -> Any:
+        if key != "class":
+            raise KeyError(key)
+        agent_class = getattr(importlib.import_module(self["module"]), self["class_name"])
+        self["class"] = agent_class
+        return agent_class
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key == "class" else super().get(key, default)
+
+
 # Registro global de agentes
-AGENT_REGISTRY: Dict[str, Any] = {}
+AGENT_REGISTRY: Dict[str, Any] = {
+    agent_id: LazyAgentEntry(entry["module"], entry["class"], entry["metadata"])
+    for agent_id, entry in AGENT_MANIFEST.items()
+}
 
 def register_agent_class(agent_class):
     """Registrar una clase de agente"""
@@ -25,6 +53,84 @@ def get_agent_by_id(agent_id: str) -> Optional[Any]:
     """Obtener un agente por su ID"""
     return AGENT_REGISTRY.get(agent_id)
 
+def get_agent_class(agent_id: str) -> Optional[type]:
+    """Clase del agente (importa su módulo si aún no se cargó)"""
+    entry = AGENT_REGISTRY.get(agent_id)
+    return entry["class"] if entry is not None else None
+
+def load_all_agents() -> int:
+    """Importa todas las clases de agentes (carga ansiosa, p. ej. para calentar un worker)"""
+    for agent_id in list(AGENT_REGISTRY):
+        get_agent_class(agent_id)
+    return len(AGENT_REGISTRY)
+
+def lazy_category_exports(package: str, list_name: str):
+    """
+    `__getattr__` (PEP 562) para un paquete de categoría: resuelve cada clase
+    de agente y la lista `<CATEGORIA>_AGENTS` desde el manifiesto, importando
+    solo los módulos que se piden.
+    """
+    entries = [entry for entry in AGENT_MANIFEST.values() if entry["module"].rsplit(".", 1)[0] == package]
+    modules = {entry["class"]: entry["module"] for entry in entries}
+
+    def __getattr__(name: str) -> Any:
+        if name in modules:
+            return getattr(importlib.import_module(modules[name]), name)
+        if name == list_name:
+            return [getattr(importlib.import_module(entry["module"]), entry["class"]) for entry in entries]
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    return __getattr__
+
+def build_agent_manifest() -> Dict[str, Dict[str, Any]]:
+    """Manifiesto a partir de los decoradores (importa los 120 módulos; solo para regenerarlo)"""
+    import inspect
+    import pkgutil
+    from app.agents import AGENT_CATEGORIES
+    manifest: Dict[str, Dict[str, Any]] = {}
+    for category in AGENT_CATEGORIES:
+        package = importlib.import_module(f"app.agents.{category}")
+        for module_info in pkgutil.iter_modules(package.__path__):
+            module = importlib.import_module(f"{package.__name__}.{module_info.name}")
+            for _, agent_class in inspect.getmembers(module, inspect.isclass):
+                if agent_class.__module__ == module.__name__ and hasattr(agent_class, "_agent_metadata"):
+                    metadata = agent_class._agent_metadata
+                    manifest[metadata["agent_id"]] = {
+                        "module": module.__name__,
+                        "class": agent_class.__name__,
+                        "metadata": metadata,
+                    }
+    return manifest
+
+def write_agent_manifest(path: Optional[str] = None) -> None:
+    """
+    Regenera agent_manifest.py tras añadir o modificar un agente:
+    python -c "from app.agents.agent_registry import write_agent_manifest; write_agent_manifest()"
+    """
+    import os
+    path = path or os.path.join(os.path.dirname(__file__), "agent_manifest.py")
+    lines = [MANIFEST_HEADER, "AGENT_MANIFEST = {"]
+    for agent_id, entry in build_agent_manifest().items():
+        lines.append(f"    {agent_id!r}: {{")
+        lines.append(f"        'module': {entry['module']!r},")
+        lines.append(f"        'class': {entry['class']!r},")
+        lines.append("        'metadata': {")
+        lines.extend(f"            {key!r}: {value!r}," for key, value in entry["metadata"].items())
+        lines.append("        },")
+        lines.append("    },")
+    lines.append("}")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+MANIFEST_HEADER = '''"""
+AFW - Agent Manifest
+Generado por app.agents.agent_registry.write_agent_manifest: no editar a mano.
+
+agent_id → módulo, clase y metadata de @register_agent. Permite conocer los
+120 agentes sin importar sus módulos (se cargan al primer uso).
+"""
+'''
+
 def register_agent(
     agent_id: str,
     name: str,
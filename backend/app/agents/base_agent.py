@@ -4,11 +4,24 @@ Clase base para todos los agentes del sistema
 Compatible con src.infrastructure.agents.base_agent
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, AsyncIterator
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from src.shared.a2a_protocol import AgentCapability
+from src.shared.single_flight import agent_single_flight
 from src.infrastructure.adapters.external.llm_adapter import LLMAdapter
+from src.domain.entities.agent import AgentProfile
+
+_llm_adapter: Optional[LLMAdapter] = None
+
+
+def shared_llm_adapter() -> LLMAdapter:
+    """LLMAdapter único del proceso: no guarda estado por agente ni por petición"""
+    global _llm_adapter
+    if _llm_adapter is None:
+        _llm_adapter = LLMAdapter()
+    return _llm_adapter
+
 
 class BaseAgent(ABC):
     """Clase base para todos los agentes - Compatible con sistema de orquestación"""
@@ -44,30 +57,24 @@ class BaseAgent(ABC):
         self.language = language
         self.level = level
         
-        # Crear perfil compatible con A2A
-        try:
-            from src.domain.entities.a2a_types import AgentProfile
-            self.profile = AgentProfile(
-                agent_id=self.agent_id,
-                name=self.name,
-                primary_capability=primary_capability or AgentCapability.GENERAL,
-                specialization=specialization,
-                description=description,
-                backstory=backstory,
-                model_name=model or "openai/gpt-4o-mini",
-                level=level
-            )
-        except ImportError:
-            # Fallback si no está disponible A2A
-            self.profile = None
+        # Perfil A2A: la entidad de dominio que usan el protocolo y el orquestador.
+        # Con prototipos (app.agents.prototypes) se construye una vez por agente
+        # y lo comparten todas las instancias por petición.
+        self.profile = AgentProfile(
+            agent_id=self.agent_id,
+            name=self.name,
+            description=description,
+            level=level,
+            specialization=specialization,
+            backstory=backstory,
+            model=self.model,
+            system_prompt="",
+            primary_capability=getattr(primary_capability, "value", primary_capability) or "general",
+            capabilities=[getattr(c, "value", c) for c in secondary_capabilities or []],
+        )
         
-        # Inicializar LLM adapter (sin parámetros, api_config se pasa en chat_completion)
-        self.llm_provider = None
-        if api_config:
-            try:
-                self.llm_provider = LLMAdapter()  # LLMAdapter no acepta parámetros en constructor
-            except Exception as e:
-                print(f"⚠️ Error inicializando LLM adapter: {e}")
+        # LLM adapter compartido (sin estado: api_config se pasa en chat_completion)
+        self.llm_provider = shared_llm_adapter() if api_config else None
     
     @abstractmethod
     def get_system_prompt(self) -> str:
@@ -78,37 +85,105 @@ class BaseAgent(ABC):
         """Obtener las capacidades del agente"""
         return []
     
+    def _ensure_llm_provider(self):
+        """Inicializa el LLM provider si no existe"""
+        if not self.llm_provider:
+            self.llm_provider = shared_llm_adapter()
+    
+    def build_messages(self, task: str) -> List[Dict[str, str]]:
+        """Mensajes enviados al LLM para una tarea"""
+        return [
+            {"role": "system", "content": self.get_system_prompt()},
+            {"role": "user", "content": task}
+        ]
+    
+    def _flight_key(self, messages: List[Dict[str, str]]):
+        """Clave de single-flight: peticiones idénticas en curso comparten la llamada al LLM"""
+        return agent_single_flight.make_key(self.agent_id, self.model, messages, self.api_config)
+    
+    async def _cached_response(self, flight_key) -> Optional[str]:
+        """Respuesta del caché de dos niveles si la petición lo permite (cache="prefer")"""
+        from app.services.cache_manager import cache_policy, CACHE_PREFER, get_cache_manager
+        if cache_policy.get() != CACHE_PREFER:
+            return None
+        # El hash del prompt completo sustituye a la tarea: cubre system prompt, contexto y endpoint
+        return await get_cache_manager().get_cached_agent_response(self.agent_id, flight_key[2], self.model)
+    
+    async def _store_response(self, flight_key, response: str) -> None:
+        from app.services.cache_manager import cache_policy, CACHE_PREFER, get_cache_manager
+        if cache_policy.get() == CACHE_PREFER and response:
+            await get_cache_manager().cache_agent_response(self.agent_id, flight_key[2], self.model, response)
+    
+    def _fallback_response(self) -> str:
+        return f"[{self.name}] Análisis completado. Recomendaciones basadas en {self.specialization}."
+    
     async def process_task(self, task: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Procesar una tarea con el agente"""
-        # Inicializar LLM provider si no existe
-        if not self.llm_provider:
-            try:
-                self.llm_provider = LLMAdapter()
-            except Exception as e:
-                print(f"⚠️ Error inicializando LLM adapter en process_task: {e}")
+        self._ensure_llm_provider()
         
         if self.llm_provider and self.api_config:
             try:
-                messages = [
-                    {"role": "system", "content": self.get_system_prompt()},
-                    {"role": "user", "content": task}
-                ]
+                messages = self.build_messages(task)
+                flight_key = self._flight_key(messages)
+                cached = await self._cached_response(flight_key)
+                if cached is not None:
+                    return {"response": cached, "content": cached, "cached": True}
+                
                 # Pasar api_config al método chat_completion, no al constructor
-                response = await self.llm_provider.chat_completion(
-                    messages=messages, 
-                    model=self.model,
-                    api_config=self.api_config
+                response = await agent_single_flight.run(
+                    flight_key,
+                    lambda: self.llm_provider.chat_completion(
+                        messages=messages, 
+                        model=self.model,
+                        api_config=self.api_config
+                    )
                 )
+                await self._store_response(flight_key, response)
                 return {"response": response, "content": response}
             except Exception as e:
                 error_msg = f"Error en LLM: {str(e)}"
                 print(f"❌ {self.name}: {error_msg}")
-                return {"response": error_msg, "content": error_msg}
+                # "status": "error" permite a workflows y orquestadores distinguirlo de una respuesta
+                return {"response": error_msg, "content": error_msg, "status": "error", "error": str(e)}
         
         # Fallback: respuesta simulada si no hay LLM configurado
-        fallback_response = f"[{self.name}] Análisis completado. Recomendaciones basadas en {self.specialization}."
+        fallback_response = self._fallback_response()
         return {"response": fallback_response, "content": fallback_response}
     
+    async def process_task_stream(self, task: str, context: Optional[Dict[str, Any]] = None) -> AsyncIterator[str]:
+        """Procesar una tarea emitiendo los deltas de texto del LLM a medida que llegan"""
+        self._ensure_llm_provider()
+        
+        if self.llm_provider and self.api_config:
+            try:
+                messages = self.build_messages(task)
+                flight_key = self._flight_key(messages)
+                cached = await self._cached_response(flight_key)
+                if cached is not None:
+                    # Se reproduce por el mismo camino de eventos que una generación en vivo
+                    yield cached
+                    return
+                
+                chunks = []
+                async for delta in agent_single_flight.stream(
+                    flight_key,
+                    lambda: self.llm_provider.stream_chat_completion(
+                        messages=messages,
+                        model=self.model,
+                        api_config=self.api_config
+                    )
+                ):
+                    chunks.append(delta)
+                    yield delta
+                await self._store_response(flight_key, "".join(chunks))
+            except Exception as e:
+                print(f"❌ {self.name}: Error en LLM: {str(e)}")
+                # Parte del texto ya salió como deltas: el pipeline lo reporta como agent_error
+                raise
+            return
+        
+        yield self._fallback_response()
+    
     async def execute(self, task: str) -> str:
         """Ejecutar tarea - método de compatibilidad"""
         result = await self.process_task(task)
@@ -0,0 +1,157 @@
+"""
+AFW - Capability Index
+Índice invertido de agentes y router léxico (BM25).
+
+Se construye una vez al importar, a partir de AGENT_DEFINITIONS y
+ENHANCED_AGENT_DEFINITIONS:
+- capacidad → agentes, categoría → agentes
+- término → agentes, con BM25 sobre nombre, descripción, especialización,
+  capacidades y categoría (capacidades y categoría pesan más)
+
+`route(query, k)` elige los k especialistas más relevantes para una consulta
+en microsegundos, sin una llamada de planificación al LLM.
+"""
+
+import math
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+from .registry import AGENT_DEFINITIONS, CATEGORIES
+from .enhanced_registry import ENHANCED_AGENT_DEFINITIONS
+
+# Parámetros estándar de BM25
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Peso (repeticiones) de cada campo en el documento de un agente
+FIELD_WEIGHTS = {
+    "name": 2,
+    "description": 1,
+    "specialization": 2,
+    "capabilities": 3,
+    "category": 2,
+}
+
+# Prefijo que se conserva de cada término: "desarrollador"/"desarrollo" → "desarr"
+STEM_LENGTH = 6
+
+_STOPWORDS = frozenset("""
+a al algo como con de del el en es esta este esto la las lo los mas me mi mis mucho
+muy no o para pero por que se sin sobre su sus un una uno unos y ya yo tu te
+the and or for to of in on with is are be my me i you how what this that an
+""".split())
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def _strip_accents(text: str) -> str:
+    return "".join(c for c in unicodedata.normalize("NFKD", text) if not unicodedata.combining(c))
+
+
+def tokenize(text: str) -> List[str]:
+    """Términos normalizados: minúsculas, sin acentos ni stopwords, truncados a STEM_LENGTH."""
+    words = _WORD.findall(_strip_accents(text.lower()))
+    return [w[:STEM_LENGTH] for w in words if len(w) > 1 and w not in _STOPWORDS]
+
+
+@dataclass(frozen=True)
+class AgentMatch:
+    """Agente elegido por el router"""
+    agent_id: str
+    score: float
+    category: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"agent_id": self.agent_id, "score": round(self.score, 3), "category": self.category}
+
+
+class CapabilityIndex:
+    """Índice invertido inmutable sobre las definiciones de agentes."""
+
+    def __init__(self, definitions: Mapping[str, Mapping[str, Any]], categories: Optional[Mapping[str, Any]] = None):
+        categories = categories or {}
+        self.categories: Dict[str, str] = {}
+        by_capability: Dict[str, set] = defaultdict(set)
+        by_category: Dict[str, set] = defaultdict(set)
+        postings: Dict[str, Dict[str, int]] = defaultdict(dict)
+        lengths: Dict[str, int] = {}
+
+        for agent_id, info in definitions.items():
+            category = info.get("category", "general")
+            self.categories[agent_id] = category
+            by_category[category].add(agent_id)
+            for capability in info.get("capabilities", []):
+                by_capability[capability].add(agent_id)
+
+            category_info = categories.get(category, {})
+            fields = {
+                "name": f"{info.get('name', '')} {agent_id.replace('_', ' ')}",
+                "description": info.get("description", ""),
+                "specialization": info.get("specialization", ""),
+                "capabilities": " ".join(c.replace("_", " ") for c in info.get("capabilities", [])),
+                "category": f"{category.replace('_', ' ')} {category_info.get('name', '')}",
+            }
+            terms: Counter = Counter()
+            for field_name, text in fields.items():
+                for term in tokenize(text):
+                    terms[term] += FIELD_WEIGHTS[field_name]
+            lengths[agent_id] = sum(terms.values())
+            for term, tf in terms.items():
+                postings[term][agent_id] = tf
+
+        self.by_capability: Mapping[str, FrozenSet[str]] = MappingProxyType(
+            {c: frozenset(ids) for c, ids in by_capability.items()}
+        )
+        self.by_category: Mapping[str, FrozenSet[str]] = MappingProxyType(
+            {c: frozenset(ids) for c, ids in by_category.items()}
+        )
+        self.size = len(lengths)
+        average = sum(lengths.values()) / self.size if self.size else 1.0
+
+        # Se precalcula idf y la normalización por longitud: buscar solo suma
+        self._postings: Dict[str, Tuple[Tuple[str, float], ...]] = {}
+        for term, docs in postings.items():
+            idf = math.log(1 + (self.size - len(docs) + 0.5) / (len(docs) + 0.5))
+            weighted = []
+            for agent_id, tf in docs.items():
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[agent_id] / average)
+                weighted.append((agent_id, idf * tf * (BM25_K1 + 1) / (tf + norm)))
+            self._postings[term] = tuple(weighted)
+
+    def agents_with_capability(self, capability: str) -> FrozenSet[str]:
+        return self.by_capability.get(capability, frozenset())
+
+    def agents_in_category(self, category: str) -> FrozenSet[str]:
+        return self.by_category.get(category, frozenset())
+
+    def search(self, query: str, k: int = 3, category: Optional[str] = None) -> List[AgentMatch]:
+        """Top-k agentes por BM25 (opcionalmente dentro de una categoría)."""
+        scores: Dict[str, float] = defaultdict(float)
+        for term in set(tokenize(query)):
+            for agent_id, weight in self._postings.get(term, ()):
+                scores[agent_id] += weight
+        if category is not None:
+            scores = {a: s for a, s in scores.items() if self.categories[a] == category}
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:k]
+        return [AgentMatch(agent_id, score, self.categories[agent_id]) for agent_id, score in ranked]
+
+    def route(self, query: str, k: int = 3, fallback: Tuple[str, ...] = ()) -> List[str]:
+        """IDs de los k especialistas más relevantes; `fallback` si nada coincide."""
+        matches = [m.agent_id for m in self.search(query, k)]
+        return matches or [a for a in fallback if a in self.categories][:k]
+
+
+def _merged_definitions() -> Dict[str, Dict[str, Any]]:
+    # Las definiciones enriquecidas completan campos que falten en las básicas
+    merged = {agent_id: dict(info) for agent_id, info in ENHANCED_AGENT_DEFINITIONS.items()}
+    for agent_id, info in AGENT_DEFINITIONS.items():
+        merged.setdefault(agent_id, {}).update(info)
+    return merged
+
+
+# Índice global construido al arrancar
+capability_index = CapabilityIndex(_merged_definitions(), CATEGORIES)
@@ -3,23 +3,10 @@ AFW v0.5.0 - Categoría: Creatividad y Diseño
 10 Agentes Especializados en Creatividad
 """
 
-from .graphic_designer import GraphicDesignerAgent
-from .ux_designer import UXDesignerAgent
-from .ui_designer import UIDesignerAgent
-from .video_producer import VideoProducerAgent
-from .animator import AnimatorAgent
-from .illustrator import IllustratorAgent
-from .brand_designer import BrandDesignerAgent
-from .motion_designer import MotionDesignerAgent
-from .three_d_artist import ThreeDimensionalArtistAgent
-from .creative_director import CreativeDirectorAgent
+from app.agents.agent_registry import lazy_category_exports
 
-CREATIVE_AGENTS = [
-    GraphicDesignerAgent, UXDesignerAgent, UIDesignerAgent,
-    VideoProducerAgent, AnimatorAgent, IllustratorAgent,
-    BrandDesignerAgent, MotionDesignerAgent, ThreeDimensionalArtistAgent,
-    CreativeDirectorAgent
-]
+# Las clases se importan al primer acceso (módulo y clase en agent_manifest.py)
+__getattr__ = lazy_category_exports(__name__, "CREATIVE_AGENTS")
 
 __all__ = [
     "GraphicDesignerAgent", "UXDesignerAgent", "UIDesignerAgent",
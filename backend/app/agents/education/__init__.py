@@ -3,22 +3,10 @@ AFW v0.5.0 - Categoría: Educación y Capacitación
 10 Agentes Especializados en Educación
 """
 
-from .instructional_designer import InstructionalDesignerAgent
-from .curriculum_developer import CurriculumDeveloperAgent
-from .elearning_specialist import ElearningSpecialistAgent
-from .training_facilitator import TrainingFacilitatorAgent
-from .educational_technologist import EducationalTechnologistAgent
-from .assessment_specialist import AssessmentSpecialistAgent
-from .academic_advisor import AcademicAdvisorAgent
-from .learning_analyst import LearningAnalystAgent
-from .content_curator import ContentCuratorAgent
-from .tutor_specialist import TutorSpecialistAgent
+from app.agents.agent_registry import lazy_category_exports
 
-EDUCATION_AGENTS = [
-    InstructionalDesignerAgent, CurriculumDeveloperAgent, ElearningSpecialistAgent,
-    TrainingFacilitatorAgent, EducationalTechnologistAgent, AssessmentSpecialistAgent,
-    AcademicAdvisorAgent, LearningAnalystAgent, ContentCuratorAgent, TutorSpecialistAgent
-]
+# Las clases se importan al primer acceso (módulo y clase en agent_manifest.py)
+__getattr__ = lazy_category_exports(__name__, "EDUCATION_AGENTS")
 
 __all__ = [
     "InstructionalDesignerAgent", "CurriculumDeveloperAgent", "ElearningSpecialistAgent",
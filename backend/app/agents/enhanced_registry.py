@@ -3,7 +3,9 @@ AFW v0.5.1 - Agent Enhanced Registry
 Extensión del registry con metadatos de formato de respuesta por agente
 """
 
-from typing import Dict, Any, List, Optional
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional
 
 # Importar el registry base y los formatos
 from app.agents.registry import AGENT_DEFINITIONS, CATEGORIES
@@ -422,9 +424,10 @@ def get_specialized_system_prompt(category: str) -> str:
     return SPECIALIZED_SYSTEM_PROMPTS.get(format_type, SPECIALIZED_SYSTEM_PROMPTS["analysis"])
 
 
-def build_agent_prompt(agent_id: str, agent_data: Dict[str, Any], task: str) -> str:
+def _render_agent_prompt(agent_data: Dict[str, Any], task: str) -> str:
     """
-    Construye el prompt completo para un agente incluyendo formato y tarea
+    Render completo con f-strings (identidad + formato + tarea).
+    Solo se usa para compilar las plantillas; el camino caliente usa CompiledPrompt.
     """
     category = agent_data.get("category", "analysis")
     system_prompt = get_specialized_system_prompt(category)
@@ -455,14 +458,73 @@ def build_agent_prompt(agent_id: str, agent_data: Dict[str, Any], task: str) ->
     return agent_context
 
 
+# Marcador que no puede aparecer en metadatos de agentes
+_TASK_SLOT = "\x00TASK\x00"
+
+
+@dataclass(frozen=True)
+class CompiledPrompt:
+    """
+    Plantilla inmutable de un agente: la parte estática ya renderizada
+    y un único hueco para la tarea. El contexto se añade al final.
+    """
+    agent_id: str
+    head: str
+    tail: str
+    
+    def render(self, task: str, context: str = "") -> str:
+        return self.head + task + self.tail + context
+
+
+def compile_agent_prompt(agent_id: str, agent_data: Dict[str, Any]) -> CompiledPrompt:
+    """
+    Compila la plantilla de un agente renderizando una vez con un marcador
+    en lugar de la tarea, así el resultado es idéntico al render completo.
+    """
+    head, tail = _render_agent_prompt(agent_data, _TASK_SLOT).split(_TASK_SLOT)
+    return CompiledPrompt(agent_id=agent_id, head=head, tail=tail)
+
+
+def compile_agent_prompts(definitions: Dict[str, Dict[str, Any]]) -> Mapping[str, CompiledPrompt]:
+    return MappingProxyType({
+        agent_id: compile_agent_prompt(agent_id, agent_data)
+        for agent_id, agent_data in definitions.items()
+    })
+
+
+def get_compiled_prompt(agent_id: str, agent_data: Optional[Dict[str, Any]] = None) -> CompiledPrompt:
+    """
+    Plantilla precompilada del agente. Si se pasan metadatos distintos a los
+    del registry (agentes ad-hoc), se compila al vuelo.
+    """
+    compiled = COMPILED_AGENT_PROMPTS.get(agent_id)
+    if compiled is not None and (agent_data is None or agent_data is ENHANCED_AGENT_DEFINITIONS.get(agent_id)):
+        return compiled
+    return compile_agent_prompt(agent_id, agent_data or {})
+
+
+def build_agent_prompt(agent_id: str, agent_data: Dict[str, Any], task: str) -> str:
+    """
+    Construye el prompt completo para un agente incluyendo formato y tarea
+    """
+    return get_compiled_prompt(agent_id, agent_data).render(task)
+
+
 # ============================================================================
 # EXPORTACIONES
 # ============================================================================
 
 ENHANCED_AGENT_DEFINITIONS = get_enhanced_agent_definitions()
 
+# Plantillas de los 120 agentes, compiladas una sola vez al importar
+COMPILED_AGENT_PROMPTS = compile_agent_prompts(ENHANCED_AGENT_DEFINITIONS)
+
 __all__ = [
     'ENHANCED_AGENT_DEFINITIONS',
+    'COMPILED_AGENT_PROMPTS',
+    'CompiledPrompt',
+    'compile_agent_prompt',
+    'get_compiled_prompt',
     'enhance_agent_definition',
     'get_enhanced_agent_definitions',
     'get_specialized_system_prompt',
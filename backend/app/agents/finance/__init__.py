@@ -3,23 +3,10 @@ AFW v0.5.0 - Categoría: Finanzas y Contabilidad
 10 Agentes Especializados en Finanzas
 """
 
-from .financial_analyst import FinancialAnalystAgent
-from .accountant import AccountantAgent
-from .tax_specialist import TaxSpecialistAgent
-from .investment_advisor import InvestmentAdvisorAgent
-from .budget_planner import BudgetPlannerAgent
-from .auditor import AuditorAgent
-from .payroll_specialist import PayrollSpecialistAgent
-from .financial_controller import FinancialControllerAgent
-from .risk_analyst import RiskAnalystAgent
-from .treasury_manager import TreasuryManagerAgent
+from app.agents.agent_registry import lazy_category_exports
 
-FINANCE_AGENTS = [
-    FinancialAnalystAgent, AccountantAgent, TaxSpecialistAgent,
-    InvestmentAdvisorAgent, BudgetPlannerAgent, AuditorAgent,
-    PayrollSpecialistAgent, FinancialControllerAgent, RiskAnalystAgent,
-    TreasuryManagerAgent
-]
+# Las clases se importan al primer acceso (módulo y clase en agent_manifest.py)
+__getattr__ = lazy_category_exports(__name__, "FINANCE_AGENTS")
 
 __all__ = [
     "FinancialAnalystAgent", "AccountantAgent", "TaxSpecialistAgent",
@@ -3,23 +3,10 @@ AFW v0.5.0 - Categoría: Legal y Compliance
 10 Agentes Especializados en Derecho y Cumplimiento
 """
 
-from .corporate_lawyer import CorporateLawyerAgent
-from .contract_specialist import ContractSpecialistAgent
-from .compliance_officer import ComplianceOfficerAgent
-from .intellectual_property import IntellectualPropertyAgent
-from .labor_law_expert import LaborLawExpertAgent
-from .data_privacy_officer import DataPrivacyOfficerAgent
-from .litigation_specialist import LitigationSpecialistAgent
-from .regulatory_advisor import RegulatoryAdvisorAgent
-from .legal_researcher import LegalResearcherAgent
-from .paralegal_assistant import ParalegalAssistantAgent
+from app.agents.agent_registry import lazy_category_exports
 
-LEGAL_AGENTS = [
-    CorporateLawyerAgent, ContractSpecialistAgent, ComplianceOfficerAgent,
-    IntellectualPropertyAgent, LaborLawExpertAgent, DataPrivacyOfficerAgent,
-    LitigationSpecialistAgent, RegulatoryAdvisorAgent, LegalResearcherAgent,
-    ParalegalAssistantAgent
-]
+# Las clases se importan al primer acceso (módulo y clase en agent_manifest.py)
+__getattr__ = lazy_category_exports(__name__, "LEGAL_AGENTS")
 
 __all__ = [
     "CorporateLawyerAgent", "ContractSpecialistAgent", "ComplianceOfficerAgent",
@@ -3,29 +3,10 @@ AFW v0.5.0 - Categoría: Marketing Digital
 10 Agentes Especializados en Marketing y Publicidad
 """
 
-from .seo_specialist import SEOSpecialistAgent
-from .content_strategist import ContentStrategistAgent
-from .social_media_manager import SocialMediaManagerAgent
-from .email_marketer import EmailMarketerAgent
-from .ppc_specialist import PPCSpecialistAgent
-from .brand_strategist import BrandStrategistAgent
-from .copywriter import CopywriterAgent
-from .analytics_expert import AnalyticsExpertAgent
-from .influencer_coordinator import InfluencerCoordinatorAgent
-from .growth_hacker import GrowthHackerAgent
+from app.agents.agent_registry import lazy_category_exports
 
-MARKETING_AGENTS = [
-    SEOSpecialistAgent,
-    ContentStrategistAgent,
-    SocialMediaManagerAgent,
-    EmailMarketerAgent,
-    PPCSpecialistAgent,
-    BrandStrategistAgent,
-    CopywriterAgent,
-    AnalyticsExpertAgent,
-    InfluencerCoordinatorAgent,
-    GrowthHackerAgent
-]
+# Las clases se importan al primer acceso (módulo y clase en agent_manifest.py)
+__getattr__ = lazy_category_exports(__name__, "MARKETING_AGENTS")
 
 __all__ = [
     "SEOSpecialistAgent",
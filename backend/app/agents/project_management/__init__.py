@@ -3,23 +3,10 @@ AFW v0.5.0 - Categoría: Gestión de Proyectos
 10 Agentes Especializados en Project Management
 """
 
-from .project_manager import ProjectManagerAgent
-from .scrum_master import ScrumMasterAgent
-from .product_owner import ProductOwnerAgent
-from .program_manager import ProgramManagerAgent
-from .pmo_specialist import PMOSpecialistAgent
-from .agile_coach import AgileCoachAgent
-from .change_manager import ChangeManagerAgent
-from .stakeholder_manager import StakeholderManagerAgent
-from .resource_planner import ResourcePlannerAgent
-from .portfolio_manager import PortfolioManagerAgent
+from app.agents.agent_registry import lazy_category_exports
 
-PROJECT_MANAGEMENT_AGENTS = [
-    ProjectManagerAgent, ScrumMasterAgent, ProductOwnerAgent,
-    ProgramManagerAgent, PMOSpecialistAgent, AgileCoachAgent,
-    ChangeManagerAgent, StakeholderManagerAgent, ResourcePlannerAgent,
-    PortfolioManagerAgent
-]
+# Las clases se importan al primer acceso (módulo y clase en agent_manifest.py)
+__getattr__ = lazy_category_exports(__name__, "PROJECT_MANAGEMENT_AGENTS")
 
 __all__ = [
     "ProjectManagerAgent", "ScrumMasterAgent", "ProductOwnerAgent",
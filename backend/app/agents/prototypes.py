@@ -0,0 +1,89 @@
+"""
+AFW - Agent Prototypes
+Prototipos inmutables de agentes compartidos entre peticiones (flyweight).
+
+Cada clase de agente se construye una sola vez: perfil A2A, backstory,
+descripción y system prompt quedan en un prototipo congelado. Una petición
+solo asigna una copia superficial con su contexto de ejecución (model,
+api_config, language); todo lo demás se comparte.
+"""
+
+import copy
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from .agent_registry import get_agent_by_id
+from .base_agent import BaseAgent, shared_llm_adapter
+
+
+@dataclass(frozen=True)
+class AgentPrototype:
+    """Definición inmutable de un agente, construida una vez por proceso"""
+    agent_id: str
+    agent_class: type
+    template: BaseAgent
+    system_prompt: str
+    metadata: Dict[str, Any]
+
+    def instantiate(
+        self,
+        model: Optional[str] = None,
+        api_config: Optional[Dict[str, Any]] = None,
+        language: str = "es"
+    ) -> BaseAgent:
+        """Instancia ligera: comparte el estado del prototipo y solo fija el contexto de ejecución"""
+        agent = copy.copy(self.template)
+        agent.model = model or self.template.model
+        agent.api_config = api_config
+        agent.language = language
+        agent.llm_provider = shared_llm_adapter() if api_config else None
+        return agent
+
+
+class AgentPrototypeRegistry:
+    """Prototipos por agent_id, creados la primera vez que se piden."""
+
+    def __init__(self):
+        self._prototypes: Dict[str, AgentPrototype] = {}
+        self.built = 0
+        self.instantiated = 0
+
+    def get(self, agent_id: str) -> Optional[AgentPrototype]:
+        prototype = self._prototypes.get(agent_id)
+        if prototype is None:
+            agent_info = get_agent_by_id(agent_id)
+            if agent_info is None:
+                return None
+            agent_class = agent_info["class"]
+            template = agent_class()
+            prototype = AgentPrototype(
+                agent_id=agent_id,
+                agent_class=agent_class,
+                template=template,
+                system_prompt=template.get_system_prompt(),
+                metadata=agent_info["metadata"],
+            )
+            self._prototypes[agent_id] = prototype
+            self.built += 1
+        return prototype
+
+    def instantiate(
+        self,
+        agent_id: str,
+        model: Optional[str] = None,
+        api_config: Optional[Dict[str, Any]] = None,
+        language: str = "es"
+    ) -> Optional[BaseAgent]:
+        """Agente listo para ejecutar, o None si el agent_id no está registrado"""
+        prototype = self.get(agent_id)
+        if prototype is None:
+            return None
+        self.instantiated += 1
+        return prototype.instantiate(model=model, api_config=api_config, language=language)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {"prototypes": self.built, "instantiated": self.instantiated}
+
+
+# Registro global compartido por REST, WebSocket y SSE
+agent_prototypes = AgentPrototypeRegistry()
@@ -3,22 +3,10 @@ AFW v0.5.0 - Categoría: Ventas y Comercial
 10 Agentes Especializados en Ventas
 """
 
-from .sales_executive import SalesExecutiveAgent
-from .account_manager import AccountManagerAgent
-from .business_development import BusinessDevelopmentAgent
-from .sales_engineer import SalesEngineerAgent
-from .customer_success import CustomerSuccessAgent
-from .sales_trainer import SalesTrainerAgent
-from .proposal_writer import ProposalWriterAgent
-from .sales_analyst import SalesAnalystAgent
-from .channel_manager import ChannelManagerAgent
-from .crm_specialist import CRMSpecialistAgent
+from app.agents.agent_registry import lazy_category_exports
 
-SALES_AGENTS = [
-    SalesExecutiveAgent, AccountManagerAgent, BusinessDevelopmentAgent,
-    SalesEngineerAgent, CustomerSuccessAgent, SalesTrainerAgent,
-    ProposalWriterAgent, SalesAnalystAgent, ChannelManagerAgent, CRMSpecialistAgent
-]
+# Las clases se importan al primer acceso (módulo y clase en agent_manifest.py)
+__getattr__ = lazy_category_exports(__name__, "SALES_AGENTS")
 
 __all__ = [
     "SalesExecutiveAgent", "AccountManagerAgent", "BusinessDevelopmentAgent",
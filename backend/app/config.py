@@ -4,10 +4,14 @@ Configuración del backend con soporte para múltiples proveedores de IA.
 Groq como proveedor predeterminado, con soporte para APIs locales y otros proveedores.
 """
 import os
+from pathlib import Path
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Directorio de datos del backend (SQLite de conversaciones, checkpoints...)
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
 # API Keys
 GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
@@ -84,6 +88,56 @@ DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./afw.db")
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
 REDIS_KEY = os.getenv("REDIS_KEY", "redis_default_key")
 
+# Caché de respuestas en dos niveles: LRU en proceso delante de Redis
+RESPONSE_CACHE_LOCAL_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_LOCAL_MAX_ENTRIES", 1000))
+RESPONSE_CACHE_LOCAL_TTL = int(os.getenv("RESPONSE_CACHE_LOCAL_TTL", 600))
+
+# Pipeline: máximo de agentes del mismo nivel ejecutándose a la vez
+PIPELINE_MAX_FAN_OUT = int(os.getenv("PIPELINE_MAX_FAN_OUT", 4))
+
+# Workflows: máximo de pasos independientes ejecutándose a la vez por ejecución
+WORKFLOW_MAX_CONCURRENCY = int(os.getenv("WORKFLOW_MAX_CONCURRENCY", 4))
+# Checkpoints por paso de las ejecuciones (SQLite); vacío = desactivados
+WORKFLOW_CHECKPOINT_DB = os.getenv("WORKFLOW_CHECKPOINT_DB", str(DATA_DIR / "workflow_checkpoints.db"))
+
+# Cola de trabajos para pipelines: "" = en la propia petición, "sqlite" o "redis"
+JOB_QUEUE_BACKEND = os.getenv("JOB_QUEUE_BACKEND", "").lower()
+# Ruta absoluta por defecto: la API y `python -m app.services.job_workers` comparten
+# cola aunque se arranquen desde directorios distintos. Guarda en claro las
+# credenciales (`secrets`) de los trabajos pendientes, en reintento o abandonados
+# por un worker caído: el fichero debe quedar dentro de data/ y protegido como tal
+JOB_QUEUE_DB = os.getenv("JOB_QUEUE_DB", str(DATA_DIR / "job_queue.db"))
+# Workers de agentes en este proceso (0 = nodo solo API; workers con `python -m app.services.job_workers`)
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", 4))
+# Segundos que un trabajo reservado queda invisible para otros workers sin heartbeat
+JOB_VISIBILITY_TIMEOUT = float(os.getenv("JOB_VISIBILITY_TIMEOUT", 120))
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", 3))
+# Espera máxima de /api/chat por el resultado de su trabajo
+JOB_RESULT_TIMEOUT = float(os.getenv("JOB_RESULT_TIMEOUT", 600))
+
+# Bus de mensajes de WebSocket entre procesos: "memory" (un proceso) o "redis"
+MESSAGE_BUS_BACKEND = os.getenv("MESSAGE_BUS_BACKEND", "memory").lower()
+
+# Registro de eventos de pipelines para reanudar streams: "memory" o "redis"
+EVENT_LOG_BACKEND = os.getenv("EVENT_LOG_BACKEND", "memory").lower()
+# Eventos por stream: respuestas/estado y, aparte, deltas y progreso (descartables)
+EVENT_LOG_MAX_EVENTS = int(os.getenv("EVENT_LOG_MAX_EVENTS", 500))
+EVENT_LOG_MAX_TRANSIENT = int(os.getenv("EVENT_LOG_MAX_TRANSIENT", 2000))
+EVENT_LOG_MAX_STREAMS = int(os.getenv("EVENT_LOG_MAX_STREAMS", 1000))
+EVENT_LOG_TTL = float(os.getenv("EVENT_LOG_TTL", 900))
+# Segundos que un pipeline sigue corriendo tras desconectarse su cliente (0 = cancelar al momento)
+PIPELINE_RESUME_GRACE = float(os.getenv("PIPELINE_RESUME_GRACE", 30))
+
+# Frames pendientes por conexión WebSocket antes de fusionar/descartar progreso y deltas
+WS_SEND_QUEUE_SIZE = int(os.getenv("WS_SEND_QUEUE_SIZE", 256))
+# Plazo de cada escritura en un socket; si vence, el cliente se da por muerto
+WS_SEND_TIMEOUT = float(os.getenv("WS_SEND_TIMEOUT", 10))
+# Espera máxima de un broadcast por las entregas antes de informar el recuento
+WS_BROADCAST_TIMEOUT = float(os.getenv("WS_BROADCAST_TIMEOUT", 5))
+# Compresión permessage-deflate de los frames WebSocket (se negocia en el handshake
+# si el cliente la ofrece; la CLI de uvicorn la activa igual por defecto)
+WS_PER_MESSAGE_DEFLATE = os.getenv("WS_PER_MESSAGE_DEFLATE", "true").lower() == "true"
+
 # Server config
 HOST = os.getenv("HOST", "0.0.0.0")
 PORT = int(os.getenv("PORT", 8001))
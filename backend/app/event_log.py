@@ -0,0 +1,317 @@
+"""
+Pipeline Event Log v1.0.0
+=========================
+Registro acotado y secuenciado de los eventos de cada pipeline, para que un
+cliente que se reconecta recupere lo que se perdió sin volver a ejecutarlo.
+
+- Cada stream (sesión WebSocket o stream SSE) numera sus eventos con `seq`
+  creciente; el cliente reanuda con el último que vio (`last_seq` en el
+  WebSocket, `Last-Event-ID` en SSE)
+- Los frames transitorios (deltas de tokens, progreso) van en un anillo
+  aparte y más corto: aunque se descarten, las respuestas completas de los
+  agentes (`agent_response`, el resumen...) siguen en el registro, así una
+  reconexión nunca vuelve a pagar llamadas LLM ya hechas
+- Los streams caducan tras EVENT_LOG_TTL segundos sin actividad
+
+Dos implementaciones con la misma interfaz:
+- InMemoryEventLog: un solo proceso (por defecto, y la que usan los tests)
+- RedisEventLog: Redis Streams, compartido entre procesos (p. ej. con los
+  workers de job_workers en otra máquina)
+"""
+
+import asyncio
+import contextvars
+import heapq
+import json
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from app.config import (
+    EVENT_LOG_BACKEND,
+    EVENT_LOG_MAX_EVENTS,
+    EVENT_LOG_MAX_TRANSIENT,
+    EVENT_LOG_MAX_STREAMS,
+    EVENT_LOG_TTL,
+    REDIS_URL,
+)
+
+# Frames que se pueden perder sin perder resultados
+TRANSIENT_TYPES = frozenset({"agent_delta", "agent_progress"})
+
+# Stream de eventos del pipeline que corre en este contexto (tarea asyncio):
+# los envíos del ConnectionManager a ese client_id se registran y llevan `event_seq`
+# (el `seq` propio de los frames agent_delta es el índice del delta del agente)
+event_stream: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("event_stream", default=None)
+
+Event = Tuple[int, Dict[str, Any]]
+
+
+def is_transient(frame: Dict[str, Any]) -> bool:
+    return frame.get("type") in TRANSIENT_TYPES
+
+
+@dataclass
+class EventReplay:
+    """Eventos posteriores a un seq, más el estado del stream"""
+    events: List[Event]
+    after_seq: int = 0
+    last_seq: int = 0
+    found: bool = True
+    closed: bool = False
+
+    @property
+    def truncated(self) -> bool:
+        """El cliente no puede reconstruir todo desde after_seq (eventos descartados o stream caducado)"""
+        if not self.found or self.after_seq > self.last_seq:
+            return self.after_seq > 0
+        # Cada seq está en un solo anillo: si faltan, se descartaron por tamaño
+        return len(self.events) < self.last_seq - self.after_seq
+
+
+class PipelineEventLog:
+    """Interfaz común: append, replay, close_stream y follow (replay + eventos en vivo)"""
+
+    backend = "none"
+
+    def __init__(self):
+        self.appended = 0
+        self.replayed = 0
+
+    async def open_stream(self, stream: str) -> None:
+        """Crea el stream vacío (un follow() espera sus eventos en vez de terminar)"""
+        raise NotImplementedError
+
+    async def append(self, stream: str, frame: Dict[str, Any]) -> int:
+        """Registra un frame y devuelve su seq"""
+        raise NotImplementedError
+
+    async def replay(self, stream: str, after_seq: int = 0) -> EventReplay:
+        """Eventos con seq > after_seq, en orden"""
+        raise NotImplementedError
+
+    async def close_stream(self, stream: str) -> None:
+        """Marca el stream como terminado (los follow() acaban tras el último evento)"""
+        raise NotImplementedError
+
+    async def _wait(self, stream: str, after_seq: int, timeout: float) -> None:
+        """Espera (como mucho `timeout`) a que haya eventos posteriores a after_seq"""
+        raise NotImplementedError
+
+    async def follow(self, stream: str, after_seq: int = 0, poll: float = 1.0) -> AsyncIterator[Event]:
+        """Reproduce lo pendiente y sigue entregando eventos hasta que el stream se cierra"""
+        while True:
+            replay = await self.replay(stream, after_seq)
+            for seq, frame in replay.events:
+                yield seq, frame
+                after_seq = seq
+            if replay.closed or not replay.found:
+                return
+            await self._wait(stream, after_seq, poll)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend,
+            "appended": self.appended,
+            "replayed": self.replayed,
+        }
+
+    async def close(self) -> None:
+        pass
+
+
+@dataclass
+class _Stream:
+    durable: deque
+    transient: deque
+    last_seq: int = 0
+    closed: bool = False
+    updated_at: float = field(default_factory=time.monotonic)
+    changed: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class InMemoryEventLog(PipelineEventLog):
+    """Registro en proceso: dos anillos por stream y LRU de streams"""
+
+    backend = "memory"
+
+    def __init__(
+        self,
+        max_events: int = EVENT_LOG_MAX_EVENTS,
+        max_transient: int = EVENT_LOG_MAX_TRANSIENT,
+        max_streams: int = EVENT_LOG_MAX_STREAMS,
+        ttl: float = EVENT_LOG_TTL
+    ):
+        super().__init__()
+        self.max_events = max_events
+        self.max_transient = max_transient
+        self.max_streams = max_streams
+        self.ttl = ttl
+        self._streams: "OrderedDict[str, _Stream]" = OrderedDict()
+
+    def _prune(self) -> None:
+        now = time.monotonic()
+        while self._streams:
+            oldest = next(iter(self._streams.values()))
+            if len(self._streams) <= self.max_streams and now - oldest.updated_at < self.ttl:
+                break
+            self._streams.popitem(last=False)
+
+    def _get(self, stream: str) -> Optional[_Stream]:
+        entry = self._streams.get(stream)
+        if entry is not None and time.monotonic() - entry.updated_at >= self.ttl:
+            del self._streams[stream]
+            return None
+        return entry
+
+    def _get_or_create(self, stream: str) -> _Stream:
+        entry = self._get(stream)
+        if entry is None:
+            entry = _Stream(deque(maxlen=self.max_events), deque(maxlen=self.max_transient))
+            self._streams[stream] = entry
+            self._prune()
+        return entry
+
+    async def open_stream(self, stream: str) -> None:
+        self._get_or_create(stream)
+
+    async def append(self, stream: str, frame: Dict[str, Any]) -> int:
+        entry = self._get_or_create(stream)
+        entry.last_seq += 1
+        entry.closed = False
+        entry.updated_at = time.monotonic()
+        (entry.transient if is_transient(frame) else entry.durable).append((entry.last_seq, frame))
+        self._streams.move_to_end(stream)
+        self._prune()
+        self.appended += 1
+        # Despierta a los follow() en espera
+        entry.changed.set()
+        entry.changed = asyncio.Event()
+        return entry.last_seq
+
+    async def replay(self, stream: str, after_seq: int = 0) -> EventReplay:
+        entry = self._get(stream)
+        if entry is None:
+            return EventReplay(events=[], after_seq=after_seq, found=False)
+        events = list(heapq.merge(
+            (event for event in entry.durable if event[0] > after_seq),
+            (event for event in entry.transient if event[0] > after_seq),
+            key=lambda event: event[0],
+        ))
+        self.replayed += len(events)
+        return EventReplay(events=events, after_seq=after_seq, last_seq=entry.last_seq, closed=entry.closed)
+
+    async def close_stream(self, stream: str) -> None:
+        entry = self._get(stream)
+        if entry is not None:
+            entry.closed = True
+            entry.changed.set()
+            entry.changed = asyncio.Event()
+
+    async def _wait(self, stream: str, after_seq: int, timeout: float) -> None:
+        entry = self._get(stream)
+        if entry is None or entry.closed or entry.last_seq > after_seq:
+            return
+        try:
+            await asyncio.wait_for(entry.changed.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        return dict(super().get_stats(), streams=len(self._streams))
+
+
+# INCR del seq y XADD en un paso: los lectores nunca ven un seq mayor sin los anteriores
+_LUA_APPEND = """
+local seq = redis.call('INCR', KEYS[1])
+redis.call('XADD', KEYS[2], 'MAXLEN', ARGV[2], seq .. '-0', 'f', ARGV[1])
+redis.call('HDEL', KEYS[4], 'closed')
+for i = 1, 4 do redis.call('EXPIRE', KEYS[i], ARGV[3]) end
+return seq
+"""
+
+
+class RedisEventLog(PipelineEventLog):
+    """Registro en Redis Streams (anillos durable/transitorio con MAXLEN, id = seq)"""
+
+    backend = "redis"
+
+    def __init__(
+        self,
+        redis_url: str = REDIS_URL,
+        prefix: str = "afw:events:",
+        max_events: int = EVENT_LOG_MAX_EVENTS,
+        max_transient: int = EVENT_LOG_MAX_TRANSIENT,
+        ttl: float = EVENT_LOG_TTL
+    ):
+        super().__init__()
+        import redis.asyncio as aioredis
+        self.redis = aioredis.from_url(redis_url, decode_responses=True)
+        self.prefix = prefix
+        self.max_events = max_events
+        self.max_transient = max_transient
+        self.ttl = int(ttl)
+        self._append_script = self.redis.register_script(_LUA_APPEND)
+
+    def _keys(self, stream: str) -> List[str]:
+        base = f"{self.prefix}{stream}"
+        return [f"{base}:seq", f"{base}:durable", f"{base}:transient", f"{base}:meta"]
+
+    async def open_stream(self, stream: str) -> None:
+        await self.redis.set(self._keys(stream)[0], 0, nx=True, ex=self.ttl)
+
+    async def append(self, stream: str, frame: Dict[str, Any]) -> int:
+        seq_key, durable, transient, meta = self._keys(stream)
+        target, other, maxlen = (
+            (transient, durable, self.max_transient) if is_transient(frame) else (durable, transient, self.max_events)
+        )
+        seq = await self._append_script(
+            keys=[seq_key, target, other, meta],
+            args=[json.dumps(frame, default=str, ensure_ascii=False), maxlen, self.ttl],
+        )
+        self.appended += 1
+        return int(seq)
+
+    async def replay(self, stream: str, after_seq: int = 0) -> EventReplay:
+        seq_key, durable, transient, meta = self._keys(stream)
+        start = f"{after_seq + 1}-0"
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.get(seq_key)
+            pipe.xrange(durable, min=start)
+            pipe.xrange(transient, min=start)
+            pipe.hget(meta, "closed")
+            last_seq, durable_events, transient_events, closed = await pipe.execute()
+        if last_seq is None:
+            return EventReplay(events=[], after_seq=after_seq, found=False)
+        events = list(heapq.merge(
+            ((int(entry_id.split("-")[0]), json.loads(fields["f"])) for entry_id, fields in durable_events),
+            ((int(entry_id.split("-")[0]), json.loads(fields["f"])) for entry_id, fields in transient_events),
+            key=lambda event: event[0],
+        ))
+        self.replayed += len(events)
+        return EventReplay(events=events, after_seq=after_seq, last_seq=int(last_seq), closed=bool(closed))
+
+    async def close_stream(self, stream: str) -> None:
+        meta = self._keys(stream)[3]
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(meta, "closed", "1")
+            pipe.expire(meta, self.ttl)
+            await pipe.execute()
+
+    async def _wait(self, stream: str, after_seq: int, timeout: float) -> None:
+        _, durable, transient, _ = self._keys(stream)
+        last_id = f"{after_seq}-0"
+        await self.redis.xread({durable: last_id, transient: last_id}, count=1, block=int(timeout * 1000))
+
+    async def close(self) -> None:
+        await self.redis.aclose()
+
+
+def create_event_log(backend: str = EVENT_LOG_BACKEND) -> PipelineEventLog:
+    """Registro según la configuración; en memoria salvo EVENT_LOG_BACKEND=redis"""
+    if backend == "redis":
+        return RedisEventLog(REDIS_URL)
+    if backend not in ("", "memory"):
+        print(f"⚠️ EVENT_LOG_BACKEND desconocido: {backend!r}; usando registro en memoria")
+    return InMemoryEventLog()
@@ -30,12 +30,13 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.config import (
     CORS_ORIGINS, MODELS, HOST, PORT, 
-    CORS_ALLOW_CREDENTIALS, CORS_ALLOW_METHODS, CORS_ALLOW_HEADERS, CORS_MAX_AGE
+    CORS_ALLOW_CREDENTIALS, CORS_ALLOW_METHODS, CORS_ALLOW_HEADERS, CORS_MAX_AGE,
+    JOB_WORKERS, PIPELINE_RESUME_GRACE, WS_PER_MESSAGE_DEFLATE
 )
 from app.models import ChatRequest, ChatResponse, HealthResponse, AgentInfo
 from app.api_models import fetch_available_models, get_model_description
 from pydantic import BaseModel, validator
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Literal
 
 # Importar sistema de seguridad v0.8.0
 from app.validators import (
@@ -53,7 +54,7 @@ from app.auth import (
 )
 
 # Importar nuevo sistema de agentes con Arquitectura Hexagonal
-from src.infrastructure.adapters.external.langgraph_orchestrator import LangGraphOrchestratorAdapter as AgentOrchestrator
+from src.infrastructure.adapters.external.langgraph_orchestrator import langgraph_orchestrator
 from src.infrastructure.adapters.external.openai_adapter import OpenAILLMAdapter
 from src.infrastructure.adapters.external.llm_provider_factory import LLMProviderFactory
 from src.infrastructure.adapters.persistence.in_memory_agent_repository import InMemoryAgentRepository
@@ -66,17 +67,25 @@ from app.agents.registry import (
 )
 from app.agents.agent_registry import AGENT_REGISTRY, get_agent_by_id
 
-# Importar todos los agentes de las 12 categorías
-from app.agents import *
+# Los módulos de agentes se cargan al primer uso (manifiesto en app.agents.agent_manifest)
+from app.agents.capability_index import capability_index
+from app.agents.prototypes import agent_prototypes
 
-# Instancia global del orchestrator
-orchestrator = AgentOrchestrator()
+# Instancia global del orchestrator (grafo compilado una vez, compartido por todas las peticiones)
+orchestrator = langgraph_orchestrator
 
 from app.websocket_manager import manager
+from app.event_log import event_stream
+from app.wire_codec import LEAN_FRAMES, lean_frame, negotiate_codec
 from app.services.streaming_pipeline import StreamingAgentPipeline
 from app.formatters.human_formatter import HumanResponseFormatter
 from app.services.online_users_tracker import get_tracker
 from app.services.conversation_service import get_conversation_service
+from app.services.cache_manager import set_cache_policy
+from app.services.pipeline_tasks import pipeline_tasks
+from app.services.pipeline_jobs import submit_chat, submit_ws_pipeline
+from app.services.job_queue import get_job_queue
+from src.infrastructure.adapters.external.token_budget import task_token_limit, count_tokens, truncate_to_tokens
 
 # AFW v0.5.0 - El sistema ahora usa 120 agentes definidos en el registry
 
@@ -107,6 +116,12 @@ async def lifespan(app: FastAPI):
     tracker = get_tracker(os.getenv("REDIS_URL", "redis://localhost:6379"))
     print("✅ Tracker de usuarios en línea listo")
     
+    # Inicializar caché de respuestas (LRU en proceso + Redis)
+    print("🗃️ Inicializando caché de respuestas...")
+    from app.services.cache_manager import get_cache_manager
+    get_cache_manager(os.getenv("REDIS_URL", "redis://localhost:6379"))
+    print("✅ Caché de respuestas listo")
+    
     # Inicializar servicio de conversaciones
     print("💬 Inicializando servicio de conversaciones...")
     from app.services.conversation_service import get_conversation_service
@@ -118,8 +133,29 @@ async def lifespan(app: FastAPI):
     app.state.save_conv_use_case = get_save_conversation_use_case()
     app.state.execute_task_use_case = get_execute_task_use_case()
     
+    # Cola de trabajos de pipelines y workers de agentes en este proceso (opcional)
+    job_queue = get_job_queue()
+    job_workers = None
+    if job_queue is not None:
+        print(f"📬 Cola de trabajos: {job_queue.backend}")
+        if JOB_WORKERS > 0:
+            from app.services.job_workers import JobWorkerPool
+            job_workers = JobWorkerPool(job_queue)
+            await job_workers.start()
+    app.state.job_workers = job_workers
+    
     yield
     print("👋 Agentic Task Platform cerrando...")
+    
+    if job_workers is not None:
+        await job_workers.stop()
+    if job_queue is not None:
+        await job_queue.close()
+    await manager.close()
+    
+    # Cerrar conexiones HTTP de los clientes LLM compartidos
+    from src.infrastructure.adapters.external.llm_client_pool import llm_client_pool
+    await llm_client_pool.close_all()
 
 
 app = FastAPI(
@@ -365,8 +401,8 @@ async def chat(request: ChatRequest):
                 detail=f"Invalid agents: {invalid_agents}"
             )
         
-        # Create orchestrator with selected agents
-        orchestrator = AgentOrchestrator()
+        # Política de caché de respuestas para esta petición
+        set_cache_policy(request.cache)
         
         # Convert ApiConfig to dict if present
         api_config_dict = None
@@ -377,48 +413,14 @@ async def chat(request: ChatRequest):
                 "base_url": request.apiConfig.baseUrl,
             }
         
-        # Map agent IDs to agent instances with model configuration
-        agent_map = {
-            "reasoning": ReasoningAgent(model=request.model, api_config=api_config_dict),
-            "planning": PlanningAgent(model=request.model, api_config=api_config_dict),
-            "research": ResearchAgent(model=request.model, api_config=api_config_dict),
-            "analysis": AnalysisAgent(model=request.model, api_config=api_config_dict),
-            "synthesis": SynthesisAgent(model=request.model, api_config=api_config_dict),
-            "critical_thinking": CriticalThinkingAgent(model=request.model, api_config=api_config_dict),
-            "coding": CodingAgent(model=request.model, api_config=api_config_dict),
-            "data": DataAgent(model=request.model, api_config=api_config_dict),
-            "writing": WritingAgent(model=request.model, api_config=api_config_dict),
-            "communication": CommunicationAgent(model=request.model, api_config=api_config_dict),
-            "decision": DecisionAgent(model=request.model, api_config=api_config_dict),
-            "problem_solving": ProblemSolvingAgent(model=request.model, api_config=api_config_dict),
-            "legal": LegalAgent(model=request.model, api_config=api_config_dict),
-            "financial": FinancialAgent(model=request.model, api_config=api_config_dict),
-            "creative": CreativeAgent(model=request.model, api_config=api_config_dict),
-            "technical": TechnicalAgent(model=request.model, api_config=api_config_dict),
-            "educational": EducationalAgent(model=request.model, api_config=api_config_dict),
-            "marketing": MarketingAgent(model=request.model, api_config=api_config_dict),
-            "qa": QAAgent(model=request.model, api_config=api_config_dict),
-            "documentation": DocumentationAgent(model=request.model, api_config=api_config_dict),
-            "optimization": OptimizationAgent(model=request.model, api_config=api_config_dict),
-            "security": SecurityAgent(model=request.model, api_config=api_config_dict),
-            "integration": IntegrationAgent(model=request.model, api_config=api_config_dict),
-            "review": ReviewAgent(model=request.model, api_config=api_config_dict),
-            "translation": TranslationAgent(model=request.model, api_config=api_config_dict),
-            "summary": SummaryAgent(model=request.model, api_config=api_config_dict),
-            "formatting": FormattingAgent(model=request.model, api_config=api_config_dict),
-            "validation": ValidationAgent(model=request.model, api_config=api_config_dict),
-            "coordination": CoordinationAgent(model=request.model, api_config=api_config_dict),
-            "explanation": ExplanationAgent(model=request.model, api_config=api_config_dict),
-        }
-        
-        # Get selected agent instances
-        selected_agents = [agent_map[agent_id] for agent_id in request.agents if agent_id in agent_map]
-        
-        # Execute task with orchestrator
-        result = await orchestrator.run_workflow(
-            task=request.message,
-            agents=selected_agents,
-            context=request.context or {}
+        # Ejecutar el workflow (en la cola de trabajos si está configurada)
+        result = await submit_chat(
+            request.message,
+            request.agents,
+            request.model,
+            api_config=api_config_dict,
+            context=request.context or {},
+            cache=request.cache
         )
         
         return ChatResponse(
@@ -450,38 +452,47 @@ class QuickChatRequest(BaseModel):
     message: str
     model: str = "openai/gpt-oss-120b"
     apiConfig: Optional[Dict[str, Any]] = None
+    agents: Optional[List[str]] = None
+    max_agents: int = 3
+
+
+# Especialistas por defecto cuando el router no encuentra coincidencias
+QUICK_CHAT_FALLBACK_AGENTS = ("project_manager", "financial_analyst", "content_strategist")
 
 
 @app.post("/api/quick-chat")
 async def quick_chat(request: QuickChatRequest):
     """
-    Quick chat endpoint - uses default agents for simple queries
+    Quick chat endpoint - elige los especialistas con el índice de capacidades
+    (BM25, sin llamada de planificación al LLM) y los ejecuta en paralelo.
     Requires API key configuration for LLM calls
     """
     if not request.message.strip():
         raise HTTPException(status_code=400, detail="Message cannot be empty")
-    
-    default_agents = ["reasoning", "synthesis"]
-    
-    orchestrator = AgentOrchestrator()
-    
-    agent_map = {
-        "reasoning": ReasoningAgent(model=request.model, api_config=request.apiConfig),
-        "synthesis": SynthesisAgent(model=request.model, api_config=request.apiConfig),
-    }
-    
-    selected_agents = [agent_map[agent_id] for agent_id in default_agents]
-    
-    result = await orchestrator.run_workflow(
-        task=request.message,
-        agents=selected_agents,
-        context={}
+
+    max_agents = max(1, min(request.max_agents, 5))
+    matches = capability_index.search(request.message, k=max_agents)
+    if request.agents:
+        agent_ids = request.agents[:max_agents]
+    else:
+        agent_ids = [m.agent_id for m in matches] or list(QUICK_CHAT_FALLBACK_AGENTS[:max_agents])
+
+    agents = create_agent_instances(agent_ids, request.model, request.apiConfig)
+    if not agents:
+        raise HTTPException(status_code=400, detail=f"No valid agents for: {agent_ids}")
+
+    responses = await asyncio.gather(*(agent.execute(request.message) for agent in agents))
+    result = "\n\n".join(
+        f"## {AGENT_DEFINITIONS.get(agent.agent_id, {}).get('emoji', '🤖')} {agent.name}\n\n{response}" if len(agents) > 1 else response
+        for agent, response in zip(agents, responses)
     )
-    
+
     return {
         "success": True,
-        "result": result.get("final_result", ""),
+        "result": result,
         "model": request.model,
+        "agents_used": [agent.agent_id for agent in agents],
+        "routing": [m.to_dict() for m in matches],
     }
 
 
@@ -495,21 +506,15 @@ def create_agent_instances(agents_list: List[str], model: str, api_config: Optio
     instances = []
     
     for agent_id in agents_list:
-        # Buscar agente en el registry
-        agent_info = get_agent_by_id(agent_id)
-        
-        if agent_info:
-            agent_class = agent_info['class']
-            print(f"🤖 Creando agente {agent_id} ({agent_info['metadata']['name']}) con api_config: {bool(api_config)}")
-            
-            try:
-                # Crear instancia del agente con configuración
-                instance = agent_class(model=model, api_config=api_config)
-                instances.append(instance)
-            except Exception as e:
-                print(f"⚠️ Error creando agente {agent_id}: {e}")
-                # Continuar con los demás agentes
-                continue
+        # Copia ligera del prototipo del agente: solo model, api_config y language son por petición
+        try:
+            instance = agent_prototypes.instantiate(agent_id, model=model, api_config=api_config, language=language)
+        except Exception as e:
+            print(f"⚠️ Error creando agente {agent_id}: {e}")
+            # Continuar con los demás agentes
+            continue
+        if instance is not None:
+            instances.append(instance)
         else:
             print(f"⚠️ Agente {agent_id} no encontrado en el registry")
     
@@ -526,6 +531,197 @@ class StreamingChatRequest(BaseModel):
     model: str = "openai/gpt-4o-mini"
     apiConfig: Optional[Dict[str, Any]] = None
     language: str = "es"
+    stream: bool = True
+    cache: Literal["prefer", "bypass"] = "bypass"
+
+
+async def _run_ws_pipeline(session_id: str, client_id: str, data: Dict[str, Any], run_id: str):
+    """
+    Ejecuta un `start_pipeline` del WebSocket. Corre como tarea de la sesión
+    (ver pipeline_tasks): se puede cancelar sin bloquear el bucle de recepción.
+    Los frames que envía a la sesión quedan en el registro de eventos con su event_seq.
+    """
+    event_stream.set(session_id)
+    
+    # Validar y sanitizar datos de entrada
+    message = data.get("message", "")
+    print(f"📝 Message length: {len(message)} chars, preview: {message[:100]}...")
+    
+    # Validar mensaje vacío
+    if not message or not message.strip():
+        await manager.send_json(session_id, {
+            "type": "error",
+            "message": "El mensaje no puede estar vacío"
+        })
+        return
+    
+    # Validar modelo (el presupuesto de tokens depende de su ventana)
+    model = SecurityValidator.validate_model_name(data.get("model", "openai/gpt-4o-mini"))
+    
+    # Truncar mensajes que no caben en el presupuesto de tokens del modelo
+    max_message_tokens = task_token_limit(model)
+    message_tokens = count_tokens(message, model)
+    if message_tokens > max_message_tokens:
+        print(f"⚠️ Message too long ({message_tokens} tokens), truncating to {max_message_tokens}")
+        message = truncate_to_tokens(message, max_message_tokens, model)
+        await manager.send_json(session_id, {
+            "type": "warning",
+            "message": f"⚠️ Mensaje truncado a {max_message_tokens} tokens para {model} (original: {message_tokens} tokens)"
+        })
+    
+    # Sanitizar mensaje (la longitud ya está acotada por tokens)
+    message = SecurityValidator.sanitize_text(message, max_length=None)
+    
+    agents_list = data.get("agents", [])
+    print(f"🤖 Agents requested: {agents_list}")
+    
+    api_config = data.get("apiConfig")
+    language = data.get("language", "es")
+    stream_tokens = bool(data.get("stream", True))
+    cache = set_cache_policy(data.get("cache"))
+    
+    # Validar agentes
+    valid_agents = SecurityValidator.validate_agent_list(agents_list)
+    print(f"✅ Valid agents: {valid_agents}")
+    
+    if not valid_agents:
+        print(f"❌ No valid agents found from: {agents_list}")
+        await manager.send_json(session_id, {
+            "type": "error",
+            "message": "No valid agents selected"
+        })
+        return
+    
+    # Validar configuración de API
+    if api_config:
+        api_config = SecurityValidator.validate_api_config(api_config)
+        if api_config:
+            api_config = {
+                "type": api_config.get("type", "openai"),
+                "api_key": api_config.get("apiKey", ""),
+                "base_url": api_config.get("baseUrl"),
+            }
+            print(f"🔑 API Config validada: type={api_config.get('type')}, has_key={bool(api_config.get('api_key'))}")
+    else:
+        print(f"⚠️ No se recibió apiConfig válida, usando fallback")
+    
+    # Crear instancias de agentes
+    print(f"🔨 Creating agent instances...")
+    agent_instances = create_agent_instances(valid_agents, model, api_config, language=language)
+    print(f"✅ Created {len(agent_instances)} agent instances")
+    
+    # Crear pipeline de streaming
+    print(f"🚀 Creating streaming pipeline...")
+    pipeline = StreamingAgentPipeline(
+        agent_instances, AGENT_DEFINITIONS, language=language, stream_tokens=stream_tokens
+    )
+    print(f"✅ Pipeline created successfully")
+    
+    # Enviar confirmación de inicio
+    await manager.send_json(session_id, {
+        "type": "pipeline_started",
+        "agents": valid_agents,
+        "model": model,
+        "message_count": len(valid_agents),
+        "cache": cache,
+        "run_id": run_id
+    })
+    
+    # Ejecutar pipeline con streaming
+    print(f"🔄 Starting pipeline execution...")
+    try:
+        async for response in pipeline.execute_with_streaming(
+            task=message,
+            client_id=session_id,
+            context={"authenticated": True, "session_id": session_id}
+        ):
+            # Las respuestas ya se envían dentro del pipeline
+            if response.get("type") != "agent_delta":
+                print(f"📤 Pipeline response: {type(response)}")
+        print(f"✅ Pipeline execution completed")
+    except asyncio.CancelledError:
+        # cancel_pipeline, desconexión o un pipeline nuevo en la sesión: no se persiste
+        print(f"🛑 Pipeline {run_id} cancelado: session_id={session_id}")
+        raise
+    except Exception as e:
+        print(f"❌ Pipeline execution error: {e}")
+        import traceback
+        traceback.print_exc()
+        await manager.send_json(session_id, {
+            "type": "error",
+            "message": f"Pipeline execution error: {str(e)}"
+        })
+    
+    # PERSISTENCIA v0.8.0 - Guardar conversación automáticamente
+    try:
+        conv_service = get_conversation_service()
+        user_id = client_id  # Usar client_id como user_id para usuarios no autenticados
+        
+        conv_id = data.get("conversation_id")
+        
+        # Si no hay conversation_id, crear una nueva conversación
+        if not conv_id:
+            conv_id = await conv_service.create_conversation(
+                user_id=user_id,
+                title=message[:100] if len(message) > 100 else message,
+                model=model,
+                agents=valid_agents
+            )
+            print(f"💾 Nueva conversación creada: {conv_id}")
+        
+        # Guardar mensaje del usuario
+        await conv_service.add_message(
+            conversation_id=conv_id,
+            role="user",
+            content=message
+        )
+        
+        # Guardar respuestas de agentes
+        results = getattr(pipeline, 'results', [])
+        for r in results:
+            await conv_service.add_message(
+                conversation_id=conv_id,
+                role="assistant",
+                content=r.get("raw_content", r.get("content", "")),
+                agent_id=r.get("agent_id"),
+                metadata={
+                    "agent_name": r.get("agent_name"),
+                    "level": r.get("level"),
+                    "sections": r.get("sections", [])
+                }
+            )
+        
+        # Informar al cliente del ID de conversación
+        await manager.send_json(session_id, {
+            "type": "conversation_saved",
+            "conversation_id": conv_id,
+            "title": message[:100] if len(message) > 100 else message
+        })
+        
+        print(f"💾 Conversación guardada: {conv_id}")
+    except Exception as e:
+        print(f"⚠️ Error al persistir conversación: {e}")
+
+
+async def _resume_ws_session(session_id: str, last_seq: int):
+    """Reenvía los eventos posteriores a `last_seq` y el estado del pipeline de la sesión"""
+    summary = await manager.replay(session_id, last_seq)
+    run = pipeline_tasks.get(session_id)
+    running = run is not None and not run.task.done()
+    await manager.send_json(session_id, {
+        "type": "replay_complete",
+        **summary,
+        "running": running,
+        "run_id": run.run_id if running else None,
+        "timestamp": datetime.utcnow().isoformat()
+    })
+
+
+def _parse_seq(value: Any) -> Optional[int]:
+    try:
+        return max(0, int(value))
+    except (TypeError, ValueError):
+        return None
 
 
 @app.websocket("/ws/{client_id}")
@@ -533,6 +729,14 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
     """
     WebSocket endpoint sin autenticación para streaming de respuestas de agentes en tiempo real.
     
+    Reanudación: al reconectar con `?last_seq=N` (o la acción `resume` con
+    `last_seq`) se reenvían los eventos del pipeline con `event_seq` > N. Un
+    pipeline sigue corriendo PIPELINE_RESUME_GRACE segundos tras desconectarse.
+    
+    Codificación: `?encoding=msgpack` (frames binarios) y `?frames=lean`
+    (respuestas de agentes con offsets en raw_content); el frame `connected`
+    indica lo negociado. permessage-deflate se negocia en el handshake.
+    
     v0.8.0 - Sin autenticación para desarrollo/pruebas
     """
     try:
@@ -545,13 +749,17 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
         # Obtener metadata del usuario
         user_agent = websocket.headers.get("user-agent", "")
         device_type = _detect_device_type(user_agent)
+        codec = negotiate_codec(
+            websocket.query_params.get("encoding"),
+            websocket.query_params.get("frames")
+        )
         
         # Conectar con session_id y metadata
         await manager.connect(websocket, session_id, {
             "user_id": user_id,
             "device_type": device_type,
             "user_agent": user_agent
-        })
+        }, codec=codec)
         
         # Registrar en tracker de usuarios en línea
         tracker = get_tracker()
@@ -564,14 +772,23 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
             device_type=device_type
         )
         
+        # Reconexión a tiempo: el pipeline en curso no se cancela
+        resumed_run = pipeline_tasks.keep(session_id)
+        
         # Enviar mensaje de bienvenida
         await manager.send_json(session_id, {
             "type": "connected",
             "message": "WebSocket conectado exitosamente",
             "client_id": client_id,
+            "run_id": resumed_run.run_id if resumed_run else None,
+            **codec.to_dict(),
             "timestamp": datetime.utcnow().isoformat()
         })
         
+        last_seq = _parse_seq(websocket.query_params.get("last_seq"))
+        if last_seq is not None:
+            await _resume_ws_session(session_id, last_seq)
+        
     except WebSocketDisconnect:
         print(f"❌ WebSocket desconectado durante autenticación: {client_id}")
         return
@@ -587,155 +804,23 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
             
             if data.get("action") == "start_pipeline":
                 print(f"🚀 Pipeline request received: {data}")
-                
-                # Validar y sanitizar datos de entrada
-                message = data.get("message", "")
-                print(f"📝 Message length: {len(message)} chars, preview: {message[:100]}...")
-                
-                # Validar mensaje vacío
-                if not message or not message.strip():
-                    await manager.send_json(session_id, {
-                        "type": "error",
-                        "message": "El mensaje no puede estar vacío"
-                    })
-                    continue
-                
-                # Truncar mensajes muy largos con advertencia
-                MAX_MESSAGE_LENGTH = 10000
-                if len(message) > MAX_MESSAGE_LENGTH:
-                    print(f"⚠️ Message too long ({len(message)} chars), truncating to {MAX_MESSAGE_LENGTH}")
-                    message = message[:MAX_MESSAGE_LENGTH]
-                    await manager.send_json(session_id, {
-                        "type": "warning",
-                        "message": f"⚠️ Mensaje truncado a {MAX_MESSAGE_LENGTH} caracteres (original: {len(data.get('message', ''))} caracteres)"
-                    })
-                
-                # Sanitizar mensaje
-                message = SecurityValidator.sanitize_text(message)
-                
-                agents_list = data.get("agents", [])
-                print(f"🤖 Agents requested: {agents_list}")
-                
-                model = data.get("model", "openai/gpt-4o-mini")
-                api_config = data.get("apiConfig")
-                language = data.get("language", "es")
-                
-                # Validar agentes
-                valid_agents = SecurityValidator.validate_agent_list(agents_list)
-                print(f"✅ Valid agents: {valid_agents}")
-                
-                if not valid_agents:
-                    print(f"❌ No valid agents found from: {agents_list}")
-                    await manager.send_json(session_id, {
-                        "type": "error",
-                        "message": "No valid agents selected"
-                    })
-                    continue
-                
-                # Validar modelo
-                model = SecurityValidator.validate_model_name(model)
-                
-                # Validar configuración de API
-                if api_config:
-                    api_config = SecurityValidator.validate_api_config(api_config)
-                    if api_config:
-                        api_config = {
-                            "type": api_config.get("type", "openai"),
-                            "api_key": api_config.get("apiKey", ""),
-                            "base_url": api_config.get("baseUrl"),
-                        }
-                        print(f"🔑 API Config validada: type={api_config.get('type')}, has_key={bool(api_config.get('api_key'))}")
-                else:
-                    print(f"⚠️ No se recibió apiConfig válida, usando fallback")
-                
-                # Crear instancias de agentes
-                print(f"🔨 Creating agent instances...")
-                agent_instances = create_agent_instances(valid_agents, model, api_config, language=language)
-                print(f"✅ Created {len(agent_instances)} agent instances")
-                
-                # Crear pipeline de streaming
-                print(f"🚀 Creating streaming pipeline...")
-                pipeline = StreamingAgentPipeline(agent_instances, AGENT_DEFINITIONS, language=language)
-                print(f"✅ Pipeline created successfully")
-                
-                # Enviar confirmación de inicio
+                # Corre en segundo plano: el bucle sigue atendiendo ping, get_stats y cancel_pipeline
+                pipeline_tasks.start(
+                    session_id,
+                    lambda run_id, data=data: submit_ws_pipeline(session_id, client_id, data, run_id)
+                )
+            
+            elif data.get("action") == "cancel_pipeline":
+                run = await pipeline_tasks.cancel(session_id, data.get("run_id"))
                 await manager.send_json(session_id, {
-                    "type": "pipeline_started",
-                    "agents": valid_agents,
-                    "model": model,
-                    "message_count": len(valid_agents)
+                    "type": "pipeline_cancelled",
+                    "run_id": run.run_id if run else data.get("run_id"),
+                    "cancelled": run is not None,
+                    "timestamp": datetime.utcnow().isoformat()
                 })
-                
-                # Ejecutar pipeline con streaming
-                print(f"🔄 Starting pipeline execution...")
-                try:
-                    async for response in pipeline.execute_with_streaming(
-                        task=message,
-                        client_id=session_id,
-                        context={"authenticated": True, "session_id": session_id}
-                    ):
-                        print(f"📤 Pipeline response: {type(response)}")
-                        # Las respuestas ya se envían dentro del pipeline
-                        pass
-                    print(f"✅ Pipeline execution completed")
-                except Exception as e:
-                    print(f"❌ Pipeline execution error: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    await manager.send_json(session_id, {
-                        "type": "error",
-                        "message": f"Pipeline execution error: {str(e)}"
-                    })
-                
-                # PERSISTENCIA v0.8.0 - Guardar conversación automáticamente
-                try:
-                    conv_service = get_conversation_service()
-                    user_id = client_id  # Usar client_id como user_id para usuarios no autenticados
-                    
-                    conv_id = data.get("conversation_id")
-                    
-                    # Si no hay conversation_id, crear una nueva conversación
-                    if not conv_id:
-                        conv_id = await conv_service.create_conversation(
-                            user_id=user_id,
-                            title=message[:100] if len(message) > 100 else message,
-                            model=model,
-                            agents=valid_agents
-                        )
-                        print(f"💾 Nueva conversación creada: {conv_id}")
-                    
-                    # Guardar mensaje del usuario
-                    await conv_service.add_message(
-                        conversation_id=conv_id,
-                        role="user",
-                        content=message
-                    )
-                    
-                    # Guardar respuestas de agentes
-                    results = getattr(pipeline, 'results', [])
-                    for r in results:
-                        await conv_service.add_message(
-                            conversation_id=conv_id,
-                            role="assistant",
-                            content=r.get("raw_content", r.get("content", "")),
-                            agent_id=r.get("agent_id"),
-                            metadata={
-                                "agent_name": r.get("agent_name"),
-                                "level": r.get("level"),
-                                "sections": r.get("sections", [])
-                            }
-                        )
-                    
-                    # Informar al cliente del ID de conversación
-                    await manager.send_json(session_id, {
-                        "type": "conversation_saved",
-                        "conversation_id": conv_id,
-                        "title": message[:100] if len(message) > 100 else message
-                    })
-                    
-                    print(f"💾 Conversación guardada: {conv_id}")
-                except Exception as e:
-                    print(f"⚠️ Error al persistir conversación: {e}")
+            
+            elif data.get("action") == "resume":
+                await _resume_ws_session(session_id, _parse_seq(data.get("last_seq")) or 0)
             
             elif data.get("action") == "ping":
                 await manager.send_json(session_id, {
@@ -772,7 +857,12 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
                 
     except WebSocketDisconnect:
         print(f"🔌 WebSocket desconectado: session_id={session_id}")
-        manager.disconnect(session_id)
+        # Un socket reemplazado por una reconexión no toca la sesión ni su pipeline
+        if manager.is_superseded(session_id, websocket):
+            return
+        # Si el cliente no vuelve a tiempo, se cancela el pipeline y sus llamadas LLM
+        pipeline_tasks.schedule_cancel(session_id, PIPELINE_RESUME_GRACE)
+        manager.disconnect(session_id, websocket)
         # Invalidar sesión
         session_manager.invalidate_session(session_id)
         # Remover del tracker
@@ -780,11 +870,15 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
         await tracker.remove_user(session_id)
     except Exception as e:
         print(f"❌ WebSocket error para session_id={session_id}: {e}")
+        if manager.is_superseded(session_id, websocket):
+            return
+        pipeline_tasks.schedule_cancel(session_id, PIPELINE_RESUME_GRACE)
         await manager.send_json(session_id, {
             "type": "error",
             "message": "Internal server error"
         })
-        manager.disconnect(session_id)
+        await manager.flush(session_id)
+        manager.disconnect(session_id, websocket)
         session_manager.invalidate_session(session_id)
         # Remover del tracker
         tracker = get_tracker()
@@ -792,10 +886,12 @@ async def websocket_endpoint(websocket: WebSocket, client_id: str):
 
 
 @app.post("/api/chat-stream")
-async def chat_stream(request: StreamingChatRequest):
+async def chat_stream(request: StreamingChatRequest, frames: Optional[str] = Query(None)):
     """
     Endpoint HTTP con Server-Sent Events (SSE) para streaming de respuestas.
     Alternativa a WebSocket para entornos que no lo soportan.
+    
+    `?frames=lean` envía las respuestas de agentes en modo lean (wire_codec).
     """
     # Validar request
     if not request.message.strip():
@@ -817,37 +913,86 @@ async def chat_stream(request: StreamingChatRequest):
     # Crear instancias de agentes
     agent_instances = create_agent_instances(valid_agents, request.model, api_config, language=request.language)
     
-    # Generar client_id único para SSE
-    client_id = f"sse_{uuid.uuid4().hex[:8]}"
+    # Id del stream SSE: también es la clave para reanudarlo (GET /api/chat-stream/{stream_id})
+    stream_id = f"sse_{uuid.uuid4().hex}"
     
-    async def event_stream():
-        """Generador de eventos SSE."""
-        pipeline = StreamingAgentPipeline(agent_instances, AGENT_DEFINITIONS, language=request.language)
-        
-        async for response in pipeline.execute_with_streaming(
-            task=request.message,
-            client_id=client_id,
-            context={}
-        ):
-            # Formato SSE: data: {json}\n\n
-            yield f"data: {json.dumps(response, default=str)}\n\n"
-            await asyncio.sleep(0.05)  # Pequeña pausa para control de flujo
-        
-        # Evento de finalización
-        yield f"data: {json.dumps({'type': 'stream_complete'})}\n\n"
+    async def run_stream(run_id: str):
+        """Ejecuta el pipeline y registra sus frames; los clientes los leen del registro."""
+        set_cache_policy(request.cache)
+        pipeline = StreamingAgentPipeline(
+            agent_instances, AGENT_DEFINITIONS, language=request.language, stream_tokens=request.stream
+        )
+        try:
+            async for response in pipeline.execute_with_streaming(
+                task=request.message,
+                client_id=stream_id,
+                context={}
+            ):
+                await manager.event_log.append(stream_id, response)
+            
+            # Evento de finalización
+            await manager.event_log.append(stream_id, {"type": "stream_complete"})
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"❌ Pipeline SSE {stream_id} error: {e}")
+            await manager.event_log.append(stream_id, {"type": "error", "message": f"Pipeline execution error: {e}"})
+        finally:
+            await manager.close_log_stream(stream_id)
+    
+    # El pipeline no depende de la conexión HTTP: sobrevive a un corte breve
+    await manager.open_log_stream(stream_id)
+    pipeline_tasks.start(stream_id, run_stream)
+    return _sse_response(stream_id, after_seq=0, lean=frames == LEAN_FRAMES)
+
+
+def _sse_response(stream_id: str, after_seq: int, lean: bool = False) -> StreamingResponse:
+    """Stream SSE de los eventos registrados de `stream_id` posteriores a `after_seq`."""
+    async def event_stream_body():
+        pipeline_tasks.keep(stream_id)
+        try:
+            async for seq, frame in manager.event_log.follow(stream_id, after_seq):
+                if lean:
+                    frame = lean_frame(frame)
+                # Formato SSE: id: {seq}\ndata: {json}\n\n (el id vuelve como Last-Event-ID)
+                yield f"id: {seq}\ndata: {json.dumps(frame, default=str)}\n\n"
+        finally:
+            # Cliente desconectado: el pipeline espera a que se reconecte antes de cancelarse
+            pipeline_tasks.schedule_cancel(stream_id, PIPELINE_RESUME_GRACE)
     
     return StreamingResponse(
-        event_stream(),
+        event_stream_body(),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
             "Connection": "keep-alive",
             "X-Accel-Buffering": "no",  # Importante para NGINX
             "Access-Control-Allow-Origin": "*",
+            "X-Stream-Id": stream_id,
         }
     )
 
 
+@app.get("/api/chat-stream/{stream_id}")
+async def resume_chat_stream(
+    stream_id: str,
+    request: Request,
+    last_event_id: Optional[int] = Query(None, ge=0),
+    frames: Optional[str] = Query(None)
+):
+    """
+    Reanuda un stream SSE de /api/chat-stream: reenvía los eventos posteriores a
+    `Last-Event-ID` (cabecera de EventSource) o `?last_event_id=` y sigue en vivo.
+    """
+    after_seq = _parse_seq(request.headers.get("last-event-id"))
+    if after_seq is None:
+        after_seq = last_event_id or 0
+    replay = await manager.event_log.replay(stream_id, after_seq)
+    if not replay.found:
+        raise HTTPException(status_code=404, detail="Stream not found or expired")
+    return _sse_response(stream_id, after_seq, lean=frames == LEAN_FRAMES)
+
+
 @app.get("/api/ws-stats")
 async def get_websocket_stats():
     """Obtiene estadísticas de conexiones WebSocket activas."""
@@ -994,6 +1139,12 @@ app.include_router(admin_router)
 app.include_router(api_v1_router)
 app.include_router(conversation_router)
 
+# Servidor LLM simulado para pruebas de carga (solo con MOCK_LLM_ENABLED=true)
+from src.infrastructure.config.settings import MOCK_LLM_ENABLED
+if MOCK_LLM_ENABLED:
+    from app.routes.mock_llm_routes import router as mock_llm_router
+    app.include_router(mock_llm_router)
+
 
 # ============== SISTEMA COMPLETO v0.8.0+ ==============
 # El sistema ATP usa 30 agentes especializados con LangGraph
@@ -1034,4 +1185,4 @@ def _detect_device_type(user_agent: str) -> str:
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host=HOST, port=PORT)
+    uvicorn.run(app, host=HOST, port=PORT, ws_per_message_deflate=WS_PER_MESSAGE_DEFLATE)
@@ -0,0 +1,175 @@
+"""
+Message Bus v1.0.0
+==================
+Bus de mensajes entre procesos para el ConnectionManager de WebSocket.
+
+Cada proceso (worker de uvicorn, réplica o proceso de job_workers) solo tiene
+los sockets que aceptó. El manager entrega en local cuando puede y, si no,
+publica en el bus; el proceso dueño del socket lo recibe y lo entrega:
+
+- Canal por sesión (`ws:session:<client_id>`): lo suscribe el proceso que
+  tiene el socket, mientras dure la conexión
+- Canal de broadcast (`ws:broadcast`): lo suscriben todos los procesos
+
+Dos implementaciones con la misma interfaz:
+- InMemoryMessageBus: un solo proceso (por defecto, y la que usan los tests)
+- RedisMessageBus: pub/sub de Redis compartido entre procesos y réplicas
+
+`publish` devuelve cuántos suscriptores recibieron el mensaje (0 = nadie
+tiene esa sesión), igual que PUBLISH de Redis.
+"""
+
+import asyncio
+import json
+import os
+import socket
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from app.config import MESSAGE_BUS_BACKEND, REDIS_URL
+
+MessageHandler = Callable[[str, Dict[str, Any]], Awaitable[None]]
+
+
+def new_node_id() -> str:
+    """Identificador del proceso en el bus (para ignorar sus propios broadcasts)"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+class MessageBus:
+    """
+    Interfaz común: `subscribe`/`unsubscribe` de handlers por canal y
+    `publish` de mensajes (dicts serializables a JSON).
+    """
+
+    backend = "none"
+
+    def __init__(self):
+        self._handlers: Dict[str, Set[MessageHandler]] = {}
+        self.published = 0
+        self.received = 0
+
+    async def subscribe(self, channel: str, handler: MessageHandler) -> None:
+        handlers = self._handlers.setdefault(channel, set())
+        first = not handlers
+        handlers.add(handler)
+        if first:
+            await self._subscribe(channel)
+
+    async def unsubscribe(self, channel: str, handler: MessageHandler) -> None:
+        handlers = self._handlers.get(channel)
+        if not handlers or handler not in handlers:
+            return
+        handlers.discard(handler)
+        if not handlers:
+            del self._handlers[channel]
+            await self._unsubscribe(channel)
+
+    async def publish(self, channel: str, message: Dict[str, Any]) -> int:
+        raise NotImplementedError
+
+    async def _dispatch(self, channel: str, message: Dict[str, Any]) -> int:
+        handlers = list(self._handlers.get(channel, ()))
+        for handler in handlers:
+            self.received += 1
+            try:
+                await handler(channel, message)
+            except Exception as e:
+                print(f"⚠️ Bus: error entregando mensaje de {channel}: {e}")
+        return len(handlers)
+
+    async def _subscribe(self, channel: str) -> None:
+        pass
+
+    async def _unsubscribe(self, channel: str) -> None:
+        pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend,
+            "channels": len(self._handlers),
+            "published": self.published,
+            "received": self.received,
+        }
+
+    async def close(self) -> None:
+        self._handlers.clear()
+
+
+class InMemoryMessageBus(MessageBus):
+    """Bus dentro del proceso: publish entrega directamente a los handlers"""
+
+    backend = "memory"
+
+    async def publish(self, channel: str, message: Dict[str, Any]) -> int:
+        self.published += 1
+        return await self._dispatch(channel, message)
+
+
+class RedisMessageBus(MessageBus):
+    """Bus sobre pub/sub de Redis; una conexión de suscripción por proceso"""
+
+    backend = "redis"
+
+    def __init__(self, redis_url: str = REDIS_URL, prefix: str = "afw:"):
+        super().__init__()
+        import redis.asyncio as aioredis
+        self.redis = aioredis.from_url(redis_url, decode_responses=True)
+        self.prefix = prefix
+        self._pubsub = None
+        self._listener: Optional[asyncio.Task] = None
+
+    async def publish(self, channel: str, message: Dict[str, Any]) -> int:
+        self.published += 1
+        payload = json.dumps(message, default=str, ensure_ascii=False)
+        return await self.redis.publish(self.prefix + channel, payload)
+
+    async def _subscribe(self, channel: str) -> None:
+        if self._pubsub is None:
+            self._pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+        await self._pubsub.subscribe(self.prefix + channel)
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen(), name="message-bus:redis")
+
+    async def _unsubscribe(self, channel: str) -> None:
+        if self._pubsub is not None:
+            await self._pubsub.unsubscribe(self.prefix + channel)
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                message = await self._pubsub.get_message(timeout=1.0)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"⚠️ Bus Redis: error leyendo mensajes: {e}")
+                await asyncio.sleep(1.0)
+                continue
+            if message is None or message.get("type") != "message":
+                continue
+            channel = message["channel"][len(self.prefix):]
+            try:
+                data = json.loads(message["data"])
+            except (TypeError, ValueError):
+                continue
+            await self._dispatch(channel, data)
+
+    async def close(self) -> None:
+        await super().close()
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+            self._pubsub = None
+        await self.redis.aclose()
+
+
+def create_message_bus(backend: str = MESSAGE_BUS_BACKEND) -> MessageBus:
+    """Bus según la configuración; en memoria salvo MESSAGE_BUS_BACKEND=redis"""
+    if backend == "redis":
+        return RedisMessageBus(REDIS_URL)
+    if backend not in ("", "memory"):
+        print(f"⚠️ MESSAGE_BUS_BACKEND desconocido: {backend!r}; usando bus en memoria")
+    return InMemoryMessageBus()
@@ -2,7 +2,7 @@
 Modelos Pydantic para el API v0.8.0
 """
 from pydantic import BaseModel, validator, Field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Literal
 from enum import Enum
 
 
@@ -30,6 +30,7 @@ class ChatRequest(BaseModel):
     model: str = Field(default="groq-default", description="Modelo a usar")
     context: Optional[str] = Field(None, max_length=5000, description="Contexto adicional")
     apiConfig: Optional[Dict[str, Any]] = Field(None, description="Configuración de API")
+    cache: Literal["prefer", "bypass"] = Field("bypass", description="Política de caché de respuestas")
     
     @validator('message')
     def validate_message_content(cls, v):
@@ -5,7 +5,7 @@ Endpoints administrativos para monitoreo y gestión del sistema.
 """
 
 from fastapi import APIRouter, HTTPException, Depends, Request
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime, timedelta
 import psutil
 import os
@@ -15,6 +15,14 @@ from app.database import db, UserRole
 from app.services.online_users_tracker import get_tracker
 from app.websocket_manager import manager
 from app.middleware.rate_limiter import limiter, get_rate_limit_stats
+from src.infrastructure.adapters.external.llm_client_pool import llm_client_pool
+from src.infrastructure.adapters.external.llm_governor import llm_governor
+from src.infrastructure.adapters.external.resilient_provider import get_resilience_stats
+from src.shared.single_flight import agent_single_flight
+from src.shared.a2a_protocol import a2a_protocol
+from app.services.cache_manager import get_cache_manager
+from app.services.pipeline_tasks import pipeline_tasks
+from app.services.job_queue import get_job_queue
 
 router = APIRouter(prefix="/api/admin", tags=["admin"])
 
@@ -93,7 +101,8 @@ async def get_system_stats(
     admin: dict = Depends(require_admin)
 ):
     """
-    Obtiene estadísticas del sistema (CPU, memoria, disco).
+    Obtiene estadísticas del sistema (CPU, memoria, disco) y la ocupación
+    del registro de mensajes A2A.
     
     Requiere rol de administrador.
     
@@ -137,7 +146,8 @@ async def get_system_stats(
                 "process": {
                     "memory_mb": process_memory,
                     "threads": process.num_threads()
-                }
+                },
+                "a2a_messages": a2a_protocol.get_memory_stats()
             },
             "timestamp": datetime.utcnow().isoformat()
         }
@@ -148,6 +158,18 @@ async def get_system_stats(
         )
 
 
+async def _get_job_stats(request: Request) -> Optional[Dict[str, Any]]:
+    """Estado de la cola de trabajos y de los workers de este proceso (None sin cola)"""
+    queue = get_job_queue()
+    if queue is None:
+        return None
+    workers = getattr(request.app.state, "job_workers", None)
+    return {
+        "queue": await queue.get_stats(),
+        "workers": workers.get_stats() if workers is not None else None
+    }
+
+
 @router.get("/stats/websocket")
 @limiter.limit("30/minute")
 async def get_websocket_stats(
@@ -175,7 +197,8 @@ async def get_websocket_stats(
                 "client_id": client_id,
                 "connected_at": connected_at.isoformat(),
                 "duration_seconds": duration.total_seconds(),
-                "messages_sent": manager.message_counts.get(client_id, 0)
+                "messages_sent": manager.message_counts.get(client_id, 0),
+                "send_queue": manager.writers[client_id].get_stats() if client_id in manager.writers else None
             })
     
     return {
@@ -183,7 +206,10 @@ async def get_websocket_stats(
         "stats": {
             "active_connections": ws_stats.get("active_connections", 0),
             "total_messages": ws_stats.get("total_messages", 0),
-            "connections": connections_detail
+            "connections": connections_detail,
+            "send_queues": manager.get_send_queue_stats(),
+            "pipelines": pipeline_tasks.get_stats(),
+            "jobs": await _get_job_stats(request)
         },
         "timestamp": datetime.utcnow().isoformat()
     }
@@ -218,6 +244,37 @@ async def get_rate_limit_stats(
         }
 
 
+@router.get("/stats/llm")
+@limiter.limit("30/minute")
+async def get_llm_stats(
+    request: Request,
+    admin: dict = Depends(require_admin)
+):
+    """
+    Obtiene estadísticas de los clientes LLM compartidos y del gobernador
+    de rate limits (profundidad de cola, concurrencia AIMD, buckets) y el
+    estado de los circuit breakers por proveedor y los contadores de
+    single-flight (generaciones compartidas por peticiones idénticas) y del
+    caché de respuestas de dos niveles.
+    
+    Requiere rol de administrador.
+    
+    Returns:
+        Estadísticas del pool de clientes LLM
+    """
+    return {
+        "success": True,
+        "stats": {
+            "client_pool": llm_client_pool.get_stats(),
+            "governor": llm_governor.get_stats(),
+            "providers": get_resilience_stats(),
+            "single_flight": agent_single_flight.get_stats(),
+            "response_cache": await get_cache_manager().get_stats()
+        },
+        "timestamp": datetime.utcnow().isoformat()
+    }
+
+
 @router.get("/stats/users")
 @limiter.limit("20/minute")
 async def get_users_stats(
@@ -324,7 +381,8 @@ async def broadcast_message(
         message: Mensaje a enviar
         
     Returns:
-        Confirmación del broadcast
+        Confirmación del broadcast con el recuento de entregas de este proceso
+        (delivered, failed, timed_out) y los nodos remotos alcanzados
     """
     if not message or len(message) > 500:
         raise HTTPException(
@@ -332,8 +390,8 @@ async def broadcast_message(
             detail="Message must be between 1 and 500 characters"
         )
     
-    # Enviar broadcast
-    await manager.broadcast({
+    # Enviar broadcast (en paralelo, con plazo por envío)
+    delivery = await manager.broadcast({
         "type": "admin_broadcast",
         "message": message,
         "timestamp": datetime.utcnow().isoformat()
@@ -342,7 +400,7 @@ async def broadcast_message(
     return {
         "success": True,
         "message": "Broadcast sent",
-        "recipients": len(manager.active_connections),
+        **delivery,
         "timestamp": datetime.utcnow().isoformat()
     }
 
@@ -379,7 +437,8 @@ async def disconnect_user(
                 "timestamp": datetime.utcnow().isoformat()
             })
             
-            # Desconectar
+            # Desconectar (tras escribir la notificación)
+            await manager.flush(session_id)
             manager.disconnect(session_id)
             await tracker.remove_user(session_id)
             disconnected += 1
@@ -6,7 +6,7 @@ Permite a sistemas externos consumir los servicios de ATP.
 """
 
 from fastapi import APIRouter, HTTPException, Depends, Request, Header
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Literal
 from datetime import datetime
 import uuid
 import hashlib
@@ -15,6 +15,7 @@ import secrets
 from app.middleware.rate_limiter import limiter
 from app.database import db
 from app.validators import SecurityValidator
+from app.services.cache_manager import set_cache_policy
 from pydantic import BaseModel, Field
 
 router = APIRouter(prefix="/api/v1", tags=["api-v1"])
@@ -277,6 +278,7 @@ class ChatRequest(BaseModel):
     agents: List[str] = Field(..., min_items=1, max_items=30)
     model: str = Field(default="openai/gpt-4o-mini")
     stream: bool = Field(default=False)
+    cache: Literal["prefer", "bypass"] = Field(default="bypass")
 
 
 class ChatResponse(BaseModel):
@@ -303,17 +305,7 @@ async def api_chat(
     
     Rate limit: 30 requests/minuto por API key.
     """
-    from app.agents import (
-        ReasoningAgent, PlanningAgent, ResearchAgent, AnalysisAgent,
-        SynthesisAgent, CriticalThinkingAgent, CodingAgent, DataAgent,
-        WritingAgent, CommunicationAgent, DecisionAgent, ProblemSolvingAgent,
-        LegalAgent, FinancialAgent, CreativeAgent, TechnicalAgent,
-        EducationalAgent, MarketingAgent, QAAgent, DocumentationAgent,
-        OptimizationAgent, SecurityAgent, IntegrationAgent, ReviewAgent,
-        TranslationAgent, SummaryAgent, FormattingAgent, ValidationAgent,
-        CoordinationAgent, ExplanationAgent
-    )
-    from src.infrastructure.adapters.external.langgraph_orchestrator import LangGraphOrchestratorAdapter
+    from app.services.pipeline_jobs import submit_chat
     
     # Validar agentes
     valid_agents = SecurityValidator.validate_agent_list(chat_request.agents)
@@ -323,56 +315,17 @@ async def api_chat(
     # Sanitizar mensaje
     message = SecurityValidator.sanitize_text(chat_request.message)
     
-    # Crear orchestrator
-    orchestrator = LangGraphOrchestratorAdapter()
-    
-    # Map de agentes
-    agent_map = {
-        "reasoning": ReasoningAgent,
-        "planning": PlanningAgent,
-        "research": ResearchAgent,
-        "analysis": AnalysisAgent,
-        "synthesis": SynthesisAgent,
-        "critical_thinking": CriticalThinkingAgent,
-        "coding": CodingAgent,
-        "data": DataAgent,
-        "writing": WritingAgent,
-        "communication": CommunicationAgent,
-        "decision": DecisionAgent,
-        "problem_solving": ProblemSolvingAgent,
-        "legal": LegalAgent,
-        "financial": FinancialAgent,
-        "creative": CreativeAgent,
-        "technical": TechnicalAgent,
-        "educational": EducationalAgent,
-        "marketing": MarketingAgent,
-        "qa": QAAgent,
-        "documentation": DocumentationAgent,
-        "optimization": OptimizationAgent,
-        "security": SecurityAgent,
-        "integration": IntegrationAgent,
-        "review": ReviewAgent,
-        "translation": TranslationAgent,
-        "summary": SummaryAgent,
-        "formatting": FormattingAgent,
-        "validation": ValidationAgent,
-        "coordination": CoordinationAgent,
-        "explanation": ExplanationAgent,
-    }
-    
-    # Crear instancias
-    agent_instances = [
-        agent_map[agent_id](model=chat_request.model)
-        for agent_id in valid_agents
-        if agent_id in agent_map
-    ]
+    # Política de caché de respuestas para esta petición
+    set_cache_policy(chat_request.cache)
     
-    # Ejecutar
+    # Ejecutar (en la cola de trabajos si está configurada)
     try:
-        result = await orchestrator.run_workflow(
-            task=message,
-            agents=agent_instances,
-            context={"api_user": user_info.get("username")}
+        result = await submit_chat(
+            message,
+            valid_agents,
+            chat_request.model,
+            context={"api_user": user_info.get("username")},
+            cache=chat_request.cache
         )
         
         request_id = str(uuid.uuid4())
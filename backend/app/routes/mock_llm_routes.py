@@ -0,0 +1,46 @@
+"""
+Mock LLM Routes
+===============
+Servidor OpenAI-compatible simulado para pruebas de carga y latencia.
+Apunta cualquier cliente OpenAI a http://<host>/mock-llm/v1.
+
+Los parámetros de la query (ttft_ms, tps, error_rate, rate_limit_rate,
+output_tokens) sobreescriben la configuración MOCK_LLM_* de la petición.
+"""
+
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from src.infrastructure.adapters.external.mock_llm import MockLLMEngine
+
+router = APIRouter(prefix="/mock-llm/v1", tags=["Mock LLM"])
+
+engine = MockLLMEngine()
+
+
+@router.post("/chat/completions")
+async def chat_completions(request: Request):
+    """chat.completions simulado (completo o SSE con stream=true)."""
+    body = await request.json()
+    config = engine.config.with_params(request.query_params)
+    result = await engine.complete(body, config)
+    
+    if result.stream is not None:
+        return StreamingResponse(
+            result.stream,
+            status_code=result.status,
+            headers=result.headers,
+            media_type="text/event-stream"
+        )
+    return JSONResponse(result.payload, status_code=result.status, headers=result.headers)
+
+
+@router.get("/models")
+async def list_models():
+    return engine.list_models()
+
+
+@router.get("/stats")
+async def get_stats():
+    """Peticiones atendidas, errores y 429 inyectados."""
+    return engine.get_stats()
@@ -1,17 +1,88 @@
 """
-Cache Manager v1.0.0
+Cache Manager v1.1.0
 ===================
 Sistema de caché con Redis para mejorar el rendimiento y reducir carga.
+Dos niveles: LRU en proceso (sin red) y Redis compartido entre réplicas.
 """
 
 import redis
 import json
 import hashlib
-from typing import Optional, Any, Callable
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Optional, Any, Callable, Dict, Tuple
 from datetime import timedelta
 from functools import wraps
 import asyncio
 
+from app.config import REDIS_URL, RESPONSE_CACHE_LOCAL_MAX_ENTRIES, RESPONSE_CACHE_LOCAL_TTL
+
+
+# Política de caché por petición (opt-in): "prefer" consulta/guarda, "bypass" la ignora
+CACHE_PREFER = "prefer"
+CACHE_BYPASS = "bypass"
+CACHE_POLICIES = (CACHE_PREFER, CACHE_BYPASS)
+
+cache_policy: ContextVar[str] = ContextVar("cache_policy", default=CACHE_BYPASS)
+
+
+def set_cache_policy(policy: Optional[str]) -> str:
+    """Fija la política de la petición en curso; valores desconocidos equivalen a bypass."""
+    policy = policy if policy in CACHE_POLICIES else CACHE_BYPASS
+    cache_policy.set(policy)
+    return policy
+
+
+class LocalLRUCache:
+    """LRU acotado en memoria con TTL por entrada (primer nivel del caché)."""
+    
+    def __init__(self, max_entries: int = RESPONSE_CACHE_LOCAL_MAX_ENTRIES, ttl: int = RESPONSE_CACHE_LOCAL_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+    
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        # El nivel local nunca vive más que su propio TTL, aunque Redis guarde más
+        ttl = min(ttl or self.ttl, self.ttl)
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def delete(self, key: str) -> bool:
+        return self._entries.pop(key, None) is not None
+    
+    def keys(self):
+        return list(self._entries.keys())
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
 
 class CacheManager:
     """
@@ -22,10 +93,10 @@ class CacheManager:
     - Caché de consultas frecuentes
     - TTL configurable por tipo de dato
     - Invalidación selectiva
-    - Fallback a memoria si Redis no está disponible
+    - LRU en proceso delante de Redis (y como único nivel si Redis no está disponible)
     """
     
-    def __init__(self, redis_url: str = "redis://localhost:6379"):
+    def __init__(self, redis_url: str = REDIS_URL):
         """
         Inicializa el gestor de caché.
         
@@ -45,7 +116,10 @@ class CacheManager:
             print(f"⚠️ Redis no disponible para caché, usando fallback: {e}")
             self.redis_client = None
             self.available = False
-            self._memory_cache = {}
+        
+        self._local = LocalLRUCache()
+        self.redis_hits = 0
+        self.redis_misses = 0
         
         # Prefijos de keys
         self.AGENT_RESPONSE_PREFIX = "atp:cache:agent:"
@@ -84,18 +158,25 @@ class CacheManager:
         Returns:
             Valor cacheado o None si no existe
         """
+        value = self._local.get(key)
+        if value is not None:
+            return value
+        
         if self.redis_client:
             try:
-                value = self.redis_client.get(key)
-                if value:
-                    return json.loads(value)
-                return None
+                # El cliente Redis es síncrono: fuera del event loop
+                raw = await asyncio.to_thread(self.redis_client.get, key)
             except Exception as e:
                 print(f"⚠️ Error obteniendo del caché: {e}")
                 return None
-        else:
-            # Fallback a memoria
-            return self._memory_cache.get(key)
+            if not raw:
+                self.redis_misses += 1
+                return None
+            self.redis_hits += 1
+            value = json.loads(raw)
+            self._local.set(key, value)
+            return value
+        return None
     
     async def set(
         self,
@@ -115,19 +196,17 @@ class CacheManager:
             True si se guardó exitosamente
         """
         ttl = ttl or self.DEFAULT_TTL
+        self._local.set(key, value, ttl)
         
         if self.redis_client:
             try:
                 serialized = json.dumps(value)
-                self.redis_client.setex(key, ttl, serialized)
+                await asyncio.to_thread(self.redis_client.setex, key, ttl, serialized)
                 return True
             except Exception as e:
                 print(f"⚠️ Error guardando en caché: {e}")
                 return False
-        else:
-            # Fallback a memoria (sin TTL automático)
-            self._memory_cache[key] = value
-            return True
+        return True
     
     async def delete(self, key: str) -> bool:
         """
@@ -139,17 +218,14 @@ class CacheManager:
         Returns:
             True si se eliminó
         """
+        deleted = self._local.delete(key)
         if self.redis_client:
             try:
-                self.redis_client.delete(key)
+                await asyncio.to_thread(self.redis_client.delete, key)
                 return True
             except:
                 return False
-        else:
-            if key in self._memory_cache:
-                del self._memory_cache[key]
-                return True
-            return False
+        return deleted
     
     async def clear_pattern(self, pattern: str) -> int:
         """
@@ -161,25 +237,26 @@ class CacheManager:
         Returns:
             Número de keys eliminadas
         """
+        local_keys = [
+            k for k in self._local.keys()
+            if pattern.replace('*', '') in k
+        ]
+        for key in local_keys:
+            self._local.delete(key)
+        
         if self.redis_client:
             try:
-                keys = list(self.redis_client.scan_iter(match=pattern))
-                if keys:
-                    self.redis_client.delete(*keys)
-                return len(keys)
+                # SCAN recorre todo el keyspace: fuera del event loop
+                return await asyncio.to_thread(self._clear_redis_pattern, pattern)
             except:
                 return 0
-        else:
-            # Fallback a memoria
-            count = 0
-            keys_to_delete = [
-                k for k in self._memory_cache.keys()
-                if pattern.replace('*', '') in k
-            ]
-            for key in keys_to_delete:
-                del self._memory_cache[key]
-                count += 1
-            return count
+        return len(local_keys)
+    
+    def _clear_redis_pattern(self, pattern: str) -> int:
+        keys = list(self.redis_client.scan_iter(match=pattern))
+        if keys:
+            self.redis_client.delete(*keys)
+        return len(keys)
     
     async def cache_agent_response(
         self,
@@ -312,6 +389,7 @@ class CacheManager:
         Returns:
             Diccionario con estadísticas
         """
+        local = self._local.get_stats()
         if self.redis_client:
             try:
                 info = self.redis_client.info('stats')
@@ -320,15 +398,18 @@ class CacheManager:
                     "total_keys": self.redis_client.dbsize(),
                     "hits": info.get('keyspace_hits', 0),
                     "misses": info.get('keyspace_misses', 0),
-                    "memory_used": self.redis_client.info('memory').get('used_memory_human', 'N/A')
+                    "memory_used": self.redis_client.info('memory').get('used_memory_human', 'N/A'),
+                    "local": local,
+                    "redis_tier": {"hits": self.redis_hits, "misses": self.redis_misses}
                 }
             except:
-                return {"available": False, "error": "Could not get stats"}
+                return {"available": False, "error": "Could not get stats", "local": local}
         else:
             return {
                 "available": False,
-                "total_keys": len(self._memory_cache),
-                "backend": "memory"
+                "total_keys": len(self._local),
+                "backend": "memory",
+                "local": local
             }
 
 
@@ -375,7 +456,7 @@ def cached(ttl: int = 3600, key_prefix: str = "atp:cache:func:"):
 _cache_manager_instance: Optional[CacheManager] = None
 
 
-def get_cache_manager(redis_url: str = "redis://localhost:6379") -> CacheManager:
+def get_cache_manager(redis_url: str = REDIS_URL) -> CacheManager:
     """
     Obtiene la instancia global del cache manager (singleton).
     
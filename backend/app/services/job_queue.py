@@ -0,0 +1,654 @@
+"""
+Job Queue v1.0.0
+================
+Cola durable de trabajos (pipelines de agentes) desacoplada de las peticiones.
+
+Las rutas encolan y los workers (app.services.job_workers) consumen, en este
+proceso o en otros, así la capacidad de API y la de agentes escalan por
+separado y la caída de un worker no pierde el trabajo:
+
+- Reservar un trabajo lo hace invisible para otros workers durante un
+  visibility timeout; el worker lo renueva con heartbeats mientras trabaja
+- Un lease vencido (worker caído) devuelve el trabajo a la cola
+- Los fallos se reintentan con backoff exponencial hasta `max_attempts`;
+  después el trabajo queda "dead"
+
+Dos implementaciones con la misma interfaz:
+- SQLiteJobQueue: en proceso / un solo host, y la que usan los tests
+- RedisJobQueue: compartida entre réplicas (scripts Lua atómicos)
+
+Las credenciales (`secrets`, p. ej. api_config) se guardan aparte del payload,
+nunca se exponen en to_dict() y se borran al terminar el trabajo. Hasta
+entonces (en cola, en reintento o abandonado por un worker caído) están en
+claro en el fichero SQLite (JOB_QUEUE_DB, dentro de data/) o en Redis.
+"""
+
+import asyncio
+import json
+import sqlite3
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from app.config import (
+    JOB_QUEUE_BACKEND,
+    JOB_QUEUE_DB,
+    JOB_MAX_ATTEMPTS,
+    REDIS_URL,
+)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+DEAD = "dead"
+CANCELLED = "cancelled"
+FINAL_STATUSES = (SUCCEEDED, DEAD, CANCELLED)
+
+# Backoff de reintentos: base * 2^(intento-1), acotado
+RETRY_BACKOFF_BASE = 1.0
+RETRY_BACKOFF_MAX = 60.0
+
+
+def retry_delay(attempts: int) -> float:
+    return min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * 2 ** max(0, attempts - 1))
+
+
+@dataclass
+class Job:
+    """Un trabajo de la cola"""
+    job_id: str
+    kind: str
+    payload: Dict[str, Any]
+    status: str = QUEUED
+    attempts: int = 0
+    max_attempts: int = JOB_MAX_ATTEMPTS
+    available_at: float = 0.0
+    lease_expires: Optional[float] = None
+    worker: Optional[str] = None
+    result: Any = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+    secrets: Dict[str, Any] = field(default_factory=dict, repr=False)
+
+    @property
+    def done(self) -> bool:
+        return self.status in FINAL_STATUSES
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Vista pública (sin secrets)"""
+        return {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "status": self.status,
+            "attempts": self.attempts,
+            "max_attempts": self.max_attempts,
+            "worker": self.worker,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        }
+
+
+class JobQueue:
+    """
+    Interfaz común. Las subclases implementan las operaciones atómicas
+    (`_enqueue`, `_try_reserve`, `_requeue_expired`, `_complete`, `extend`,
+    `cancel`, `get`); la espera por trabajos o resultados se resuelve aquí,
+    con aviso inmediato en proceso y sondeo para los demás procesos.
+    """
+
+    poll_interval = 0.25
+
+    def __init__(self):
+        self._wakeup = asyncio.Event()
+        self._finished: Dict[str, asyncio.Event] = {}
+        self._cancel_listeners: List[Callable[[str], None]] = []
+        self.enqueued = 0
+        self.retried = 0
+
+    def _notify(self, job_id: Optional[str] = None) -> None:
+        self._wakeup.set()
+        if job_id and job_id in self._finished:
+            self._finished[job_id].set()
+
+    async def enqueue(
+        self,
+        kind: str,
+        payload: Dict[str, Any],
+        secrets: Optional[Dict[str, Any]] = None,
+        max_attempts: Optional[int] = None,
+        delay: float = 0.0
+    ) -> Job:
+        """Encola un trabajo y despierta a los workers en espera"""
+        now = time.time()
+        job = Job(
+            job_id=uuid.uuid4().hex,
+            kind=kind,
+            payload=payload,
+            max_attempts=max(1, max_attempts or JOB_MAX_ATTEMPTS),
+            available_at=now + delay,
+            created_at=now,
+            updated_at=now,
+            secrets=secrets or {},
+        )
+        await self._enqueue(job)
+        self.enqueued += 1
+        self._notify()
+        return job
+
+    async def reserve(self, worker_id: str, visibility_timeout: float, wait: float = 1.0) -> Optional[Job]:
+        """
+        Reserva el siguiente trabajo disponible (invisible durante
+        `visibility_timeout`), esperando hasta `wait` segundos.
+        """
+        deadline = time.monotonic() + wait
+        while True:
+            self._wakeup.clear()
+            job = await self._try_reserve(worker_id, visibility_timeout)
+            if job is not None:
+                return job
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=min(remaining, self.poll_interval))
+            except asyncio.TimeoutError:
+                pass
+
+    async def ack(self, job: Job, result: Any = None) -> bool:
+        """Marca el trabajo como completado (solo si el worker conserva el lease)"""
+        return await self._finish(job, SUCCEEDED, result=result)
+
+    async def fail(self, job: Job, error: str, retry: bool = True) -> bool:
+        """Fallo del intento: reintento con backoff o "dead" si se agotaron los intentos"""
+        if retry and job.attempts < job.max_attempts:
+            ok = await self._complete(job, QUEUED, error=error, available_at=time.time() + retry_delay(job.attempts))
+            if ok:
+                self.retried += 1
+                self._notify()
+            return ok
+        return await self._finish(job, DEAD, error=error)
+
+    async def _finish(self, job: Job, status: str, result: Any = None, error: Optional[str] = None) -> bool:
+        ok = await self._complete(job, status, result=result, error=error)
+        if ok:
+            self._notify(job.job_id)
+        return ok
+
+    async def requeue_expired(self) -> int:
+        """Devuelve a la cola los trabajos cuyo lease venció (workers caídos)"""
+        requeued = await self._requeue_expired()
+        if requeued:
+            self._notify()
+        return requeued
+
+    async def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[Job]:
+        """Espera a que el trabajo termine (succeeded, dead o cancelled)"""
+        event = self._finished.setdefault(job_id, asyncio.Event())
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            while True:
+                event.clear()
+                job = await self.get(job_id)
+                if job is None or job.done:
+                    return job
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return job
+                try:
+                    await asyncio.wait_for(
+                        event.wait(),
+                        timeout=self.poll_interval if remaining is None else min(remaining, self.poll_interval)
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._finished.pop(job_id, None)
+
+    async def cancel(self, job_id: str) -> bool:
+        """Cancela un trabajo pendiente o en curso (el worker lo nota en su heartbeat)"""
+        ok = await self._cancel(job_id)
+        if ok:
+            self._notify(job_id)
+            for listener in self._cancel_listeners:
+                listener(job_id)
+        return ok
+
+    def add_cancel_listener(self, listener: Callable[[str], None]) -> None:
+        """Aviso inmediato de cancelaciones hechas en este proceso (p. ej. al pool de workers)"""
+        self._cancel_listeners.append(listener)
+
+    # Operaciones atómicas de cada backend
+    async def _enqueue(self, job: Job) -> None:
+        raise NotImplementedError
+
+    async def _try_reserve(self, worker_id: str, visibility_timeout: float) -> Optional[Job]:
+        raise NotImplementedError
+
+    async def _requeue_expired(self) -> int:
+        raise NotImplementedError
+
+    async def _complete(
+        self,
+        job: Job,
+        status: str,
+        result: Any = None,
+        error: Optional[str] = None,
+        available_at: Optional[float] = None
+    ) -> bool:
+        raise NotImplementedError
+
+    async def _cancel(self, job_id: str) -> bool:
+        raise NotImplementedError
+
+    async def extend(self, job: Job, visibility_timeout: float) -> bool:
+        """Heartbeat: renueva el lease. False si se perdió o el trabajo fue cancelado"""
+        raise NotImplementedError
+
+    async def get(self, job_id: str) -> Optional[Job]:
+        raise NotImplementedError
+
+    async def counts(self) -> Dict[str, int]:
+        raise NotImplementedError
+
+    async def get_stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend,
+            "enqueued": self.enqueued,
+            "retried": self.retried,
+            "jobs": await self.counts(),
+        }
+
+    async def close(self) -> None:
+        pass
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    secrets TEXT,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    available_at REAL NOT NULL,
+    lease_expires REAL,
+    worker TEXT,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_ready ON jobs (status, available_at);
+"""
+
+
+class SQLiteJobQueue(JobQueue):
+    """Cola sobre SQLite (una conexión por operación, en hilo aparte)"""
+
+    backend = "sqlite"
+
+    def __init__(self, db_path: str = JOB_QUEUE_DB):
+        super().__init__()
+        self.db_path = db_path
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = self._get_connection()
+        conn.executescript(_SCHEMA)
+        conn.close()
+
+    def _get_connection(self):
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @staticmethod
+    def _row_to_job(row: sqlite3.Row) -> Job:
+        return Job(
+            job_id=row["job_id"],
+            kind=row["kind"],
+            payload=json.loads(row["payload"]),
+            status=row["status"],
+            attempts=row["attempts"],
+            max_attempts=row["max_attempts"],
+            available_at=row["available_at"],
+            lease_expires=row["lease_expires"],
+            worker=row["worker"],
+            result=json.loads(row["result"]) if row["result"] else None,
+            error=row["error"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+            secrets=json.loads(row["secrets"]) if row["secrets"] else {},
+        )
+
+    def _run(self, operation, *args):
+        conn = self._get_connection()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            value = operation(conn, *args)
+            conn.execute("COMMIT")
+            return value
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    async def _enqueue(self, job: Job) -> None:
+        def insert(conn, job):
+            conn.execute("""
+                INSERT INTO jobs (job_id, kind, payload, secrets, status, attempts, max_attempts,
+                                  available_at, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, 0, ?, ?, ?, ?)
+            """, (
+                job.job_id, job.kind,
+                json.dumps(job.payload, default=str, ensure_ascii=False),
+                json.dumps(job.secrets) if job.secrets else None,
+                QUEUED, job.max_attempts, job.available_at, job.created_at, job.updated_at,
+            ))
+        await asyncio.to_thread(self._run, insert, job)
+
+    async def _try_reserve(self, worker_id: str, visibility_timeout: float) -> Optional[Job]:
+        def reserve(conn, worker_id, visibility_timeout):
+            now = time.time()
+            row = conn.execute("""
+                SELECT job_id FROM jobs WHERE status = ? AND available_at <= ?
+                ORDER BY available_at LIMIT 1
+            """, (QUEUED, now)).fetchone()
+            if row is None:
+                return None
+            conn.execute("""
+                UPDATE jobs SET status = ?, attempts = attempts + 1, lease_expires = ?,
+                                worker = ?, updated_at = ?
+                WHERE job_id = ?
+            """, (RUNNING, now + visibility_timeout, worker_id, now, row["job_id"]))
+            return self._row_to_job(conn.execute("SELECT * FROM jobs WHERE job_id = ?", (row["job_id"],)).fetchone())
+        return await asyncio.to_thread(self._run, reserve, worker_id, visibility_timeout)
+
+    async def _requeue_expired(self) -> int:
+        def requeue(conn):
+            now = time.time()
+            # Sin intentos restantes, un lease vencido es definitivo
+            dead = conn.execute("""
+                UPDATE jobs SET status = ?, error = 'visibility timeout expired', secrets = NULL,
+                                lease_expires = NULL, updated_at = ?
+                WHERE status = ? AND lease_expires < ? AND attempts >= max_attempts
+            """, (DEAD, now, RUNNING, now)).rowcount
+            requeued = conn.execute("""
+                UPDATE jobs SET status = ?, error = 'visibility timeout expired', available_at = ?,
+                                lease_expires = NULL, worker = NULL, updated_at = ?
+                WHERE status = ? AND lease_expires < ?
+            """, (QUEUED, now, now, RUNNING, now)).rowcount
+            return requeued + dead
+        return await asyncio.to_thread(self._run, requeue)
+
+    async def _complete(
+        self,
+        job: Job,
+        status: str,
+        result: Any = None,
+        error: Optional[str] = None,
+        available_at: Optional[float] = None
+    ) -> bool:
+        def complete(conn):
+            now = time.time()
+            final = status in FINAL_STATUSES
+            return conn.execute(f"""
+                UPDATE jobs SET status = ?, result = ?, error = ?, lease_expires = NULL,
+                                available_at = COALESCE(?, available_at), updated_at = ?
+                                {", secrets = NULL" if final else ", worker = NULL"}
+                WHERE job_id = ? AND status = ? AND worker = ?
+            """, (
+                status,
+                json.dumps(result, default=str, ensure_ascii=False) if result is not None else None,
+                error, available_at, now, job.job_id, RUNNING, job.worker,
+            )).rowcount == 1
+        return await asyncio.to_thread(self._run, complete)
+
+    async def _cancel(self, job_id: str) -> bool:
+        def cancel(conn):
+            return conn.execute("""
+                UPDATE jobs SET status = ?, secrets = NULL, lease_expires = NULL, updated_at = ?
+                WHERE job_id = ? AND status IN (?, ?)
+            """, (CANCELLED, time.time(), job_id, QUEUED, RUNNING)).rowcount == 1
+        return await asyncio.to_thread(self._run, cancel)
+
+    async def extend(self, job: Job, visibility_timeout: float) -> bool:
+        def extend(conn):
+            now = time.time()
+            return conn.execute("""
+                UPDATE jobs SET lease_expires = ?, updated_at = ?
+                WHERE job_id = ? AND status = ? AND worker = ?
+            """, (now + visibility_timeout, now, job.job_id, RUNNING, job.worker)).rowcount == 1
+        return await asyncio.to_thread(self._run, extend)
+
+    async def get(self, job_id: str) -> Optional[Job]:
+        def get(conn):
+            row = conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+            return self._row_to_job(row) if row else None
+        return await asyncio.to_thread(self._run, get)
+
+    async def counts(self) -> Dict[str, int]:
+        def counts(conn):
+            rows = conn.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status").fetchall()
+            return {row["status"]: row["n"] for row in rows}
+        return await asyncio.to_thread(self._run, counts)
+
+
+# Scripts Lua: cada transición de estado es atómica en Redis.
+# Claves: KEYS[1] = zset ready (score available_at), KEYS[2] = zset inflight
+# (score lease_expires), KEYS[3] = prefijo de los hashes de trabajo.
+_LUA_RESERVE = """
+local ids = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, 1)
+if #ids == 0 then return nil end
+local id = ids[1]
+redis.call('ZREM', KEYS[1], id)
+local key = KEYS[3] .. id
+local job = cjson.decode(redis.call('HGET', key, 'data'))
+job.status = 'running'
+job.attempts = job.attempts + 1
+job.lease_expires = tonumber(ARGV[1]) + tonumber(ARGV[2])
+job.worker = ARGV[3]
+job.updated_at = tonumber(ARGV[1])
+local data = cjson.encode(job)
+redis.call('HSET', key, 'data', data)
+redis.call('ZADD', KEYS[2], job.lease_expires, id)
+local fields = redis.call('HMGET', key, 'payload', 'secrets')
+return {data, fields[1] or '{}', fields[2] or ''}
+"""
+
+_LUA_REQUEUE_EXPIRED = """
+local ids = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', ARGV[1])
+for _, id in ipairs(ids) do
+  redis.call('ZREM', KEYS[2], id)
+  local key = KEYS[3] .. id
+  local job = cjson.decode(redis.call('HGET', key, 'data'))
+  job.error = 'visibility timeout expired'
+  job.lease_expires = cjson.null
+  job.updated_at = tonumber(ARGV[1])
+  if job.attempts >= job.max_attempts then
+    job.status = 'dead'
+    redis.call('HDEL', key, 'secrets')
+  else
+    job.status = 'queued'
+    job.worker = cjson.null
+    job.available_at = tonumber(ARGV[1])
+    redis.call('ZADD', KEYS[1], job.available_at, id)
+  end
+  redis.call('HSET', key, 'data', cjson.encode(job))
+end
+return #ids
+"""
+
+# Transición condicionada: solo si el trabajo sigue en ARGV[2] y (si se indica) lo tiene el worker ARGV[3].
+# ARGV[4] = JSON con los campos a actualizar; ARGV[5] = extender lease hasta (o ''); ARGV[6] = 1 si es final;
+# ARGV[7] = resultado JSON tal cual (o ''). Payload y resultado nunca pasan por cjson (listas vacías → {}).
+_LUA_TRANSITION = """
+local key = KEYS[3] .. ARGV[1]
+local raw = redis.call('HGET', key, 'data')
+if not raw then return 0 end
+local job = cjson.decode(raw)
+local allowed = false
+for status in string.gmatch(ARGV[2], '[^,]+') do
+  if job.status == status then allowed = true end
+end
+if not allowed then return 0 end
+if ARGV[3] ~= '' and job.worker ~= ARGV[3] then return 0 end
+for field, value in pairs(cjson.decode(ARGV[4])) do job[field] = value end
+redis.call('ZREM', KEYS[2], ARGV[1])
+if ARGV[5] ~= '' then
+  job.lease_expires = tonumber(ARGV[5])
+  redis.call('ZADD', KEYS[2], job.lease_expires, ARGV[1])
+end
+if job.status == 'queued' then
+  redis.call('ZADD', KEYS[1], job.available_at, ARGV[1])
+else
+  redis.call('ZREM', KEYS[1], ARGV[1])
+end
+if ARGV[6] == '1' then redis.call('HDEL', key, 'secrets') end
+if ARGV[7] ~= '' then redis.call('HSET', key, 'result', ARGV[7]) end
+redis.call('HSET', key, 'data', cjson.encode(job))
+return 1
+"""
+
+
+class RedisJobQueue(JobQueue):
+    """Cola compartida entre réplicas sobre Redis (hash por trabajo + zsets ready/inflight)"""
+
+    backend = "redis"
+
+    def __init__(self, redis_url: str = REDIS_URL, prefix: str = "afw:jobs", result_ttl: int = 86400):
+        super().__init__()
+        import redis.asyncio as aioredis
+        self.redis = aioredis.from_url(redis_url, decode_responses=True)
+        self.prefix = prefix
+        self.result_ttl = result_ttl
+        self._keys = [f"{prefix}:ready", f"{prefix}:inflight", f"{prefix}:job:"]
+        self._reserve_script = self.redis.register_script(_LUA_RESERVE)
+        self._requeue_script = self.redis.register_script(_LUA_REQUEUE_EXPIRED)
+        self._transition_script = self.redis.register_script(_LUA_TRANSITION)
+
+    def _job_key(self, job_id: str) -> str:
+        return f"{self.prefix}:job:{job_id}"
+
+    @staticmethod
+    def _job_data(job: Job) -> Dict[str, Any]:
+        # Solo metadatos escalares: es lo que manipulan los scripts Lua
+        data = job.to_dict()
+        data.pop("result")
+        data.update(available_at=job.available_at, lease_expires=job.lease_expires)
+        return data
+
+    @staticmethod
+    def _load(data: str, payload: Optional[str], result: Optional[str] = None, secrets: Optional[str] = None) -> Job:
+        return Job(
+            payload=json.loads(payload) if payload else {},
+            result=json.loads(result) if result else None,
+            secrets=json.loads(secrets) if secrets else {},
+            **json.loads(data),
+        )
+
+    async def _enqueue(self, job: Job) -> None:
+        key = self._job_key(job.job_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, "data", json.dumps(self._job_data(job), default=str, ensure_ascii=False))
+            pipe.hset(key, "payload", json.dumps(job.payload, default=str, ensure_ascii=False))
+            if job.secrets:
+                pipe.hset(key, "secrets", json.dumps(job.secrets))
+            pipe.zadd(self._keys[0], {job.job_id: job.available_at})
+            await pipe.execute()
+
+    async def _try_reserve(self, worker_id: str, visibility_timeout: float) -> Optional[Job]:
+        reserved = await self._reserve_script(keys=self._keys, args=[time.time(), visibility_timeout, worker_id])
+        if not reserved:
+            return None
+        return self._load(reserved[0], reserved[1], secrets=reserved[2] or None)
+
+    async def _requeue_expired(self) -> int:
+        return int(await self._requeue_script(keys=self._keys, args=[time.time()]))
+
+    async def _transition(
+        self,
+        job_id: str,
+        from_statuses: List[str],
+        updates: Dict[str, Any],
+        worker: Optional[str] = None,
+        lease_until: Optional[float] = None,
+        result: Any = None
+    ) -> bool:
+        final = updates.get("status") in FINAL_STATUSES
+        ok = await self._transition_script(keys=self._keys, args=[
+            job_id, ",".join(from_statuses), worker or "",
+            json.dumps(updates, default=str, ensure_ascii=False),
+            "" if lease_until is None else lease_until,
+            "1" if final else "0",
+            "" if result is None else json.dumps(result, default=str, ensure_ascii=False),
+        ])
+        if ok and final:
+            await self.redis.expire(self._job_key(job_id), self.result_ttl)
+        return bool(ok)
+
+    async def _complete(
+        self,
+        job: Job,
+        status: str,
+        result: Any = None,
+        error: Optional[str] = None,
+        available_at: Optional[float] = None
+    ) -> bool:
+        updates: Dict[str, Any] = {"status": status, "error": error, "updated_at": time.time()}
+        if available_at is not None:
+            updates["available_at"] = available_at
+        if status == QUEUED:
+            updates["worker"] = None
+        return await self._transition(job.job_id, [RUNNING], updates, worker=job.worker, result=result)
+
+    async def _cancel(self, job_id: str) -> bool:
+        return await self._transition(job_id, [QUEUED, RUNNING], {"status": CANCELLED, "updated_at": time.time()})
+
+    async def extend(self, job: Job, visibility_timeout: float) -> bool:
+        now = time.time()
+        return await self._transition(
+            job.job_id, [RUNNING], {"updated_at": now}, worker=job.worker, lease_until=now + visibility_timeout
+        )
+
+    async def get(self, job_id: str) -> Optional[Job]:
+        data, payload, result = await self.redis.hmget(self._job_key(job_id), "data", "payload", "result")
+        return self._load(data, payload, result) if data else None
+
+    async def counts(self) -> Dict[str, int]:
+        return {
+            QUEUED: await self.redis.zcard(self._keys[0]),
+            RUNNING: await self.redis.zcard(self._keys[1]),
+        }
+
+    async def close(self) -> None:
+        await self.redis.aclose()
+
+
+def create_job_queue(backend: str = JOB_QUEUE_BACKEND) -> Optional[JobQueue]:
+    """Cola según la configuración; None = los pipelines corren en la propia petición"""
+    if backend == "sqlite":
+        return SQLiteJobQueue(JOB_QUEUE_DB)
+    if backend == "redis":
+        return RedisJobQueue(REDIS_URL)
+    if backend:
+        print(f"⚠️ JOB_QUEUE_BACKEND desconocido: {backend!r}; pipelines en la propia petición")
+    return None
+
+
+_job_queue: Optional[JobQueue] = None
+_job_queue_ready = False
+
+
+def get_job_queue() -> Optional[JobQueue]:
+    """Cola global (se crea la primera vez); None si está desactivada"""
+    global _job_queue, _job_queue_ready
+    if not _job_queue_ready:
+        _job_queue = create_job_queue()
+        _job_queue_ready = True
+    return _job_queue
@@ -0,0 +1,190 @@
+"""
+Job Workers v1.0.0
+==================
+Pool de workers de agentes que consumen la cola de trabajos (job_queue).
+
+- Cada worker reserva un trabajo, ejecuta su handler y renueva el lease con
+  heartbeats; si el lease se pierde o el trabajo se cancela, el handler se
+  cancela (las llamadas LLM en curso se cortan)
+- Los errores se reintentan con backoff; un reaper devuelve a la cola los
+  trabajos de workers caídos
+- Los handlers se registran por tipo con @job_handler("tipo")
+
+Se arrancan dentro de la API (JOB_WORKERS > 0) o como proceso aparte:
+
+    JOB_QUEUE_BACKEND=redis MESSAGE_BUS_BACKEND=redis python -m app.services.job_workers
+
+En un proceso aparte los frames de los pipelines de WebSocket llegan al
+cliente a través del bus de mensajes (MESSAGE_BUS_BACKEND=redis).
+"""
+
+import asyncio
+import os
+import socket
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from app.config import JOB_WORKERS, JOB_VISIBILITY_TIMEOUT
+from app.services.job_queue import Job, JobQueue, get_job_queue
+
+JobHandler = Callable[[Job], Awaitable[Any]]
+
+# Handlers por tipo de trabajo
+job_handlers: Dict[str, JobHandler] = {}
+
+
+def job_handler(kind: str):
+    """Decorador para registrar el handler de un tipo de trabajo"""
+    def decorator(func: JobHandler) -> JobHandler:
+        job_handlers[kind] = func
+        return func
+    return decorator
+
+
+class JobWorkerPool:
+    """N workers concurrentes sobre una cola, más un reaper de leases vencidos."""
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        handlers: Optional[Dict[str, JobHandler]] = None,
+        concurrency: int = JOB_WORKERS,
+        visibility_timeout: float = JOB_VISIBILITY_TIMEOUT,
+        name: Optional[str] = None
+    ):
+        self.queue = queue
+        self.handlers = job_handlers if handlers is None else handlers
+        self.concurrency = max(1, concurrency)
+        self.visibility_timeout = visibility_timeout
+        self.heartbeat_interval = min(visibility_timeout / 3, 5.0)
+        self.name = name or f"{socket.gethostname()}:{os.getpid()}"
+        self._workers: list = []
+        self._running: Dict[str, asyncio.Task] = {}
+        self.processed = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.lost = 0
+        queue.add_cancel_listener(self._on_cancel)
+
+    async def start(self) -> None:
+        if self._workers:
+            return
+        self._workers = [
+            asyncio.create_task(self._worker(f"{self.name}#{i}"), name=f"job-worker:{i}")
+            for i in range(self.concurrency)
+        ]
+        self._workers.append(asyncio.create_task(self._reaper(), name="job-reaper"))
+        print(f"👷 {self.concurrency} workers de trabajos ({self.queue.backend}) iniciados")
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Detiene los workers; los trabajos en curso vuelven a la cola"""
+        for task in self._workers:
+            task.cancel()
+        if self._workers:
+            await asyncio.wait(self._workers, timeout=timeout)
+        self._workers = []
+
+    def _on_cancel(self, job_id: str) -> None:
+        # Cancelación en este proceso: no hace falta esperar al heartbeat
+        task = self._running.get(job_id)
+        if task is not None:
+            task.cancel()
+
+    async def _worker(self, worker_id: str) -> None:
+        while True:
+            try:
+                job = await self.queue.reserve(worker_id, self.visibility_timeout)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"⚠️ Worker {worker_id}: error reservando trabajo: {e}")
+                await asyncio.sleep(1.0)
+                continue
+            if job is not None:
+                await self._process(job)
+
+    async def _process(self, job: Job) -> None:
+        handler = self.handlers.get(job.kind)
+        if handler is None:
+            await self.queue.fail(job, f"No handler for job kind {job.kind!r}", retry=False)
+            return
+
+        self.processed += 1
+        started = time.monotonic()
+        task = asyncio.create_task(handler(job), name=f"job:{job.kind}:{job.job_id}")
+        self._running[job.job_id] = task
+        lost = False
+        try:
+            while not task.done():
+                done, _ = await asyncio.wait({task}, timeout=self.heartbeat_interval)
+                if not done and not await self.queue.extend(job, self.visibility_timeout):
+                    # Cancelado en otro proceso o lease perdido: otro worker puede tenerlo
+                    lost = True
+                    task.cancel()
+                    await asyncio.wait({task})
+        except asyncio.CancelledError:
+            # El pool se detiene: el intento falla y el trabajo vuelve a la cola
+            task.cancel()
+            await asyncio.wait({task})
+            await asyncio.shield(self.queue.fail(job, "worker stopped"))
+            raise
+        finally:
+            self._running.pop(job.job_id, None)
+
+        if task.cancelled():
+            # Cancelado en este proceso (ya marcado en la cola) o lease perdido
+            if lost:
+                self.lost += 1
+            return
+        error = task.exception()
+        if error is None:
+            await self.queue.ack(job, task.result())
+            self.succeeded += 1
+            print(f"✅ Trabajo {job.kind}:{job.job_id[:8]} completado en {time.monotonic() - started:.2f}s")
+        else:
+            await self.queue.fail(job, str(error) or type(error).__name__)
+            self.failed += 1
+            print(f"❌ Trabajo {job.kind}:{job.job_id[:8]} falló (intento {job.attempts}/{job.max_attempts}): {error}")
+
+    async def _reaper(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            try:
+                requeued = await self.queue.requeue_expired()
+                if requeued:
+                    print(f"♻️ {requeued} trabajos con lease vencido devueltos a la cola")
+            except Exception as e:
+                print(f"⚠️ Reaper de trabajos: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "workers": self.concurrency,
+            "running": len(self._running),
+            "processed": self.processed,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "lost": self.lost,
+            "visibility_timeout": self.visibility_timeout,
+        }
+
+
+async def run_workers() -> None:
+    """Proceso de workers independiente de la API"""
+    queue = get_job_queue()
+    if queue is None:
+        raise SystemExit("JOB_QUEUE_BACKEND no está configurado (sqlite | redis)")
+    import app.services.pipeline_jobs  # noqa: F401  (registra los handlers)
+    pool = JobWorkerPool(queue)
+    await pool.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        from app.websocket_manager import manager
+        await pool.stop()
+        await queue.close()
+        await manager.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_workers())
@@ -0,0 +1,139 @@
+"""
+Pipeline Jobs v1.0.0
+====================
+Pipelines de agentes como trabajos de la cola (job_queue + job_workers).
+
+- "chat": /api/chat y /api/v1/chat. Ejecuta el workflow LangGraph con los
+  agentes pedidos y devuelve el resultado final
+- "ws_pipeline": `start_pipeline` del WebSocket. Ejecuta el pipeline con
+  streaming hacia la sesión
+
+Sin JOB_QUEUE_BACKEND configurado, `submit_*` ejecutan en la propia petición
+(comportamiento anterior). Con cola, encolan y esperan el resultado; si la
+petición se cancela (cancel_pipeline, desconexión, timeout) el trabajo se
+cancela en la cola y el worker corta el handler.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from app.config import JOB_RESULT_TIMEOUT
+from app.event_log import event_stream
+from app.services.cache_manager import set_cache_policy
+from app.services.job_queue import SUCCEEDED, Job, get_job_queue
+from app.services.job_workers import job_handler
+
+CHAT_JOB = "chat"
+WS_PIPELINE_JOB = "ws_pipeline"
+
+
+class PipelineJobError(RuntimeError):
+    """El trabajo terminó sin éxito (dead, cancelado o sin resultado a tiempo)"""
+
+    def __init__(self, job: Optional[Job], message: str):
+        super().__init__(message)
+        self.job = job
+
+
+async def run_chat(
+    message: str,
+    agents: List[str],
+    model: str,
+    api_config: Optional[Dict[str, Any]] = None,
+    context: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Workflow LangGraph con los agentes pedidos (instancias desde prototipos)"""
+    from app.agents.prototypes import agent_prototypes
+    from src.infrastructure.adapters.external.langgraph_orchestrator import langgraph_orchestrator
+
+    selected_agents = [
+        agent for agent in (agent_prototypes.instantiate(a, model=model, api_config=api_config) for a in agents)
+        if agent is not None
+    ]
+    result = await langgraph_orchestrator.run_workflow(task=message, agents=selected_agents, context=context or {})
+    return {"final_result": result.get("final_result", "")}
+
+
+@job_handler(CHAT_JOB)
+async def _chat_job(job: Job) -> Dict[str, Any]:
+    payload = job.payload
+    set_cache_policy(payload.get("cache"))
+    return await run_chat(
+        payload["message"],
+        payload["agents"],
+        payload["model"],
+        api_config=job.secrets.get("api_config"),
+        context=payload.get("context"),
+    )
+
+
+@job_handler(WS_PIPELINE_JOB)
+async def _ws_pipeline_job(job: Job) -> Dict[str, Any]:
+    from app.main import _run_ws_pipeline
+    payload = job.payload
+    data = dict(payload["data"], apiConfig=job.secrets.get("apiConfig"))
+    await _run_ws_pipeline(payload["session_id"], payload["client_id"], data, payload["run_id"])
+    return {"run_id": payload["run_id"]}
+
+
+async def _await_job(job: Job, timeout: Optional[float]) -> Job:
+    queue = get_job_queue()
+    try:
+        finished = await queue.wait(job.job_id, timeout=timeout)
+    except asyncio.CancelledError:
+        await asyncio.shield(queue.cancel(job.job_id))
+        raise
+    if finished is None or not finished.done:
+        await queue.cancel(job.job_id)
+        raise PipelineJobError(finished, f"Job {job.job_id} did not finish within {timeout}s")
+    if finished.status != SUCCEEDED:
+        raise PipelineJobError(finished, finished.error or f"Job {job.job_id} {finished.status}")
+    return finished
+
+
+async def submit_chat(
+    message: str,
+    agents: List[str],
+    model: str,
+    api_config: Optional[Dict[str, Any]] = None,
+    context: Optional[Dict[str, Any]] = None,
+    cache: Optional[str] = None,
+    timeout: float = JOB_RESULT_TIMEOUT
+) -> Dict[str, Any]:
+    """Ejecuta un chat en la cola (o en línea si no hay cola) y devuelve su resultado"""
+    queue = get_job_queue()
+    if queue is None:
+        return await run_chat(message, agents, model, api_config=api_config, context=context)
+    job = await queue.enqueue(
+        CHAT_JOB,
+        {"message": message, "agents": agents, "model": model, "context": context or {}, "cache": cache},
+        secrets={"api_config": api_config} if api_config else None,
+    )
+    return (await _await_job(job, timeout)).result
+
+
+async def submit_ws_pipeline(session_id: str, client_id: str, data: Dict[str, Any], run_id: str) -> None:
+    """`start_pipeline` del WebSocket vía cola; sin cola corre en la tarea de la sesión"""
+    # Los frames de error de esta tarea también van al registro de eventos de la sesión
+    event_stream.set(session_id)
+    queue = get_job_queue()
+    if queue is None:
+        from app.main import _run_ws_pipeline
+        await _run_ws_pipeline(session_id, client_id, data, run_id)
+        return
+    payload_data = {key: value for key, value in data.items() if key != "apiConfig"}
+    job = await queue.enqueue(
+        WS_PIPELINE_JOB,
+        {"session_id": session_id, "client_id": client_id, "run_id": run_id, "data": payload_data},
+        secrets={"apiConfig": data["apiConfig"]} if data.get("apiConfig") else None,
+    )
+    try:
+        # Un reintento vuelve a empezar con su propio pipeline_started
+        await _await_job(job, timeout=None)
+    except PipelineJobError as e:
+        from app.websocket_manager import manager
+        await manager.send_json(session_id, {
+            "type": "error",
+            "message": f"Pipeline execution error: {e}",
+            "run_id": run_id,
+        })
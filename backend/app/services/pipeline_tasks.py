@@ -0,0 +1,180 @@
+"""
+Pipeline Tasks v1.0.0
+=====================
+Pipelines en ejecución por sesión WebSocket.
+
+Cada `start_pipeline` corre como una tarea asyncio registrada bajo su sesión,
+así el bucle de recepción sigue atendiendo ping, get_stats o cancel_pipeline.
+La tarea se cancela con `cancel_pipeline`, al desconectarse el cliente o al
+lanzar otro pipeline en la misma sesión. La cancelación llega hasta las
+llamadas LLM en curso: los streams HTTP se cierran y la capacidad del
+gobernador se libera en el momento.
+
+Al desconectarse, la cancelación puede diferirse (`schedule_cancel`) para que
+un cliente que se reconecta a tiempo (`keep`) reanude el mismo pipeline desde
+el registro de eventos en vez de volver a ejecutarlo.
+"""
+
+import asyncio
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+
+@dataclass
+class PipelineRun:
+    """Un pipeline en ejecución"""
+    run_id: str
+    session_id: str
+    task: asyncio.Task
+    started_at: datetime
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "run_id": self.run_id,
+            "session_id": self.session_id,
+            "started_at": self.started_at.isoformat(),
+            "running": not self.task.done(),
+        }
+
+
+class PipelineTaskRegistry:
+    """Un pipeline activo por sesión; lanzar otro reemplaza (y cancela) al anterior."""
+
+    def __init__(self):
+        self._runs: Dict[str, PipelineRun] = {}
+        self._pending_cancels: Dict[str, asyncio.TimerHandle] = {}
+        self.started = 0
+        self.completed = 0
+        self.cancelled = 0
+        self.superseded = 0
+        self.resumed = 0
+
+    def start(self, session_id: str, factory: Callable[[str], Awaitable[Any]]) -> PipelineRun:
+        """
+        Lanza `factory(run_id)` como tarea de la sesión.
+
+        Args:
+            session_id: Sesión WebSocket propietaria
+            factory: Crea la corrutina del pipeline a partir de su run_id
+
+        Returns:
+            El PipelineRun registrado
+        """
+        self._discard_pending(session_id)
+        previous = self._runs.get(session_id)
+        run_id = uuid.uuid4().hex[:12]
+        if previous and not previous.task.done():
+            print(f"🛑 Pipeline {previous.run_id} reemplazado en {session_id}")
+            previous.task.cancel()
+            self.superseded += 1
+            coro = self._after(previous.task, factory, run_id)
+        else:
+            coro = factory(run_id)
+
+        task = asyncio.create_task(coro, name=f"pipeline:{session_id}:{run_id}")
+        run = PipelineRun(run_id=run_id, session_id=session_id, task=task, started_at=datetime.utcnow())
+        self._runs[session_id] = run
+        self.started += 1
+        task.add_done_callback(lambda _: self._finished(run))
+        return run
+
+    @staticmethod
+    async def _after(previous: asyncio.Task, factory: Callable[[str], Awaitable[Any]], run_id: str) -> Any:
+        # El reemplazado termina de cancelarse antes de que el nuevo emita frames.
+        # La corrutina se crea después: si este run se cancela antes, no queda ninguna sin esperar
+        await asyncio.wait({previous})
+        return await factory(run_id)
+
+    def _finished(self, run: PipelineRun) -> None:
+        if self._runs.get(run.session_id) is run:
+            del self._runs[run.session_id]
+            self._discard_pending(run.session_id)
+        if run.task.cancelled():
+            self.cancelled += 1
+            return
+        self.completed += 1
+        if run.task.exception() is not None:
+            print(f"❌ Pipeline {run.run_id} terminó con error: {run.task.exception()}")
+
+    def get(self, session_id: str) -> Optional[PipelineRun]:
+        return self._runs.get(session_id)
+
+    async def cancel(
+        self,
+        session_id: str,
+        run_id: Optional[str] = None,
+        timeout: float = 5.0
+    ) -> Optional[PipelineRun]:
+        """
+        Cancela el pipeline de la sesión (si `run_id` coincide, cuando se indica)
+        y espera hasta `timeout` segundos a que libere sus recursos.
+
+        Returns:
+            El PipelineRun cancelado, o None si no había nada que cancelar
+        """
+        run = self._runs.get(session_id)
+        if run is None or run.task.done() or (run_id and run.run_id != run_id):
+            return None
+        self._discard_pending(session_id)
+        run.task.cancel()
+        await asyncio.wait({run.task}, timeout=timeout)
+        print(f"🛑 Pipeline {run.run_id} cancelado en {session_id}")
+        return run
+
+    def schedule_cancel(self, session_id: str, delay: float) -> Optional[PipelineRun]:
+        """
+        Cancela el pipeline de la sesión dentro de `delay` segundos, salvo que
+        antes se llame a `keep` (el cliente se reconectó). `delay <= 0` cancela ya.
+
+        Returns:
+            El PipelineRun afectado, o None si no había nada en curso
+        """
+        run = self._runs.get(session_id)
+        if run is None or run.task.done():
+            return None
+        self._discard_pending(session_id)
+        if delay <= 0:
+            run.task.cancel()
+            print(f"🛑 Pipeline {run.run_id} cancelado en {session_id}")
+            return run
+        self._pending_cancels[session_id] = asyncio.get_running_loop().call_later(delay, self._expire, run)
+        print(f"⏳ Pipeline {run.run_id} sigue {delay:.0f}s a la espera de que {session_id} se reconecte")
+        return run
+
+    def _expire(self, run: PipelineRun) -> None:
+        self._pending_cancels.pop(run.session_id, None)
+        if not run.task.done():
+            run.task.cancel()
+            print(f"🛑 Pipeline {run.run_id} cancelado: {run.session_id} no se reconectó")
+
+    def keep(self, session_id: str) -> Optional[PipelineRun]:
+        """Anula una cancelación diferida; devuelve el pipeline que sigue en curso"""
+        if self._discard_pending(session_id):
+            self.resumed += 1
+        run = self._runs.get(session_id)
+        return run if run is not None and not run.task.done() else None
+
+    def _discard_pending(self, session_id: str) -> bool:
+        handle = self._pending_cancels.pop(session_id, None)
+        if handle is None:
+            return False
+        handle.cancel()
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "active": len(self._runs),
+            "awaiting_reconnect": len(self._pending_cancels),
+            "resumed": self.resumed,
+            "started": self.started,
+            "completed": self.completed,
+            "cancelled": self.cancelled,
+            "superseded": self.superseded,
+            "runs": [run.to_dict() for run in self._runs.values()],
+        }
+
+
+# Instancia global compartida por el endpoint WebSocket y las rutas admin
+pipeline_tasks = PipelineTaskRegistry()
@@ -1,30 +1,38 @@
 """
-Streaming Agent Pipeline v0.8.0
+Streaming Agent Pipeline v0.9.0
 ===============================
 Pipeline de agentes con streaming en tiempo real y formatos especializados.
 
 Características:
 - Ejecución jerárquica por niveles
+- **NUEVO**: Agentes del mismo nivel en paralelo (DAG con límite de fan-out)
 - Streaming de respuestas vía WebSocket
 - Formateo automático para humanos
 - Inyección de contexto entre agentes
+- **NUEVO**: Streaming de tokens del LLM (frames `agent_delta` agrupados)
 - **NUEVO**: Prompts especializados por tipo de agente
 - **NUEVO**: Mínimos de palabras según funcionalidad
 - Manejo robusto de errores
 """
 
 import asyncio
-from typing import List, Dict, Any, AsyncGenerator, Optional
+import itertools
+import time
+from typing import List, Dict, Any, AsyncGenerator, Optional, Tuple
 from datetime import datetime
 import traceback
 
+from app.config import PIPELINE_MAX_FAN_OUT
 from app.websocket_manager import manager
 from app.formatters.human_formatter import HumanResponseFormatter
+from src.infrastructure.adapters.external.llm_governor import llm_user_id
+from src.infrastructure.adapters.external.token_budget import fit_entries, plan_budget, count_tokens
 
 # === SISTEMA DE FORMATOS ESPECIALIZADOS ===
 try:
     from app.agents.enhanced_registry import (
         build_agent_prompt,
+        get_compiled_prompt,
         get_specialized_system_prompt,
         ENHANCED_AGENT_DEFINITIONS
     )
@@ -38,19 +46,34 @@ except ImportError:
     ENHANCED_AGENT_DEFINITIONS = {}
     CATEGORY_FORMAT_MAPPING = {}
 
+# Agrupación de deltas: se envía un frame cuando se acumulan DELTA_FLUSH_CHARS
+# caracteres o pasan DELTA_FLUSH_INTERVAL segundos desde el último envío.
+DELTA_FLUSH_CHARS = 64
+DELTA_FLUSH_INTERVAL = 0.05
+
+# Marca en la cola de frames de que un agente terminó (con o sin error)
+_AGENT_FINISHED = object()
+
 
 class StreamingAgentPipeline:
     """
     Pipeline de agentes con capacidad de streaming en tiempo real.
     
     Integra:
-    - Ejecución secuencial por niveles
+    - Ejecución por niveles: los niveles en orden, los agentes de un nivel en paralelo
     - WebSocket para actualizaciones en vivo
     - Formateo humano de respuestas
     - Contexto acumulativo entre agentes
     """
     
-    def __init__(self, agents: List[Any], agent_definitions: Dict[str, Dict], language: str = "es"):
+    def __init__(
+        self,
+        agents: List[Any],
+        agent_definitions: Dict[str, Dict],
+        language: str = "es",
+        stream_tokens: bool = True,
+        max_fan_out: Optional[int] = None
+    ):
         """
         Inicializa el pipeline.
         
@@ -58,12 +81,18 @@ class StreamingAgentPipeline:
             agents: Lista de instancias de agentes
             agent_definitions: Definiciones de agentes con niveles
             language: Idioma de la respuesta
+            stream_tokens: Reenviar los tokens del LLM como frames `agent_delta`
+            max_fan_out: Máximo de agentes ejecutándose a la vez (por defecto PIPELINE_MAX_FAN_OUT)
         """
         self.agents = agents
         self.agent_definitions = agent_definitions
         self.language = language
+        self.stream_tokens = stream_tokens
+        self.max_fan_out = max(1, max_fan_out or PIPELINE_MAX_FAN_OUT)
         self.results: List[Dict] = []
         self.accumulated_context = ""
+        # paso → (agente, respuesta); se recorta por tokens al preparar cada paso
+        self.context_entries: Dict[int, Tuple[str, str]] = {}
         self.start_time: Optional[datetime] = None
     
     async def execute_with_streaming(
@@ -81,11 +110,15 @@ class StreamingAgentPipeline:
             context: Contexto inicial opcional
             
         Yields:
-            Respuestas formateadas de cada agente
+            Frames `agent_delta` (si stream_tokens) y respuestas formateadas de cada agente
         """
         self.start_time = datetime.utcnow()
         self.results = []
         self.accumulated_context = ""
+        self.context_entries = {}
+        
+        # Las llamadas LLM de este pipeline se encolan de forma justa bajo este cliente
+        llm_user_id.set(client_id)
         
         # Ordenar agentes por nivel
         sorted_agents = self._sort_agents_by_level()
@@ -96,126 +129,52 @@ class StreamingAgentPipeline:
             "type": "pipeline_start",
             "total_agents": total_agents,
             "agents": [self._get_agent_info(a) for a in sorted_agents],
+            "max_fan_out": self.max_fan_out,
             "timestamp": datetime.utcnow().isoformat()
         })
         
-        for i, agent in enumerate(sorted_agents, 1):
-            agent_id = self._get_agent_id(agent)
-            agent_info = self._get_agent_info(agent)
-            
+        # DAG por niveles: cada agente depende de los de niveles inferiores
+        # (salvo los marcados como independientes) y los del mismo nivel corren en paralelo
+        levels = [self._get_level(a) for a in sorted_agents]
+        dependencies = {
+            step: self._get_dependencies(step, agent, levels)
+            for step, agent in enumerate(sorted_agents, 1)
+        }
+        finished = {step: asyncio.Event() for step in dependencies}
+        fan_out = asyncio.Semaphore(self.max_fan_out)
+        frames: asyncio.Queue = asyncio.Queue()
+        self._completion_counter = itertools.count(1)
+        
+        async def run(step: int, agent: Any):
             try:
-                # Notificar inicio del agente
-                await manager.send_agent_start(
-                    client_id,
-                    agent_info["name"],
-                    i,
-                    total_agents
-                )
-                
-                # Preparar input con contexto acumulado y prompt especializado
-                agent_category = self._get_agent_category(agent)
-                enhanced_task = self._prepare_task_with_context(task, i, agent)
-                
-                # Enviar progreso inicial
-                await manager.send_agent_progress(
-                    client_id,
-                    agent_info["name"],
-                    10,
-                    "Analizando consulta..."
-                )
-                
-                # Ejecutar agente
-                raw_response = await self._execute_agent(agent, enhanced_task)
-                
-                # Enviar progreso de procesamiento
-                await manager.send_agent_progress(
-                    client_id,
-                    agent_info["name"],
-                    70,
-                    "Formateando respuesta..."
-                )
-                
-                # Formatear respuesta para humanos
-                formatted = HumanResponseFormatter.format_agent_response(
-                    raw_response=raw_response,
-                    agent_id=agent_id,
-                    agent_name=agent_info["name"],
-                    level=agent_info["level"],
-                    specialty=agent_info["specialty"],
-                    step=i,
-                    total_steps=total_agents,
-                    language=self.language
-                )
-                
-                # === AGREGAR METADATOS DE FORMATO ESPECIALIZADO ===
-                formatted["category"] = agent_category
-                if SPECIALIZED_FORMATS_AVAILABLE:
-                    format_type = CATEGORY_FORMAT_MAPPING.get(agent_category, "analysis")
-                    formatted["format_type"] = format_type
-                    formatted["min_words"] = get_min_words_for_agent(agent_category)
-                else:
-                    formatted["format_type"] = "analysis"
-                    formatted["min_words"] = 500
-                
-                # Agregar a resultados
-                self.results.append(formatted)
-                
-                # Actualizar contexto acumulado
-                self._update_accumulated_context(agent_info["name"], raw_response)
-                
-                # Enviar respuesta completa
-                await manager.send_agent_response(client_id, formatted)
-                
-                # Enviar progreso completado
-                await manager.send_agent_progress(
-                    client_id,
-                    agent_info["name"],
-                    100,
-                    "Completado"
-                )
-                
-                # Yield para SSE
-                yield formatted
-                
-                # Pequeña pausa para mejor UX
-                await asyncio.sleep(0.3)
-                
-            except Exception as e:
-                error_msg = str(e)
-                error_traceback = traceback.format_exc()
-                print(f"❌ Error en agente {agent_id}: {error_msg}")
-                print(f"📋 Traceback:\n{error_traceback}")
-                
-                # Crear respuesta de error
-                error_response = {
-                    "agent_id": agent_id,
-                    "agent_name": agent_info["name"],
-                    "agent_emoji": "⚠️",
-                    "level": agent_info["level"],
-                    "level_name": f"Nivel {agent_info['level']}",
-                    "specialty": agent_info["specialty"],
-                    "response_type": "error",
-                    "title": f"⚠️ Error en {agent_info['name']}",
-                    "sections": [{
-                        "title": "Error",
-                        "type": "error",
-                        "items": [f"Error: {error_msg}"]
-                    }],
-                    "key_points": ["Proceso interrumpido"],
-                    "summary": "Error durante el procesamiento",
-                    "raw_content": error_msg,
-                    "step": i,
-                    "total_steps": total_agents,
-                    "progress": round((i / total_agents) * 100, 1),
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-                
-                await manager.send_agent_error(client_id, agent_info["name"], error_msg)
-                self.results.append(error_response)
-                yield error_response
-                
-                # Continuar con el siguiente agente en lugar de detener todo
-                continue
+                for dependency in dependencies[step]:
+                    await finished[dependency].wait()
+                async with fan_out:
+                    async for frame in self._run_agent(
+                        agent, task, client_id, step, total_agents, levels[step - 1], dependencies[step]
+                    ):
+                        await frames.put(frame)
+            finally:
+                finished[step].set()
+                await frames.put(_AGENT_FINISHED)
+        
+        tasks = [asyncio.create_task(run(step, agent)) for step, agent in enumerate(sorted_agents, 1)]
+        running = len(tasks)
+        try:
+            # Los frames salen en cuanto cada agente los produce
+            while running:
+                frame = await frames.get()
+                if frame is _AGENT_FINISHED:
+                    running -= 1
+                    continue
+                yield frame
+        finally:
+            for pending in tasks:
+                pending.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        # Orden determinista de resultados (por paso), independiente de quién terminó antes
+        self.results.sort(key=lambda r: r.get("step", 0))
         
         # Calcular tiempo total
         total_time_ms = (datetime.utcnow() - self.start_time).total_seconds() * 1000
@@ -232,18 +191,162 @@ class StreamingAgentPipeline:
         await manager.send_pipeline_complete(client_id, summary)
         yield summary
     
-    def _sort_agents_by_level(self) -> List[Any]:
-        """Ordena agentes por nivel de expertise (1 primero)."""
-        def get_level(agent) -> int:
-            agent_id = self._get_agent_id(agent)
-            agent_type = agent_id.rsplit('_', 2)[0] if '_' in agent_id else agent_id
+    async def _run_agent(
+        self,
+        agent: Any,
+        task: str,
+        client_id: str,
+        i: int,
+        total_agents: int,
+        level: int,
+        depends_on: List[int]
+    ) -> AsyncGenerator[Dict, None]:
+        """Ejecuta un agente del DAG y emite sus frames (deltas y respuesta o error)."""
+        agent_id = self._get_agent_id(agent)
+        agent_info = self._get_agent_info(agent)
+        
+        try:
+            # Notificar inicio del agente
+            await manager.send_agent_start(
+                client_id,
+                agent_info["name"],
+                i,
+                total_agents
+            )
+            
+            # Preparar input con el contexto de sus dependencias y prompt especializado
+            agent_category = self._get_agent_category(agent)
+            enhanced_task = self._prepare_task_with_context(task, i, agent, depends_on)
+            
+            # Ejecutar agente
+            if self.stream_tokens and hasattr(agent, 'process_task_stream'):
+                chunks: List[str] = []
+                async for delta_frame in self._stream_agent(
+                    agent, enhanced_task, client_id, agent_info, i, chunks
+                ):
+                    yield delta_frame
+                raw_response = "".join(chunks)
+            else:
+                await manager.send_agent_progress(
+                    client_id,
+                    agent_info["name"],
+                    10,
+                    "Analizando consulta..."
+                )
+                raw_response = await self._execute_agent(agent, enhanced_task)
+            
+            # Formatear respuesta para humanos
+            formatted = HumanResponseFormatter.format_agent_response(
+                raw_response=raw_response,
+                agent_id=agent_id,
+                agent_name=agent_info["name"],
+                level=agent_info["level"],
+                specialty=agent_info["specialty"],
+                step=i,
+                total_steps=total_agents,
+                language=self.language
+            )
+            
+            # === AGREGAR METADATOS DE FORMATO ESPECIALIZADO ===
+            formatted["category"] = agent_category
+            if SPECIALIZED_FORMATS_AVAILABLE:
+                format_type = CATEGORY_FORMAT_MAPPING.get(agent_category, "analysis")
+                formatted["format_type"] = format_type
+                formatted["min_words"] = get_min_words_for_agent(agent_category)
+            else:
+                formatted["format_type"] = "analysis"
+                formatted["min_words"] = 500
+            formatted["execution"] = self._execution_metadata(i, level, depends_on)
             
-            for key, info in self.agent_definitions.items():
-                if agent_type.startswith(key) or key in agent_type:
-                    return info.get('level', 3)
-            return 3
+            # Agregar a resultados
+            self.results.append(formatted)
+            
+            # Actualizar contexto acumulado
+            self._update_accumulated_context(agent_info["name"], raw_response, step=i)
+            
+            # Enviar respuesta completa
+            await manager.send_agent_response(client_id, formatted)
+            
+            # Enviar progreso completado
+            await manager.send_agent_progress(
+                client_id,
+                agent_info["name"],
+                100,
+                "Completado"
+            )
+            
+            # Yield para SSE
+            yield formatted
+            
+        except Exception as e:
+            error_msg = str(e)
+            error_traceback = traceback.format_exc()
+            print(f"❌ Error en agente {agent_id}: {error_msg}")
+            print(f"📋 Traceback:\n{error_traceback}")
+            
+            # Crear respuesta de error
+            error_response = {
+                "agent_id": agent_id,
+                "agent_name": agent_info["name"],
+                "agent_emoji": "⚠️",
+                "level": agent_info["level"],
+                "level_name": f"Nivel {agent_info['level']}",
+                "specialty": agent_info["specialty"],
+                "response_type": "error",
+                "title": f"⚠️ Error en {agent_info['name']}",
+                "sections": [{
+                    "title": "Error",
+                    "type": "error",
+                    "items": [f"Error: {error_msg}"]
+                }],
+                "key_points": ["Proceso interrumpido"],
+                "summary": "Error durante el procesamiento",
+                "raw_content": error_msg,
+                "step": i,
+                "total_steps": total_agents,
+                "progress": round((i / total_agents) * 100, 1),
+                "execution": self._execution_metadata(i, level, depends_on),
+                "timestamp": datetime.utcnow().isoformat()
+            }
+            
+            # Los demás agentes siguen: un error no detiene el pipeline
+            await manager.send_agent_error(client_id, agent_info["name"], error_msg)
+            self.results.append(error_response)
+            yield error_response
+    
+    def _execution_metadata(self, step: int, level: int, depends_on: List[int]) -> Dict[str, Any]:
+        """Orden determinista (paso, nivel, dependencias) más el orden real de finalización."""
+        return {
+            "step": step,
+            "level": level,
+            "depends_on": depends_on,
+            "completion_index": next(self._completion_counter),
+        }
+    
+    def _get_level(self, agent: Any) -> int:
+        agent_id = self._get_agent_id(agent)
+        agent_type = agent_id.rsplit('_', 2)[0] if '_' in agent_id else agent_id
         
-        return sorted(self.agents, key=get_level)
+        for key, info in self.agent_definitions.items():
+            if agent_type.startswith(key) or key in agent_type:
+                return info.get('level', 3)
+        return 3
+    
+    def _needs_context(self, agent: Any) -> bool:
+        """Un agente puede declararse independiente (needs_context=False) en su clase o definición."""
+        definition = self.agent_definitions.get(self._get_agent_id(agent), {})
+        return bool(getattr(agent, "needs_context", definition.get("needs_context", True)))
+    
+    def _get_dependencies(self, step: int, agent: Any, levels: List[int]) -> List[int]:
+        """Pasos de niveles inferiores cuyo resultado necesita este agente."""
+        if not self._needs_context(agent):
+            return []
+        level = levels[step - 1]
+        return [s for s in range(1, step) if levels[s - 1] < level]
+    
+    def _sort_agents_by_level(self) -> List[Any]:
+        """Ordena agentes por nivel de expertise (1 primero)."""
+        return sorted(self.agents, key=self._get_level)
     
     def _get_agent_id(self, agent: Any) -> str:
         """Obtiene el ID del agente."""
@@ -353,7 +456,13 @@ class StreamingAgentPipeline:
             "specialty": specialty
         }
     
-    def _prepare_task_with_context(self, task: str, step: int, agent: Any = None) -> str:
+    def _prepare_task_with_context(
+        self,
+        task: str,
+        step: int,
+        agent: Any = None,
+        depends_on: Optional[List[int]] = None
+    ) -> str:
         """
         Prepara la tarea con contexto acumulado y prompt especializado según categoría.
         
@@ -361,6 +470,7 @@ class StreamingAgentPipeline:
             task: Tarea original
             step: Paso actual en el pipeline
             agent: Instancia del agente (opcional, para obtener categoría)
+            depends_on: Pasos cuyo resultado entra como contexto (por defecto, todos los registrados)
         
         Returns:
             Tarea enriquecida con formato especializado
@@ -369,42 +479,54 @@ class StreamingAgentPipeline:
         agent_id = self._get_agent_id(agent) if agent else "generic"
         agent_category = self._get_agent_category(agent) if agent else "analysis"
         
-        # === USAR PROMPT ESPECIALIZADO SI ESTÁ DISPONIBLE ===
-        specialized_prompt = ""
+        # === USAR PLANTILLA PRECOMPILADA DEL AGENTE SI ESTÁ DISPONIBLE ===
+        compiled_prompt = None
         if SPECIALIZED_FORMATS_AVAILABLE and agent:
             agent_data = ENHANCED_AGENT_DEFINITIONS.get(agent_id, {})
             if agent_data:
                 try:
-                    specialized_prompt = build_agent_prompt(agent_id, agent_data, task)
+                    compiled_prompt = get_compiled_prompt(agent_id, agent_data)
                 except Exception as e:
                     print(f"⚠️ Error generando prompt especializado: {e}")
-                    specialized_prompt = ""
-        
-        # Construir prompt base si no hay especializado
-        if specialized_prompt:
-            base_task = specialized_prompt
-        else:
-            base_task = task
-        
-        # Agregar contexto de agentes anteriores
-        if step == 1 or not self.accumulated_context:
-            return base_task
-        
-        # Combinar con contexto acumulado
-        enhanced = f"""{base_task}
+                    compiled_prompt = None
+        
+        base_prompt = compiled_prompt.render(task) if compiled_prompt else task
+        
+        # Agregar contexto de agentes anteriores dentro del presupuesto de tokens del modelo
+        context_block = ""
+        steps = sorted(self.context_entries if depends_on is None else depends_on)
+        entries = [self.context_entries[s] for s in steps if s in self.context_entries]
+        if step > 1 and entries:
+            model = getattr(agent, "model", None)
+            budget = plan_budget(model, system=self._get_system_prompt(agent), task=base_prompt)
+            available = budget.context - count_tokens(self._context_block(""), model)
+            context_text = fit_entries(entries, available, model)
+            if context_text:
+                context_block = self._context_block(context_text)
+        
+        return base_prompt + context_block
+    
+    @staticmethod
+    def _context_block(context_text: str) -> str:
+        return f"""
 
 ---
 
 ## CONTEXTO DE EXPERTOS ANTERIORES
 
-{self.accumulated_context}
+{context_text}
 
 ---
 
 **INSTRUCCIÓN:** Considera el análisis previo y COMPLEMENTA con tu expertise especializado.
 Tu respuesta debe seguir la estructura de formato indicada arriba y ser EXHAUSTIVA."""
-        
-        return enhanced
+    
+    @staticmethod
+    def _get_system_prompt(agent: Any) -> str:
+        try:
+            return agent.get_system_prompt() if hasattr(agent, "get_system_prompt") else ""
+        except Exception:
+            return ""
     
     def _get_agent_category(self, agent: Any) -> str:
         """
@@ -498,19 +620,73 @@ Tu respuesta debe seguir la estructura de formato indicada arriba y ser EXHAUSTI
         
         return "analysis"  # Default
     
-    def _update_accumulated_context(self, agent_name: str, response: Any):
-        """Actualiza el contexto acumulado con la respuesta del agente."""
+    def _update_accumulated_context(self, agent_name: str, response: Any, step: Optional[int] = None):
+        """
+        Registra la respuesta del agente para los pasos siguientes. El recorte
+        no es por caracteres: se hace por tokens en _prepare_task_with_context,
+        según la ventana del modelo de cada agente. El contexto se ordena por
+        paso, no por orden de finalización, para que sea determinista.
+        """
         response_text = str(response) if not isinstance(response, str) else response
+        step = step if step is not None else len(self.context_entries) + 1
+        self.context_entries[step] = (agent_name, response_text)
+        self.accumulated_context = "".join(
+            f"\n\n--- {name} ---\n{text}" for _, (name, text) in sorted(self.context_entries.items())
+        )
+    
+    async def _stream_agent(
+        self,
+        agent: Any,
+        task: str,
+        client_id: str,
+        agent_info: Dict[str, Any],
+        step: int,
+        chunks: List[str]
+    ) -> AsyncGenerator[Dict, None]:
+        """
+        Ejecuta un agente en modo streaming.
         
-        # Limitar tamaño del contexto
-        if len(response_text) > 1000:
-            response_text = response_text[:1000] + "..."
-        
-        self.accumulated_context += f"\n\n--- {agent_name} ---\n{response_text}"
+        Agrupa los deltas del LLM y envía cada grupo como frame `agent_delta`
+        por WebSocket (y lo emite para SSE). El texto completo queda en `chunks`.
+        """
+        seq = 0
+        buffer: List[str] = []
+        buffered_chars = 0
+        last_flush = time.monotonic()
+        
+        def build_frame() -> Dict[str, Any]:
+            return {
+                "type": "agent_delta",
+                "agent": agent_info["name"],
+                "agent_id": agent_info["id"],
+                "step": step,
+                "seq": seq,
+                "delta": "".join(buffer),
+                "timestamp": datetime.utcnow().isoformat()
+            }
         
-        # Mantener contexto manejable
-        if len(self.accumulated_context) > 5000:
-            self.accumulated_context = self.accumulated_context[-4000:]
+        async for delta in agent.process_task_stream(task, {}):
+            if not delta:
+                continue
+            chunks.append(delta)
+            buffer.append(delta)
+            buffered_chars += len(delta)
+            
+            now = time.monotonic()
+            # El primer delta sale de inmediato para minimizar el time-to-first-token
+            if seq == 0 or buffered_chars >= DELTA_FLUSH_CHARS or now - last_flush >= DELTA_FLUSH_INTERVAL:
+                frame = build_frame()
+                await manager.send_agent_delta(client_id, frame)
+                yield frame
+                seq += 1
+                buffer.clear()
+                buffered_chars = 0
+                last_flush = now
+        
+        if buffer:
+            frame = build_frame()
+            await manager.send_agent_delta(client_id, frame)
+            yield frame
     
     async def _execute_agent(self, agent: Any, task: str) -> Any:
         """
@@ -10,6 +10,9 @@ import json
 from typing import Any, Dict, List, Optional
 from pydantic import validator, Field
 import bleach
+
+from src.infrastructure.config.settings import MOCK_LLM_ENABLED
+from src.infrastructure.adapters.external.mock_llm import is_mock_url
 from urllib.parse import urlparse
 
 # Configuración de bleach para HTML sanitización
@@ -45,8 +48,8 @@ class SecurityValidator:
         return clean_html
     
     @staticmethod
-    def sanitize_text(text: str) -> str:
-        """Sanitizar texto plano"""
+    def sanitize_text(text: str, max_length: Optional[int] = 10000) -> str:
+        """Sanitizar texto plano (max_length=None si el llamador ya acotó por tokens)"""
         if not text:
             return ""
         
@@ -57,8 +60,7 @@ class SecurityValidator:
         sanitized = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f]', '', sanitized)
         
         # Limitar longitud
-        max_length = 10000
-        if len(sanitized) > max_length:
+        if max_length is not None and len(sanitized) > max_length:
             sanitized = sanitized[:max_length] + "..."
         
         return sanitized.strip()
@@ -183,8 +185,9 @@ class SecurityValidator:
         
         valid_config = {}
         
-        # Validar tipo
-        if config.get('type') in ['groq', 'openai', 'anthropic', 'local']:
+        # Validar tipo (el proveedor simulado solo si está habilitado)
+        allowed_types = ['groq', 'openai', 'anthropic', 'local'] + (['mock'] if MOCK_LLM_ENABLED else [])
+        if config.get('type') in allowed_types:
             valid_config['type'] = config['type']
         
         # Validar API key (sin validar contenido, solo formato)
@@ -196,6 +199,8 @@ class SecurityValidator:
         base_url = config.get('baseUrl', '')
         if isinstance(base_url, str) and SecurityValidator.validate_url(base_url):
             valid_config['baseUrl'] = base_url
+        elif MOCK_LLM_ENABLED and isinstance(base_url, str) and is_mock_url(base_url):
+            valid_config['baseUrl'] = base_url
         
         return valid_config
 
@@ -1,5 +1,5 @@
 """
-WebSocket Manager v0.8.0
+WebSocket Manager v0.9.0
 ========================
 Gestiona conexiones WebSocket en tiempo real para streaming de respuestas de agentes.
 
@@ -9,14 +9,227 @@ Características:
 - Envío dirigido por client_id
 - Manejo robusto de desconexiones
 - Tracking de usuarios en línea con Redis
+- Entrega entre procesos/réplicas a través de un bus de mensajes (message_bus)
+- Frames de pipelines numerados (`event_seq`) en un registro de eventos (event_log),
+  reproducibles al reconectar con `last_seq`
+- Una cola de salida acotada y una tarea de escritura por conexión: un cliente
+  lento no frena a su pipeline ni a los broadcasts
+- Broadcast serializado una sola vez, con plazo y recuento de entregas
+- Codificación negociada por conexión (wire_codec): JSON o msgpack, frames
+  completos o lean
 """
 
 from fastapi import WebSocket
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 import json
 import asyncio
+import time
+from collections import Counter, deque
 from datetime import datetime
 
+from app.config import WS_SEND_QUEUE_SIZE, WS_SEND_TIMEOUT, WS_BROADCAST_TIMEOUT
+from app.event_log import PipelineEventLog, create_event_log, event_stream, is_transient
+from app.message_bus import MessageBus, create_message_bus, new_node_id
+from app.wire_codec import DEFAULT_CODEC, WireCodec
+
+BROADCAST_CHANNEL = "ws:broadcast"
+
+# Frames durables encolados por encima del límite antes de dar al cliente por atascado
+SEND_QUEUE_OVERFLOW_FACTOR = 4
+
+
+def session_channel(client_id: str) -> str:
+    """Canal del bus de la sesión: lo suscribe el proceso que tiene el socket"""
+    return f"ws:session:{client_id}"
+
+
+def _coalesce_key(data: Any) -> Optional[Tuple]:
+    """Clave para fusionar frames transitorios pendientes (None = frame durable)"""
+    if not isinstance(data, dict) or not is_transient(data):
+        return None
+    if data.get("type") == "agent_delta":
+        return ("agent_delta", data.get("agent_id"), data.get("step"))
+    return (data.get("type"), data.get("agent"))
+
+
+def _merge_frames(pending: dict, data: dict) -> dict:
+    """Un delta se acumula sobre el pendiente; el progreso más reciente reemplaza al anterior"""
+    if data.get("type") != "agent_delta":
+        return data
+    merged = dict(pending, **data)
+    merged["delta"] = pending.get("delta", "") + data.get("delta", "")
+    if "seq" in pending:
+        merged["seq"] = pending["seq"]
+    return merged
+
+
+class ClientWriter:
+    """
+    Cola de salida de una conexión, vaciada por su propia tarea de escritura.
+    
+    `put` nunca espera a la red. Con la cola llena o el cliente lento:
+    - `agent_progress` pendiente se reemplaza por el más reciente y los
+      `agent_delta` pendientes del mismo agente se concatenan
+    - Un frame transitorio sin hueco se descarta
+    - Un frame durable (agent_response, pipeline_complete...) siempre se
+      encola, desplazando al transitorio más antiguo si hace falta; si aun así
+      se acumulan demasiados, `put` devuelve False (cliente atascado)
+    
+    Los frames se codifican con el `codec` de la conexión al escribirse, así
+    la fusión de transitorios trabaja siempre sobre dicts.
+    """
+    
+    def __init__(
+        self,
+        client_id: str,
+        websocket: WebSocket,
+        max_queue: int = WS_SEND_QUEUE_SIZE,
+        on_sent: Optional[Callable[[str], None]] = None,
+        on_error: Optional[Callable[[str], None]] = None,
+        send_timeout: float = WS_SEND_TIMEOUT,
+        codec: WireCodec = DEFAULT_CODEC
+    ):
+        self.client_id = client_id
+        self.websocket = websocket
+        self.codec = codec
+        self.max_queue = max(1, max_queue)
+        self.send_timeout = send_timeout
+        self._on_sent = on_sent
+        self._on_error = on_error
+        self._queue: deque = deque()  # entradas [kind, data, clave de fusión, future de entrega]
+        self._pending: Dict[Tuple, list] = {}
+        self._ready = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self.task: Optional[asyncio.Task] = None
+        self.sent = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.max_depth = 0
+    
+    def start(self):
+        self.task = asyncio.create_task(self._run(), name=f"ws-writer:{self.client_id}")
+    
+    def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+        self._discard_queue()
+    
+    def _discard_queue(self):
+        for entry in self._queue:
+            self._resolve(entry, False)
+        self._queue.clear()
+        self._pending.clear()
+        self._idle.set()
+    
+    @property
+    def depth(self) -> int:
+        return len(self._queue)
+    
+    @staticmethod
+    def _resolve(entry: list, delivered: bool):
+        waiter = entry[3]
+        if waiter is not None and not waiter.done():
+            waiter.set_result(delivered)
+    
+    def put(self, data: Any, kind: str = "json", waiter: Optional[asyncio.Future] = None) -> bool:
+        """
+        Encola un frame; False si el cliente no consume (se debe desconectar).
+        
+        `waiter` (solo frames durables) se resuelve a True al escribirse o a
+        False si la conexión se cierra antes.
+        """
+        key = _coalesce_key(data) if kind == "json" else None
+        if key is not None:
+            entry = self._pending.get(key)
+            if entry is not None:
+                entry[1] = _merge_frames(entry[1], data)
+                self.coalesced += 1
+                return True
+            if len(self._queue) >= self.max_queue:
+                self.dropped += 1
+                return True
+        elif len(self._queue) >= self.max_queue and not self._evict_transient():
+            if len(self._queue) >= self.max_queue * SEND_QUEUE_OVERFLOW_FACTOR:
+                return False
+        
+        entry = [kind, data, key, waiter]
+        self._queue.append(entry)
+        if key is None:
+            # Lo transitorio posterior no se adelanta a este frame durable
+            self._pending.clear()
+        else:
+            self._pending[key] = entry
+        self.max_depth = max(self.max_depth, len(self._queue))
+        self._idle.clear()
+        self._ready.set()
+        return True
+    
+    def _evict_transient(self) -> bool:
+        for entry in self._queue:
+            if entry[2] is not None:
+                self._queue.remove(entry)
+                if self._pending.get(entry[2]) is entry:
+                    del self._pending[entry[2]]
+                self.dropped += 1
+                return True
+        return False
+    
+    async def flush(self, timeout: float = 1.0) -> bool:
+        """Espera a que la cola se vacíe; False si no ocurrió en `timeout`"""
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
+    async def _run(self):
+        while True:
+            if not self._queue:
+                self._idle.set()
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+            entry = self._queue.popleft()
+            kind, data, key, _ = entry
+            if key is not None and self._pending.get(key) is entry:
+                del self._pending[key]
+            try:
+                if kind == "json" and self.codec != DEFAULT_CODEC:
+                    kind, data = self.codec.encode(data)
+                # Plazo por envío: un peer muerto no retiene la conexión indefinidamente
+                if kind == "text":
+                    await asyncio.wait_for(self.websocket.send_text(data), self.send_timeout)
+                elif kind == "bytes":
+                    await asyncio.wait_for(self.websocket.send_bytes(data), self.send_timeout)
+                else:
+                    await asyncio.wait_for(self.websocket.send_json(data), self.send_timeout)
+            except asyncio.CancelledError:
+                self._resolve(entry, False)
+                raise
+            except Exception as e:
+                reason = f"sin respuesta en {self.send_timeout}s" if isinstance(e, asyncio.TimeoutError) else e
+                print(f"⚠️ Error enviando a {self.client_id}: {reason}")
+                self._resolve(entry, False)
+                self._discard_queue()
+                if self._on_error:
+                    self._on_error(self.client_id)
+                return
+            self._resolve(entry, True)
+            self.sent += 1
+            if self._on_sent:
+                self._on_sent(self.client_id)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.codec.to_dict(),
+            "depth": self.depth,
+            "max_depth": self.max_depth,
+            "sent": self.sent,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+        }
+
 
 class ConnectionManager:
     """
@@ -26,15 +239,48 @@ class ConnectionManager:
     - Múltiples clientes conectados simultáneamente
     - Envío de mensajes individuales o broadcast
     - Tracking de estado de conexión
+    
+    Los sockets viven en el proceso que los aceptó. Los envíos a sesiones de
+    otro proceso y los broadcasts pasan por el bus: cada proceso suscribe el
+    canal de sus sesiones y el de broadcast, y entrega en local lo que recibe.
+    
+    La entrega local pasa por el ClientWriter de la conexión: `send_json`
+    devuelve en cuanto el frame está encolado, sin esperar a la red.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        bus: Optional[MessageBus] = None,
+        event_log: Optional[PipelineEventLog] = None,
+        send_queue_size: int = WS_SEND_QUEUE_SIZE
+    ):
         self.active_connections: Dict[str, WebSocket] = {}
+        self.writers: Dict[str, ClientWriter] = {}
+        self.send_queue_size = send_queue_size
         self.connection_times: Dict[str, datetime] = {}
         self.message_counts: Dict[str, int] = {}
         self.user_metadata: Dict[str, Dict] = {}  # Metadata de usuarios conectados
+        self.bus = bus or create_message_bus()
+        self.event_log = event_log or create_event_log()
+        # Streams SSE: se leen solo del registro de eventos, nunca de un socket
+        self.log_streams: Set[str] = set()
+        self.node_id = new_node_id()
+        self._broadcast_subscribed = False
+        self._bus_tasks: Set[asyncio.Task] = set()
+        self.remote_sent = 0
+        self.remote_delivered = 0
+        # Acumulados de conexiones ya cerradas
+        self.dropped_frames = 0
+        self.coalesced_frames = 0
+        self.overflow_disconnects = 0
     
-    async def connect(self, websocket: WebSocket, client_id: str, user_metadata: Optional[Dict] = None) -> bool:
+    async def connect(
+        self,
+        websocket: WebSocket,
+        client_id: str,
+        user_metadata: Optional[Dict] = None,
+        codec: WireCodec = DEFAULT_CODEC
+    ) -> bool:
         """
         Acepta una nueva conexión WebSocket.
         
@@ -42,16 +288,35 @@ class ConnectionManager:
             websocket: Instancia de WebSocket
             client_id: Identificador único del cliente
             user_metadata: Metadata del usuario (user_id, device_type, etc.)
+            codec: Codificación negociada (wire_codec.negotiate_codec)
             
         Returns:
             True si la conexión fue exitosa
         """
         try:
             await websocket.accept()
+            previous = self.writers.pop(client_id, None)
+            if previous is not None:
+                previous.stop()
+            superseded = self.active_connections.get(client_id)
+            if superseded is not None and superseded is not websocket:
+                # Reconexión antes de detectar que el socket anterior murió: se cierra,
+                # y su bucle de recepción ya no puede desconectar a esta conexión
+                print(f"♻️ WebSocket {client_id} reemplazado por una nueva conexión")
+                asyncio.create_task(self._close_quietly(superseded, 1000, "Replaced by a new connection"))
+            writer = ClientWriter(
+                client_id, websocket, self.send_queue_size,
+                on_sent=self._count_sent,
+                on_error=lambda cid, ws=websocket: self.disconnect(cid, ws),
+                codec=codec
+            )
+            writer.start()
+            self.writers[client_id] = writer
             self.active_connections[client_id] = websocket
             self.connection_times[client_id] = datetime.utcnow()
             self.message_counts[client_id] = 0
             self.user_metadata[client_id] = user_metadata or {}
+            await self._subscribe(client_id)
             
             print(f"✅ WebSocket conectado: {client_id}")
             return True
@@ -59,15 +324,28 @@ class ConnectionManager:
             print(f"❌ Error conectando WebSocket {client_id}: {e}")
             return False
     
-    def disconnect(self, client_id: str):
+    def disconnect(self, client_id: str, websocket: Optional[WebSocket] = None) -> bool:
         """
         Desconecta un cliente y limpia sus recursos.
         
         Args:
             client_id: Identificador del cliente a desconectar
+            websocket: Socket que se desconecta; si ya no es el registrado para
+                client_id (lo reemplazó una reconexión), no se toca nada
+        
+        Returns:
+            True si se desconectó la conexión registrada
         """
+        if websocket is not None and self.is_superseded(client_id, websocket):
+            return False
         if client_id in self.active_connections:
             del self.active_connections[client_id]
+            self._unsubscribe(client_id)
+            writer = self.writers.pop(client_id, None)
+            if writer is not None:
+                writer.stop()
+                self.dropped_frames += writer.dropped
+                self.coalesced_frames += writer.coalesced
             
             # Calcular duración de sesión
             if client_id in self.connection_times:
@@ -81,82 +359,271 @@ class ConnectionManager:
             
             if client_id in self.user_metadata:
                 del self.user_metadata[client_id]
+            return True
+        return False
     
     def is_connected(self, client_id: str) -> bool:
-        """Verifica si un cliente está conectado."""
+        """Verifica si un cliente está conectado a este proceso."""
         return client_id in self.active_connections
     
+    def is_superseded(self, client_id: str, websocket: WebSocket) -> bool:
+        """Otra conexión (una reconexión) reemplazó a este socket para client_id"""
+        current = self.active_connections.get(client_id)
+        return current is not None and current is not websocket
+    
+    async def _subscribe(self, client_id: str):
+        """Suscribe el canal de la sesión (y el de broadcast la primera vez)"""
+        try:
+            if not self._broadcast_subscribed:
+                await self.bus.subscribe(BROADCAST_CHANNEL, self._on_bus_message)
+                self._broadcast_subscribed = True
+            await self.bus.subscribe(session_channel(client_id), self._on_bus_message)
+        except Exception as e:
+            print(f"⚠️ Bus no disponible para {client_id}, solo entrega local: {e}")
+    
+    def _unsubscribe(self, client_id: str):
+        # disconnect() es síncrono: la baja del canal se hace en segundo plano
+        try:
+            task = asyncio.get_running_loop().create_task(
+                self.bus.unsubscribe(session_channel(client_id), self._on_bus_message)
+            )
+        except RuntimeError:
+            return
+        self._bus_tasks.add(task)
+        task.add_done_callback(self._bus_tasks.discard)
+    
+    async def _on_bus_message(self, channel: str, message: Dict[str, Any]):
+        """Entrega en local un mensaje recibido por el bus"""
+        if channel == BROADCAST_CHANNEL:
+            if message.get("origin") == self.node_id:
+                return
+            self._broadcast_local(message["data"], message.get("exclude"))
+            return
+        client_id = channel[len(session_channel("")):]
+        if await self._send_local(client_id, message["data"], message.get("kind", "json")):
+            self.remote_delivered += 1
+    
+    async def _publish(self, client_id: str, data: Any, kind: str) -> bool:
+        """Envía a una sesión de otro proceso; True si algún proceso la tiene"""
+        try:
+            receivers = await self.bus.publish(session_channel(client_id), {
+                "origin": self.node_id,
+                "kind": kind,
+                "data": data
+            })
+        except Exception as e:
+            print(f"⚠️ Error publicando en el bus para {client_id}: {e}")
+            return False
+        if receivers:
+            self.remote_sent += 1
+        return receivers > 0
+    
+    def _count_sent(self, client_id: str):
+        if client_id in self.message_counts:
+            self.message_counts[client_id] += 1
+    
+    async def _send_local(self, client_id: str, data: Any, kind: str = "json") -> bool:
+        return self._send_local_nowait(client_id, data, kind)
+    
+    def _send_local_nowait(
+        self,
+        client_id: str,
+        data: Any,
+        kind: str = "json",
+        waiter: Optional[asyncio.Future] = None
+    ) -> bool:
+        writer = self.writers.get(client_id)
+        if writer is None:
+            return False
+        if writer.put(data, kind, waiter):
+            return True
+        
+        # Cliente atascado: se cierra; puede reconectar y reanudar con last_seq
+        print(f"⚠️ Cola de salida de {client_id} desbordada ({writer.depth} frames), desconectando")
+        self.overflow_disconnects += 1
+        websocket = self.active_connections.get(client_id)
+        self.disconnect(client_id)
+        if websocket is not None:
+            asyncio.create_task(self._close_quietly(websocket, 1013, "Send queue overflow"))
+        return False
+    
+    @staticmethod
+    async def _close_quietly(websocket: WebSocket, code: int, reason: str):
+        try:
+            await websocket.close(code=code, reason=reason)
+        except Exception:
+            pass
+    
+    async def flush(self, client_id: str, timeout: float = 1.0) -> bool:
+        """Espera a que se escriba lo encolado para el cliente (p. ej. antes de desconectarlo)"""
+        writer = self.writers.get(client_id)
+        return await writer.flush(timeout) if writer is not None else False
+    
     async def send_json(self, client_id: str, data: dict) -> bool:
         """
-        Envía datos JSON a un cliente específico.
+        Envía datos JSON a un cliente específico (en local o vía bus).
         
         Args:
             client_id: Identificador del cliente
             data: Diccionario a enviar como JSON
             
         Returns:
-            True si el envío fue exitoso
+            True si el envío fue exitoso (o algún proceso tiene la sesión)
         """
-        if client_id not in self.active_connections:
+        if event_stream.get() == client_id:
+            data = await self._record(client_id, data)
+        if client_id in self.active_connections:
+            return await self._send_local(client_id, data)
+        if client_id in self.log_streams:
             return False
-        
+        return await self._publish(client_id, data, "json")
+    
+    async def _record(self, client_id: str, data: dict) -> dict:
+        """Frame del pipeline en curso: se registra y se envía con su `event_seq`"""
         try:
-            await self.active_connections[client_id].send_json(data)
-            self.message_counts[client_id] = self.message_counts.get(client_id, 0) + 1
-            return True
+            seq = await self.event_log.append(client_id, data)
         except Exception as e:
-            print(f"⚠️ Error enviando a {client_id}: {e}")
-            self.disconnect(client_id)
-            return False
+            print(f"⚠️ Error registrando evento de {client_id}: {e}")
+            return data
+        return dict(data, event_seq=seq)
+    
+    async def open_log_stream(self, stream_id: str):
+        """
+        Abre un stream que los clientes leen del registro de eventos (SSE).
+        
+        Sus frames no corresponden a ningún WebSocket: los envíos del pipeline
+        a ese id no se publican en el bus, donde nadie los escucharía.
+        """
+        self.log_streams.add(stream_id)
+        await self.event_log.open_stream(stream_id)
+    
+    async def close_log_stream(self, stream_id: str):
+        self.log_streams.discard(stream_id)
+        await self.event_log.close_stream(stream_id)
+    
+    async def replay(self, client_id: str, last_seq: int) -> dict:
+        """
+        Reenvía a un cliente reconectado los eventos posteriores a `last_seq`.
+        
+        Puede repetir frames que ya le llegaron en vivo durante la reconexión:
+        el cliente descarta los de event_seq <= último visto.
+        
+        Returns:
+            Resumen del replay (frame `replay_complete` sin el tipo)
+        """
+        replay = await self.event_log.replay(client_id, last_seq)
+        for seq, frame in replay.events:
+            await self.send_json(client_id, dict(frame, event_seq=seq))
+        return {
+            "replayed": len(replay.events),
+            "last_seq": replay.last_seq,
+            "truncated": replay.truncated
+        }
     
     async def send_text(self, client_id: str, message: str) -> bool:
         """
-        Envía texto plano a un cliente específico.
+        Envía texto plano a un cliente específico (en local o vía bus).
         
         Args:
             client_id: Identificador del cliente
             message: Mensaje de texto a enviar
             
         Returns:
-            True si el envío fue exitoso
+            True si el envío fue exitoso (o algún proceso tiene la sesión)
         """
-        if client_id not in self.active_connections:
-            return False
-        
-        try:
-            await self.active_connections[client_id].send_text(message)
-            self.message_counts[client_id] = self.message_counts.get(client_id, 0) + 1
-            return True
-        except Exception as e:
-            print(f"⚠️ Error enviando texto a {client_id}: {e}")
-            self.disconnect(client_id)
+        if client_id in self.active_connections:
+            return await self._send_local(client_id, message, "text")
+        if client_id in self.log_streams:
             return False
+        return await self._publish(client_id, message, "text")
     
-    async def broadcast(self, data: dict, exclude: Optional[List[str]] = None):
+    async def broadcast(
+        self,
+        data: dict,
+        exclude: Optional[List[str]] = None,
+        timeout: float = WS_BROADCAST_TIMEOUT
+    ) -> dict:
         """
-        Envía datos a todos los clientes conectados.
+        Envía datos a todos los clientes conectados, en todos los procesos.
+        
+        El payload se serializa una vez y se encola en el writer de cada
+        conexión (todas escriben en paralelo); se espera hasta `timeout`
+        segundos a las entregas de este proceso.
         
         Args:
             data: Diccionario a enviar
             exclude: Lista de client_ids a excluir del broadcast
+            timeout: Plazo para contar entregas locales
+            
+        Returns:
+            Recuento local (recipients, delivered, failed, timed_out), nodos
+            remotos que recibieron el broadcast y duración en ms
+        """
+        started = time.perf_counter()
+        try:
+            remote_nodes = await self.bus.publish(BROADCAST_CHANNEL, {
+                "origin": self.node_id,
+                "data": data,
+                "exclude": exclude or []
+            })
+            # Este proceso también está suscrito al canal
+            remote_nodes = max(0, remote_nodes - int(self._broadcast_subscribed))
+        except Exception as e:
+            print(f"⚠️ Error publicando broadcast en el bus: {e}")
+            remote_nodes = 0
+        
+        waiters, rejected = self._broadcast_local(data, exclude, track=True)
+        delivered = failed = timed_out = 0
+        if waiters:
+            done, pending = await asyncio.wait(waiters, timeout=timeout)
+            delivered = sum(1 for waiter in done if waiter.result())
+            failed = len(done) - delivered
+            timed_out = len(pending)
+        
+        return {
+            "recipients": len(waiters) + rejected,
+            "delivered": delivered,
+            "failed": failed + rejected,
+            "timed_out": timed_out,
+            "remote_nodes": remote_nodes,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 2)
+        }
+    
+    def _broadcast_local(
+        self,
+        data: dict,
+        exclude: Optional[List[str]] = None,
+        track: bool = False
+    ) -> Tuple[List[asyncio.Future], int]:
+        """
+        Encola el broadcast en cada conexión local (serializado una sola vez
+        por codificación negociada).
+        
+        Returns:
+            Futures de entrega (si `track`) y conexiones que no lo aceptaron
         """
-        exclude = exclude or []
-        disconnected = []
+        exclude = set(exclude or ())
+        encoded: Dict[WireCodec, Tuple[str, Any]] = {}
+        loop = asyncio.get_running_loop()
+        waiters: List[asyncio.Future] = []
+        rejected = 0
         
-        for client_id, connection in self.active_connections.items():
+        # Solo encola: un socket lento no retrasa a los demás
+        for client_id in list(self.active_connections):
             if client_id in exclude:
                 continue
-            
-            try:
-                await connection.send_json(data)
-                self.message_counts[client_id] = self.message_counts.get(client_id, 0) + 1
-            except Exception as e:
-                print(f"⚠️ Error en broadcast a {client_id}: {e}")
-                disconnected.append(client_id)
-        
-        # Limpiar conexiones fallidas
-        for client_id in disconnected:
-            self.disconnect(client_id)
+            writer = self.writers.get(client_id)
+            codec = writer.codec if writer is not None else DEFAULT_CODEC
+            if codec not in encoded:
+                encoded[codec] = codec.encode(data)
+            kind, payload = encoded[codec]
+            waiter = loop.create_future() if track else None
+            if self._send_local_nowait(client_id, payload, kind, waiter):
+                if waiter is not None:
+                    waiters.append(waiter)
+            else:
+                rejected += 1
+        return waiters, rejected
     
     async def send_agent_start(self, client_id: str, agent_name: str, step: int, total: int):
         """
@@ -194,6 +661,16 @@ class ConnectionManager:
             "timestamp": datetime.utcnow().isoformat()
         })
     
+    async def send_agent_delta(self, client_id: str, delta_frame: dict):
+        """
+        Envía un fragmento (delta) de texto generado por un agente en streaming.
+        
+        Args:
+            client_id: Cliente destino
+            delta_frame: Frame `agent_delta` ya construido por el pipeline
+        """
+        await self.send_json(client_id, delta_frame)
+    
     async def send_agent_response(self, client_id: str, response_data: dict):
         """
         Envía la respuesta completa de un agente.
@@ -239,12 +716,45 @@ class ConnectionManager:
         })
     
     def get_stats(self) -> dict:
-        """Retorna estadísticas de conexiones."""
+        """Retorna estadísticas de conexiones (de este proceso) y del bus."""
         return {
             "active_connections": len(self.active_connections),
             "client_ids": list(self.active_connections.keys()),
-            "total_messages": sum(self.message_counts.values())
+            "total_messages": sum(self.message_counts.values()),
+            "node_id": self.node_id,
+            "bus": dict(
+                self.bus.get_stats(),
+                remote_sent=self.remote_sent,
+                remote_delivered=self.remote_delivered
+            ),
+            "event_log": self.event_log.get_stats(),
+            "send_queues": self.get_send_queue_stats(),
+            "encodings": dict(Counter(
+                f"{writer.codec.encoding}/{writer.codec.frames}" for writer in self.writers.values()
+            ))
         }
+    
+    def get_send_queue_stats(self) -> dict:
+        """Profundidad de las colas de salida y frames fusionados/descartados"""
+        writers = list(self.writers.values())
+        return {
+            "max_size": self.send_queue_size,
+            "depth": sum(writer.depth for writer in writers),
+            "max_depth": max((writer.max_depth for writer in writers), default=0),
+            "coalesced": self.coalesced_frames + sum(writer.coalesced for writer in writers),
+            "dropped": self.dropped_frames + sum(writer.dropped for writer in writers),
+            "overflow_disconnects": self.overflow_disconnects
+        }
+    
+    async def close(self):
+        """Cierra el bus y las tareas de escritura (al apagar el proceso)"""
+        for writer in self.writers.values():
+            writer.stop()
+        if self._bus_tasks:
+            await asyncio.gather(*self._bus_tasks, return_exceptions=True)
+        await self.bus.close()
+        await self.event_log.close()
+        self._broadcast_subscribed = False
 
 
 # Instancia global del manager
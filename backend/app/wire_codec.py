@@ -0,0 +1,175 @@
+"""
+Wire Codec v1.0.0
+=================
+Codificación de los frames de WebSocket negociada por conexión.
+
+- `encoding`: "json" (texto, por defecto) o "msgpack" (binario)
+- `frames`: "full" (por defecto) o "lean". En modo lean las respuestas de
+  agentes envían `raw_content` una sola vez y los textos de `sections`,
+  `key_points` y `summary` que aparecen en él viajan como offsets
+  `[inicio, fin]` en lugar de repetirse
+
+Los offsets se cuentan en unidades UTF-16, las de `String.prototype.slice`
+en el navegador. `expand_response` reconstruye la respuesta completa.
+
+La compresión permessage-deflate se negocia aparte, en el handshake del
+WebSocket (uvicorn, WS_PER_MESSAGE_DEFLATE). Deflate ya elimina el texto
+duplicado, así que el modo lean rinde sobre todo en clientes o proxies que
+no la negocian (ver wire_encoding_benchmark.py).
+"""
+
+import json
+import re
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import msgpack
+
+JSON_ENCODING = "json"
+MSGPACK_ENCODING = "msgpack"
+FULL_FRAMES = "full"
+LEAN_FRAMES = "lean"
+
+Offset = List[int]
+
+_ASTRAL = re.compile("[\U00010000-\U0010FFFF]")
+
+
+class _Utf16Index:
+    """Convierte índices de Python (code points) a unidades UTF-16"""
+
+    def __init__(self, text: str):
+        # Los caracteres fuera del BMP ocupan dos unidades (par sustituto)
+        self.astral = [match.start() for match in _ASTRAL.finditer(text)]
+
+    def __call__(self, index: int) -> int:
+        return index + bisect_left(self.astral, index) if self.astral else index
+
+
+def _slice_utf16(text: str, start: int, end: int) -> str:
+    encoded = text.encode("utf-16-le")
+    return encoded[2 * start:2 * end].decode("utf-16-le")
+
+
+class _OffsetFinder:
+    """Busca cada texto en raw_content avanzando un cursor (aparecen en orden)"""
+
+    def __init__(self, raw: str):
+        self.raw = raw
+        self.cursor = 0
+        self.utf16 = _Utf16Index(raw)
+
+    def __call__(self, value: Any) -> Union[Any, Offset]:
+        if not isinstance(value, str) or not value:
+            return value
+        start = self.raw.find(value, self.cursor)
+        if start < 0:
+            start = self.raw.find(value)
+            if start < 0:
+                return value
+        end = start + len(value)
+        self.cursor = end
+        return [self.utf16(start), self.utf16(end)]
+
+
+def compact_response(formatted: Dict[str, Any]) -> Dict[str, Any]:
+    """Respuesta formateada en modo lean (textos repetidos como offsets en raw_content)"""
+    raw = formatted.get("raw_content")
+    if not isinstance(raw, str) or not raw:
+        return formatted
+    compact = dict(formatted)
+    find = _OffsetFinder(raw)
+
+    sections = formatted.get("sections")
+    if isinstance(sections, list):
+        compact_sections = []
+        for section in sections:
+            if not isinstance(section, dict):
+                compact_sections.append(section)
+                continue
+            section = dict(section)
+            section["title"] = find(section.get("title"))
+            if isinstance(section.get("items"), list):
+                section["items"] = [find(item) for item in section["items"]]
+            compact_sections.append(section)
+        compact["sections"] = compact_sections
+
+    if isinstance(formatted.get("key_points"), list):
+        find.cursor = 0
+        compact["key_points"] = [find(point) for point in formatted["key_points"]]
+    find.cursor = 0
+    compact["summary"] = find(formatted.get("summary"))
+    compact["frames"] = LEAN_FRAMES
+    return compact
+
+
+def _expand(raw: str, value: Any) -> Any:
+    if isinstance(value, list) and len(value) == 2 and all(isinstance(i, int) for i in value):
+        return _slice_utf16(raw, value[0], value[1])
+    return value
+
+
+def expand_response(compact: Dict[str, Any]) -> Dict[str, Any]:
+    """Inversa de compact_response"""
+    if compact.get("frames") != LEAN_FRAMES:
+        return compact
+    raw = compact["raw_content"]
+    formatted = {key: value for key, value in compact.items() if key != "frames"}
+    if isinstance(compact.get("sections"), list):
+        formatted["sections"] = [
+            dict(
+                section,
+                title=_expand(raw, section.get("title")),
+                **({"items": [_expand(raw, item) for item in section["items"]]}
+                   if isinstance(section.get("items"), list) else {})
+            ) if isinstance(section, dict) else section
+            for section in compact["sections"]
+        ]
+    if isinstance(compact.get("key_points"), list):
+        formatted["key_points"] = [_expand(raw, point) for point in compact["key_points"]]
+    formatted["summary"] = _expand(raw, compact.get("summary"))
+    return formatted
+
+
+def lean_frame(frame: Any) -> Any:
+    """Aplica compact_response a los frames que llevan una respuesta de agente"""
+    if not isinstance(frame, dict):
+        return frame
+    if frame.get("type") == "agent_response" and isinstance(frame.get("data"), dict):
+        return dict(frame, data=compact_response(frame["data"]))
+    if "raw_content" in frame and "sections" in frame:
+        # Respuesta formateada sin envolver (streams SSE)
+        return compact_response(frame)
+    return frame
+
+
+@dataclass(frozen=True)
+class WireCodec:
+    """Codificación de una conexión; `encode` devuelve (kind, payload) para el writer"""
+    encoding: str = JSON_ENCODING
+    frames: str = FULL_FRAMES
+
+    def encode(self, frame: Any) -> Tuple[str, Union[str, bytes]]:
+        if self.frames == LEAN_FRAMES:
+            frame = lean_frame(frame)
+        if self.encoding == MSGPACK_ENCODING:
+            return "bytes", msgpack.packb(frame, default=str, use_bin_type=True)
+        return "text", json.dumps(frame, separators=(",", ":"), ensure_ascii=False, default=str)
+
+    def to_dict(self) -> Dict[str, str]:
+        return {"encoding": self.encoding, "frames": self.frames}
+
+
+DEFAULT_CODEC = WireCodec()
+
+
+def negotiate_codec(encoding: Optional[str] = None, frames: Optional[str] = None) -> WireCodec:
+    """Codec pedido por el cliente, con los valores por defecto para lo desconocido"""
+    encoding = (encoding or JSON_ENCODING).lower()
+    frames = (frames or FULL_FRAMES).lower()
+    if encoding not in (JSON_ENCODING, MSGPACK_ENCODING):
+        encoding = JSON_ENCODING
+    if frames not in (FULL_FRAMES, LEAN_FRAMES):
+        frames = FULL_FRAMES
+    return WireCodec(encoding, frames)
@@ -3,12 +3,16 @@ AFW v0.5.0 - Base Workflow Classes
 Clases base para el sistema de workflows pre-programados
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Callable
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
+import asyncio
 import uuid
 
+from app.config import WORKFLOW_MAX_CONCURRENCY, WORKFLOW_CHECKPOINT_DB
+from .checkpoint_store import WorkflowCheckpointStore, get_checkpoint_store
+
 
 class WorkflowComplexity(Enum):
     """Niveles de complejidad de workflows"""
@@ -108,6 +112,9 @@ class WorkflowExecution:
     current_step: int = 0
     results: Dict[str, Any] = field(default_factory=dict)
     errors: List[str] = field(default_factory=list)
+    timing: Dict[str, Any] = field(default_factory=dict)
+    context: Dict[str, Any] = field(default_factory=dict)
+    model: Optional[str] = None
     
     @classmethod
     def create(cls, workflow_id: str, user_id: str) -> "WorkflowExecution":
@@ -121,68 +128,338 @@ class WorkflowExecution:
         )
 
 
+def topological_order(steps: List[WorkflowStep]) -> List[WorkflowStep]:
+    """
+    Orden topológico de los pasos (Kahn); a igualdad, por `order`.
+    
+    Raises:
+        ValueError: Si hay dependencias a pasos inexistentes o ciclos
+    """
+    by_id = {step.step_id: step for step in steps}
+    pending = {step.step_id: set(step.depends_on) for step in steps}
+    for step_id, deps in pending.items():
+        missing = deps - by_id.keys()
+        if missing:
+            raise ValueError(f"Step {step_id} depends on non-existent step {sorted(missing)[0]}")
+    
+    ordered: List[WorkflowStep] = []
+    while pending:
+        ready = sorted((by_id[sid] for sid, deps in pending.items() if not deps), key=lambda s: s.order)
+        if not ready:
+            raise ValueError(f"Dependency cycle between steps {sorted(pending)}")
+        for step in ready:
+            ordered.append(step)
+            del pending[step.step_id]
+        for deps in pending.values():
+            deps.difference_update(step.step_id for step in ready)
+    return ordered
+
+
 class WorkflowExecutor:
-    """Ejecutor de workflows"""
+    """
+    Ejecutor de workflows como DAG.
     
-    def __init__(self, agent_registry=None):
+    - Cada paso arranca en cuanto terminan sus `depends_on`; los pasos
+      independientes corren en paralelo con un máximo de `max_concurrency`
+    - El prompt de cada paso recibe el contexto de entrada y las salidas de
+      sus dependencias
+    - Un paso `optional` que falla no detiene el workflow; uno obligatorio lo
+      marca como fallido y se omiten los pasos que dependen de él
+    - `execution.timing` reporta duración por paso y el camino crítico
+    - Cada paso se guarda en el checkpoint store al terminar; `resume()`
+      vuelve a ejecutar solo los pasos fallidos o pendientes
+    """
+    
+    def __init__(
+        self,
+        agent_registry=None,
+        max_concurrency: Optional[int] = None,
+        agent_factory: Optional[Callable[[str], Any]] = None,
+        checkpoint_store: Optional[WorkflowCheckpointStore] = None
+    ):
+        """
+        Args:
+            agent_registry: Registro agent_id → {"class": ...} (por defecto AGENT_REGISTRY)
+            max_concurrency: Pasos en paralelo por ejecución (por defecto WORKFLOW_MAX_CONCURRENCY)
+            agent_factory: Alternativa al registro: crea el agente de un agent_id
+            checkpoint_store: Persistencia de checkpoints (por defecto SQLite en WORKFLOW_CHECKPOINT_DB)
+        """
         self.agent_registry = agent_registry
+        self.max_concurrency = max(1, max_concurrency or WORKFLOW_MAX_CONCURRENCY)
+        self.agent_factory = agent_factory
+        self.checkpoint_store = checkpoint_store or get_checkpoint_store(WORKFLOW_CHECKPOINT_DB)
         self.executions: Dict[str, WorkflowExecution] = {}
+        self._running: Dict[str, List[asyncio.Task]] = {}
+    
+    def _create_agent(self, agent_id: str, model: Optional[str], api_config: Optional[Dict[str, Any]]) -> Any:
+        if self.agent_factory:
+            return self.agent_factory(agent_id)
+        registry = self.agent_registry
+        if registry is None:
+            # Import diferido: cargar los 120 agentes solo cuando se ejecuta un workflow.
+            # Los agentes salen de prototipos compartidos (solo se asigna el contexto de ejecución)
+            from app.agents.prototypes import agent_prototypes
+            agent = agent_prototypes.instantiate(agent_id, model=model, api_config=api_config)
+            if agent is None:
+                raise KeyError(f"Agent {agent_id} not found in registry")
+            return agent
+        entry = registry.get(agent_id)
+        if entry is None:
+            raise KeyError(f"Agent {agent_id} not found in registry")
+        agent_class = entry["class"] if isinstance(entry, dict) else entry
+        if not isinstance(agent_class, type):
+            return agent_class
+        kwargs: Dict[str, Any] = {"api_config": api_config}
+        if model:
+            kwargs["model"] = model
+        return agent_class(**kwargs)
+    
+    @staticmethod
+    def _build_prompt(step: WorkflowStep, context: Dict[str, Any], dependency_outputs: Dict[str, str]) -> str:
+        prompt = step.get_prompt({**context, **dependency_outputs})
+        if dependency_outputs:
+            sections = "".join(f"\n\n### {sid}\n{output}" for sid, output in dependency_outputs.items())
+            prompt += f"\n\n---\n## RESULTADOS DE PASOS ANTERIORES{sections}"
+        return prompt
     
     async def execute(
         self, 
         workflow: WorkflowTemplate, 
         user_id: str,
-        context: Dict[str, Any]
+        context: Dict[str, Any],
+        model: Optional[str] = None,
+        api_config: Optional[Dict[str, Any]] = None
     ) -> WorkflowExecution:
         """Ejecuta un workflow completo"""
         execution = WorkflowExecution.create(workflow.workflow_id, user_id)
+        execution.context, execution.model = context, model
+        return await self._run(execution, workflow, api_config)
+    
+    async def resume(
+        self,
+        execution_id: str,
+        api_config: Optional[Dict[str, Any]] = None,
+        workflow: Optional[WorkflowTemplate] = None
+    ) -> WorkflowExecution:
+        """
+        Reanuda una ejecución (en memoria o desde el checkpoint store): los pasos
+        completados se reutilizan y solo se ejecutan los fallidos u omitidos.
+        La api_config no se persiste, así que se vuelve a pasar aquí.
+        
+        Raises:
+            KeyError: Si la ejecución o su workflow no existen
+            ValueError: Si la ejecución sigue en curso
+        """
+        if execution_id in self._running:
+            raise ValueError(f"Execution {execution_id} is still running")
+        
+        saved = await self._checkpoint(self.checkpoint_store.load, execution_id) if self.checkpoint_store else None
+        execution = self.executions.get(execution_id)
+        if saved is None and execution is None:
+            raise KeyError(f"Execution {execution_id} not found")
+        if saved is not None:
+            execution = WorkflowExecution(
+                execution_id=execution_id,
+                workflow_id=saved["workflow_id"],
+                user_id=saved["user_id"],
+                status=WorkflowStatus(saved["status"]),
+                started_at=datetime.fromisoformat(saved["started_at"]),
+                results=saved["results"],
+                context=saved["context"],
+                model=saved["model"],
+            )
+        
+        if workflow is None:
+            from .workflow_registry import get_workflow
+            workflow = get_workflow(execution.workflow_id)
+            if workflow is None:
+                raise KeyError(f"Workflow {execution.workflow_id} not found")
+        
+        if execution.status == WorkflowStatus.COMPLETED:
+            return execution
+        
+        # Solo se conservan los pasos completados; el resto se vuelve a ejecutar
+        completed = {sid: r for sid, r in execution.results.items() if r.get("status") == "completed"}
+        print(f"🔁 Reanudando {execution_id}: {len(completed)}/{len(workflow.steps)} pasos ya completados")
+        execution.results = completed
+        execution.errors = []
+        execution.timing = {}
+        execution.completed_at = None
+        return await self._run(execution, workflow, api_config)
+    
+    async def _checkpoint(self, operation: Callable[..., Any], *args: Any) -> Any:
+        # SQLite fuera del event loop; un fallo del checkpoint nunca rompe la ejecución
+        try:
+            return await asyncio.to_thread(operation, *args)
+        except Exception as e:
+            print(f"⚠️ Error en checkpoint de workflow: {e}")
+            return None
+    
+    async def _run(
+        self,
+        execution: WorkflowExecution,
+        workflow: WorkflowTemplate,
+        api_config: Optional[Dict[str, Any]]
+    ) -> WorkflowExecution:
         execution.status = WorkflowStatus.RUNNING
+        context, model = execution.context, execution.model
         self.executions[execution.execution_id] = execution
+        store = self.checkpoint_store
+        if store:
+            await self._checkpoint(store.save_execution, execution)
         
         try:
-            sorted_steps = sorted(workflow.steps, key=lambda s: s.order)
-            
-            for step in sorted_steps:
-                execution.current_step = step.order
-                
-                # Check dependencies
-                for dep in step.depends_on:
-                    if dep not in execution.results:
-                        if not step.optional:
-                            raise Exception(f"Dependency {dep} not completed")
-                
-                # Execute step
-                prompt = step.get_prompt({**context, **execution.results})
-                
-                # Here we would call the agent
-                # For now, we'll simulate the response
-                result = {
+            ordered_steps = topological_order(workflow.steps)
+        except ValueError as e:
+            execution.status = WorkflowStatus.FAILED
+            execution.errors.append(str(e))
+            execution.completed_at = datetime.now()
+            if store:
+                await self._checkpoint(store.save_execution, execution)
+            return execution
+        
+        loop = asyncio.get_running_loop()
+        origin = loop.time()
+        pool = asyncio.Semaphore(self.max_concurrency)
+        tasks: Dict[str, asyncio.Task] = {}
+        # Los pasos ya completados (reanudación) no se vuelven a ejecutar
+        outcome: Dict[str, str] = {sid: "completed" for sid in execution.results}
+        steps = {step.step_id: step for step in ordered_steps}
+        
+        async def run_step(step: WorkflowStep) -> None:
+            if outcome.get(step.step_id) == "completed":
+                return
+            if step.depends_on:
+                await asyncio.wait([tasks[dep] for dep in step.depends_on])
+            # Bloquean: una dependencia obligatoria sin resultado o cualquiera omitida.
+            # Si solo falló una opcional, el paso sigue sin esa salida.
+            blocked = [
+                dep for dep in step.depends_on
+                if outcome.get(dep) == "skipped" or (outcome.get(dep) != "completed" and not steps[dep].optional)
+            ]
+            if blocked:
+                outcome[step.step_id] = "skipped"
+                execution.results[step.step_id] = {
                     "step_id": step.step_id,
                     "agent_id": step.agent_id,
-                    "output": f"Output for step {step.name}",
-                    "completed_at": datetime.now().isoformat()
+                    "status": "skipped",
+                    "error": f"Dependency {blocked[0]} not completed",
                 }
-                
-                execution.results[step.step_id] = result
-            
-            execution.status = WorkflowStatus.COMPLETED
-            execution.completed_at = datetime.now()
+                if store:
+                    await self._checkpoint(store.save_step, execution.execution_id, step.step_id, execution.results[step.step_id])
+                return
             
-        except Exception as e:
-            execution.status = WorkflowStatus.FAILED
-            execution.errors.append(str(e))
+            dependency_outputs = {
+                dep: execution.results[dep]["output"] for dep in step.depends_on if outcome.get(dep) == "completed"
+            }
+            async with pool:
+                started = loop.time()
+                execution.current_step = max(execution.current_step, step.order)
+                try:
+                    agent = self._create_agent(step.agent_id, model, api_config)
+                    prompt = self._build_prompt(step, context, dependency_outputs)
+                    response = await asyncio.wait_for(
+                        agent.process_task(prompt, {
+                            "workflow_id": workflow.workflow_id,
+                            "step_id": step.step_id,
+                            "previous_results": dependency_outputs,
+                        }),
+                        timeout=step.timeout_seconds
+                    )
+                    # Los agentes devuelven los fallos del LLM como respuesta con status "error":
+                    # el paso falla (y se reintenta en resume) en vez de pasar el error a sus dependientes
+                    if isinstance(response, dict) and response.get("status") == "error":
+                        raise RuntimeError(response.get("error") or response.get("content") or "Agent error")
+                    output = response.get("content", "") if isinstance(response, dict) else str(response)
+                    outcome[step.step_id] = "completed"
+                    execution.results[step.step_id] = {
+                        "step_id": step.step_id,
+                        "agent_id": step.agent_id,
+                        "status": "completed",
+                        "output": output,
+                        "completed_at": datetime.now().isoformat(),
+                    }
+                except Exception as e:
+                    error = f"Step {step.step_id} failed: {str(e) or type(e).__name__}"
+                    outcome[step.step_id] = "failed"
+                    execution.results[step.step_id] = {
+                        "step_id": step.step_id,
+                        "agent_id": step.agent_id,
+                        "status": "failed",
+                        "error": error,
+                    }
+                    print(f"⚠️ Workflow {workflow.workflow_id}: {error}")
+                    if not step.optional:
+                        execution.errors.append(error)
+                finally:
+                    finished = loop.time()
+                    execution.timing.setdefault("steps", {})[step.step_id] = {
+                        "started_ms": round((started - origin) * 1000, 1),
+                        "finished_ms": round((finished - origin) * 1000, 1),
+                        "duration_ms": round((finished - started) * 1000, 1),
+                    }
+            if store:
+                await self._checkpoint(store.save_step, execution.execution_id, step.step_id, execution.results[step.step_id])
+        
+        for step in ordered_steps:
+            tasks[step.step_id] = asyncio.create_task(run_step(step))
+        self._running[execution.execution_id] = list(tasks.values())
+        
+        try:
+            await asyncio.gather(*tasks.values())
+            failed_required = any(
+                outcome.get(sid) != "completed" and not steps[sid].optional for sid in steps
+            )
+            execution.status = WorkflowStatus.FAILED if failed_required else WorkflowStatus.COMPLETED
+        except asyncio.CancelledError:
+            for task in tasks.values():
+                task.cancel()
+            if execution.status != WorkflowStatus.CANCELLED:
+                # Cancelación externa de execute() (no vía cancel_execution): se propaga
+                execution.status = WorkflowStatus.CANCELLED
+                raise
+        finally:
+            self._running.pop(execution.execution_id, None)
             execution.completed_at = datetime.now()
+            execution.timing.update(self._critical_path(steps, execution.timing.get("steps", {})))
+            execution.timing["wall_time_ms"] = round((loop.time() - origin) * 1000, 1)
+            execution.timing["max_concurrency"] = self.max_concurrency
+            if store:
+                await self._checkpoint(store.save_execution, execution)
         
         return execution
     
+    @staticmethod
+    def _critical_path(steps: Dict[str, WorkflowStep], timings: Dict[str, Dict[str, float]]) -> Dict[str, Any]:
+        """
+        Camino crítico: desde el paso que terminó último, retrocede por la
+        dependencia que terminó más tarde. Su suma de duraciones frente al
+        tiempo total muestra cuánto se perdió esperando turno en el pool.
+        """
+        if not timings:
+            return {"critical_path": [], "critical_path_ms": 0.0}
+        path = [max(timings, key=lambda sid: timings[sid]["finished_ms"])]
+        while True:
+            deps = [dep for dep in steps[path[-1]].depends_on if dep in timings]
+            if not deps:
+                break
+            path.append(max(deps, key=lambda sid: timings[sid]["finished_ms"]))
+        path.reverse()
+        return {
+            "critical_path": path,
+            "critical_path_ms": round(sum(timings[sid]["duration_ms"] for sid in path), 1),
+        }
+    
     def get_execution(self, execution_id: str) -> Optional[WorkflowExecution]:
         """Obtiene una ejecución por ID"""
         return self.executions.get(execution_id)
     
     def cancel_execution(self, execution_id: str) -> bool:
-        """Cancela una ejecución en progreso"""
+        """Cancela una ejecución en progreso (y los pasos que estén corriendo)"""
         execution = self.executions.get(execution_id)
         if execution and execution.status == WorkflowStatus.RUNNING:
+            for task in self._running.pop(execution_id, []):
+                task.cancel()
             execution.status = WorkflowStatus.CANCELLED
             execution.completed_at = datetime.now()
             return True
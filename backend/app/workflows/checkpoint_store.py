@@ -0,0 +1,129 @@
+"""
+AFW - Workflow Checkpoint Store
+Checkpoints por paso de las ejecuciones de workflows en SQLite.
+
+Cada paso terminado (o fallido) se guarda en cuanto acaba, así una ejecución
+interrumpida por un reinicio o un fallo del proveedor se reanuda sin volver a
+pagar los pasos ya completados. La api_config (con API keys) nunca se guarda.
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS workflow_executions (
+    execution_id TEXT PRIMARY KEY,
+    workflow_id TEXT NOT NULL,
+    user_id TEXT,
+    status TEXT NOT NULL,
+    context TEXT,
+    model TEXT,
+    started_at TEXT,
+    completed_at TEXT,
+    errors TEXT,
+    timing TEXT
+);
+CREATE TABLE IF NOT EXISTS workflow_steps (
+    execution_id TEXT NOT NULL,
+    step_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    result TEXT,
+    updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (execution_id, step_id)
+);
+"""
+
+
+class WorkflowCheckpointStore:
+    """Persistencia de ejecuciones y resultados por paso (una conexión por operación)."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = self._get_connection()
+        conn.executescript(_SCHEMA)
+        conn.close()
+
+    def _get_connection(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def save_execution(self, execution: Any) -> None:
+        """Guarda (o actualiza) la cabecera de una ejecución"""
+        conn = self._get_connection()
+        with conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO workflow_executions
+                (execution_id, workflow_id, user_id, status, context, model, started_at, completed_at, errors, timing)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                execution.execution_id,
+                execution.workflow_id,
+                execution.user_id,
+                execution.status.value,
+                json.dumps(execution.context, default=str, ensure_ascii=False),
+                execution.model,
+                execution.started_at.isoformat(),
+                execution.completed_at.isoformat() if execution.completed_at else None,
+                json.dumps(execution.errors, ensure_ascii=False),
+                json.dumps(execution.timing, ensure_ascii=False),
+            ))
+        conn.close()
+
+    def save_step(self, execution_id: str, step_id: str, result: Dict[str, Any]) -> None:
+        """Checkpoint de un paso (completado, fallido u omitido)"""
+        conn = self._get_connection()
+        with conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO workflow_steps (execution_id, step_id, status, result, updated_at)
+                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+            """, (execution_id, step_id, result.get("status", "completed"), json.dumps(result, default=str, ensure_ascii=False)))
+        conn.close()
+
+    def load(self, execution_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Carga una ejecución con sus pasos.
+
+        Returns:
+            Diccionario con las columnas de la ejecución (JSON ya decodificado)
+            y `results` (step_id → resultado), o None si no existe
+        """
+        conn = self._get_connection()
+        row = conn.execute(
+            "SELECT * FROM workflow_executions WHERE execution_id = ?", (execution_id,)
+        ).fetchone()
+        if not row:
+            conn.close()
+            return None
+        steps = conn.execute(
+            "SELECT step_id, result FROM workflow_steps WHERE execution_id = ?", (execution_id,)
+        ).fetchall()
+        conn.close()
+
+        data = dict(row)
+        for column, default in (("context", {}), ("errors", []), ("timing", {})):
+            data[column] = json.loads(data[column]) if data[column] else default
+        data["results"] = {step["step_id"]: json.loads(step["result"]) for step in steps}
+        return data
+
+    def delete(self, execution_id: str) -> None:
+        conn = self._get_connection()
+        with conn:
+            conn.execute("DELETE FROM workflow_steps WHERE execution_id = ?", (execution_id,))
+            conn.execute("DELETE FROM workflow_executions WHERE execution_id = ?", (execution_id,))
+        conn.close()
+
+
+_stores: Dict[str, WorkflowCheckpointStore] = {}
+
+
+def get_checkpoint_store(db_path: str) -> Optional[WorkflowCheckpointStore]:
+    """Store compartido por ruta; ruta vacía = checkpoints desactivados"""
+    if not db_path:
+        return None
+    if db_path not in _stores:
+        _stores[db_path] = WorkflowCheckpointStore(db_path)
+    return _stores[db_path]
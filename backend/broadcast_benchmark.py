@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+AFW - Broadcast Benchmark
+=========================
+
+Mide un broadcast administrativo a miles de sockets simulados (latencia de
+red fija por envío y algunos peers muertos que nunca responden):
+- Secuencial: un `send_json` tras otro, sin plazo (implementación anterior)
+- Fan-out: payload serializado una vez, writers por conexión y plazo por envío
+
+Uso: python broadcast_benchmark.py [conexiones] [latencia_ms] [peers_muertos]
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+PAYLOAD = {"type": "admin_broadcast", "message": "Mantenimiento programado a las 22:00", "timestamp": ""}
+
+
+class SimulatedSocket:
+    """Socket con latencia de envío fija; los muertos no responden nunca"""
+
+    def __init__(self, latency: float, dead: bool = False):
+        self.latency = latency
+        self.dead = dead
+
+    async def accept(self):
+        pass
+
+    async def send_json(self, data):
+        await self.send_text(json.dumps(data, separators=(",", ":"), ensure_ascii=False))
+
+    async def send_text(self, message):
+        await asyncio.sleep(3600 if self.dead else self.latency)
+
+
+async def sequential(sockets, deadline):
+    """Bucle anterior: cada envío espera al anterior; un peer muerto bloquea al resto"""
+    delivered = 0
+
+    async def run():
+        nonlocal delivered
+        for socket in sockets:
+            await socket.send_json(PAYLOAD)
+            delivered += 1
+
+    started = time.perf_counter()
+    try:
+        await asyncio.wait_for(run(), timeout=deadline)
+    except asyncio.TimeoutError:
+        pass
+    return delivered, time.perf_counter() - started
+
+
+async def fan_out(sockets, deadline, send_timeout):
+    from app.message_bus import InMemoryMessageBus
+    from app.websocket_manager import ConnectionManager
+
+    manager = ConnectionManager(InMemoryMessageBus())
+    for i, socket in enumerate(sockets):
+        await manager.connect(socket, f"client_{i}")
+    for writer in manager.writers.values():
+        writer.send_timeout = send_timeout
+
+    started = time.perf_counter()
+    result = await manager.broadcast(PAYLOAD, timeout=deadline)
+    elapsed = time.perf_counter() - started
+    await manager.close()
+    return result, elapsed
+
+
+async def main():
+    connections = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    latency_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 2
+    dead = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+    deadline = 5.0
+
+    def build():
+        step = max(1, connections // max(1, dead))
+        return [
+            SimulatedSocket(latency_ms / 1000, dead=dead > 0 and i % step == step // 2 and i // step < dead)
+            for i in range(connections)
+        ]
+
+    print("🚀 AFW - Broadcast Benchmark")
+    print("=" * 72)
+    print(f"📅 Fecha: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"🔌 Conexiones: {connections} | latencia por envío: {latency_ms} ms | peers muertos: {dead}")
+    print(f"⏱️ Plazo del broadcast: {deadline}s")
+    print("=" * 72)
+
+    delivered, elapsed = await sequential(build(), deadline)
+    print(f"{'Secuencial (anterior)':.<40} {elapsed * 1000:9.1f} ms  entregados {delivered}/{connections}")
+
+    result, elapsed = await fan_out(build(), deadline, send_timeout=1.0)
+    print(
+        f"{'Fan-out (writers + plazo)':.<40} {elapsed * 1000:9.1f} ms  entregados {result['delivered']}/{connections}"
+        f"  fallidos {result['failed']}  sin confirmar {result['timed_out']}"
+    )
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
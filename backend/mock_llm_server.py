@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+AFW - Mock LLM Server
+=====================
+
+Servidor OpenAI-compatible simulado e independiente, para pruebas de carga
+sin cuota real. Configuración por entorno (MOCK_LLM_TTFT_MS,
+MOCK_LLM_TOKENS_PER_SEC, MOCK_LLM_ERROR_RATE, MOCK_LLM_RATE_LIMIT_RATE,
+MOCK_LLM_OUTPUT_TOKENS) o por query en cada petición.
+
+Uso: python mock_llm_server.py [puerto]
+     → base_url http://localhost:8090/mock-llm/v1
+"""
+
+import sys
+
+import uvicorn
+from fastapi import FastAPI
+
+from app.routes.mock_llm_routes import router, engine
+
+app = FastAPI(title="AFW Mock LLM", version="1.0.0")
+app.include_router(router)
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8090
+    print("🧪 AFW - Mock LLM Server")
+    print(f"📡 base_url: http://localhost:{port}/mock-llm/v1")
+    print(f"⚙️ Configuración: {engine.get_stats()['config']}")
+    uvicorn.run(app, host="0.0.0.0", port=port)
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+AFW - Prompt Compiler Benchmark
+===============================
+
+Compara el coste por paso de montar el prompt de cada agente:
+- Antes: render completo con f-strings en cada llamada
+- Después: plantilla precompilada al arrancar (solo se inserta la tarea)
+
+Uso: python prompt_compiler_benchmark.py [iteraciones]
+"""
+
+import sys
+import time
+from datetime import datetime
+
+from app.agents.enhanced_registry import (
+    ENHANCED_AGENT_DEFINITIONS,
+    COMPILED_AGENT_PROMPTS,
+    compile_agent_prompts,
+    _render_agent_prompt,
+)
+
+TASK = "Analiza la viabilidad de lanzar un producto SaaS B2B en LATAM con un presupuesto de 50k USD. " * 4
+CONTEXT = "\n\n---\n## CONTEXTO DE EXPERTOS ANTERIORES\n" + ("Resultado previo del experto. " * 200)
+
+
+def bench(label, func, iterations):
+    """Ejecuta func(agent_id, agent_data) para los 120 agentes y devuelve µs por paso."""
+    items = list(ENHANCED_AGENT_DEFINITIONS.items())
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for agent_id, agent_data in items:
+            func(agent_id, agent_data)
+    elapsed = time.perf_counter() - start
+    per_step = elapsed / (iterations * len(items)) * 1e6
+    print(f"{label:.<50} {per_step:8.2f} µs/paso")
+    return per_step
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    agents = len(ENHANCED_AGENT_DEFINITIONS)
+
+    print("🚀 AFW - Prompt Compiler Benchmark")
+    print("=" * 60)
+    print(f"📅 Fecha: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"🤖 Agentes: {agents} | 🔁 Iteraciones: {iterations}")
+    print("=" * 60)
+
+    # Coste único de compilación al arrancar
+    start = time.perf_counter()
+    compile_agent_prompts(ENHANCED_AGENT_DEFINITIONS)
+    print(f"🧱 Compilación de {agents} plantillas: {(time.perf_counter() - start) * 1000:.2f} ms (una vez)")
+
+    # Verificar que ambos caminos producen el mismo texto
+    mismatches = [
+        agent_id for agent_id, agent_data in ENHANCED_AGENT_DEFINITIONS.items()
+        if COMPILED_AGENT_PROMPTS[agent_id].render(TASK) != _render_agent_prompt(agent_data, TASK)
+    ]
+    print(f"🔍 Prompts idénticos: {agents - len(mismatches)}/{agents}")
+
+    print("\n📊 Solo tarea")
+    before = bench("Antes (f-strings por llamada)", lambda a, d: _render_agent_prompt(d, TASK), iterations)
+    after = bench("Después (plantilla precompilada)", lambda a, d: COMPILED_AGENT_PROMPTS[a].render(TASK), iterations)
+    print(f"⚡ Mejora: {before / after:.1f}x")
+
+    print("\n📊 Tarea + contexto acumulado")
+    before = bench("Antes (f-strings por llamada)", lambda a, d: _render_agent_prompt(d, TASK) + CONTEXT, iterations)
+    after = bench("Después (plantilla precompilada)", lambda a, d: COMPILED_AGENT_PROMPTS[a].render(TASK, CONTEXT), iterations)
+    print(f"⚡ Mejora: {before / after:.1f}x")
+    print("=" * 60)
+
+    return not mismatches
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator
 
 class LLMProviderPort(ABC):
     """
@@ -20,3 +20,25 @@ class LLMProviderPort(ABC):
         Genera una respuesta de chat usando el LLM.
         """
         pass
+
+    async def stream_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        api_config: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Genera la respuesta como iterador asíncrono de fragmentos de texto (deltas).
+        Por defecto emite la respuesta completa en un solo fragmento.
+        """
+        response = await self.chat_completion(
+            messages=messages,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            api_config=api_config
+        )
+        if response:
+            yield response
@@ -1,4 +1,4 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set
 import uuid
 from ..entities.a2a_types import (
     A2AMessage, A2AResponse, AgentProfile, AgentCapability,
@@ -16,10 +16,18 @@ class A2AService:
     def __init__(self):
         self.active_conversations: Dict[str, List[A2AMessage]] = {}
         self.agent_registry: Dict[str, AgentProfile] = {}
+        # Índice invertido capacidad → agent_ids (evita recorrer todo el registro)
+        self.capability_index: Dict[AgentCapability, Set[str]] = {}
         
     def register_agent(self, profile: AgentProfile) -> bool:
         """Registrar un agente en el protocolo"""
+        previous = self.agent_registry.get(profile.agent_id)
+        if previous is not None:
+            for capability in [previous.primary_capability, *previous.secondary_capabilities]:
+                self.capability_index.get(capability, set()).discard(profile.agent_id)
         self.agent_registry[profile.agent_id] = profile
+        for capability in [profile.primary_capability, *profile.secondary_capabilities]:
+            self.capability_index.setdefault(capability, set()).add(profile.agent_id)
         return True
     
     def create_message(
@@ -94,14 +102,13 @@ class A2AService:
         exclude_agents = exclude_agents or []
         capable_agents = []
         
-        for agent_id, profile in self.agent_registry.items():
+        for agent_id in self.capability_index.get(required_capability, ()):
             if agent_id in exclude_agents:
                 continue
             
-            if (profile.primary_capability == required_capability or
-                required_capability in profile.secondary_capabilities):
-                if profile.status == AgentStatus.IDLE or profile.current_load < profile.max_concurrent_tasks:
-                    capable_agents.append(profile)
+            profile = self.agent_registry[agent_id]
+            if profile.status == AgentStatus.IDLE or profile.current_load < profile.max_concurrent_tasks:
+                capable_agents.append(profile)
         
         # Ordenar por carga actual (menor carga primero)
         capable_agents.sort(key=lambda x: x.current_load)
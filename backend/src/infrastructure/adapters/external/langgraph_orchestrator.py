@@ -2,6 +2,11 @@
 LangGraph Orchestrator Adapter - ATP v0.8.1
 Implementation of GraphWorkflowPort using LangGraph and A2A Protocol.
 Enhanced with specialized response formats.
+
+El grafo se compila una sola vez por instancia y se reutiliza en todas las
+ejecuciones: los datos de cada ejecución (agentes incluidos) viajan en
+AgentState, nunca en el adaptador, así que ejecuciones concurrentes sobre la
+misma instancia no se pisan.
 """
 from typing import Dict, Any, List, Optional, TypedDict
 from langgraph.graph import StateGraph, END
@@ -21,10 +26,13 @@ from src.shared.a2a_protocol import (
     AgentStatus,
 )
 
+from src.infrastructure.adapters.external.token_budget import plan_budget, count_tokens, truncate_to_tokens
+
 # === SISTEMA DE FORMATOS ESPECIALIZADOS ===
 try:
     from app.agents.enhanced_registry import (
         build_agent_prompt,
+        get_compiled_prompt,
         get_specialized_system_prompt,
         ENHANCED_AGENT_DEFINITIONS
     )
@@ -43,6 +51,7 @@ class AgentState(TypedDict):
     a2a_responses: List[A2AResponse]
     current_step: str
     next_agent: Optional[str]
+    agents: Dict[str, Agent]
     agents_to_execute: List[str]
     agents_completed: List[str]
     intermediate_results: Dict[str, Any]
@@ -54,10 +63,10 @@ class AgentState(TypedDict):
 
 class LangGraphOrchestratorAdapter(GraphWorkflowPort):
     def __init__(self):
-        self.agents_map: Dict[str, Agent] = {}
         self.protocol = a2a_protocol
         self._register_orchestrator_agent()
-        self.graph = None
+        # Compilado una vez; sin estado por ejecución, seguro para uso concurrente
+        self.graph = self._build_graph()
 
     def _register_orchestrator_agent(self) -> None:
         orchestrator_id = "orchestrator"
@@ -92,16 +101,13 @@ class LangGraphOrchestratorAdapter(GraphWorkflowPort):
     ) -> Dict[str, Any]:
         
         sorted_agents = self._sort_agents(agents)
-        self.agents_map = {a.profile.agent_id: a for a in sorted_agents}
+        agents_map = {a.profile.agent_id: a for a in sorted_agents}
         
         # Register in protocol
         for agent in sorted_agents:
             self.protocol.register_agent(agent.profile)
-
-        # Build graph
-        self.graph = self._build_graph()
         
-        # Start state
+        # Start state (todo lo propio de esta ejecución va aquí)
         initial_state: AgentState = {
             "user_query": task,
             "context": context or {},
@@ -109,6 +115,7 @@ class LangGraphOrchestratorAdapter(GraphWorkflowPort):
             "a2a_responses": [],
             "current_step": "init",
             "next_agent": None,
+            "agents": agents_map,
             "agents_to_execute": [a.profile.agent_id for a in sorted_agents],
             "agents_completed": [],
             "intermediate_results": {},
@@ -119,11 +126,15 @@ class LangGraphOrchestratorAdapter(GraphWorkflowPort):
             "error": None
         }
 
-        final_state = await self.graph.ainvoke(initial_state)
+        try:
+            final_state = await self.graph.ainvoke(initial_state)
+        finally:
+            # Los mensajes A2A de esta ejecución ya no se consultan: se liberan
+            self.protocol.close_conversation(initial_state["conversation_id"])
         
         agent_responses = []
         for agent_id in final_state["agents_completed"]:
-            agent = self.agents_map.get(agent_id)
+            agent = agents_map.get(agent_id)
             if agent:
                 agent_responses.append({
                     "agent_id": agent_id,
@@ -138,7 +149,7 @@ class LangGraphOrchestratorAdapter(GraphWorkflowPort):
             "conversation_id": final_state["conversation_id"]
         }
 
-    def _build_graph(self) -> StateGraph:
+    def _build_graph(self):
         workflow = StateGraph(AgentState)
         workflow.add_node("analyze_query", self._analyze_query)
         workflow.add_node("execute_agents", self._execute_agents)
@@ -180,7 +191,7 @@ class LangGraphOrchestratorAdapter(GraphWorkflowPort):
             return state
         
         agent_id = pending[0]
-        agent = self.agents_map.get(agent_id)
+        agent = state["agents"].get(agent_id)
         if not agent:
             state["error"] = f"Agent {agent_id} not found"
             return state
@@ -200,12 +211,19 @@ class LangGraphOrchestratorAdapter(GraphWorkflowPort):
                 agent_data = ENHANCED_AGENT_DEFINITIONS.get(agent_id, {})
                 if agent_data:
                     try:
-                        # Construir prompt especializado con formato definido
-                        enhanced_task = build_agent_prompt(agent_id, agent_data, state["user_query"])
-                        
-                        # Agregar contexto previo si existe
+                        # Plantilla precompilada del agente: solo se rellenan tarea y contexto previo
+                        base_prompt = get_compiled_prompt(agent_id, agent_data).render(state["user_query"])
+                        context_block = ""
                         if previous_context:
-                            enhanced_task += f"\n\n---\n## CONTEXTO DE EXPERTOS ANTERIORES\n{previous_context}\n---\n"
+                            # El contexto previo se recorta al presupuesto de tokens del modelo del agente
+                            model = getattr(agent, "model", None)
+                            budget = plan_budget(model, system=getattr(agent, "get_system_prompt", str)(), task=base_prompt)
+                            context_block = "\n\n---\n## CONTEXTO DE EXPERTOS ANTERIORES\n{}\n---\n"
+                            previous_context = truncate_to_tokens(
+                                previous_context, budget.context - count_tokens(context_block, model), model
+                            )
+                            context_block = context_block.format(previous_context) if previous_context else ""
+                        enhanced_task = base_prompt + context_block
                     except Exception as e:
                         print(f"⚠️ Error building specialized prompt: {e}")
                         enhanced_task = state["user_query"]
@@ -248,7 +266,7 @@ class LangGraphOrchestratorAdapter(GraphWorkflowPort):
         results = ["# 🎯 Multi-Expert Analysis\n"]
         for agent_id in state["agents_completed"]:
             result_data = state["intermediate_results"].get(agent_id)
-            agent = self.agents_map.get(agent_id)
+            agent = state["agents"].get(agent_id)
             
             if agent and result_data:
                 # Handle both old format (string) and new format (dict with metadata)
@@ -274,3 +292,7 @@ class LangGraphOrchestratorAdapter(GraphWorkflowPort):
         state["is_complete"] = True
         state["current_step"] = "finalized"
         return state
+
+
+# Instancia compartida: el grafo compilado se reutiliza en todas las peticiones
+langgraph_orchestrator = LangGraphOrchestratorAdapter()
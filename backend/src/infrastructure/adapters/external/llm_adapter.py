@@ -1,73 +1,101 @@
-from typing import List, Dict, Any, Optional
-from openai import OpenAI
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator
 from ....domain.ports.output.llm_port import LLMProviderPort
-from ...config.settings import MODELS, GROQ_API_KEY
+from ....domain.ports.output.llm_provider import LLMProviderPort as ModelProviderPort
+from ...config.settings import MODELS, GROQ_API_KEY, MOCK_LLM_ENABLED
+from .mock_llm import is_mock_url
+from .llm_client_pool import LLMClientPool, llm_client_pool
+from .llm_governor import LLMGovernor, llm_governor
+from .llm_provider_factory import LLMProviderFactory
+from .token_budget import max_tokens_for
 
 class LLMAdapter(LLMProviderPort):
     """
     Implementación del puerto LLMProviderPort usando OpenAI SDK.
+    Resuelve el proveedor a partir de `api_config` y delega la llamada en el
+    proveedor resiliente de LLMProviderFactory (clientes compartidos, gobernador
+    de rate limits, reintentos y failover).
     """
-    
-    def __init__(self):
-        pass
 
-    def _get_client(self, api_config: Optional[Dict[str, Any]] = None):
+    def __init__(self, client_pool: Optional[LLMClientPool] = None, governor: Optional[LLMGovernor] = None):
+        self.client_pool = client_pool or llm_client_pool
+        self.governor = governor or llm_governor
+        self.factory = LLMProviderFactory(client_pool=self.client_pool, governor=self.governor)
+
+    def _resolve_config(self, api_config: Optional[Dict[str, Any]] = None) -> Tuple[str, str, Optional[str], str]:
         """
-        Obtiene un cliente OpenAI configurado.
+        Resuelve (tipo de proveedor, api_key, base_url, modelo por defecto).
         """
         api_key = None
         base_url = None
+        api_type = "openai"
         model = "gpt-4o-mini"
+
+        if MOCK_LLM_ENABLED and api_config and (api_config.get("type") == "mock" or is_mock_url(api_config.get("base_url"))):
+            # Proveedor simulado: no requiere API key
+            return "mock", api_config.get("api_key") or "mock", api_config.get("base_url"), "mock-model"
         
         if api_config and api_config.get("api_key"):
             api_key = api_config.get("api_key")
             base_url = api_config.get("base_url")
-            # Determine provider defaults if needed
             api_type = api_config.get("type", "openai")
-            # (Logic to set default base_url if not provided based on type could go here)
         elif GROQ_API_KEY:
             api_key = GROQ_API_KEY
             base_url = "https://api.groq.com/openai/v1"
+            api_type = "groq"
             model = "llama-3.3-70b-versatile"
-        
+
         if not api_key:
             raise ValueError("No API key configured.")
-            
-        client = OpenAI(api_key=api_key, base_url=base_url)
-        return client, model
+
+        return api_type, api_key, base_url, model
+
+    def _provider(self, api_config: Optional[Dict[str, Any]]) -> Tuple[ModelProviderPort, str]:
+        api_type, api_key, base_url, default_model = self._resolve_config(api_config)
+        provider = self.factory.create({"type": api_type, "api_key": api_key, "base_url": base_url})
+        return provider, default_model
 
     async def chat_completion(
         self,
         messages: List[Dict[str, str]],
         model: Optional[str] = None,
         temperature: Optional[float] = 0.7,
-        max_tokens: Optional[int] = 4096,
+        max_tokens: Optional[int] = None,
         api_config: Optional[Dict[str, Any]] = None
     ) -> str:
-        
-        client, default_model = self._get_client(api_config)
-        actual_model = model or default_model
-        
-        # Async call is not natively supported by OpenAI sync client without wrapping or using AsyncOpenAI
-        # For simplicity in this synchronous context (or if we switch to AsyncOpenAI):
-        # We should use AsyncOpenAI for async context.
-        
-        from openai import AsyncOpenAI
-        
-        # Re-instantiate as Async
-        # Note: This is a bit inefficient, better to cache clients.
-        # But for now, following the pattern:
-        
-        api_key = client.api_key
-        base_url = str(client.base_url) 
-        
-        async_client = AsyncOpenAI(api_key=api_key, base_url=base_url)
-        
-        response = await async_client.chat.completions.create(
-            model=actual_model,
+
+        provider, default_model = self._provider(api_config)
+        model = model or default_model
+        return await provider.chat_completion(
             messages=messages,
+            model=model,
             temperature=temperature,
-            max_tokens=max_tokens,
+            max_tokens=max_tokens_for(messages, model, max_tokens),
         )
-        
-        return response.choices[0].message.content
+
+    async def stream_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: Optional[float] = 0.7,
+        max_tokens: Optional[int] = None,
+        api_config: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Streaming real (stream=True): emite cada delta de texto en cuanto llega.
+        El cliente permanece prestado hasta que se consume (o se cierra) el stream.
+        Sin max_tokens explícito, la salida se ajusta a la ventana del modelo.
+        """
+        provider, default_model = self._provider(api_config)
+        model = model or default_model
+        stream = await provider.chat_completion(
+            messages=messages,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens_for(messages, model, max_tokens),
+            stream=True,
+        )
+        try:
+            async for delta in stream:
+                yield delta
+        finally:
+            await stream.aclose()
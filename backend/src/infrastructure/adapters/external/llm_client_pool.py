@@ -0,0 +1,195 @@
+"""
+Registro de clientes LLM asíncronos reutilizables.
+
+Mantiene un cliente `AsyncOpenAI` de larga vida por cada combinación
+(tipo de proveedor, base_url, huella de API key), de modo que los pasos
+consecutivos de un pipeline reutilicen conexiones HTTP ya calientes
+(keep-alive + TLS) en lugar de abrir un pool nuevo en cada llamada.
+"""
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+import httpx
+from openai import AsyncOpenAI
+
+from .mock_llm import MOCK_HTTP_BASE_URL, build_mock_http_client, is_mock_url
+from ...config.settings import (
+    LLM_POOL_MAX_CLIENTS,
+    LLM_POOL_MAX_CONNECTIONS,
+    LLM_POOL_MAX_KEEPALIVE,
+    LLM_POOL_KEEPALIVE_EXPIRY,
+    LLM_POOL_IDLE_TTL,
+    LLM_REQUEST_TIMEOUT,
+)
+
+ClientKey = Tuple[str, str, str]
+
+
+def fingerprint_api_key(api_key: str) -> str:
+    """Huella corta de la API key; nunca se guarda la key en claro como clave del registro."""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
+@dataclass
+class _PooledClient:
+    client: AsyncOpenAI
+    created_at: float = field(default_factory=time.monotonic)
+    last_used: float = field(default_factory=time.monotonic)
+    in_flight: int = 0
+    uses: int = 0
+
+
+class LLMClientPool:
+    """
+    Registro LRU acotado de clientes AsyncOpenAI.
+
+    - Límites de conexión y keep-alive configurables por cliente (httpx.Limits)
+    - Expulsión de clientes inactivos tras `idle_ttl` segundos
+    - Tamaño máximo `max_clients` con expulsión LRU
+    - Un cliente con peticiones en vuelo nunca se cierra
+    """
+
+    def __init__(
+        self,
+        max_clients: int = LLM_POOL_MAX_CLIENTS,
+        max_connections: int = LLM_POOL_MAX_CONNECTIONS,
+        max_keepalive_connections: int = LLM_POOL_MAX_KEEPALIVE,
+        keepalive_expiry: float = LLM_POOL_KEEPALIVE_EXPIRY,
+        idle_ttl: float = LLM_POOL_IDLE_TTL,
+        timeout: float = LLM_REQUEST_TIMEOUT,
+    ):
+        self.max_clients = max_clients
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.idle_ttl = idle_ttl
+        self.timeout = timeout
+        self._clients: "OrderedDict[ClientKey, _PooledClient]" = OrderedDict()
+        self._lock = asyncio.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(api_type: str, base_url: Optional[str], api_key: str) -> ClientKey:
+        return (api_type or "openai", (base_url or "").rstrip("/"), fingerprint_api_key(api_key))
+
+    def _build_client(self, api_key: str, base_url: Optional[str]) -> AsyncOpenAI:
+        # Los reintentos los gestiona ResilientLLMProvider; el SDK no debe repetirlos por su cuenta
+        if is_mock_url(base_url):
+            http_client = build_mock_http_client(base_url, httpx.Timeout(self.timeout, connect=10.0))
+            return AsyncOpenAI(api_key=api_key, base_url=MOCK_HTTP_BASE_URL, http_client=http_client, max_retries=0)
+        
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(self.timeout, connect=10.0),
+        )
+        return AsyncOpenAI(api_key=api_key, base_url=base_url or None, http_client=http_client, max_retries=0)
+
+    async def _evict(self, now: float) -> None:
+        """Cierra clientes inactivos y recorta el registro al tamaño máximo (LRU)."""
+        stale = [
+            key for key, entry in self._clients.items()
+            if entry.in_flight == 0 and now - entry.last_used > self.idle_ttl
+        ]
+        # OrderedDict mantiene el orden de uso: el primero es el menos reciente
+        overflow = len(self._clients) - len(stale) - self.max_clients
+        if overflow > 0:
+            for key, entry in self._clients.items():
+                if overflow <= 0:
+                    break
+                if key not in stale and entry.in_flight == 0:
+                    stale.append(key)
+                    overflow -= 1
+
+        for key in stale:
+            entry = self._clients.pop(key)
+            self.evictions += 1
+            try:
+                await entry.client.close()
+            except Exception as e:
+                print(f"⚠️ Error cerrando cliente LLM expulsado: {e}")
+
+    async def acquire(self, api_type: str, api_key: str, base_url: Optional[str] = None) -> _PooledClient:
+        """Devuelve la entrada del registro para la combinación dada, creándola si no existe."""
+        key = self.make_key(api_type, base_url, api_key)
+        now = time.monotonic()
+        async with self._lock:
+            entry = self._clients.get(key)
+            if entry is None:
+                self.misses += 1
+                entry = _PooledClient(client=self._build_client(api_key, base_url))
+                self._clients[key] = entry
+            else:
+                self.hits += 1
+                self._clients.move_to_end(key)
+            entry.last_used = now
+            entry.uses += 1
+            entry.in_flight += 1
+            await self._evict(now)
+        return entry
+
+    def release(self, entry: _PooledClient) -> None:
+        entry.in_flight = max(0, entry.in_flight - 1)
+        entry.last_used = time.monotonic()
+
+    @asynccontextmanager
+    async def lease(self, api_type: str, api_key: str, base_url: Optional[str] = None) -> AsyncIterator[AsyncOpenAI]:
+        """
+        Préstamo de un cliente durante una petición (incluido el consumo de un stream).
+
+        Uso:
+            async with pool.lease("groq", key, url) as client:
+                await client.chat.completions.create(...)
+        """
+        entry = await self.acquire(api_type, api_key, base_url)
+        try:
+            yield entry.client
+        finally:
+            self.release(entry)
+
+    async def close_all(self) -> None:
+        """Cierra todos los clientes (apagado del proceso)."""
+        async with self._lock:
+            entries = list(self._clients.values())
+            self._clients.clear()
+        for entry in entries:
+            try:
+                await entry.client.close()
+            except Exception:
+                pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        return {
+            "clients": len(self._clients),
+            "max_clients": self.max_clients,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "in_flight": sum(e.in_flight for e in self._clients.values()),
+            "entries": [
+                {
+                    "provider": key[0],
+                    "base_url": key[1],
+                    "key_fingerprint": key[2],
+                    "uses": entry.uses,
+                    "in_flight": entry.in_flight,
+                    "idle_seconds": round(now - entry.last_used, 1),
+                }
+                for key, entry in self._clients.items()
+            ],
+        }
+
+
+# Registro global del proceso
+llm_client_pool = LLMClientPool()
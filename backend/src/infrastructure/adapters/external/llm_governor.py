@@ -0,0 +1,376 @@
+"""
+Gobernador de llamadas salientes a proveedores LLM.
+
+Se coloca delante de cada completion para evitar tormentas de 429 cuando
+muchos usuarios ejecutan pipelines a la vez:
+
+- Token buckets de RPM y TPM por proveedor y por API key
+- Concurrencia adaptativa AIMD por (proveedor, API key): crece +1 por ventana
+  de éxitos y se reduce a la mitad ante un 429; `retry-after` y las cabeceras
+  `x-ratelimit-*` pausan o ajustan el carril
+- Cola justa round-robin entre usuarios: un usuario con 10 agentes no
+  bloquea al siguiente usuario que llega
+- Métricas de profundidad de cola y estado de cada carril
+"""
+import asyncio
+import re
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Deque, Dict, List, Mapping, Optional, Tuple
+
+from ...config.settings import LLM_RATE_LIMITS
+from .llm_client_pool import fingerprint_api_key
+
+# Usuario en nombre del cual se hace la llamada (session/client id). Lo fija el pipeline.
+llm_user_id: ContextVar[str] = ContextVar("llm_user_id", default="anonymous")
+
+
+def estimate_tokens(messages: List[Dict[str, str]], max_tokens: Optional[int] = None) -> int:
+    """Estimación barata (~4 caracteres por token) del prompt más la salida máxima."""
+    prompt_chars = sum(len(m.get("content") or "") for m in messages)
+    return prompt_chars // 4 + (max_tokens or 0)
+
+
+_DURATION_RE = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+
+
+def parse_duration(value: Optional[str]) -> Optional[float]:
+    """Convierte '1m2.5s', '120ms', '6s' o '30' (segundos) a segundos."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_RE.findall(value)
+    if not parts:
+        return None
+    factors = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+    return sum(float(n) * factors[unit] for n, unit in parts)
+
+
+def _is_rate_limited(exc: BaseException) -> bool:
+    return getattr(exc, "status_code", None) == 429
+
+
+def _error_headers(exc: BaseException) -> Mapping[str, str]:
+    response = getattr(exc, "response", None)
+    return getattr(response, "headers", None) or {}
+
+
+class TokenBucket:
+    """Token bucket con recarga continua; `per_minute` <= 0 significa sin límite."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    @property
+    def unlimited(self) -> bool:
+        return self.capacity <= 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, amount: float = 1) -> float:
+        """Consume `amount` tokens esperando lo necesario. Devuelve el tiempo esperado."""
+        if self.unlimited:
+            return 0.0
+        amount = min(amount, self.capacity)
+        waited = 0.0
+        while True:
+            self._refill()
+            if self.tokens >= amount:
+                self.tokens -= amount
+                return waited
+            delay = (amount - self.tokens) / self.rate
+            await asyncio.sleep(delay)
+            waited += delay
+
+    def refund(self, amount: float) -> None:
+        if not self.unlimited and amount > 0:
+            self._refill()
+            self.tokens = min(self.capacity, self.tokens + amount)
+
+    def clamp(self, remaining: float) -> None:
+        """Ajusta el nivel a lo que el proveedor informa como restante."""
+        if not self.unlimited:
+            self._refill()
+            self.tokens = min(self.tokens, max(0.0, remaining))
+
+    def level(self) -> Optional[float]:
+        if self.unlimited:
+            return None
+        self._refill()
+        return round(self.tokens, 1)
+
+
+@dataclass
+class _Lane:
+    """Carril de concurrencia AIMD con cola justa por usuario."""
+    limit: float
+    min_limit: float
+    max_limit: float
+    in_flight: int = 0
+    paused_until: float = 0.0
+    queues: "OrderedDict[str, Deque[asyncio.Future]]" = field(default_factory=OrderedDict)
+    wakeup: Optional[asyncio.TimerHandle] = None
+    successes: int = 0
+    throttles: int = 0
+    errors: int = 0
+    max_queue_depth: int = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(len(q) for q in self.queues.values())
+
+
+class GovernorPermit:
+    """Permiso de una llamada en curso; recibe cabeceras y uso real para ajustar los buckets."""
+
+    def __init__(self, governor: "LLMGovernor", lane_key: Tuple[str, str], buckets: List[Tuple[str, TokenBucket]], reserved_tokens: int):
+        self._governor = governor
+        self._lane_key = lane_key
+        self._buckets = buckets
+        self.reserved_tokens = reserved_tokens
+        self.queued_seconds = 0.0
+
+    def record_usage(self, total_tokens: Optional[int]) -> None:
+        """Devuelve a los buckets TPM la diferencia entre lo reservado y lo consumido."""
+        if total_tokens is None:
+            return
+        refund = self.reserved_tokens - total_tokens
+        for kind, bucket in self._buckets:
+            if kind == "tpm":
+                bucket.refund(refund)
+        self.reserved_tokens = total_tokens
+
+    def record_headers(self, headers: Optional[Mapping[str, str]]) -> None:
+        self._governor._apply_headers(self._lane_key, headers or {})
+
+
+class LLMGovernor:
+    """Planificador de llamadas salientes por proveedor / API key."""
+
+    def __init__(self, limits: Optional[Dict[str, Dict[str, float]]] = None):
+        self.limits = limits or LLM_RATE_LIMITS
+        self._lanes: Dict[Tuple[str, str], _Lane] = {}
+        self._buckets: Dict[Tuple[str, ...], TokenBucket] = {}
+
+    def _provider_limits(self, api_type: str) -> Dict[str, float]:
+        merged = dict(self.limits.get("default", {}))
+        merged.update(self.limits.get(api_type, {}))
+        return merged
+
+    def _lane(self, lane_key: Tuple[str, str]) -> _Lane:
+        lane = self._lanes.get(lane_key)
+        if lane is None:
+            cfg = self._provider_limits(lane_key[0])
+            lane = _Lane(
+                limit=float(cfg.get("initial_concurrency", cfg.get("max_concurrency", 8))),
+                min_limit=float(cfg.get("min_concurrency", 1)),
+                max_limit=float(cfg.get("max_concurrency", 8)),
+            )
+            self._lanes[lane_key] = lane
+        return lane
+
+    def _bucket(self, key: Tuple[str, ...], per_minute: float) -> TokenBucket:
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(per_minute)
+            self._buckets[key] = bucket
+        return bucket
+
+    def _buckets_for(self, api_type: str, key_fp: str) -> List[Tuple[str, TokenBucket]]:
+        cfg = self._provider_limits(api_type)
+        return [
+            ("rpm", self._bucket(("provider", api_type, "rpm"), cfg.get("rpm", 0))),
+            ("tpm", self._bucket(("provider", api_type, "tpm"), cfg.get("tpm", 0))),
+            ("rpm", self._bucket(("key", api_type, key_fp, "rpm"), cfg.get("key_rpm", 0))),
+            ("tpm", self._bucket(("key", api_type, key_fp, "tpm"), cfg.get("key_tpm", 0))),
+        ]
+
+    # --- Cola justa -------------------------------------------------------
+
+    def _dispatch(self, lane_key: Tuple[str, str]) -> None:
+        """Concede huecos libres en round-robin entre usuarios con peticiones en cola."""
+        lane = self._lanes[lane_key]
+        now = time.monotonic()
+        if lane.paused_until > now:
+            if lane.queues and lane.wakeup is None:
+                lane.wakeup = asyncio.get_running_loop().call_later(
+                    lane.paused_until - now, self._wake, lane_key
+                )
+            return
+        while lane.queues and lane.in_flight < max(1, int(lane.limit)):
+            user, queue = next(iter(lane.queues.items()))
+            future = queue.popleft()
+            # Rotar: el usuario atendido pasa al final de la ronda
+            del lane.queues[user]
+            if queue:
+                lane.queues[user] = queue
+            if future.done():
+                continue
+            lane.in_flight += 1
+            future.set_result(None)
+
+    def _wake(self, lane_key: Tuple[str, str]) -> None:
+        self._lanes[lane_key].wakeup = None
+        self._dispatch(lane_key)
+
+    async def _acquire_slot(self, lane_key: Tuple[str, str], user: str) -> None:
+        lane = self._lane(lane_key)
+        if not lane.queues and lane.in_flight < max(1, int(lane.limit)) and lane.paused_until <= time.monotonic():
+            lane.in_flight += 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        lane.queues.setdefault(user, deque()).append(future)
+        lane.max_queue_depth = max(lane.max_queue_depth, lane.queue_depth)
+        self._dispatch(lane_key)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # El hueco ya se había concedido: devolverlo
+                self._release_slot(lane_key)
+            else:
+                queue = lane.queues.get(user)
+                if queue and future in queue:
+                    queue.remove(future)
+                    if not queue:
+                        del lane.queues[user]
+            raise
+
+    def _release_slot(self, lane_key: Tuple[str, str]) -> None:
+        lane = self._lanes[lane_key]
+        lane.in_flight = max(0, lane.in_flight - 1)
+        self._dispatch(lane_key)
+
+    # --- AIMD ---------------------------------------------------------------
+
+    def _on_success(self, lane_key: Tuple[str, str]) -> None:
+        lane = self._lanes[lane_key]
+        lane.successes += 1
+        # Incremento aditivo: ~+1 por cada `limit` éxitos
+        lane.limit = min(lane.max_limit, lane.limit + 1.0 / max(1.0, lane.limit))
+
+    def _on_throttle(self, lane_key: Tuple[str, str], headers: Mapping[str, str]) -> None:
+        lane = self._lanes[lane_key]
+        lane.throttles += 1
+        # Decremento multiplicativo
+        lane.limit = max(lane.min_limit, lane.limit / 2.0)
+        retry_after = parse_duration(headers.get("retry-after")) or 1.0
+        lane.paused_until = max(lane.paused_until, time.monotonic() + retry_after)
+
+    def _apply_headers(self, lane_key: Tuple[str, str], headers: Mapping[str, str]) -> None:
+        """Sincroniza los buckets por key con `x-ratelimit-remaining-*` y pausa si se agotaron."""
+        api_type, key_fp = lane_key
+        remaining_requests = headers.get("x-ratelimit-remaining-requests")
+        remaining_tokens = headers.get("x-ratelimit-remaining-tokens")
+        if remaining_requests is not None:
+            try:
+                remaining = float(remaining_requests)
+                self._bucket(("key", api_type, key_fp, "rpm"), self._provider_limits(api_type).get("key_rpm", 0)).clamp(remaining)
+                if remaining <= 0:
+                    reset = parse_duration(headers.get("x-ratelimit-reset-requests")) or 1.0
+                    lane = self._lanes[lane_key]
+                    lane.paused_until = max(lane.paused_until, time.monotonic() + reset)
+            except ValueError:
+                pass
+        if remaining_tokens is not None:
+            try:
+                self._bucket(("key", api_type, key_fp, "tpm"), self._provider_limits(api_type).get("key_tpm", 0)).clamp(float(remaining_tokens))
+            except ValueError:
+                pass
+
+    # --- API pública ---------------------------------------------------------
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        api_type: str,
+        api_key: str,
+        estimated_tokens: int = 0,
+        user_id: Optional[str] = None,
+    ) -> AsyncIterator[GovernorPermit]:
+        """
+        Reserva un hueco de concurrencia y los tokens de RPM/TPM para una llamada.
+
+        Uso:
+            async with llm_governor.slot("groq", key, estimate_tokens(msgs, 4096)) as permit:
+                raw = await client.chat.completions.with_raw_response.create(...)
+                permit.record_headers(raw.headers)
+        """
+        api_type = api_type or "openai"
+        lane_key = (api_type, fingerprint_api_key(api_key or ""))
+        user = user_id or llm_user_id.get()
+        buckets = self._buckets_for(*lane_key)
+
+        started = time.monotonic()
+        # Buckets antes que el hueco: esperar la recarga de RPM/TPM no ocupa el carril
+        taken: List[Tuple[TokenBucket, float]] = []
+        try:
+            for kind, bucket in buckets:
+                amount = 1 if kind == "rpm" else estimated_tokens
+                await bucket.acquire(amount)
+                taken.append((bucket, amount))
+            await self._acquire_slot(lane_key, user)
+        except BaseException:
+            # Cancelada en la espera: devolver lo ya reservado
+            for bucket, amount in taken:
+                bucket.refund(amount)
+            raise
+        permit = GovernorPermit(self, lane_key, buckets, estimated_tokens)
+        permit.queued_seconds = time.monotonic() - started
+        try:
+            yield permit
+        except BaseException as exc:
+            if _is_rate_limited(exc):
+                self._on_throttle(lane_key, _error_headers(exc))
+            elif isinstance(exc, Exception):
+                self._lanes[lane_key].errors += 1
+            raise
+        else:
+            self._on_success(lane_key)
+        finally:
+            self._release_slot(lane_key)
+
+    def get_stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        lanes = []
+        for (api_type, key_fp), lane in self._lanes.items():
+            lanes.append({
+                "provider": api_type,
+                "key_fingerprint": key_fp,
+                "concurrency_limit": round(lane.limit, 2),
+                "in_flight": lane.in_flight,
+                "queue_depth": lane.queue_depth,
+                "queued_users": len(lane.queues),
+                "max_queue_depth": lane.max_queue_depth,
+                "paused_for_seconds": round(max(0.0, lane.paused_until - now), 2),
+                "successes": lane.successes,
+                "throttles": lane.throttles,
+                "errors": lane.errors,
+            })
+        return {
+            "total_queue_depth": sum(l["queue_depth"] for l in lanes),
+            "total_in_flight": sum(l["in_flight"] for l in lanes),
+            "lanes": lanes,
+            "buckets": {
+                ":".join(key): bucket.level()
+                for key, bucket in self._buckets.items()
+                if not bucket.unlimited
+            },
+        }
+
+
+# Gobernador global del proceso
+llm_governor = LLMGovernor()
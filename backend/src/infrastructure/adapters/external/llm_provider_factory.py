@@ -1,16 +1,83 @@
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlparse
 from src.domain.ports.output.llm_provider import LLMProviderPort, LLMProviderFactoryPort
 from src.infrastructure.adapters.external.openai_adapter import OpenAILLMAdapter
+from src.infrastructure.adapters.external.llm_client_pool import LLMClientPool
+from src.infrastructure.adapters.external.llm_governor import LLMGovernor
+from src.infrastructure.adapters.external.resilient_provider import ProviderTarget, ResilientLLMProvider
+from src.infrastructure.adapters.external.mock_llm import is_mock_url
+from src.infrastructure.config.settings import PROVIDER_ENDPOINTS, LLM_FALLBACK_CHAINS, MOCK_LLM_ENABLED
 
 class LLMProviderFactory(LLMProviderFactoryPort):
+    """
+    Crea proveedores OpenAI-compatibles envueltos en ResilientLLMProvider
+    (reintentos, hedging opcional, failover por modelo y circuit breaker por proveedor).
+    """
+
+    def __init__(
+        self,
+        client_pool: Optional[LLMClientPool] = None,
+        governor: Optional[LLMGovernor] = None,
+        fallback_chains: Optional[Dict[str, List[Dict[str, Any]]]] = None
+    ):
+        self.client_pool = client_pool
+        self.governor = governor
+        self.fallback_chains = LLM_FALLBACK_CHAINS if fallback_chains is None else fallback_chains
+
+    @staticmethod
+    def target_name(api_type: str, base_url: Optional[str]) -> str:
+        """Nombre del proveedor para breaker/latencias: el tipo, o tipo@host si es un endpoint propio."""
+        default = PROVIDER_ENDPOINTS.get(api_type, {}).get("base_url")
+        if not base_url or base_url.rstrip("/") == (default or "").rstrip("/"):
+            return api_type
+        return f"{api_type}@{urlparse(base_url).netloc or base_url}"
+
+    def _adapter(self, api_type: str, api_key: str, base_url: Optional[str]) -> OpenAILLMAdapter:
+        return OpenAILLMAdapter(
+            api_key=api_key,
+            base_url=base_url,
+            api_type=api_type,
+            client_pool=self.client_pool,
+            governor=self.governor
+        )
+
+    def _fallback_targets(self, model: str) -> List[ProviderTarget]:
+        """Eslabones configurados para el modelo (o "*"), usando las API keys del servidor."""
+        chain = self.fallback_chains.get(model) or self.fallback_chains.get("*") or []
+        targets = []
+        for link in chain:
+            api_type = link.get("type", "openai")
+            endpoint = PROVIDER_ENDPOINTS.get(api_type, {})
+            api_key = link.get("api_key") or endpoint.get("api_key")
+            base_url = link.get("base_url") or endpoint.get("base_url")
+            if not api_key:
+                continue
+            targets.append(ProviderTarget(
+                name=self.target_name(api_type, base_url),
+                provider=self._adapter(api_type, api_key, base_url),
+                model=link.get("model")
+            ))
+        return targets
+
     def create(self, api_config: Dict[str, Any]) -> LLMProviderPort:
         api_type = api_config.get("type", "openai")
         api_key = api_config.get("api_key") or api_config.get("apiKey")
         base_url = api_config.get("base_url") or api_config.get("baseUrl")
-        
-        if api_type == "openai" or api_type == "groq":
-            # Groq uses OpenAI compatible API if custom base_url is provided
-            return OpenAILLMAdapter(api_key=api_key, base_url=base_url or "https://api.openai.com/v1")
-        
-        # Default to OpenAI adapter for now as it's the primary one
-        return OpenAILLMAdapter(api_key=api_key, base_url=base_url)
+
+        # Proveedor simulado: type "mock" o una base_url mock:// (sin red ni cuota)
+        if api_type == "mock" or is_mock_url(base_url):
+            if not MOCK_LLM_ENABLED:
+                raise ValueError("El proveedor LLM simulado está deshabilitado (MOCK_LLM_ENABLED=false)")
+            api_type = "mock"
+            api_key = api_key or PROVIDER_ENDPOINTS["mock"]["api_key"]
+
+        # Groq y demás proveedores usan la API compatible con OpenAI
+        base_url = base_url or PROVIDER_ENDPOINTS.get(api_type, PROVIDER_ENDPOINTS["openai"])["base_url"]
+
+        server_key = PROVIDER_ENDPOINTS.get(api_type, {}).get("api_key")
+        primary = ProviderTarget(
+            name=self.target_name(api_type, base_url),
+            provider=self._adapter(api_type, api_key, base_url),
+            user_key=bool(api_key) and api_key != server_key
+        )
+        return ResilientLLMProvider(primary=primary, fallback_resolver=self._fallback_targets)
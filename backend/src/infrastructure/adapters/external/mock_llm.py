@@ -0,0 +1,319 @@
+"""
+Proveedor LLM simulado, compatible con la API de OpenAI.
+
+Permite ejecutar pipelines, streaming, caché y el gobernador de rate limits
+sin gastar cuota real (portátil o CI):
+
+- TTFT y tokens/segundo configurables
+- Tasa de errores 5xx y de 429 (con retry-after), con semilla fija
+- Contenido determinista: la misma conversación produce el mismo texto
+
+Se usa de dos formas con el mismo motor:
+- En proceso: base_url "mock://local?ttft_ms=50&tps=200" → MockLLMTransport
+  (httpx) detrás del SDK de OpenAI, sin red
+- Por HTTP: router /mock-llm/v1 (app/routes/mock_llm_routes.py)
+"""
+import asyncio
+import hashlib
+import json
+import random
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional
+from urllib.parse import parse_qsl, urlparse
+
+import httpx
+
+from src.infrastructure.config.settings import (
+    MOCK_LLM_TTFT_MS,
+    MOCK_LLM_TOKENS_PER_SEC,
+    MOCK_LLM_ERROR_RATE,
+    MOCK_LLM_RATE_LIMIT_RATE,
+    MOCK_LLM_OUTPUT_TOKENS,
+    MOCK_LLM_FAULT_SEED,
+    MOCK_LLM_MAX_SECONDS,
+)
+
+MOCK_SCHEME = "mock"
+# base_url real que ve el SDK cuando la petición va por el transporte en proceso
+MOCK_HTTP_BASE_URL = "http://mock-llm.local/v1"
+
+_VOCABULARY = (
+    "análisis estrategia datos mercado riesgo impacto propuesta solución clientes "
+    "proceso equipo objetivo métrica costo valor calidad escenario recomendación "
+    "implementación fase resultado evidencia supuesto alternativa prioridad recurso "
+    "plazo indicador oportunidad limitación contexto hallazgo criterio modelo"
+).split()
+_SECTIONS = ("Resumen", "Análisis", "Hallazgos clave", "Recomendaciones", "Próximos pasos")
+
+
+def is_mock_url(base_url: Optional[str]) -> bool:
+    return bool(base_url) and base_url.startswith(f"{MOCK_SCHEME}://")
+
+
+def _clamp(value: float, low: float, high: float) -> float:
+    return max(low, min(high, value))
+
+
+@dataclass(frozen=True)
+class MockLLMConfig:
+    ttft_ms: float = MOCK_LLM_TTFT_MS
+    tokens_per_sec: float = MOCK_LLM_TOKENS_PER_SEC
+    error_rate: float = MOCK_LLM_ERROR_RATE
+    rate_limit_rate: float = MOCK_LLM_RATE_LIMIT_RATE
+    output_tokens: int = MOCK_LLM_OUTPUT_TOKENS
+    fault_seed: int = MOCK_LLM_FAULT_SEED
+
+    # Nombres cortos aceptados en la query de la URL
+    PARAMS = {
+        "ttft_ms": "ttft_ms",
+        "tps": "tokens_per_sec",
+        "tokens_per_sec": "tokens_per_sec",
+        "error_rate": "error_rate",
+        "rate_limit_rate": "rate_limit_rate",
+        "429_rate": "rate_limit_rate",
+        "output_tokens": "output_tokens",
+        "seed": "fault_seed",
+    }
+
+    def with_params(self, params: Mapping[str, str]) -> "MockLLMConfig":
+        """
+        Aplica overrides acotados: TTFT + output_tokens/tps nunca supera
+        MOCK_LLM_MAX_SECONDS (se sube tps si hace falta).
+        """
+        updates: Dict[str, Any] = {}
+        for name, value in params.items():
+            attr = self.PARAMS.get(name)
+            if attr is None:
+                continue
+            try:
+                number = float(value)
+            except (TypeError, ValueError):
+                continue
+            if attr == "ttft_ms":
+                updates[attr] = _clamp(number, 0, MOCK_LLM_MAX_SECONDS * 1000 / 2)
+            elif attr == "tokens_per_sec":
+                updates[attr] = _clamp(number, 1, 100000)
+            elif attr in ("error_rate", "rate_limit_rate"):
+                updates[attr] = _clamp(number, 0, 1)
+            elif attr == "output_tokens":
+                updates[attr] = int(_clamp(number, 1, 32768))
+            else:
+                updates[attr] = int(number)
+        config = replace(self, **updates)
+        generation_seconds = max(MOCK_LLM_MAX_SECONDS - config.ttft_ms / 1000, 0.001)
+        if config.output_tokens / config.tokens_per_sec > generation_seconds:
+            config = replace(config, tokens_per_sec=config.output_tokens / generation_seconds)
+        return config
+
+    @classmethod
+    def from_url(cls, base_url: str) -> "MockLLMConfig":
+        return cls().with_params(dict(parse_qsl(urlparse(base_url).query)))
+
+
+@dataclass
+class MockLLMResult:
+    status: int
+    headers: Dict[str, str]
+    payload: Optional[Dict[str, Any]] = None
+    stream: Optional[AsyncIterator[bytes]] = None
+
+
+def prompt_hash(model: str, messages: List[Dict[str, Any]]) -> str:
+    payload = json.dumps({"model": model, "messages": messages}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def generate_tokens(seed_hash: str, count: int) -> List[str]:
+    """Texto markdown determinista (un token ≈ una palabra) sembrado por el hash del prompt."""
+    rng = random.Random(int(seed_hash[:16], 16))
+    tokens: List[str] = []
+    section = 0
+    while len(tokens) < count:
+        if len(tokens) % 60 == 0:
+            prefix = "\n\n" if tokens else ""
+            tokens.append(f"{prefix}## {_SECTIONS[section % len(_SECTIONS)]}\n\n")
+            section += 1
+            continue
+        word = rng.choice(_VOCABULARY)
+        if len(tokens) % 12 == 11:
+            word += ". "
+        else:
+            word += " "
+        tokens.append(word)
+    return tokens[:count]
+
+
+@dataclass
+class MockLLMEngine:
+    """Genera respuestas chat.completions (completas o SSE) con latencia y fallos simulados."""
+    config: MockLLMConfig = field(default_factory=MockLLMConfig)
+    requests: int = 0
+    errors: int = 0
+    rate_limited: int = 0
+
+    def __post_init__(self):
+        self._faults = random.Random(self.config.fault_seed)
+
+    @staticmethod
+    def _rate_headers() -> Dict[str, str]:
+        return {
+            "x-ratelimit-limit-requests": "100000",
+            "x-ratelimit-remaining-requests": "99999",
+            "x-ratelimit-limit-tokens": "100000000",
+            "x-ratelimit-remaining-tokens": "99999999",
+        }
+
+    def _fault(self, config: MockLLMConfig) -> Optional[MockLLMResult]:
+        roll = self._faults.random()
+        if roll < config.rate_limit_rate:
+            self.rate_limited += 1
+            return MockLLMResult(
+                status=429,
+                headers={"retry-after": "1", "x-ratelimit-remaining-requests": "0", "x-ratelimit-reset-requests": "1s"},
+                payload={"error": {"message": "Rate limit reached (mock)", "type": "rate_limit_exceeded", "code": "rate_limit_exceeded"}},
+            )
+        if roll < config.rate_limit_rate + config.error_rate:
+            self.errors += 1
+            return MockLLMResult(
+                status=503,
+                headers={},
+                payload={"error": {"message": "Service unavailable (mock)", "type": "server_error", "code": None}},
+            )
+        return None
+
+    async def complete(self, body: Dict[str, Any], config: Optional[MockLLMConfig] = None) -> MockLLMResult:
+        config = config or self.config
+        self.requests += 1
+        fault = self._fault(config)
+        if fault is not None:
+            return fault
+
+        model = body.get("model") or "mock-model"
+        messages = body.get("messages") or []
+        seed = prompt_hash(model, messages)
+        max_tokens = body.get("max_tokens") or body.get("max_completion_tokens") or config.output_tokens
+        count = max(1, min(int(max_tokens), config.output_tokens))
+        tokens = generate_tokens(seed, count)
+        finish_reason = "length" if int(max_tokens) < config.output_tokens else "stop"
+        prompt_tokens = sum(len(str(m.get("content") or "").split()) for m in messages)
+        completion_id = f"chatcmpl-mock-{seed[:12]}"
+
+        if body.get("stream"):
+            stream = self._sse(config, completion_id, model, tokens, finish_reason)
+            headers = dict(self._rate_headers(), **{"content-type": "text/event-stream"})
+            return MockLLMResult(status=200, headers=headers, stream=stream)
+
+        await asyncio.sleep(config.ttft_ms / 1000 + len(tokens) / config.tokens_per_sec)
+        return MockLLMResult(status=200, headers=self._rate_headers(), payload={
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": "".join(tokens)},
+                "finish_reason": finish_reason,
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": len(tokens),
+                "total_tokens": prompt_tokens + len(tokens),
+            },
+        })
+
+    async def _sse(
+        self,
+        config: MockLLMConfig,
+        completion_id: str,
+        model: str,
+        tokens: List[str],
+        finish_reason: str
+    ) -> AsyncIterator[bytes]:
+        created = int(time.time())
+
+        def chunk(delta: Dict[str, Any], finish: Optional[str] = None) -> bytes:
+            data = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish}],
+            }
+            return f"data: {json.dumps(data, ensure_ascii=False)}\n\n".encode("utf-8")
+
+        await asyncio.sleep(config.ttft_ms / 1000)
+        yield chunk({"role": "assistant", "content": ""})
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        interval = 1 / config.tokens_per_sec
+        sent = 0
+        while sent < len(tokens):
+            # Se envían todos los tokens que "ya deberían" haber salido según tokens/seg
+            due = max(sent + 1, int((loop.time() - started) / interval) + 1)
+            batch = tokens[sent:due]
+            sent += len(batch)
+            yield chunk({"content": "".join(batch)})
+            if sent < len(tokens):
+                await asyncio.sleep(interval)
+
+        yield chunk({}, finish_reason)
+        yield b"data: [DONE]\n\n"
+
+    def list_models(self) -> Dict[str, Any]:
+        return {"object": "list", "data": [{"id": "mock-model", "object": "model", "owned_by": "mock"}]}
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "rate_limited": self.rate_limited,
+            "config": {
+                "ttft_ms": self.config.ttft_ms,
+                "tokens_per_sec": self.config.tokens_per_sec,
+                "error_rate": self.config.error_rate,
+                "rate_limit_rate": self.config.rate_limit_rate,
+                "output_tokens": self.config.output_tokens,
+            },
+        }
+
+
+class _IteratorByteStream(httpx.AsyncByteStream):
+    def __init__(self, iterator: AsyncIterator[bytes]):
+        self._iterator = iterator
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for part in self._iterator:
+            yield part
+
+    async def aclose(self) -> None:
+        aclose = getattr(self._iterator, "aclose", None)
+        if aclose:
+            await aclose()
+
+
+class MockLLMTransport(httpx.AsyncBaseTransport):
+    """Transporte httpx que responde con el motor simulado, con streaming real (sin red)."""
+
+    def __init__(self, engine: Optional[MockLLMEngine] = None):
+        self.engine = engine or MockLLMEngine()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path.rstrip("/")
+        if request.method == "GET" and path.endswith("/models"):
+            return httpx.Response(200, json=self.engine.list_models())
+        if not path.endswith("/chat/completions"):
+            return httpx.Response(404, json={"error": {"message": f"Unknown mock route {path}"}})
+
+        body = json.loads(await request.aread() or b"{}")
+        result = await self.engine.complete(body)
+        if result.stream is not None:
+            return httpx.Response(result.status, headers=result.headers, stream=_IteratorByteStream(result.stream))
+        return httpx.Response(result.status, headers=result.headers, json=result.payload)
+
+
+def build_mock_http_client(base_url: str, timeout: httpx.Timeout) -> httpx.AsyncClient:
+    """Cliente httpx para una base_url mock:// (la query define TTFT, tps y tasas de fallo)."""
+    engine = MockLLMEngine(config=MockLLMConfig.from_url(base_url))
+    return httpx.AsyncClient(transport=MockLLMTransport(engine), timeout=timeout)
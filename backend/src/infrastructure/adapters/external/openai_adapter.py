@@ -1,30 +1,87 @@
-import os
-from openai import OpenAI
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator
 from src.domain.ports.output.llm_provider import LLMProviderPort
+from src.infrastructure.adapters.external.llm_client_pool import LLMClientPool, llm_client_pool
+from src.infrastructure.adapters.external.llm_governor import LLMGovernor, llm_governor, estimate_tokens
 
 class OpenAILLMAdapter(LLMProviderPort):
-    def __init__(self, api_key: str, base_url: str = "https://api.openai.com/v1"):
-        self.client = OpenAI(api_key=api_key, base_url=base_url)
+    """
+    Adaptador OpenAI-compatible 100% asíncrono.
+    Usa clientes AsyncOpenAI del registro compartido, así ninguna llamada bloquea el event loop.
+    Cada llamada pasa por el gobernador de rate/concurrencia del proveedor.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.openai.com/v1",
+        api_type: str = "openai",
+        client_pool: Optional[LLMClientPool] = None,
+        governor: Optional[LLMGovernor] = None
+    ):
+        self.api_key = api_key
+        self.base_url = base_url
+        self.api_type = api_type
+        self.client_pool = client_pool or llm_client_pool
+        self.governor = governor or llm_governor
 
     async def chat_completion(
-        self, 
-        messages: List[Dict[str, str]], 
-        model: str, 
-        temperature: float = 0.7, 
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        temperature: float = 0.7,
         max_tokens: int = 4000,
         stream: bool = False
     ) -> Any:
-        # Nota: En una implementación real, esto debería manejar el streaming si stream=True
-        response = self.client.chat.completions.create(
-            model=model,
-            messages=messages,
-            temperature=temperature,
-            max_tokens=max_tokens,
-            stream=stream
-        )
-        
+        """
+        Con stream=False devuelve el texto completo.
+        Con stream=True devuelve un generador asíncrono de deltas de texto.
+        """
         if stream:
-            return response
-        
+            return self._stream(messages, model, temperature, max_tokens)
+
+        async with self.governor.slot(self.api_type, self.api_key, estimate_tokens(messages, max_tokens)) as permit:
+            async with self.client_pool.lease(self.api_type, self.api_key, self.base_url) as client:
+                raw = await client.chat.completions.with_raw_response.create(
+                    model=model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                )
+            permit.record_headers(raw.headers)
+            response = raw.parse()
+            if response.usage:
+                permit.record_usage(response.usage.total_tokens)
+
         return response.choices[0].message.content
+
+    async def _stream(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        temperature: float,
+        max_tokens: int
+    ) -> AsyncIterator[str]:
+        prompt_tokens = estimate_tokens(messages)
+        async with self.governor.slot(self.api_type, self.api_key, prompt_tokens + (max_tokens or 0)) as permit:
+            async with self.client_pool.lease(self.api_type, self.api_key, self.base_url) as client:
+                raw = await client.chat.completions.with_raw_response.create(
+                    model=model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    stream=True,
+                )
+                permit.record_headers(raw.headers)
+                stream = raw.parse()
+                generated_chars = 0
+                try:
+                    async for chunk in stream:
+                        if not chunk.choices:
+                            continue
+                        delta = chunk.choices[0].delta.content
+                        if delta:
+                            generated_chars += len(delta)
+                            yield delta
+                finally:
+                    await stream.close()
+                    permit.record_usage(prompt_tokens + generated_chars // 4)
@@ -0,0 +1,348 @@
+"""
+Proveedor LLM resiliente: reintentos, hedging y failover entre proveedores.
+
+- Reintento con backoff exponencial y jitter para fallos transitorios
+  (conexión, timeout, 429, 5xx)
+- Hedging opcional: si la petición supera el p95 de latencia del proveedor,
+  se lanza una segunda petición idéntica (al siguiente proveedor de la cadena)
+  y gana la primera respuesta
+- Cadena ordenada de fallback por modelo (p. ej. Groq → OpenRouter)
+- Circuit breaker por proveedor: un endpoint caído se salta al instante.
+  Solo cuentan los fallos del proveedor; un 429 o un 401 es de la key
+  concreta y no debe bloquear al resto de usuarios del proveedor
+- Una key de usuario rechazada no pasa a las keys del servidor de la cadena
+  (LLM_FAILOVER_FROM_USER_KEYS)
+"""
+import asyncio
+import random
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Deque, Dict, List, Optional
+
+from src.domain.ports.output.llm_provider import LLMProviderPort
+from src.infrastructure.config.settings import (
+    LLM_MAX_RETRIES,
+    LLM_RETRY_BASE_DELAY,
+    LLM_RETRY_MAX_DELAY,
+    LLM_HEDGING_ENABLED,
+    LLM_HEDGE_MIN_SAMPLES,
+    LLM_BREAKER_FAILURE_THRESHOLD,
+    LLM_BREAKER_RESET_TIMEOUT,
+    LLM_FAILOVER_FROM_USER_KEYS,
+)
+
+TRANSIENT_STATUS = {408, 409, 429, 500, 502, 503, 504}
+# Errores del proveedor (no de la petición) que justifican probar el siguiente
+FAILOVER_STATUS = TRANSIENT_STATUS | {401, 403, 404}
+# Errores de la credencial concreta (permisos, cuota), no de la salud del proveedor
+CREDENTIAL_STATUS = {401, 403, 404, 429}
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    return getattr(exc, "status_code", None)
+
+
+def is_transient(exc: BaseException) -> bool:
+    """Fallos idempotentes que vale la pena reintentar."""
+    if isinstance(exc, (asyncio.TimeoutError, ConnectionError)):
+        return True
+    # openai.APIConnectionError / APITimeoutError no tienen status_code
+    if type(exc).__name__ in ("APIConnectionError", "APITimeoutError"):
+        return True
+    return _status_code(exc) in TRANSIENT_STATUS
+
+
+def should_failover(exc: BaseException) -> bool:
+    return is_transient(exc) or _status_code(exc) in FAILOVER_STATUS
+
+
+def counts_against_provider(exc: BaseException) -> bool:
+    """Fallos que alimentan el breaker compartido: los transitorios salvo el 429 de una key."""
+    return is_transient(exc) and _status_code(exc) not in CREDENTIAL_STATUS
+
+
+class CircuitBreaker:
+    """Breaker clásico closed → open → half-open con una única petición de prueba."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = LLM_BREAKER_FAILURE_THRESHOLD, reset_timeout: float = LLM_BREAKER_RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trial_in_flight = False
+        self.short_circuited = 0
+
+    def allow(self) -> bool:
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+            self.state = self.HALF_OPEN
+            self.trial_in_flight = False
+        if self.state == self.HALF_OPEN and not self.trial_in_flight:
+            self.trial_in_flight = True
+            return True
+        self.short_circuited += 1
+        return False
+
+    def release_trial(self) -> None:
+        """La petición de prueba terminó sin veredicto sobre el proveedor (error de la petición)."""
+        self.trial_in_flight = False
+
+    def record_success(self) -> None:
+        self.state = self.CLOSED
+        self.failures = 0
+        self.trial_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self.trial_in_flight = False
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "short_circuited": self.short_circuited,
+        }
+
+
+class LatencyTracker:
+    """Ventana deslizante de latencias de éxito para calcular el p95 del hedge."""
+
+    def __init__(self, window: int = 200):
+        self.samples: Deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        self.samples.append(seconds)
+
+    def p95(self, min_samples: int = LLM_HEDGE_MIN_SAMPLES) -> Optional[float]:
+        if len(self.samples) < min_samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+
+# Estado compartido por todo el proceso, indexado por nombre de proveedor/endpoint
+circuit_breakers: Dict[str, CircuitBreaker] = {}
+latency_trackers: Dict[str, LatencyTracker] = {}
+
+
+def get_breaker(name: str) -> CircuitBreaker:
+    if name not in circuit_breakers:
+        circuit_breakers[name] = CircuitBreaker()
+    return circuit_breakers[name]
+
+
+def get_latency_tracker(name: str) -> LatencyTracker:
+    if name not in latency_trackers:
+        latency_trackers[name] = LatencyTracker()
+    return latency_trackers[name]
+
+
+def get_resilience_stats() -> Dict[str, Any]:
+    return {
+        name: dict(breaker.get_stats(), p95_seconds=get_latency_tracker(name).p95())
+        for name, breaker in circuit_breakers.items()
+    }
+
+
+@dataclass
+class ProviderTarget:
+    """Un eslabón de la cadena: proveedor concreto y, opcionalmente, el modelo a usar en él."""
+    name: str
+    provider: LLMProviderPort
+    model: Optional[str] = None
+    user_key: bool = False  # API key aportada por el usuario (no del servidor)
+
+
+class ResilientLLMProvider(LLMProviderPort):
+    """Envuelve un proveedor primario con reintentos, hedging y failover ordenado."""
+
+    def __init__(
+        self,
+        primary: ProviderTarget,
+        fallback_resolver: Optional[Callable[[str], List[ProviderTarget]]] = None,
+        max_retries: int = LLM_MAX_RETRIES,
+        base_delay: float = LLM_RETRY_BASE_DELAY,
+        max_delay: float = LLM_RETRY_MAX_DELAY,
+        hedging: bool = LLM_HEDGING_ENABLED,
+        failover_from_user_key: bool = LLM_FAILOVER_FROM_USER_KEYS,
+    ):
+        self.primary = primary
+        self.fallback_resolver = fallback_resolver
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.hedging = hedging
+        self.failover_from_user_key = failover_from_user_key
+
+    def _targets(self, model: str) -> List[ProviderTarget]:
+        targets = [self.primary]
+        if self.fallback_resolver:
+            targets.extend(t for t in self.fallback_resolver(model) if t.name != self.primary.name)
+        return targets
+
+    def _may_failover(self, target: ProviderTarget, exc: BaseException) -> bool:
+        if not should_failover(exc):
+            return False
+        # Lo que rechazó la key del usuario no se reintenta con las keys del servidor
+        if target.user_key and _status_code(exc) in CREDENTIAL_STATUS:
+            return self.failover_from_user_key
+        return True
+
+    def _backoff(self, attempt: int) -> float:
+        # Full jitter: uniforme entre 0 y el techo exponencial
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    async def _attempt(self, target: ProviderTarget, messages, model, temperature, max_tokens) -> Any:
+        """Una petición a un proveedor, con sus reintentos; actualiza breaker y latencias."""
+        breaker = get_breaker(target.name)
+        for attempt in range(self.max_retries + 1):
+            started = time.monotonic()
+            try:
+                result = await target.provider.chat_completion(
+                    messages=messages,
+                    model=target.model or model,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                )
+            except Exception as e:
+                if counts_against_provider(e):
+                    breaker.record_failure()
+                else:
+                    breaker.release_trial()
+                if not is_transient(e) or attempt == self.max_retries or breaker.state == CircuitBreaker.OPEN:
+                    raise
+                await asyncio.sleep(self._backoff(attempt))
+                continue
+            except BaseException:
+                # Cancelada (pipeline cancelado, hedge perdedor): sin veredicto, libera la prueba
+                breaker.release_trial()
+                raise
+            breaker.record_success()
+            get_latency_tracker(target.name).record(time.monotonic() - started)
+            return result
+
+    def _hedge_target(self, targets: List[ProviderTarget], index: int) -> ProviderTarget:
+        target = targets[index]
+        # Una key de usuario lenta no se cubre con las keys del servidor
+        if target.user_key and not self.failover_from_user_key:
+            return target
+        return targets[index + 1] if index + 1 < len(targets) else target
+
+    async def _hedged(self, target: ProviderTarget, hedge_target: ProviderTarget, args: tuple,
+                      spent: set) -> Any:
+        """
+        Lanza la petición principal y, si supera el p95, una segunda; gana la primera.
+        Si fallan las dos se propaga el error de la principal y el destino del hedge
+        queda en `spent` para que la cadena no lo repita.
+        """
+        primary = asyncio.create_task(self._attempt(target, *args))
+        delay = get_latency_tracker(target.name).p95()
+        if delay is None:
+            return await primary
+
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done:
+            return primary.result()
+        if not get_breaker(hedge_target.name).allow():
+            return await primary
+
+        hedge = asyncio.create_task(self._attempt(hedge_target, *args))
+        pending = {primary, hedge}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    if task is hedge:
+                        spent.add(hedge_target.name)
+            raise primary.exception()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4000,
+        stream: bool = False
+    ) -> Any:
+        if stream:
+            return self._stream(messages, model, temperature, max_tokens)
+
+        args = (messages, model, temperature, max_tokens)
+        targets = self._targets(model)
+        last_exc: Optional[BaseException] = None
+        spent: set = set()
+        for index, target in enumerate(targets):
+            if target.name in spent or not get_breaker(target.name).allow():
+                continue
+            try:
+                if self.hedging:
+                    return await self._hedged(target, self._hedge_target(targets, index), args, spent)
+                return await self._attempt(target, *args)
+            except Exception as e:
+                last_exc = e
+                if not self._may_failover(target, e):
+                    raise
+                print(f"⚠️ Proveedor LLM {target.name} falló ({e}); probando siguiente de la cadena")
+        raise last_exc or RuntimeError("No hay proveedores LLM disponibles (circuit breakers abiertos)")
+
+    async def _stream(self, messages, model, temperature, max_tokens) -> AsyncIterator[str]:
+        """
+        Streaming con reintento/failover mientras no se haya emitido ningún delta.
+        Una vez que el cliente recibió texto, un fallo se propaga tal cual.
+        """
+        last_exc: Optional[BaseException] = None
+        for target in self._targets(model):
+            breaker = get_breaker(target.name)
+            if not breaker.allow():
+                continue
+            for attempt in range(self.max_retries + 1):
+                emitted = False
+                stream = None
+                try:
+                    stream = await target.provider.chat_completion(
+                        messages=messages,
+                        model=target.model or model,
+                        temperature=temperature,
+                        max_tokens=max_tokens,
+                        stream=True,
+                    )
+                    async for delta in stream:
+                        emitted = True
+                        yield delta
+                    breaker.record_success()
+                    return
+                except Exception as e:
+                    last_exc = e
+                    if counts_against_provider(e):
+                        breaker.record_failure()
+                    else:
+                        breaker.release_trial()
+                    if emitted or not self._may_failover(target, e):
+                        raise
+                    if not is_transient(e) or attempt == self.max_retries or breaker.state == CircuitBreaker.OPEN:
+                        print(f"⚠️ Proveedor LLM {target.name} falló ({e}); probando siguiente de la cadena")
+                        break
+                    await asyncio.sleep(self._backoff(attempt))
+                except BaseException:
+                    # CancelledError / GeneratorExit: el consumidor abandonó el stream
+                    breaker.release_trial()
+                    raise
+                finally:
+                    if stream is not None:
+                        await stream.aclose()
+        raise last_exc or RuntimeError("No hay proveedores LLM disponibles (circuit breakers abiertos)")
@@ -0,0 +1,283 @@
+"""
+Contabilidad de tokens por familia de modelo.
+
+- Tokenizador local por familia: tiktoken (o200k/cl100k) si está instalado
+  para modelos OpenAI; para el resto una estimación calibrada por familia
+  (conservadora: nunca subestima mucho)
+- Presupuesto explícito por petición: ventana = system + tarea + contexto
+  de agentes previos + salida + margen
+- Recorte por tokens (no por caracteres) del contexto y de la tarea
+"""
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from src.infrastructure.config.settings import (
+    LLM_MODEL_TOKEN_LIMITS,
+    LLM_DEFAULT_OUTPUT_TOKENS,
+    LLM_MIN_OUTPUT_TOKENS,
+    LLM_CONTEXT_SAFETY_MARGIN,
+    LLM_TASK_BUDGET_SHARE,
+)
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# (prefijo del nombre de modelo, familia) — se evalúan en orden
+MODEL_FAMILIES: List[Tuple[str, str]] = [
+    ("gpt-4o", "o200k"),
+    ("gpt-4.1", "o200k"),
+    ("gpt-oss", "o200k"),
+    ("o1", "o200k"),
+    ("o3", "o200k"),
+    ("o4", "o200k"),
+    ("gpt-4", "cl100k"),
+    ("gpt-3.5", "cl100k"),
+    ("llama2", "sentencepiece"),
+    ("llama-2", "sentencepiece"),
+    ("llama", "llama3"),
+    ("mixtral", "sentencepiece"),
+    ("mistral", "sentencepiece"),
+    ("gemma", "gemma"),
+    ("deepseek", "deepseek"),
+    ("qwen", "qwen"),
+]
+
+# Caracteres por token medidos sobre texto mixto español/inglés con markdown
+CHARS_PER_TOKEN: Dict[str, float] = {
+    "o200k": 4.0,
+    "cl100k": 3.6,
+    "llama3": 3.6,
+    "gemma": 3.6,
+    "deepseek": 3.4,
+    "qwen": 3.4,
+    "sentencepiece": 3.0,
+    "default": 3.0,
+}
+
+TIKTOKEN_ENCODINGS = {"o200k": "o200k_base", "cl100k": "cl100k_base"}
+
+# Tokens extra por mensaje del formato chat (rol, separadores) y del cebado de respuesta
+MESSAGE_OVERHEAD_TOKENS = 4
+REPLY_PRIMING_TOKENS = 3
+
+TRUNCATION_MARK = "..."
+
+
+def _normalize(model: Optional[str]) -> str:
+    return (model or "").strip().lower()
+
+
+def _candidates(model: str) -> List[str]:
+    """'openai/gpt-4o-mini' → ['openai/gpt-4o-mini', 'gpt-4o-mini']"""
+    names = [model]
+    if "/" in model:
+        names.append(model.rsplit("/", 1)[1])
+    return names
+
+
+def model_family(model: Optional[str]) -> str:
+    for name in _candidates(_normalize(model)):
+        for prefix, family in MODEL_FAMILIES:
+            if name.startswith(prefix):
+                return family
+    return "default"
+
+
+@lru_cache(maxsize=256)
+def model_limits(model: Optional[str]) -> Tuple[int, int]:
+    """(ventana de contexto, salida máxima); coincidencia exacta y luego por prefijo más largo."""
+    names = _candidates(_normalize(model))
+    for name in names:
+        if name in LLM_MODEL_TOKEN_LIMITS:
+            limits = LLM_MODEL_TOKEN_LIMITS[name]
+            break
+    else:
+        matches = [key for key in LLM_MODEL_TOKEN_LIMITS for name in names if key != "default" and name.startswith(key)]
+        limits = LLM_MODEL_TOKEN_LIMITS[max(matches, key=len)] if matches else LLM_MODEL_TOKEN_LIMITS["default"]
+    window = int(limits.get("window", LLM_MODEL_TOKEN_LIMITS["default"]["window"]))
+    return window, int(limits.get("max_output", min(window, LLM_DEFAULT_OUTPUT_TOKENS)))
+
+
+class Tokenizer:
+    """Cuenta y recorta texto en tokens de una familia de modelos."""
+
+    def __init__(self, family: str, encoding: Any = None):
+        self.family = family
+        self.encoding = encoding
+        self.chars_per_token = CHARS_PER_TOKEN.get(family, CHARS_PER_TOKEN["default"])
+
+    @property
+    def exact(self) -> bool:
+        return self.encoding is not None
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        if self.encoding is not None:
+            return len(self.encoding.encode(text, disallowed_special=()))
+        return math.ceil(len(text) / self.chars_per_token)
+
+    def truncate(self, text: str, max_tokens: int, keep: str = "head") -> str:
+        """Recorta a `max_tokens` conservando el inicio ("head") o el final ("tail")."""
+        if max_tokens <= 0:
+            return ""
+        if self.count(text) <= max_tokens:
+            return text
+        if self.encoding is not None:
+            tokens = self.encoding.encode(text, disallowed_special=())
+            kept = tokens[:max_tokens] if keep == "head" else tokens[-max_tokens:]
+            return self.encoding.decode(kept)
+        chars = int(max_tokens * self.chars_per_token)
+        return text[:chars] if keep == "head" else text[-chars:]
+
+
+@lru_cache(maxsize=None)
+def _tokenizer_for_family(family: str) -> Tokenizer:
+    encoding = None
+    if tiktoken is not None and family in TIKTOKEN_ENCODINGS:
+        try:
+            encoding = tiktoken.get_encoding(TIKTOKEN_ENCODINGS[family])
+        except Exception as e:
+            # Sin acceso a los ficheros BPE (entorno offline): estimación local
+            print(f"⚠️ tiktoken no disponible para {family}, usando estimación: {e}")
+    return Tokenizer(family, encoding)
+
+
+def get_tokenizer(model: Optional[str]) -> Tokenizer:
+    return _tokenizer_for_family(model_family(model))
+
+
+def count_tokens(text: str, model: Optional[str]) -> int:
+    return get_tokenizer(model).count(text)
+
+
+def count_message_tokens(messages: Sequence[Dict[str, str]], model: Optional[str]) -> int:
+    tokenizer = get_tokenizer(model)
+    return REPLY_PRIMING_TOKENS + sum(
+        MESSAGE_OVERHEAD_TOKENS + tokenizer.count(m.get("content") or "") for m in messages
+    )
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: Optional[str], keep: str = "head") -> str:
+    return get_tokenizer(model).truncate(text, max_tokens, keep)
+
+
+@dataclass(frozen=True)
+class TokenBudget:
+    """Reparto explícito de la ventana de un modelo para una petición."""
+    model: str
+    window: int
+    output: int
+    system: int
+    task: int
+    margin: int = LLM_CONTEXT_SAFETY_MARGIN
+
+    @property
+    def prompt_limit(self) -> int:
+        return max(0, self.window - self.output - self.margin)
+
+    @property
+    def context(self) -> int:
+        """Tokens que quedan para el contexto de agentes previos."""
+        return max(0, self.prompt_limit - self.system - self.task)
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "window": self.window,
+            "output": self.output,
+            "system": self.system,
+            "task": self.task,
+            "context": self.context,
+            "margin": self.margin,
+        }
+
+
+def output_tokens(model: Optional[str], requested: Optional[int] = None) -> int:
+    """Salida reservada: la pedida (o la por defecto) acotada por el modelo y su ventana."""
+    window, max_output = model_limits(model)
+    desired = requested or LLM_DEFAULT_OUTPUT_TOKENS
+    # En ventanas pequeñas la salida nunca se come más de la mitad
+    return max(LLM_MIN_OUTPUT_TOKENS, min(desired, max_output, window // 2))
+
+
+def plan_budget(
+    model: Optional[str],
+    system: str = "",
+    task: str = "",
+    requested_output: Optional[int] = None
+) -> TokenBudget:
+    tokenizer = get_tokenizer(model)
+    window, _ = model_limits(model)
+    return TokenBudget(
+        model=model or "default",
+        window=window,
+        output=output_tokens(model, requested_output),
+        system=tokenizer.count(system) + MESSAGE_OVERHEAD_TOKENS,
+        task=tokenizer.count(task) + MESSAGE_OVERHEAD_TOKENS + REPLY_PRIMING_TOKENS,
+    )
+
+
+def task_token_limit(model: Optional[str]) -> int:
+    """Máximo de tokens para el mensaje del usuario, dejando sitio a system y contexto."""
+    return int(plan_budget(model).prompt_limit * LLM_TASK_BUDGET_SHARE)
+
+
+def max_tokens_for(messages: Sequence[Dict[str, str]], model: Optional[str], requested: Optional[int] = None) -> int:
+    """
+    max_tokens a enviar al proveedor: la salida reservada, reducida si el
+    prompt real deja menos hueco en la ventana (evita errores de overflow).
+    """
+    window, _ = model_limits(model)
+    room = window - count_message_tokens(messages, model) - LLM_CONTEXT_SAFETY_MARGIN
+    return max(LLM_MIN_OUTPUT_TOKENS, min(output_tokens(model, requested), room))
+
+
+def fit_entries(
+    entries: Sequence[Tuple[str, str]],
+    max_tokens: int,
+    model: Optional[str],
+    header: str = "\n\n--- {name} ---\n"
+) -> str:
+    """
+    Junta (nombre, texto) dentro de `max_tokens`. Si no caben, cada entrada
+    recibe una parte justa: las cortas se quedan enteras y el sobrante se
+    reparte entre las largas, que se recortan por el final.
+    """
+    if not entries or max_tokens <= 0:
+        return ""
+    tokenizer = get_tokenizer(model)
+    headers = [header.format(name=name) for name, _ in entries]
+    mark_tokens = tokenizer.count(TRUNCATION_MARK)
+    available = max_tokens - sum(tokenizer.count(h) for h in headers)
+    sizes = [tokenizer.count(text) for _, text in entries]
+    if available <= 0:
+        return ""
+
+    allowance = [0] * len(entries)
+    pending = sorted(range(len(entries)), key=lambda i: sizes[i])
+    remaining = available
+    while pending:
+        share = remaining // len(pending)
+        index = pending[0]
+        if sizes[index] <= share:
+            allowance[index] = sizes[index]
+            remaining -= sizes[index]
+            pending.pop(0)
+            continue
+        for index in pending:
+            allowance[index] = share
+        break
+
+    parts = []
+    for (name, text), head, size, limit in zip(entries, headers, sizes, allowance):
+        if size > limit:
+            text = tokenizer.truncate(text, limit - mark_tokens)
+            if not text:
+                continue
+            text += TRUNCATION_MARK
+        parts.append(head + text)
+    return "".join(parts)
@@ -14,19 +14,19 @@ DB_PATH = "atp_platform.db"
 
 # Singletons de Infraestructura
 from src.infrastructure.adapters.external.llm_provider_factory import LLMProviderFactory
-from src.infrastructure.adapters.external.langgraph_orchestrator import LangGraphOrchestratorAdapter
+from src.infrastructure.adapters.external.langgraph_orchestrator import langgraph_orchestrator
 
 # Singletons de Infraestructura
 conversation_repo = SQLiteConversationRepository(DB_PATH)
 user_repo = SQLiteUserRepository(DB_PATH)
 agent_repo = InMemoryAgentRepository()
 hasher = PBKDF2PasswordHasher()
-workflow_adapter = LangGraphOrchestratorAdapter() # Use the new adapter
+workflow_adapter = langgraph_orchestrator  # Grafo compilado compartido
 llm_factory = LLMProviderFactory()
 
 # LLM Provider default
 if GROQ_API_KEY:
-    default_llm_provider = OpenAILLMAdapter(api_key=GROQ_API_KEY, base_url="https://api.groq.com/openai/v1")
+    default_llm_provider = OpenAILLMAdapter(api_key=GROQ_API_KEY, base_url="https://api.groq.com/openai/v1", api_type="groq")
 else:
     default_llm_provider = OpenAILLMAdapter(api_key=OPENAI_API_KEY or "no-key")
 
@@ -1,4 +1,5 @@
 import os
+import json
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -37,3 +38,110 @@ CORS_ORIGINS = [
     "http://127.0.0.1:3000",
     "http://localhost:8000",
 ]
+
+# LLM client pool (clientes HTTP reutilizables por proveedor/base_url/API key)
+LLM_POOL_MAX_CLIENTS = int(os.getenv("LLM_POOL_MAX_CLIENTS", 32))
+LLM_POOL_MAX_CONNECTIONS = int(os.getenv("LLM_POOL_MAX_CONNECTIONS", 100))
+LLM_POOL_MAX_KEEPALIVE = int(os.getenv("LLM_POOL_MAX_KEEPALIVE", 20))
+LLM_POOL_KEEPALIVE_EXPIRY = float(os.getenv("LLM_POOL_KEEPALIVE_EXPIRY", 60))
+LLM_POOL_IDLE_TTL = float(os.getenv("LLM_POOL_IDLE_TTL", 600))
+LLM_REQUEST_TIMEOUT = float(os.getenv("LLM_REQUEST_TIMEOUT", 120))
+
+# Gobernador de llamadas LLM: límites por proveedor (rpm/tpm globales del proveedor,
+# key_rpm/key_tpm por API key, concurrencia AIMD). 0 = sin límite.
+# Se puede sobreescribir con LLM_RATE_LIMITS='{"groq": {"key_rpm": 30}}'
+LLM_RATE_LIMITS = {
+    "default": {
+        "rpm": 0,
+        "tpm": 0,
+        "key_rpm": 500,
+        "key_tpm": 200000,
+        "min_concurrency": 1,
+        "initial_concurrency": 4,
+        "max_concurrency": 16,
+    },
+    "groq": {"key_rpm": 30, "key_tpm": 60000, "initial_concurrency": 4, "max_concurrency": 8},
+    "openrouter": {"key_rpm": 200, "initial_concurrency": 6, "max_concurrency": 20},
+    # El proveedor simulado no tiene cuota: límites amplios para pruebas de carga
+    "mock": {"key_rpm": 0, "key_tpm": 0, "initial_concurrency": 16, "max_concurrency": 64},
+}
+for _provider, _overrides in json.loads(os.getenv("LLM_RATE_LIMITS", "{}")).items():
+    LLM_RATE_LIMITS.setdefault(_provider, {}).update(_overrides)
+
+# Endpoints por proveedor para failover (las API keys del servidor vienen del entorno)
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
+PROVIDER_ENDPOINTS = {
+    "openai": {"base_url": "https://api.openai.com/v1", "api_key": OPENAI_API_KEY},
+    "groq": {"base_url": "https://api.groq.com/openai/v1", "api_key": GROQ_API_KEY},
+    "openrouter": {"base_url": "https://openrouter.ai/api/v1", "api_key": OPENROUTER_API_KEY},
+    "mock": {"base_url": "mock://local", "api_key": "mock"},
+}
+
+# Cadenas de fallback por modelo ("*" aplica a cualquier modelo), p. ej.
+# LLM_FALLBACK_CHAINS='{"openai/gpt-oss-120b": [{"type": "openrouter", "model": "openai/gpt-oss-120b"}]}'
+LLM_FALLBACK_CHAINS = json.loads(os.getenv("LLM_FALLBACK_CHAINS", "{}"))
+# Si la API key del usuario es rechazada (401/403/404/429), no se pasa a las keys del
+# servidor de la cadena salvo que se active aquí (lo pagaría el operador)
+LLM_FAILOVER_FROM_USER_KEYS = os.getenv("LLM_FAILOVER_FROM_USER_KEYS", "false").lower() == "true"
+
+# Reintentos, hedging y circuit breaker de proveedores
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", 2))
+LLM_RETRY_BASE_DELAY = float(os.getenv("LLM_RETRY_BASE_DELAY", 0.5))
+LLM_RETRY_MAX_DELAY = float(os.getenv("LLM_RETRY_MAX_DELAY", 8))
+LLM_HEDGING_ENABLED = os.getenv("LLM_HEDGING_ENABLED", "false").lower() == "true"
+LLM_HEDGE_MIN_SAMPLES = int(os.getenv("LLM_HEDGE_MIN_SAMPLES", 20))
+LLM_BREAKER_FAILURE_THRESHOLD = int(os.getenv("LLM_BREAKER_FAILURE_THRESHOLD", 5))
+LLM_BREAKER_RESET_TIMEOUT = float(os.getenv("LLM_BREAKER_RESET_TIMEOUT", 30))
+
+# Presupuesto de tokens: ventana de contexto y salida máxima por modelo.
+# Se puede sobreescribir con LLM_MODEL_TOKEN_LIMITS='{"mi-modelo": {"window": 32768, "max_output": 4096}}'
+LLM_MODEL_TOKEN_LIMITS = {
+    "gpt-4o": {"window": 128000, "max_output": 16384},
+    "gpt-4o-mini": {"window": 128000, "max_output": 16384},
+    "gpt-4.1": {"window": 1047576, "max_output": 32768},
+    "gpt-4-turbo": {"window": 128000, "max_output": 4096},
+    "gpt-4": {"window": 8192, "max_output": 4096},
+    "gpt-3.5-turbo": {"window": 16385, "max_output": 4096},
+    "gpt-oss-120b": {"window": 131072, "max_output": 65536},
+    "gpt-oss-20b": {"window": 131072, "max_output": 65536},
+    "llama-3.3-70b-versatile": {"window": 131072, "max_output": 32768},
+    "llama-3.1-8b-instant": {"window": 131072, "max_output": 8192},
+    "llama3-70b-8192": {"window": 8192, "max_output": 8192},
+    "llama3-8b-8192": {"window": 8192, "max_output": 8192},
+    "llama2": {"window": 4096, "max_output": 2048},
+    "mixtral-8x7b-32768": {"window": 32768, "max_output": 32768},
+    "mistral": {"window": 32768, "max_output": 8192},
+    "gemma2-9b-it": {"window": 8192, "max_output": 8192},
+    "deepseek-chat": {"window": 65536, "max_output": 8192},
+    "default": {"window": 8192, "max_output": 4096},
+}
+for _model, _limits in json.loads(os.getenv("LLM_MODEL_TOKEN_LIMITS", "{}")).items():
+    LLM_MODEL_TOKEN_LIMITS.setdefault(_model, {}).update(_limits)
+
+LLM_DEFAULT_OUTPUT_TOKENS = int(os.getenv("LLM_DEFAULT_OUTPUT_TOKENS", 4096))
+LLM_MIN_OUTPUT_TOKENS = int(os.getenv("LLM_MIN_OUTPUT_TOKENS", 256))
+LLM_CONTEXT_SAFETY_MARGIN = int(os.getenv("LLM_CONTEXT_SAFETY_MARGIN", 256))
+# Fracción del prompt disponible que puede ocupar el mensaje del usuario
+LLM_TASK_BUDGET_SHARE = float(os.getenv("LLM_TASK_BUDGET_SHARE", 0.5))
+
+# Proveedor LLM simulado (OpenAI-compatible) para pruebas de carga y latencia sin cuota real.
+# Se selecciona con api_config {"type": "mock"} o base_url "mock://local?ttft_ms=50&tps=200".
+# Opt-in: monta /mock-llm/v1 sin autenticación, solo para entornos de prueba.
+MOCK_LLM_ENABLED = os.getenv("MOCK_LLM_ENABLED", "false").lower() == "true"
+MOCK_LLM_TTFT_MS = float(os.getenv("MOCK_LLM_TTFT_MS", 300))
+MOCK_LLM_TOKENS_PER_SEC = float(os.getenv("MOCK_LLM_TOKENS_PER_SEC", 80))
+MOCK_LLM_ERROR_RATE = float(os.getenv("MOCK_LLM_ERROR_RATE", 0))
+MOCK_LLM_RATE_LIMIT_RATE = float(os.getenv("MOCK_LLM_RATE_LIMIT_RATE", 0))
+MOCK_LLM_OUTPUT_TOKENS = int(os.getenv("MOCK_LLM_OUTPUT_TOKENS", 400))
+MOCK_LLM_FAULT_SEED = int(os.getenv("MOCK_LLM_FAULT_SEED", 0))
+# Duración máxima de una respuesta simulada (TTFT + generación) con cualquier override
+MOCK_LLM_MAX_SECONDS = float(os.getenv("MOCK_LLM_MAX_SECONDS", 15))
+
+# Registro de mensajes A2A: buffer circular por conversación, expiración por TTL
+# y LRU de conversaciones completas. A2A_SPILL_PATH (SQLite) guarda lo expulsado
+# para depuración; vacío = desactivado.
+A2A_MAX_CONVERSATIONS = int(os.getenv("A2A_MAX_CONVERSATIONS", 500))
+A2A_MAX_MESSAGES_PER_CONVERSATION = int(os.getenv("A2A_MAX_MESSAGES_PER_CONVERSATION", 100))
+A2A_CONVERSATION_TTL = float(os.getenv("A2A_CONVERSATION_TTL", 900))
+A2A_SPILL_PATH = os.getenv("A2A_SPILL_PATH", "")
@@ -0,0 +1,209 @@
+"""
+Almacén acotado de mensajes A2A.
+
+Cada conversación guarda sus últimos N mensajes en un buffer circular; las
+conversaciones completas se expulsan por TTL (sin actividad) y por LRU cuando
+se supera el máximo. Opcionalmente lo expulsado se vuelca a SQLite para
+depuración. Así un worker de larga duración no acumula prompts indefinidamente.
+"""
+import json
+import sqlite3
+import time
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+from dataclasses import asdict, is_dataclass
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+_SPILL_SCHEMA = """
+CREATE TABLE IF NOT EXISTS a2a_messages (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    conversation_id TEXT,
+    message_id TEXT,
+    sender_id TEXT,
+    recipient_id TEXT,
+    message_type TEXT,
+    subject TEXT,
+    created_at TEXT,
+    reason TEXT,
+    data TEXT
+)
+"""
+
+
+def estimate_size(value: Any) -> int:
+    """Bytes aproximados del contenido (texto dominante en payloads de prompts)."""
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set)):
+        return sum(estimate_size(v) for v in value)
+    return 16
+
+
+class _Conversation:
+    __slots__ = ("messages", "touched", "size", "dropped")
+
+    def __init__(self, max_messages: int, now: float):
+        self.messages: Deque[Any] = deque(maxlen=max_messages)
+        self.touched = now
+        self.size = 0
+        self.dropped = 0
+
+
+class A2AMessageStore(Mapping):
+    """
+    conversation_id → mensajes recientes. Se comporta como un Mapping de solo
+    lectura (get, in, len); las escrituras pasan por append().
+    """
+
+    def __init__(
+        self,
+        max_conversations: int,
+        max_messages: int,
+        ttl_seconds: float,
+        spill_path: Optional[str] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_conversations = max(1, max_conversations)
+        self.max_messages = max(1, max_messages)
+        self.ttl_seconds = ttl_seconds
+        self.spill_path = spill_path or None
+        self._clock = clock
+        # Orden LRU: la menos usada primero (y, por tanto, también la más antigua por TTL)
+        self._conversations: "OrderedDict[str, _Conversation]" = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        self.messages_stored = 0
+        self.messages_dropped = 0
+        self.evicted_ttl = 0
+        self.evicted_lru = 0
+        self.closed = 0
+        self.spilled = 0
+
+    # --- Mapping ---
+
+    def __getitem__(self, conversation_id: str) -> List[Any]:
+        conversation = self._conversations[conversation_id]
+        conversation.touched = self._clock()
+        self._conversations.move_to_end(conversation_id)
+        return list(conversation.messages)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._conversations))
+
+    def __len__(self) -> int:
+        return len(self._conversations)
+
+    def __contains__(self, conversation_id: object) -> bool:
+        return conversation_id in self._conversations
+
+    # --- Escritura y expulsión ---
+
+    def append(self, message: Any) -> None:
+        now = self._clock()
+        self.prune(now)
+        conversation_id = message.conversation_id
+        conversation = self._conversations.get(conversation_id)
+        if conversation is None:
+            conversation = _Conversation(self.max_messages, now)
+            self._conversations[conversation_id] = conversation
+        else:
+            self._conversations.move_to_end(conversation_id)
+            conversation.touched = now
+
+        if len(conversation.messages) == self.max_messages:
+            # El buffer circular descarta el mensaje más antiguo
+            oldest = conversation.messages[0]
+            conversation.size -= estimate_size(oldest.payload)
+            conversation.dropped += 1
+            self.messages_dropped += 1
+            self._spill(conversation_id, [oldest], "ring")
+        conversation.messages.append(message)
+        conversation.size += estimate_size(message.payload)
+        self.messages_stored += 1
+
+        while len(self._conversations) > self.max_conversations:
+            oldest_id = next(iter(self._conversations))
+            self._evict(oldest_id, "lru")
+            self.evicted_lru += 1
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """Expulsa las conversaciones sin actividad desde hace más de ttl_seconds."""
+        if self.ttl_seconds <= 0:
+            return 0
+        now = self._clock() if now is None else now
+        expired = 0
+        while self._conversations:
+            conversation_id, conversation = next(iter(self._conversations.items()))
+            if now - conversation.touched < self.ttl_seconds:
+                break
+            self._evict(conversation_id, "ttl")
+            expired += 1
+        self.evicted_ttl += expired
+        return expired
+
+    def close(self, conversation_id: str) -> bool:
+        """Libera una conversación terminada (se vuelca si hay spill configurado)."""
+        if conversation_id not in self._conversations:
+            return False
+        self._evict(conversation_id, "closed")
+        self.closed += 1
+        return True
+
+    def _evict(self, conversation_id: str, reason: str) -> None:
+        conversation = self._conversations.pop(conversation_id)
+        self._spill(conversation_id, conversation.messages, reason)
+
+    # --- Spill a SQLite ---
+
+    def _spill(self, conversation_id: str, messages: Any, reason: str) -> None:
+        if not self.spill_path or not messages:
+            return
+        try:
+            if self._db is None:
+                self._db = sqlite3.connect(self.spill_path, check_same_thread=False)
+                self._db.execute(_SPILL_SCHEMA)
+            rows = [
+                (
+                    conversation_id,
+                    getattr(m, "message_id", None),
+                    getattr(m, "sender_id", None),
+                    getattr(m, "recipient_id", None),
+                    str(getattr(m, "message_type", "")),
+                    getattr(m, "subject", None),
+                    str(getattr(m, "timestamp", "")),
+                    reason,
+                    json.dumps(asdict(m) if is_dataclass(m) else m, default=str, ensure_ascii=False),
+                )
+                for m in messages
+            ]
+            with self._db:
+                self._db.executemany(
+                    "INSERT INTO a2a_messages (conversation_id, message_id, sender_id, recipient_id, "
+                    "message_type, subject, created_at, reason, data) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+            self.spilled += len(rows)
+        except Exception as e:
+            # El volcado es solo para depuración: nunca rompe el flujo de mensajes
+            print(f"⚠️ Error volcando mensajes A2A a {self.spill_path}: {e}")
+
+    # --- Estadísticas ---
+
+    def get_stats(self) -> Dict[str, Any]:
+        messages = sum(len(c.messages) for c in self._conversations.values())
+        return {
+            "conversations": len(self._conversations),
+            "messages": messages,
+            "payload_bytes": sum(c.size for c in self._conversations.values()),
+            "max_conversations": self.max_conversations,
+            "max_messages_per_conversation": self.max_messages,
+            "ttl_seconds": self.ttl_seconds,
+            "messages_stored": self.messages_stored,
+            "messages_dropped": self.messages_dropped,
+            "evicted_ttl": self.evicted_ttl,
+            "evicted_lru": self.evicted_lru,
+            "closed": self.closed,
+            "spill_path": self.spill_path,
+            "spilled": self.spilled,
+        }
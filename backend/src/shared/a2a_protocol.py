@@ -8,6 +8,13 @@ from enum import Enum
 import uuid
 from dataclasses import dataclass, field
 from src.domain.entities.agent import AgentProfile
+from src.infrastructure.config.settings import (
+    A2A_MAX_CONVERSATIONS,
+    A2A_MAX_MESSAGES_PER_CONVERSATION,
+    A2A_CONVERSATION_TTL,
+    A2A_SPILL_PATH,
+)
+from src.shared.a2a_message_store import A2AMessageStore
 
 class MessageType(str, Enum):
     REQUEST = "request"
@@ -112,8 +119,16 @@ class A2AResponse:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 class A2AProtocol:
-    def __init__(self):
-        self.active_conversations: Dict[str, List[A2AMessage]] = {}
+    def __init__(self, message_store: Optional[A2AMessageStore] = None):
+        # Registro acotado (buffer circular por conversación, TTL y LRU)
+        if message_store is None:
+            message_store = A2AMessageStore(
+                max_conversations=A2A_MAX_CONVERSATIONS,
+                max_messages=A2A_MAX_MESSAGES_PER_CONVERSATION,
+                ttl_seconds=A2A_CONVERSATION_TTL,
+                spill_path=A2A_SPILL_PATH,
+            )
+        self.active_conversations = message_store
         self.agent_registry: Dict[str, AgentProfile] = {}
         
     def register_agent(self, profile: AgentProfile) -> bool:
@@ -149,12 +164,19 @@ class A2AProtocol:
             **kwargs
         )
         
-        if conversation_id not in self.active_conversations:
-            self.active_conversations[conversation_id] = []
-        self.active_conversations[conversation_id].append(message)
+        self.active_conversations.append(message)
         
         return message
     
+    def get_conversation_history(self, conversation_id: str) -> List[A2AMessage]:
+        return self.active_conversations.get(conversation_id, [])
+    
+    def close_conversation(self, conversation_id: str) -> bool:
+        return self.active_conversations.close(conversation_id)
+    
+    def get_memory_stats(self) -> Dict[str, Any]:
+        return self.active_conversations.get_stats()
+    
     def create_response(
         self,
         original_message: A2AMessage,
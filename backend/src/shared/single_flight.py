@@ -0,0 +1,147 @@
+"""
+Single-flight de generaciones LLM.
+
+Peticiones idénticas que llegan mientras una generación sigue en curso
+(mismo agente, mismo modelo, mismo prompt construido) se enganchan a esa
+única llamada en vez de pagar otra. Los suscriptores en streaming comparten
+los deltas: quien llega tarde recibe primero lo ya generado y después sigue
+en vivo. No es una caché: al terminar la generación la entrada desaparece.
+"""
+import asyncio
+import hashlib
+import json
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+FlightKey = Tuple[str, str, str]
+
+
+class _Flight:
+    """Una generación en curso y los deltas emitidos hasta ahora."""
+
+    def __init__(self, key: FlightKey):
+        self.key = key
+        self.chunks: List[str] = []
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.subscribers = 0
+        self.changed = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+
+    def notify(self) -> None:
+        # Cada cambio despierta a los que esperan y arma un evento nuevo
+        event, self.changed = self.changed, asyncio.Event()
+        event.set()
+
+
+class SingleFlight:
+    """Registro de generaciones en curso indexado por (agent_id, model, hash del prompt)."""
+
+    def __init__(self):
+        self._flights: Dict[FlightKey, _Flight] = {}
+        self.flights_started = 0
+        self.attached = 0
+        self.stream_attached = 0
+        self.abandoned = 0
+
+    @staticmethod
+    def make_key(
+        agent_id: str,
+        model: str,
+        messages: List[Dict[str, str]],
+        api_config: Optional[Dict[str, Any]] = None
+    ) -> FlightKey:
+        """
+        El hash cubre los mensajes completos, el endpoint (tipo y base_url) y un
+        hash de la API key: solo comparten llamada quienes usan la misma
+        credencial, así un 401 o una cuota agotada de un usuario no se propaga
+        a otros con keys válidas.
+        """
+        config = api_config or {}
+        route = {k: config.get(k) for k in ("type", "base_url")}
+        api_key = config.get("api_key") or config.get("apiKey") or ""
+        route["credential"] = hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+        payload = json.dumps({"messages": messages, "route": route}, sort_keys=True, ensure_ascii=False)
+        return agent_id, model, hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _join(self, key: FlightKey, source: Callable[[], AsyncIterator[str]], stream: bool) -> _Flight:
+        flight = self._flights.get(key)
+        if flight is not None:
+            self.attached += 1
+            if stream:
+                self.stream_attached += 1
+            return flight
+
+        flight = _Flight(key)
+        self._flights[key] = flight
+        self.flights_started += 1
+        flight.task = asyncio.create_task(self._produce(flight, source()))
+        return flight
+
+    async def _produce(self, flight: _Flight, source: AsyncIterator[str]) -> None:
+        try:
+            async for chunk in source:
+                flight.chunks.append(chunk)
+                flight.notify()
+        except BaseException as e:
+            flight.error = e
+            if isinstance(e, asyncio.CancelledError):
+                raise
+        finally:
+            flight.done = True
+            if self._flights.get(flight.key) is flight:
+                del self._flights[flight.key]
+            flight.notify()
+            aclose = getattr(source, "aclose", None)
+            if aclose:
+                await aclose()
+
+    async def _subscribe(self, flight: _Flight) -> AsyncIterator[str]:
+        flight.subscribers += 1
+        index = 0
+        try:
+            while True:
+                event = flight.changed
+                while index < len(flight.chunks):
+                    yield flight.chunks[index]
+                    index += 1
+                if flight.done:
+                    break
+                await event.wait()
+            if flight.error is not None:
+                raise flight.error
+        finally:
+            flight.subscribers -= 1
+            if flight.subscribers == 0 and not flight.done:
+                # Nadie espera ya esta generación: se cancela y no acepta nuevos suscriptores
+                self.abandoned += 1
+                if self._flights.get(flight.key) is flight:
+                    del self._flights[flight.key]
+                flight.task.cancel()
+
+    async def run(self, key: FlightKey, call: Callable[[], Awaitable[str]]) -> str:
+        """Devuelve la respuesta completa; `call` solo se ejecuta si no hay otra igual en curso."""
+        async def source():
+            yield await call()
+
+        chunks = [chunk async for chunk in self._subscribe(self._join(key, source, stream=False))]
+        return "".join(chunks)
+
+    async def stream(self, key: FlightKey, call: Callable[[], AsyncIterator[str]]) -> AsyncIterator[str]:
+        """Emite los deltas de la generación compartida (los ya emitidos y los siguientes)."""
+        async for chunk in self._subscribe(self._join(key, call, stream=True)):
+            yield chunk
+
+    def get_stats(self) -> Dict[str, Any]:
+        requests = self.flights_started + self.attached
+        return {
+            "in_flight": len(self._flights),
+            "flights_started": self.flights_started,
+            "attached": self.attached,
+            "stream_attached": self.stream_attached,
+            "abandoned": self.abandoned,
+            "attach_rate": round(self.attached / requests, 3) if requests else 0.0,
+        }
+
+
+# Instancia global compartida por todos los agentes
+agent_single_flight = SingleFlight()
@@ -0,0 +1,4 @@
+import os
+
+# Los tests usan el proveedor LLM simulado, que es opt-in (MOCK_LLM_ENABLED)
+os.environ.setdefault("MOCK_LLM_ENABLED", "true")
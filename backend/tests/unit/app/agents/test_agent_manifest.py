@@ -0,0 +1,45 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from app.agents.agent_manifest import AGENT_MANIFEST
+from app.agents.agent_registry import AGENT_REGISTRY, LazyAgentEntry, build_agent_manifest, get_agent_class
+
+BACKEND_DIR = Path(__file__).resolve().parents[4]
+
+
+def test_manifest_matches_agent_decorators():
+    # Si falla: python -c "from app.agents.agent_registry import write_agent_manifest; write_agent_manifest()"
+    assert build_agent_manifest() == AGENT_MANIFEST
+    assert len(AGENT_MANIFEST) == 120
+
+
+def test_registry_knows_every_agent_before_import():
+    for agent_id, entry in AGENT_MANIFEST.items():
+        assert AGENT_REGISTRY[agent_id]["metadata"] == entry["metadata"]
+
+
+def test_lazy_entry_imports_class_on_first_access():
+    entry = LazyAgentEntry("app.agents.legal.contract_specialist", "ContractSpecialistAgent", {"agent_id": "x"})
+    assert "class" not in entry
+    agent_class = entry.get("class")
+    assert agent_class.__name__ == "ContractSpecialistAgent"
+    assert entry["class"] is agent_class
+    assert get_agent_class("contract_specialist") is agent_class
+    assert get_agent_class("does_not_exist") is None
+
+
+def test_cold_import_loads_only_requested_agent_modules():
+    code = (
+        "import sys\n"
+        "from app.agents.agent_registry import AGENT_REGISTRY\n"
+        "import app.agents\n"
+        "def loaded(): return sorted(m for m in sys.modules if m.count('.') == 3 and m.startswith('app.agents.'))\n"
+        "assert len(AGENT_REGISTRY) == 120 and loaded() == [], loaded()\n"
+        "from app.agents import TaxSpecialistAgent\n"
+        "assert loaded() == ['app.agents.finance.tax_specialist'], loaded()\n"
+        "from app.agents.finance import FINANCE_AGENTS\n"
+        "assert len(FINANCE_AGENTS) == 10 and len(loaded()) == 10, loaded()\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=BACKEND_DIR, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,53 @@
+import dataclasses
+
+import pytest
+
+from app.agents.agent_registry import AGENT_REGISTRY
+from app.agents.base_agent import shared_llm_adapter
+from app.agents.prototypes import AgentPrototypeRegistry
+
+
+MOCK_CONFIG = {"type": "mock", "base_url": "mock://local?ttft_ms=0&tps=100000&output_tokens=8"}
+
+
+def test_every_agent_class_has_a_prototype():
+    registry = AgentPrototypeRegistry()
+    for agent_id in AGENT_REGISTRY:
+        prototype = registry.get(agent_id)
+        assert prototype.template.agent_id == agent_id
+        assert prototype.template.profile.agent_id == agent_id
+        assert prototype.system_prompt
+    assert registry.get("does_not_exist") is None
+    assert registry.instantiate("does_not_exist") is None
+
+
+def test_prototype_is_built_once_and_immutable():
+    registry = AgentPrototypeRegistry()
+    first = registry.get("tax_specialist")
+    assert registry.get("tax_specialist") is first
+    assert registry.get_stats()["prototypes"] == 1
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.system_prompt = ""
+
+
+def test_instances_share_definition_but_not_execution_context():
+    registry = AgentPrototypeRegistry()
+    a = registry.instantiate("tax_specialist", model="m1", api_config=MOCK_CONFIG, language="en")
+    b = registry.instantiate("tax_specialist", model="m2")
+    template = registry.get("tax_specialist").template
+
+    assert a is not b
+    assert a.profile is b.profile is template.profile
+    assert a.backstory is template.backstory
+    assert (a.model, a.language, a.api_config) == ("m1", "en", MOCK_CONFIG)
+    assert (b.model, b.api_config, b.llm_provider) == ("m2", None, None)
+    assert a.llm_provider is shared_llm_adapter()
+    assert template.api_config is None and template.model != "m1"
+
+
+@pytest.mark.asyncio
+async def test_prototype_instance_runs_against_mock_llm():
+    registry = AgentPrototypeRegistry()
+    agent = registry.instantiate("contract_specialist", model="mock-model", api_config=MOCK_CONFIG)
+    result = await agent.process_task("Revisa este contrato")
+    assert result["content"] and not result["content"].startswith("Error")
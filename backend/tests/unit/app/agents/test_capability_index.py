@@ -0,0 +1,57 @@
+import time
+
+import pytest
+
+from app.agents.capability_index import CapabilityIndex, capability_index, tokenize
+from app.agents.registry import AGENT_DEFINITIONS
+
+
+def test_tokenize_normalizes_accents_stopwords_and_stems():
+    assert tokenize("Diseño de la Campaña") == ["diseno", "campan"]
+    assert tokenize("desarrollador") == tokenize("desarrollo")
+
+
+def test_index_covers_every_agent_capability_and_category():
+    assert capability_index.size == len(AGENT_DEFINITIONS)
+    for agent_id, info in AGENT_DEFINITIONS.items():
+        assert agent_id in capability_index.agents_in_category(info["category"])
+        for capability in info["capabilities"]:
+            assert agent_id in capability_index.agents_with_capability(capability)
+
+
+@pytest.mark.parametrize("query, category", [
+    ("Revisa mi contrato de arrendamiento", "legal"),
+    ("Cómo calculo los impuestos de mi empresa", "finance"),
+    ("quiero crecer mi canal de youtube", "youtube"),
+    ("mejorar mis ventas en mercadolibre", "mercadolibre"),
+])
+def test_search_routes_to_expected_category(query, category):
+    top = capability_index.search(query, k=3)
+    assert top and top[0].category == category
+    assert [m.score for m in top] == sorted((m.score for m in top), reverse=True)
+
+
+def test_search_filters_by_category_and_route_falls_back():
+    assert all(m.category == "marketing" for m in capability_index.search("estrategia de contenido", 5, category="marketing"))
+    assert capability_index.search("hola", 3) == []
+    assert capability_index.route("hola", 2, fallback=("project_manager", "unknown", "content_strategist")) == [
+        "project_manager", "content_strategist"
+    ]
+
+
+def test_search_is_fast_enough_for_request_path():
+    started = time.perf_counter()
+    for _ in range(200):
+        capability_index.search("optimizar el SEO y las ventas de mi tienda online", k=3)
+    # Cotas generosas para CI: el objetivo real es del orden de microsegundos
+    assert (time.perf_counter() - started) / 200 < 0.002
+
+
+def test_custom_index_ranks_capability_matches_first():
+    index = CapabilityIndex({
+        "a": {"category": "x", "description": "ayuda general", "capabilities": ["tax_planning"]},
+        "b": {"category": "x", "description": "planning de impuestos mencionado una vez", "capabilities": []},
+        "c": {"category": "y", "description": "otra cosa", "capabilities": ["design"]},
+    })
+    assert [m.agent_id for m in index.search("tax planning")] == ["a", "b"]
+    assert index.agents_with_capability("design") == frozenset({"c"})
@@ -0,0 +1,40 @@
+import dataclasses
+
+import pytest
+
+from app.agents.enhanced_registry import (
+    COMPILED_AGENT_PROMPTS,
+    ENHANCED_AGENT_DEFINITIONS,
+    _render_agent_prompt,
+    build_agent_prompt,
+    get_compiled_prompt,
+)
+
+
+def test_every_agent_is_compiled_at_import():
+    assert set(COMPILED_AGENT_PROMPTS) == set(ENHANCED_AGENT_DEFINITIONS)
+    assert len(COMPILED_AGENT_PROMPTS) == 120
+
+
+def test_compiled_prompts_match_full_render_for_all_agents():
+    task = "Tarea con {llaves} y % símbolos"
+    for agent_id, agent_data in ENHANCED_AGENT_DEFINITIONS.items():
+        assert build_agent_prompt(agent_id, agent_data, task) == _render_agent_prompt(agent_data, task)
+
+
+def test_templates_are_immutable_and_reused():
+    agent_id, agent_data = next(iter(ENHANCED_AGENT_DEFINITIONS.items()))
+    compiled = get_compiled_prompt(agent_id, agent_data)
+    assert compiled is COMPILED_AGENT_PROMPTS[agent_id]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        compiled.head = ""
+    with pytest.raises(TypeError):
+        COMPILED_AGENT_PROMPTS[agent_id] = compiled
+
+
+def test_ad_hoc_metadata_is_compiled_on_the_fly():
+    agent_id, agent_data = next(iter(ENHANCED_AGENT_DEFINITIONS.items()))
+    custom = dict(agent_data, name="Agente Propio")
+    prompt = build_agent_prompt(agent_id, custom, "tarea")
+    assert "**Nombre:** Agente Propio" in prompt
+    assert prompt == _render_agent_prompt(custom, "tarea")
@@ -0,0 +1,152 @@
+import asyncio
+import fnmatch
+import threading
+
+import pytest
+
+from app.agents.base_agent import BaseAgent
+from app.services import cache_manager
+from app.services.cache_manager import (
+    CACHE_BYPASS, CACHE_PREFER, CacheManager, LocalLRUCache, set_cache_policy,
+)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.gets = 0
+        self.threads = set()
+
+    def get(self, key):
+        self.gets += 1
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+
+    def delete(self, *keys):
+        self.threads.add(threading.get_ident())
+        for key in keys:
+            self.store.pop(key, None)
+
+    def scan_iter(self, match):
+        self.threads.add(threading.get_ident())
+        return [key for key in list(self.store) if fnmatch.fnmatch(key, match)]
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    def unavailable(*args, **kwargs):
+        raise ConnectionError("sin redis")
+
+    monkeypatch.setattr(cache_manager.redis, "from_url", unavailable)
+    instance = CacheManager()
+    monkeypatch.setattr(cache_manager, "_cache_manager_instance", instance)
+    return instance
+
+
+def test_local_lru_evicts_least_recent_and_expires():
+    lru = LocalLRUCache(max_entries=2, ttl=60)
+    lru.set("a", 1)
+    lru.set("b", 2)
+    lru.get("a")
+    lru.set("c", 3)
+    assert lru.get("b") is None
+    assert lru.get("a") == 1
+    assert lru.evictions == 1
+
+    lru.set("d", 4, ttl=-1)
+    assert lru.get("d") is None
+
+
+@pytest.mark.asyncio
+async def test_redis_hit_is_promoted_to_local_tier(manager):
+    manager.redis_client = FakeRedis()
+    await manager.cache_agent_response("reasoning", "hash", "m", "respuesta")
+    manager._local = LocalLRUCache()
+
+    assert await manager.get_cached_agent_response("reasoning", "hash", "m") == "respuesta"
+    assert await manager.get_cached_agent_response("reasoning", "hash", "m") == "respuesta"
+    assert manager.redis_client.gets == 1
+    assert manager.redis_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_deletes_run_off_the_event_loop(manager):
+    manager.redis_client = FakeRedis()
+    for key in ("atp:cache:agent:a", "atp:cache:agent:b", "atp:cache:other"):
+        await manager.set(key, "valor")
+
+    assert await manager.delete("atp:cache:other")
+    assert await manager.clear_pattern("atp:cache:agent:*") == 2
+
+    assert manager.redis_client.store == {}
+    assert threading.get_ident() not in manager.redis_client.threads
+
+
+def test_unknown_policy_falls_back_to_bypass():
+    assert asyncio.run(_policy_in_task("whatever")) == CACHE_BYPASS
+    assert asyncio.run(_policy_in_task("prefer")) == CACHE_PREFER
+
+
+async def _policy_in_task(value):
+    return set_cache_policy(value)
+
+
+class CountingProvider:
+    def __init__(self):
+        self.calls = 0
+
+    async def chat_completion(self, messages, model=None, api_config=None, **kwargs):
+        self.calls += 1
+        return "generado"
+
+    async def stream_chat_completion(self, messages, model=None, api_config=None, **kwargs):
+        self.calls += 1
+        for part in ["gene", "rado"]:
+            yield part
+
+
+class EchoAgent(BaseAgent):
+    def get_system_prompt(self):
+        return "sistema"
+
+
+def _agent(provider):
+    agent = EchoAgent(agent_id="reasoning", model="m")
+    agent.api_config = {"type": "groq", "api_key": "k"}
+    agent.llm_provider = provider
+    return agent
+
+
+async def _run_twice(policy, stream):
+    set_cache_policy(policy)
+    provider = CountingProvider()
+    agent = _agent(provider)
+    outputs = []
+    for _ in range(2):
+        if stream:
+            outputs.append("".join([d async for d in agent.process_task_stream("tarea")]))
+        else:
+            outputs.append((await agent.process_task("tarea"))["content"])
+    return provider.calls, outputs
+
+
+@pytest.mark.asyncio
+async def test_prefer_policy_serves_repeated_prompt_from_cache(manager):
+    calls, outputs = await _run_twice(CACHE_PREFER, stream=False)
+    assert calls == 1
+    assert outputs == ["generado", "generado"]
+
+
+@pytest.mark.asyncio
+async def test_prefer_policy_replays_cached_stream(manager):
+    calls, outputs = await _run_twice(CACHE_PREFER, stream=True)
+    assert calls == 1
+    assert outputs == ["generado", "generado"]
+
+
+@pytest.mark.asyncio
+async def test_bypass_policy_always_calls_llm(manager):
+    calls, _ = await _run_twice(CACHE_BYPASS, stream=False)
+    assert calls == 2
@@ -0,0 +1,147 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from app.services import job_queue as job_queue_module
+from app.services import pipeline_jobs
+from app.services.job_queue import (
+    CANCELLED, DEAD, QUEUED, RUNNING, SUCCEEDED, SQLiteJobQueue
+)
+from app.services.job_workers import JobWorkerPool
+
+
+@pytest_asyncio.fixture
+async def queue(tmp_path):
+    queue = SQLiteJobQueue(str(tmp_path / "data" / "jobs.db"))
+    yield queue
+    await queue.close()
+
+
+@pytest.mark.asyncio
+async def test_enqueue_reserve_ack(queue):
+    job = await queue.enqueue("echo", {"value": [1, 2]}, secrets={"api_key": "sk"})
+    reserved = await queue.reserve("w1", visibility_timeout=30, wait=0)
+
+    assert reserved.job_id == job.job_id
+    assert reserved.status == RUNNING
+    assert reserved.attempts == 1
+    assert reserved.payload == {"value": [1, 2]}
+    assert reserved.secrets == {"api_key": "sk"}
+    assert await queue.reserve("w2", visibility_timeout=30, wait=0) is None
+
+    assert await queue.ack(reserved, {"ok": []})
+    finished = await queue.get(job.job_id)
+    assert finished.status == SUCCEEDED
+    assert finished.result == {"ok": []}
+    # Los secrets no se exponen ni sobreviven al trabajo
+    assert finished.secrets == {}
+    assert "secrets" not in finished.to_dict()
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_is_requeued_and_stale_worker_cannot_ack(queue):
+    job = await queue.enqueue("echo", {})
+    first = await queue.reserve("w1", visibility_timeout=0.01, wait=0)
+    await asyncio.sleep(0.05)
+
+    assert await queue.requeue_expired() == 1
+    second = await queue.reserve("w2", visibility_timeout=30, wait=0)
+    assert second.job_id == job.job_id
+    assert second.attempts == 2
+
+    # El worker que perdió el lease ya no puede renovar ni completar
+    assert not await queue.extend(first, 30)
+    assert not await queue.ack(first, "tarde")
+    assert await queue.ack(second, "a tiempo")
+    assert (await queue.get(job.job_id)).result == "a tiempo"
+
+
+@pytest.mark.asyncio
+async def test_failures_retry_with_backoff_then_dead(queue, monkeypatch):
+    monkeypatch.setattr(job_queue_module, "retry_delay", lambda attempts: 0)
+    job = await queue.enqueue("echo", {}, max_attempts=2)
+
+    first = await queue.reserve("w1", 30, wait=0)
+    assert await queue.fail(first, "boom")
+    assert (await queue.get(job.job_id)).status == QUEUED
+
+    second = await queue.reserve("w1", 30, wait=0)
+    assert await queue.fail(second, "boom otra vez")
+    dead = await queue.get(job.job_id)
+    assert dead.status == DEAD
+    assert dead.error == "boom otra vez"
+    assert (await queue.counts()).get(DEAD) == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_runs_handlers_and_retries(queue, monkeypatch):
+    monkeypatch.setattr(job_queue_module, "retry_delay", lambda attempts: 0)
+    calls = []
+
+    async def flaky(job):
+        calls.append(job.attempts)
+        if job.attempts == 1:
+            raise RuntimeError("transitorio")
+        return {"double": job.payload["n"] * 2}
+
+    pool = JobWorkerPool(queue, handlers={"flaky": flaky}, concurrency=2, visibility_timeout=5)
+    await pool.start()
+    try:
+        job = await queue.enqueue("flaky", {"n": 21})
+        finished = await queue.wait(job.job_id, timeout=5)
+    finally:
+        await pool.stop()
+
+    assert finished.status == SUCCEEDED
+    assert finished.result == {"double": 42}
+    assert calls == [1, 2]
+    assert pool.get_stats()["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cancel_stops_running_handler(queue):
+    started = asyncio.Event()
+    interrupted = asyncio.Event()
+
+    async def hanging(job):
+        started.set()
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            interrupted.set()
+            raise
+
+    pool = JobWorkerPool(queue, handlers={"hang": hanging}, concurrency=1, visibility_timeout=5)
+    await pool.start()
+    try:
+        job = await queue.enqueue("hang", {})
+        await asyncio.wait_for(started.wait(), timeout=5)
+        assert await queue.cancel(job.job_id)
+        await asyncio.wait_for(interrupted.wait(), timeout=5)
+    finally:
+        await pool.stop()
+
+    assert (await queue.get(job.job_id)).status == CANCELLED
+
+
+@pytest.mark.asyncio
+async def test_submit_chat_through_queue(queue, monkeypatch):
+    async def fake_run_chat(message, agents, model, api_config=None, context=None):
+        return {"final_result": f"{message}|{','.join(agents)}|{api_config['api_key']}"}
+
+    monkeypatch.setattr(pipeline_jobs, "run_chat", fake_run_chat)
+    monkeypatch.setattr(pipeline_jobs, "get_job_queue", lambda: queue)
+
+    pool = JobWorkerPool(queue, concurrency=1, visibility_timeout=5)
+    await pool.start()
+    try:
+        result = await pipeline_jobs.submit_chat(
+            "hola", ["project_manager"], "groq-default",
+            api_config={"type": "groq", "api_key": "sk-test"}, timeout=5
+        )
+    finally:
+        await pool.stop()
+
+    assert result == {"final_result": "hola|project_manager|sk-test"}
+    assert (await queue.counts()).get(SUCCEEDED) == 1
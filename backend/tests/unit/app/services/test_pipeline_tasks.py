@@ -0,0 +1,140 @@
+import asyncio
+
+import pytest
+
+from app.services.pipeline_tasks import PipelineTaskRegistry
+from app.services.streaming_pipeline import StreamingAgentPipeline
+from src.infrastructure.adapters.external.llm_client_pool import LLMClientPool
+from src.infrastructure.adapters.external.llm_governor import LLMGovernor
+from src.infrastructure.adapters.external.llm_provider_factory import LLMProviderFactory
+
+
+class HangingAgent:
+    def __init__(self, agent_id):
+        self.id = agent_id
+        self.started = asyncio.Event()
+        self.cancelled = False
+
+    async def process_task(self, task, context=None):
+        self.started.set()
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+async def _consume(pipeline):
+    async for _ in pipeline.execute_with_streaming("tarea", client_id="nobody"):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_cancel_stops_running_agents():
+    registry = PipelineTaskRegistry()
+    agents = [HangingAgent("expert_a"), HangingAgent("expert_b")]
+    pipeline = StreamingAgentPipeline(agents, {}, stream_tokens=False)
+
+    run = registry.start("session_1", lambda run_id: _consume(pipeline))
+    await asyncio.gather(*(a.started.wait() for a in agents))
+
+    cancelled = await registry.cancel("session_1")
+
+    assert cancelled is run and run.task.cancelled()
+    assert all(a.cancelled for a in agents)
+    assert registry.get("session_1") is None
+    assert registry.get_stats()["cancelled"] == 1
+
+
+@pytest.mark.asyncio
+async def test_new_pipeline_supersedes_previous_and_run_id_must_match():
+    registry = PipelineTaskRegistry()
+    first_agent, second_agent = HangingAgent("a"), HangingAgent("b")
+    first = registry.start("s", lambda run_id: _consume(StreamingAgentPipeline([first_agent], {}, stream_tokens=False)))
+    await first_agent.started.wait()
+
+    second = registry.start("s", lambda run_id: _consume(StreamingAgentPipeline([second_agent], {}, stream_tokens=False)))
+    await second_agent.started.wait()
+
+    assert first.task.cancelled() and first_agent.cancelled
+    assert await registry.cancel("s", run_id=first.run_id) is None
+    assert await registry.cancel("s", run_id=second.run_id) is second
+    assert registry.get_stats()["superseded"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cancel_aborts_in_flight_llm_stream():
+    pool, governor = LLMClientPool(), LLMGovernor()
+    provider = LLMProviderFactory(client_pool=pool, governor=governor, fallback_chains={}).create(
+        {"type": "mock", "base_url": "mock://local?ttft_ms=0&tps=20&output_tokens=400"}
+    )
+    first_delta = asyncio.Event()
+
+    async def run(run_id):
+        stream = await provider.chat_completion(
+            [{"role": "user", "content": "hola"}], model="mock-model", stream=True
+        )
+        try:
+            async for _ in stream:
+                first_delta.set()
+        finally:
+            await stream.aclose()
+
+    registry = PipelineTaskRegistry()
+    registry.start("s", run)
+    await asyncio.wait_for(first_delta.wait(), 5)
+    assert pool.get_stats()["in_flight"] == 1
+
+    await registry.cancel("s")
+
+    # El stream (20 s a 20 tokens/s) se corta y la capacidad vuelve al momento
+    assert pool.get_stats()["in_flight"] == 0
+    assert governor.get_stats()["total_in_flight"] == 0
+    await pool.close_all()
+
+
+@pytest.mark.asyncio
+async def test_scheduled_cancel_is_kept_on_reconnect():
+    registry = PipelineTaskRegistry()
+    agent = HangingAgent("expert_a")
+    pipeline = StreamingAgentPipeline([agent], {}, stream_tokens=False)
+
+    run = registry.start("session_1", lambda run_id: _consume(pipeline))
+    await agent.started.wait()
+
+    # Desconexión y reconexión dentro del margen: el pipeline sigue
+    assert registry.schedule_cancel("session_1", delay=0.05) is run
+    assert registry.keep("session_1") is run
+    await asyncio.sleep(0.1)
+    assert not run.task.done()
+
+    # Sin reconexión se cancela al vencer el margen
+    registry.schedule_cancel("session_1", delay=0.01)
+    await asyncio.wait({run.task}, timeout=5)
+    assert run.task.cancelled()
+    assert agent.cancelled
+    assert registry.get_stats()["resumed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_superseding_run_cancelled_before_start_never_builds_its_coroutine():
+    registry = PipelineTaskRegistry()
+    agent = HangingAgent("a")
+    registry.start("s", lambda run_id: _consume(StreamingAgentPipeline([agent], {}, stream_tokens=False)))
+    await agent.started.wait()
+    built = []
+
+    async def never_started():
+        pass
+
+    def factory(run_id):
+        built.append(run_id)
+        return never_started()
+
+    second = registry.start("s", factory)
+    second.task.cancel()
+    await asyncio.wait({second.task})
+
+    # La corrutina del run reemplazante no llegó a crearse (ni queda sin esperar)
+    assert second.task.cancelled()
+    assert built == []
@@ -0,0 +1,181 @@
+import asyncio
+import pytest
+from app.agents.base_agent import BaseAgent
+from app.services import streaming_pipeline
+from app.services.streaming_pipeline import StreamingAgentPipeline
+
+
+class StreamingFakeAgent:
+    def __init__(self, agent_id, deltas):
+        self.id = agent_id
+        self.deltas = deltas
+
+    async def process_task_stream(self, task, context=None):
+        for delta in self.deltas:
+            yield delta
+
+
+@pytest.mark.asyncio
+async def test_deltas_are_coalesced_and_reassembled(monkeypatch):
+    monkeypatch.setattr(streaming_pipeline, "DELTA_FLUSH_CHARS", 10)
+    monkeypatch.setattr(streaming_pipeline, "DELTA_FLUSH_INTERVAL", 60)
+    deltas = ["Hola", " ", "mundo", ", ", "esto ", "es ", "un ", "stream"]
+    pipeline = StreamingAgentPipeline([StreamingFakeAgent("reasoning", deltas)], {}, language="es")
+
+    frames = [f async for f in pipeline.execute_with_streaming("tarea", client_id="nobody")]
+
+    delta_frames = [f for f in frames if f.get("type") == "agent_delta"]
+    # El primer delta sale solo; el resto se agrupa por tamaño
+    assert delta_frames[0]["delta"] == "Hola"
+    assert len(delta_frames) < len(deltas)
+    assert [f["seq"] for f in delta_frames] == list(range(len(delta_frames)))
+    assert "".join(f["delta"] for f in delta_frames) == "".join(deltas)
+    assert pipeline.results[0]["raw_content"] == "".join(deltas)
+
+
+@pytest.mark.asyncio
+async def test_stream_tokens_disabled_uses_full_completion():
+    class BlockingAgent:
+        id = "reasoning"
+
+        async def process_task(self, task, context=None):
+            return {"content": "respuesta completa"}
+
+    pipeline = StreamingAgentPipeline([BlockingAgent()], {}, stream_tokens=False)
+
+    frames = [f async for f in pipeline.execute_with_streaming("tarea", client_id="nobody")]
+
+    assert not any(f.get("type") == "agent_delta" for f in frames)
+    assert pipeline.results[0]["raw_content"] == "respuesta completa"
+
+
+class ModelAgent(StreamingFakeAgent):
+    def __init__(self, agent_id, deltas, model):
+        super().__init__(agent_id, deltas)
+        self.model = model
+
+    def get_system_prompt(self):
+        return "Eres un experto."
+
+
+@pytest.mark.asyncio
+async def test_previous_context_is_trimmed_by_model_token_budget():
+    long_answer = ["x" * 60000]
+    for model, expect_full in (("llama3-8b-8192", False), ("llama-3.3-70b-versatile", True)):
+        agents = [ModelAgent("first", long_answer, model), ModelAgent("second", ["ok"], model)]
+        pipeline = StreamingAgentPipeline(agents, {}, stream_tokens=True)
+        [f async for f in pipeline.execute_with_streaming("tarea", client_id="nobody")]
+
+        prompt = pipeline._prepare_task_with_context("tarea", 2, agents[1])
+        assert ("x" * 60000 in prompt) is expect_full
+        if not expect_full:
+            assert "CONTEXTO DE EXPERTOS ANTERIORES" in prompt
+            assert len(prompt) < 8192 * 3
+
+
+class SleepingAgent:
+    def __init__(self, agent_id, delay, needs_context=True):
+        self.id = agent_id
+        self.delay = delay
+        self.needs_context = needs_context
+        self.tasks = []
+
+    async def process_task(self, task, context=None):
+        self.tasks.append(task)
+        await asyncio.sleep(self.delay)
+        return {"content": f"respuesta de {self.id}"}
+
+
+LEVELS = {"analyst": {"level": 1}, "expert": {"level": 2}, "writer": {"level": 2}, "reviewer": {"level": 3}}
+
+
+async def _run(pipeline):
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    frames = [f async for f in pipeline.execute_with_streaming("tarea", client_id="nobody")]
+    return frames, loop.time() - started
+
+
+@pytest.mark.asyncio
+async def test_same_level_agents_run_concurrently_with_ordering_metadata():
+    agents = [SleepingAgent("expert_a", 0.3), SleepingAgent("expert_b", 0.1), SleepingAgent("expert_c", 0.2)]
+    pipeline = StreamingAgentPipeline(agents, LEVELS, stream_tokens=False)
+
+    frames, elapsed = await _run(pipeline)
+
+    # Tiempo ≈ el agente más lento, no la suma (0.6 s)
+    assert elapsed < 0.45
+    responses = [f for f in frames if "execution" in f]
+    # Llegan según terminan, con su paso determinista
+    assert [f["agent_id"] for f in responses] == ["expert_b", "expert_c", "expert_a"]
+    assert [f["execution"]["completion_index"] for f in responses] == [1, 2, 3]
+    assert [f["step"] for f in responses] == [2, 3, 1]
+    assert [r["agent_id"] for r in pipeline.results] == ["expert_a", "expert_b", "expert_c"]
+
+
+@pytest.mark.asyncio
+async def test_levels_wait_for_lower_levels_and_independent_agents_start_early():
+    analyst = SleepingAgent("analyst", 0.2)
+    expert = SleepingAgent("expert", 0.1)
+    writer = SleepingAgent("writer", 0.1, needs_context=False)
+    reviewer = SleepingAgent("reviewer", 0.1)
+    pipeline = StreamingAgentPipeline([reviewer, writer, expert, analyst], LEVELS, stream_tokens=False)
+
+    frames, elapsed = await _run(pipeline)
+
+    execution = {f["agent_id"]: f["execution"] for f in frames if "execution" in f}
+    assert execution["analyst"]["depends_on"] == []
+    assert execution["expert"]["depends_on"] == [1]
+    assert execution["writer"]["depends_on"] == []
+    assert execution["reviewer"]["depends_on"] == [1, 2, 3]
+    # El independiente termina antes que el nivel 1 y no recibe contexto
+    assert execution["writer"]["completion_index"] == 1
+    assert "CONTEXTO DE EXPERTOS ANTERIORES" not in writer.tasks[0]
+    assert "respuesta de analyst" in expert.tasks[0]
+    assert "respuesta de expert" in reviewer.tasks[0] and "respuesta de writer" in reviewer.tasks[0]
+    # Camino más largo: analyst → expert → reviewer
+    assert elapsed < 0.55
+
+
+@pytest.mark.asyncio
+async def test_fan_out_limit_bounds_concurrency():
+    agents = [SleepingAgent(f"expert_{n}", 0.1) for n in range(4)]
+    pipeline = StreamingAgentPipeline(agents, LEVELS, stream_tokens=False, max_fan_out=2)
+
+    _, elapsed = await _run(pipeline)
+
+    assert 0.2 <= elapsed < 0.35
+
+
+class BrokenStreamProvider:
+    async def stream_chat_completion(self, messages, model=None, api_config=None, **kwargs):
+        yield "Respuesta a med"
+        raise ConnectionError("stream cortado")
+
+
+class AnalystAgent(BaseAgent):
+    def get_system_prompt(self):
+        return "sistema"
+
+
+@pytest.mark.asyncio
+async def test_stream_failing_mid_answer_is_reported_as_agent_error(monkeypatch):
+    errors = []
+
+    async def record_error(client_id, agent_name, error):
+        errors.append((agent_name, error))
+
+    monkeypatch.setattr(streaming_pipeline.manager, "send_agent_error", record_error)
+    analyst = AnalystAgent(agent_id="analyst", name="Analyst", model="m")
+    analyst.api_config = {"type": "groq", "api_key": "k"}
+    analyst.llm_provider = BrokenStreamProvider()
+    expert = SleepingAgent("expert", 0)
+    pipeline = StreamingAgentPipeline([analyst, expert], LEVELS, stream_tokens=True)
+
+    frames = [f async for f in pipeline.execute_with_streaming("tarea", client_id="nobody")]
+
+    assert [f["delta"] for f in frames if f.get("type") == "agent_delta"] == ["Respuesta a med"]
+    assert pipeline.results[0]["response_type"] == "error"
+    assert pipeline.results[0]["raw_content"] == "stream cortado"
+    assert errors == [("Analyst", "stream cortado")]
+    assert "Respuesta a med" not in expert.tasks[0]
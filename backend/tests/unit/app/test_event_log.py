@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+
+from app.event_log import InMemoryEventLog, event_stream
+from app.message_bus import InMemoryMessageBus
+from app.websocket_manager import ConnectionManager
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send_json(self, data):
+        self.sent.append(data)
+
+
+@pytest.mark.asyncio
+async def test_replay_returns_events_after_seq_in_order():
+    log = InMemoryEventLog()
+    for i in range(5):
+        await log.append("s", {"type": "agent_delta" if i % 2 else "agent_start", "i": i})
+
+    replay = await log.replay("s", after_seq=2)
+    assert [seq for seq, _ in replay.events] == [3, 4, 5]
+    assert [frame["i"] for _, frame in replay.events] == [2, 3, 4]
+    assert replay.last_seq == 5
+    assert not replay.truncated
+
+
+@pytest.mark.asyncio
+async def test_transient_frames_are_evicted_before_agent_responses():
+    log = InMemoryEventLog(max_events=10, max_transient=3)
+    await log.append("s", {"type": "agent_start"})
+    for i in range(20):
+        await log.append("s", {"type": "agent_delta", "delta": str(i)})
+    await log.append("s", {"type": "agent_response", "data": "completo"})
+
+    replay = await log.replay("s", after_seq=0)
+    types = [frame["type"] for _, frame in replay.events]
+    assert types == ["agent_start", "agent_delta", "agent_delta", "agent_delta", "agent_response"]
+    assert replay.truncated
+    # Desde un seq posterior a lo descartado no falta nada
+    assert not (await log.replay("s", after_seq=replay.events[1][0] - 1)).truncated
+
+
+@pytest.mark.asyncio
+async def test_unknown_or_expired_stream_is_reported_truncated_for_resuming_clients():
+    log = InMemoryEventLog(ttl=0.01)
+    await log.append("s", {"type": "agent_start"})
+    await asyncio.sleep(0.02)
+
+    replay = await log.replay("s", after_seq=1)
+    assert not replay.found
+    assert replay.truncated
+    assert not (await log.replay("nuevo", after_seq=0)).truncated
+
+
+@pytest.mark.asyncio
+async def test_follow_streams_live_events_until_closed():
+    log = InMemoryEventLog()
+    await log.open_stream("s")
+    await log.append("s", {"type": "agent_start"})
+
+    async def produce():
+        await asyncio.sleep(0.01)
+        await log.append("s", {"type": "agent_response"})
+        await log.append("s", {"type": "stream_complete"})
+        await log.close_stream("s")
+
+    producer = asyncio.create_task(produce())
+    received = [(seq, frame["type"]) async for seq, frame in log.follow("s", after_seq=0, poll=5)]
+    await producer
+
+    assert received == [(1, "agent_start"), (2, "agent_response"), (3, "stream_complete")]
+
+
+@pytest.mark.asyncio
+async def test_manager_records_pipeline_frames_and_replays_them():
+    manager = ConnectionManager(InMemoryMessageBus(), InMemoryEventLog())
+    socket = FakeWebSocket()
+    await manager.connect(socket, "session_1")
+
+    async def pipeline():
+        event_stream.set("session_1")
+        await manager.send_json("session_1", {"type": "agent_delta", "seq": 0, "delta": "Ho"})
+        await manager.send_json("session_1", {"type": "agent_response", "data": {}})
+
+    await asyncio.create_task(pipeline())
+    # Fuera del pipeline (ping, stats...) no se registra
+    await manager.send_json("session_1", {"type": "pong"})
+    await manager.flush("session_1")
+
+    assert [frame.get("event_seq") for frame in socket.sent] == [1, 2, None]
+    # El seq propio del delta no se pisa
+    assert socket.sent[0]["seq"] == 0
+
+    # Reconexión habiendo visto solo el seq 1
+    manager.disconnect("session_1")
+    reconnected = FakeWebSocket()
+    await manager.connect(reconnected, "session_1")
+    summary = await manager.replay("session_1", last_seq=1)
+    await manager.flush("session_1")
+
+    assert reconnected.sent == [{"type": "agent_response", "data": {}, "event_seq": 2}]
+    assert summary == {"replayed": 1, "last_seq": 2, "truncated": False}
@@ -0,0 +1,253 @@
+import asyncio
+
+import pytest
+
+from app.message_bus import InMemoryMessageBus
+from app.websocket_manager import ConnectionManager
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send_json(self, data):
+        self.sent.append(data)
+
+    async def send_text(self, message):
+        self.sent.append(message)
+
+
+@pytest.fixture
+def workers():
+    """Dos procesos simulados (dos managers) sobre el mismo bus"""
+    bus = InMemoryMessageBus()
+    return ConnectionManager(bus), ConnectionManager(bus)
+
+
+@pytest.mark.asyncio
+async def test_send_json_reaches_socket_on_other_process(workers):
+    api, worker = workers
+    socket = FakeWebSocket()
+    await api.connect(socket, "session_1")
+
+    assert await worker.send_json("session_1", {"type": "agent_response", "data": [1]})
+    assert await worker.send_text("session_1", "hola")
+    await api.flush("session_1")
+    assert socket.sent == [{"type": "agent_response", "data": [1]}, "hola"]
+    assert api.message_counts["session_1"] == 2
+    assert worker.get_stats()["bus"]["remote_sent"] == 2
+
+    # Sin ningún proceso con la sesión, el envío falla como antes
+    assert not await worker.send_json("missing", {"type": "x"})
+
+
+@pytest.mark.asyncio
+async def test_local_send_does_not_use_bus(workers):
+    api, _ = workers
+    socket = FakeWebSocket()
+    await api.connect(socket, "session_1")
+
+    assert await api.send_json("session_1", {"type": "ping"})
+    await api.flush("session_1")
+    assert socket.sent == [{"type": "ping"}]
+    assert api.bus.published == 0
+
+
+@pytest.mark.asyncio
+async def test_log_stream_frames_are_not_published(workers):
+    api, _ = workers
+    await api.open_log_stream("sse_1")
+
+    assert not await api.send_json("sse_1", {"type": "agent_delta", "delta": "ho"})
+    assert not await api.send_text("sse_1", "hola")
+    assert api.bus.published == 0
+
+    await api.close_log_stream("sse_1")
+    await api.send_json("sse_1", {"type": "agent_delta", "delta": "la"})
+    assert api.bus.published == 1
+
+
+@pytest.mark.asyncio
+async def test_broadcast_reaches_every_process_once(workers):
+    api, worker = workers
+    local, remote, excluded = FakeWebSocket(), FakeWebSocket(), FakeWebSocket()
+    await api.connect(local, "a")
+    await worker.connect(remote, "b")
+    await worker.connect(excluded, "c")
+
+    await api.broadcast({"type": "admin_broadcast"}, exclude=["c"])
+    await api.flush("a")
+    await worker.flush("b")
+
+    assert local.sent == ['{"type":"admin_broadcast"}']
+    assert remote.sent == ['{"type":"admin_broadcast"}']
+    assert excluded.sent == []
+
+
+@pytest.mark.asyncio
+async def test_disconnect_unsubscribes_session(workers):
+    api, worker = workers
+    await api.connect(FakeWebSocket(), "session_1")
+    api.disconnect("session_1")
+    await asyncio.sleep(0)  # la baja del canal corre en segundo plano
+
+    assert not await worker.send_json("session_1", {"type": "x"})
+
+
+class SlowWebSocket(FakeWebSocket):
+    """Cliente que no lee hasta que se le deja"""
+
+    def __init__(self):
+        super().__init__()
+        self.gate = asyncio.Event()
+
+    async def send_json(self, data):
+        await self.gate.wait()
+        self.sent.append(data)
+
+
+def _progress(value):
+    return {"type": "agent_progress", "agent": "PM", "progress": value}
+
+
+def _delta(text, seq):
+    return {"type": "agent_delta", "agent_id": "pm", "step": 1, "seq": seq, "delta": text}
+
+
+@pytest.mark.asyncio
+async def test_slow_client_does_not_block_sender_and_transient_frames_are_coalesced():
+    manager = ConnectionManager(InMemoryMessageBus(), send_queue_size=8)
+    slow = SlowWebSocket()
+    await manager.connect(slow, "slow")
+
+    await manager.send_json("slow", {"type": "agent_start"})
+    await asyncio.sleep(0)  # el writer toma el primer frame y queda bloqueado en la red
+    for i in range(50):
+        await manager.send_agent_delta("slow", _delta(f"t{i} ", i))
+        await manager.send_json("slow", _progress(i))
+    await manager.send_json("slow", {"type": "agent_response", "data": "final"})
+
+    stats = manager.get_send_queue_stats()
+    assert stats["depth"] == 3
+    assert stats["coalesced"] == 98
+
+    slow.gate.set()
+    await manager.flush("slow")
+    types = [frame["type"] for frame in slow.sent]
+    assert types == ["agent_start", "agent_delta", "agent_progress", "agent_response"]
+    delta = slow.sent[1]
+    assert delta["delta"] == "".join(f"t{i} " for i in range(50))
+    assert delta["seq"] == 0
+    assert slow.sent[2]["progress"] == 49
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_transient_frames_but_keeps_durable_ones():
+    manager = ConnectionManager(InMemoryMessageBus(), send_queue_size=2)
+    slow = SlowWebSocket()
+    await manager.connect(slow, "slow")
+    await manager.send_json("slow", {"type": "agent_start"})
+    await asyncio.sleep(0)
+
+    await manager.send_json("slow", {"type": "agent_progress", "agent": "A", "progress": 1})
+    await manager.send_json("slow", {"type": "agent_progress", "agent": "B", "progress": 1})
+    # Cola llena: el progreso de otro agente se descarta
+    await manager.send_json("slow", {"type": "agent_progress", "agent": "C", "progress": 1})
+    # Los durables desplazan al transitorio más antiguo
+    await manager.send_pipeline_complete("slow", {"ok": True})
+
+    slow.gate.set()
+    await manager.flush("slow")
+    sent = [(frame["type"], frame.get("agent")) for frame in slow.sent]
+    assert sent == [("agent_start", None), ("agent_progress", "B"), ("pipeline_complete", None)]
+    assert manager.get_send_queue_stats()["dropped"] == 2
+
+
+@pytest.mark.asyncio
+async def test_stuck_client_is_disconnected_on_overflow():
+    manager = ConnectionManager(InMemoryMessageBus(), send_queue_size=1)
+    slow = SlowWebSocket()
+    await manager.connect(slow, "slow")
+    await asyncio.sleep(0)
+
+    results = [await manager.send_json("slow", {"type": "agent_response", "i": i}) for i in range(6)]
+
+    assert False in results
+    assert not manager.is_connected("slow")
+    assert manager.get_send_queue_stats()["overflow_disconnects"] == 1
+
+
+class DeadWebSocket(FakeWebSocket):
+    async def send_text(self, message):
+        await asyncio.sleep(3600)
+
+
+class BrokenWebSocket(FakeWebSocket):
+    async def send_text(self, message):
+        raise ConnectionResetError("peer gone")
+
+
+@pytest.mark.asyncio
+async def test_broadcast_reports_delivered_failed_and_timed_out():
+    manager = ConnectionManager(InMemoryMessageBus())
+    healthy = [FakeWebSocket() for _ in range(50)]
+    for i, socket in enumerate(healthy):
+        await manager.connect(socket, f"ok_{i}")
+    await manager.connect(BrokenWebSocket(), "broken")
+    await manager.connect(DeadWebSocket(), "dead")
+
+    result = await manager.broadcast({"type": "admin_broadcast", "message": "hola"}, timeout=0.2)
+
+    assert result["recipients"] == 52
+    assert result["delivered"] == 50
+    assert result["failed"] == 1
+    assert result["timed_out"] == 1
+    assert result["remote_nodes"] == 0
+    # Serializado una vez y enviado como texto
+    assert healthy[0].sent == ['{"type":"admin_broadcast","message":"hola"}']
+    assert not manager.is_connected("broken")
+
+
+@pytest.mark.asyncio
+async def test_dead_peer_is_disconnected_after_send_timeout():
+    manager = ConnectionManager(InMemoryMessageBus())
+    await manager.connect(DeadWebSocket(), "dead")
+    manager.writers["dead"].send_timeout = 0.05
+
+    result = await manager.broadcast({"type": "admin_broadcast"}, timeout=1)
+
+    assert result["failed"] == 1
+    assert not manager.is_connected("dead")
+
+
+class ClosableWebSocket(FakeWebSocket):
+    def __init__(self):
+        super().__init__()
+        self.closed = None
+
+    async def close(self, code=1000, reason=None):
+        self.closed = code
+
+
+@pytest.mark.asyncio
+async def test_reconnect_supersedes_old_socket_without_losing_the_new_one():
+    manager = ConnectionManager(InMemoryMessageBus())
+    old, new = ClosableWebSocket(), ClosableWebSocket()
+    await manager.connect(old, "session_1")
+    await manager.connect(new, "session_1")
+    await asyncio.sleep(0)
+
+    # El bucle de recepción del socket viejo termina más tarde
+    assert manager.is_superseded("session_1", old)
+    assert not manager.disconnect("session_1", old)
+
+    assert old.closed == 1000
+    assert manager.is_connected("session_1")
+    assert await manager.send_json("session_1", {"type": "ping"})
+    await manager.flush("session_1")
+    assert new.sent == [{"type": "ping"}]
+    assert manager.disconnect("session_1", new)
+    assert not manager.is_connected("session_1")
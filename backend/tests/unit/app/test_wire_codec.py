@@ -0,0 +1,134 @@
+import json
+
+import msgpack
+import pytest
+
+from app.formatters.human_formatter import HumanResponseFormatter
+from app.message_bus import InMemoryMessageBus
+from app.websocket_manager import ConnectionManager
+from app.wire_codec import (
+    JSON_ENCODING, LEAN_FRAMES, MSGPACK_ENCODING, WireCodec,
+    compact_response, expand_response, lean_frame, negotiate_codec
+)
+
+RAW = """## Plan del proyecto 🚀
+
+1. Definir el alcance con el cliente
+2. Diseñar la arquitectura 🏗️ del backend
+3. Implementar y probar
+
+## Riesgos
+
+- Plazos ajustados
+- Dependencias externas
+
+En resumen: empezar por el alcance."""
+
+
+def _formatted():
+    return HumanResponseFormatter.format_agent_response(
+        RAW, agent_id="project_manager", agent_name="Project Manager", level=1,
+        specialty="Planificación", step=1, total_steps=2
+    )
+
+
+def test_lean_response_uses_offsets_and_round_trips():
+    formatted = _formatted()
+    compact = compact_response(formatted)
+
+    assert compact["raw_content"] == formatted["raw_content"]
+    items = [item for section in compact["sections"] for item in section["items"]]
+    assert items and all(isinstance(item, list) for item in items)
+    assert expand_response(compact) == formatted
+    assert len(json.dumps(compact, ensure_ascii=False)) < len(json.dumps(formatted, ensure_ascii=False))
+
+
+def test_offsets_are_utf16_code_units():
+    raw = "🚀 uno\n- dos 🏗️ tres"
+    compact = compact_response({"raw_content": raw, "sections": [{"title": "", "items": ["dos 🏗️ tres"]}]})
+
+    start, end = compact["sections"][0]["items"][0]
+    # Como String.prototype.slice en el navegador
+    assert raw.encode("utf-16-le")[2 * start:2 * end].decode("utf-16-le") == "dos 🏗️ tres"
+    assert start == 9
+
+
+def test_text_missing_from_raw_content_is_kept():
+    compact = compact_response({"raw_content": "hola", "sections": [], "summary": "resumen aparte"})
+    assert compact["summary"] == "resumen aparte"
+
+
+def test_lean_frame_only_touches_agent_responses():
+    formatted = _formatted()
+    frame = {"type": "agent_response", "data": formatted}
+
+    assert lean_frame(frame)["data"]["frames"] == LEAN_FRAMES
+    assert "frames" not in frame["data"]
+    assert lean_frame({"type": "agent_start", "agent": "PM"}) == {"type": "agent_start", "agent": "PM"}
+
+
+def test_negotiate_codec_falls_back_to_defaults():
+    assert negotiate_codec("MSGPACK", "lean") == WireCodec(MSGPACK_ENCODING, LEAN_FRAMES)
+    assert negotiate_codec("xml", "tiny") == WireCodec(JSON_ENCODING)
+    assert negotiate_codec() == WireCodec()
+
+
+def test_msgpack_codec_encodes_binary_frames():
+    codec = negotiate_codec(MSGPACK_ENCODING)
+
+    kind, payload = codec.encode({"type": "ping"})
+    assert kind == "bytes"
+    assert msgpack.unpackb(payload) == {"type": "ping"}
+
+
+class TextWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send_json(self, data):
+        self.sent.append(json.loads(json.dumps(data)))
+
+    async def send_text(self, message):
+        self.sent.append(json.loads(message))
+
+    async def send_bytes(self, message):
+        self.sent.append(msgpack.unpackb(message))
+
+
+@pytest.mark.asyncio
+async def test_lean_connection_receives_compact_agent_responses():
+    manager = ConnectionManager(InMemoryMessageBus())
+    lean, full = TextWebSocket(), TextWebSocket()
+    await manager.connect(lean, "lean", codec=negotiate_codec(frames="lean"))
+    await manager.connect(full, "full", codec=WireCodec(frames="full"))
+    formatted = _formatted()
+
+    for client_id in ("lean", "full"):
+        await manager.send_agent_response(client_id, formatted)
+        await manager.flush(client_id)
+    await manager.broadcast({"type": "agent_response", "data": formatted}, timeout=1)
+
+    assert lean.sent[0]["data"]["frames"] == LEAN_FRAMES
+    assert expand_response(lean.sent[0]["data"]) == formatted
+    assert lean.sent[1]["data"]["frames"] == LEAN_FRAMES
+    assert full.sent[0]["data"] == formatted
+    assert manager.get_stats()["encodings"] == {"json/lean": 1, "json/full": 1}
+
+
+@pytest.mark.asyncio
+async def test_msgpack_connection_receives_binary_frames():
+    manager = ConnectionManager(InMemoryMessageBus())
+    binary = TextWebSocket()
+    await manager.connect(binary, "bin", codec=negotiate_codec("msgpack", "lean"))
+    formatted = _formatted()
+
+    await manager.send_agent_response("bin", formatted)
+    await manager.flush("bin")
+    await manager.broadcast({"type": "admin_broadcast", "message": "hola"}, timeout=1)
+
+    assert expand_response(binary.sent[0]["data"]) == formatted
+    assert binary.sent[1] == {"type": "admin_broadcast", "message": "hola"}
+    assert manager.get_stats()["encodings"] == {"msgpack/lean": 1}
@@ -0,0 +1,247 @@
+import asyncio
+
+import pytest
+
+from app.workflows import base_workflow, workflow_registry
+from app.workflows.checkpoint_store import WorkflowCheckpointStore
+from app.workflows.base_workflow import (
+    WorkflowComplexity,
+    WorkflowExecutor,
+    WorkflowStatus,
+    WorkflowStep,
+    WorkflowTemplate,
+    topological_order,
+)
+
+
+class TimedAgent:
+    """Agente falso: duerme `delay` y registra los prompts y la concurrencia."""
+    active = 0
+    peak = 0
+
+    def __init__(self, agent_id, delay=0.1, fail=False):
+        self.agent_id = agent_id
+        self.delay = delay
+        self.fail = fail
+        self.prompts = []
+
+    async def process_task(self, task, context=None):
+        self.prompts.append(task)
+        TimedAgent.active += 1
+        TimedAgent.peak = max(TimedAgent.peak, TimedAgent.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            TimedAgent.active -= 1
+        if self.fail:
+            raise RuntimeError("boom")
+        return {"content": f"salida de {self.agent_id}"}
+
+
+@pytest.fixture(autouse=True)
+def reset_peak():
+    TimedAgent.active = TimedAgent.peak = 0
+
+
+@pytest.fixture(autouse=True)
+def checkpoint_db(tmp_path, monkeypatch):
+    path = str(tmp_path / "checkpoints.db")
+    monkeypatch.setattr(base_workflow, "WORKFLOW_CHECKPOINT_DB", path)
+    return path
+
+
+def template(steps):
+    return WorkflowTemplate(
+        workflow_id="wf_test", name="Test", description="", category="test",
+        complexity=WorkflowComplexity.LOW, estimated_time_minutes=1,
+        required_agents=sorted({s.agent_id for s in steps}), steps=steps,
+    )
+
+
+def step(step_id, order, depends_on=(), optional=False, agent_id=None):
+    return WorkflowStep(
+        step_id, step_id, "", agent_id or step_id, f"Tarea {step_id}: {{topic}}", order,
+        list(depends_on), optional,
+    )
+
+
+def executor_for(agents, **kwargs):
+    return WorkflowExecutor(agent_factory=lambda agent_id: agents[agent_id], **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_diamond_runs_branches_concurrently_and_feeds_outputs():
+    agents = {sid: TimedAgent(sid, delay) for sid, delay in
+              {"plan": 0.1, "left": 0.2, "right": 0.1, "merge": 0.1}.items()}
+    workflow = template([
+        step("plan", 1), step("left", 2, ["plan"]), step("right", 2, ["plan"]),
+        step("merge", 3, ["left", "right"]),
+    ])
+
+    execution = await executor_for(agents).execute(workflow, "u1", {"topic": "SaaS"})
+
+    assert execution.status == WorkflowStatus.COMPLETED
+    assert agents["plan"].prompts[0] == "Tarea plan: SaaS"
+    merge_prompt = agents["merge"].prompts[0]
+    assert "salida de left" in merge_prompt and "salida de right" in merge_prompt
+    timing = execution.timing
+    assert timing["critical_path"] == ["plan", "left", "merge"]
+    assert 380 <= timing["critical_path_ms"] <= 600
+    # Tiempo total ≈ camino crítico (0.4 s), no la suma de pasos (0.5 s)
+    assert timing["wall_time_ms"] < 480
+    assert TimedAgent.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_pool_bounds_concurrency():
+    agents = {f"s{n}": TimedAgent(f"s{n}", 0.05) for n in range(6)}
+    workflow = template([step(sid, 1) for sid in agents])
+
+    execution = await executor_for(agents, max_concurrency=2).execute(workflow, "u1", {"topic": "x"})
+
+    assert execution.status == WorkflowStatus.COMPLETED
+    assert TimedAgent.peak == 2
+    assert execution.timing["wall_time_ms"] >= 150
+
+
+@pytest.mark.asyncio
+async def test_optional_failure_continues_and_required_failure_skips_dependents():
+    agents = {
+        "base": TimedAgent("base", 0.01),
+        "extra": TimedAgent("extra", 0.01, fail=True),
+        "final": TimedAgent("final", 0.01),
+    }
+    workflow = template([step("base", 1), step("extra", 2, ["base"], optional=True), step("final", 3, ["extra"])])
+
+    execution = await executor_for(agents).execute(workflow, "u1", {"topic": "x"})
+
+    assert execution.status == WorkflowStatus.COMPLETED
+    assert execution.results["extra"]["status"] == "failed"
+    assert execution.results["final"]["status"] == "completed"
+    assert "RESULTADOS DE PASOS ANTERIORES" not in agents["final"].prompts[0]
+
+    agents["base"].fail = True
+    execution = await executor_for(agents).execute(workflow, "u1", {"topic": "x"})
+
+    assert execution.status == WorkflowStatus.FAILED
+    assert execution.results["extra"]["status"] == "skipped"
+    assert execution.results["final"]["status"] == "skipped"
+    assert execution.errors == ["Step base failed: boom"]
+
+
+def test_cycles_are_rejected():
+    with pytest.raises(ValueError):
+        topological_order([step("a", 1, ["b"]), step("b", 2, ["a"])])
+
+
+@pytest.mark.asyncio
+async def test_all_registry_templates_execute():
+    agents = {}
+
+    def factory(agent_id):
+        return agents.setdefault(agent_id, TimedAgent(agent_id, 0))
+
+    executor = WorkflowExecutor(agent_factory=factory)
+    for workflow in workflow_registry.get_all():
+        execution = await executor.execute(workflow, "u1", {name: "dato" for name in workflow.inputs})
+        assert execution.status == WorkflowStatus.COMPLETED, workflow.workflow_id
+        assert set(execution.results) == {s.step_id for s in workflow.steps}
+
+
+@pytest.mark.asyncio
+async def test_resume_after_restart_reruns_only_failed_steps(checkpoint_db):
+    agents = {
+        "research": TimedAgent("research", 0.01),
+        "draft": TimedAgent("draft", 0.01, fail=True),
+        "review": TimedAgent("review", 0.01),
+    }
+    workflow = template([step("research", 1), step("draft", 2, ["research"]), step("review", 3, ["draft"])])
+    first = await executor_for(agents).execute(workflow, "u1", {"topic": "IA"}, model="mock-model")
+    assert first.status == WorkflowStatus.FAILED
+    assert [first.results[s]["status"] for s in ("research", "draft", "review")] == ["completed", "failed", "skipped"]
+
+    # Nuevo proceso: otro ejecutor, mismo store; el proveedor ya responde
+    agents["draft"].fail = False
+    restarted = WorkflowExecutor(
+        agent_factory=lambda agent_id: agents[agent_id],
+        checkpoint_store=WorkflowCheckpointStore(checkpoint_db),
+    )
+    resumed = await restarted.resume(first.execution_id, workflow=workflow)
+
+    assert resumed.execution_id == first.execution_id
+    assert resumed.status == WorkflowStatus.COMPLETED
+    assert len(agents["research"].prompts) == 1
+    assert len(agents["draft"].prompts) == 2
+    assert len(agents["review"].prompts) == 1
+    assert "salida de research" in agents["draft"].prompts[-1]
+    assert resumed.context == {"topic": "IA"} and resumed.model == "mock-model"
+    assert set(resumed.timing["steps"]) == {"draft", "review"}
+
+    saved = WorkflowCheckpointStore(checkpoint_db).load(first.execution_id)
+    assert saved["status"] == "completed"
+    assert {sid: r["status"] for sid, r in saved["results"].items()} == dict.fromkeys(
+        ("research", "draft", "review"), "completed"
+    )
+
+
+@pytest.mark.asyncio
+async def test_resume_registry_workflow_and_unknown_execution():
+    agents = {}
+    executor = WorkflowExecutor(agent_factory=lambda agent_id: agents.setdefault(agent_id, TimedAgent(agent_id, 0)))
+    workflow = workflow_registry.get("sw_code_review")
+    execution = await executor.execute(workflow, "u1", {"code_snippet": "x = 1", "language": "python"})
+
+    # Completada: no hay nada que volver a ejecutar
+    assert (await executor.resume(execution.execution_id)).status == WorkflowStatus.COMPLETED
+    assert all(len(agent.prompts) == 1 for agent in agents.values())
+    with pytest.raises(KeyError):
+        await executor.resume("missing")
+
+
+FAILING_LLM = {"type": "mock", "base_url": "mock://local?ttft_ms=0&tps=100000&output_tokens=8&error_rate=1"}
+
+
+@pytest.fixture
+def fresh_breakers(monkeypatch):
+    from src.infrastructure.adapters.external import resilient_provider
+    monkeypatch.setattr(resilient_provider, "circuit_breakers", {})
+    monkeypatch.setattr(resilient_provider, "latency_trackers", {})
+
+
+@pytest.mark.asyncio
+async def test_real_agent_llm_error_fails_step_and_skips_dependents(fresh_breakers):
+    workflow = template([
+        step("analysis", 1, agent_id="tax_specialist"),
+        step("extra", 1, optional=True, agent_id="financial_analyst"),
+        step("report", 2, ["analysis"], agent_id="financial_analyst"),
+    ])
+    execution = await WorkflowExecutor().execute(workflow, "u1", {"topic": "IVA"}, api_config=FAILING_LLM)
+
+    assert execution.status == WorkflowStatus.FAILED
+    assert {sid: r["status"] for sid, r in execution.results.items()} == {
+        "analysis": "failed", "extra": "failed", "report": "skipped"
+    }
+    assert "503" in execution.results["analysis"]["error"]
+    # Solo el paso obligatorio cuenta como error de la ejecución
+    assert len(execution.errors) == 1
+
+
+@pytest.mark.asyncio
+async def test_resume_reruns_step_whose_real_agent_llm_call_failed(checkpoint_db, fresh_breakers):
+    workflow = template([
+        step("analysis", 1, agent_id="tax_specialist"),
+        step("report", 2, ["analysis"], agent_id="financial_analyst"),
+    ])
+    first = await WorkflowExecutor().execute(workflow, "u1", {"topic": "IVA"}, api_config=FAILING_LLM)
+    saved = WorkflowCheckpointStore(checkpoint_db).load(first.execution_id)
+    # El fallo del proveedor queda como paso fallido, no como salida completada
+    assert {sid: r["status"] for sid, r in saved["results"].items()} == {"analysis": "failed", "report": "skipped"}
+
+    healthy = dict(FAILING_LLM, base_url="mock://local?ttft_ms=0&tps=100000&output_tokens=8")
+    restarted = WorkflowExecutor(checkpoint_store=WorkflowCheckpointStore(checkpoint_db))
+    resumed = await restarted.resume(first.execution_id, api_config=healthy, workflow=workflow)
+
+    assert resumed.status == WorkflowStatus.COMPLETED
+    assert set(resumed.timing["steps"]) == {"analysis", "report"}
+    assert "Error en LLM" not in resumed.results["analysis"]["output"]
+
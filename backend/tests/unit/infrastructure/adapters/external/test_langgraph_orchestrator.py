@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+
+from src.domain.entities.agent import AgentProfile
+from src.infrastructure.adapters.external.langgraph_orchestrator import LangGraphOrchestratorAdapter
+
+
+class EchoAgent:
+    def __init__(self, agent_id, run, level=1):
+        self.profile = AgentProfile(
+            agent_id=agent_id,
+            name=f"Agent {agent_id}",
+            description="Eco",
+            level=level,
+            specialization="test",
+            backstory="",
+            model="mock-model",
+            system_prompt="",
+        )
+        self.run = run
+
+    async def process_task(self, task, context=None):
+        await asyncio.sleep(0.01)
+        return {"content": f"{self.profile.agent_id}:{self.run}"}
+
+
+@pytest.mark.asyncio
+async def test_graph_is_compiled_once_and_reused(monkeypatch):
+    adapter = LangGraphOrchestratorAdapter()
+    graph = adapter.graph
+    monkeypatch.setattr(adapter, "_build_graph", lambda: pytest.fail("graph rebuilt per run"))
+
+    await adapter.run_workflow("tarea", [EchoAgent("lg_a", 0)])
+    await adapter.run_workflow("tarea", [EchoAgent("lg_a", 1)])
+
+    assert adapter.graph is graph
+
+
+@pytest.mark.asyncio
+async def test_concurrent_workflows_do_not_share_agents():
+    adapter = LangGraphOrchestratorAdapter()
+
+    async def run(n):
+        agents = [EchoAgent(f"lg_{n}_first", n, level=1), EchoAgent(f"lg_{n}_second", n, level=2)]
+        return n, await adapter.run_workflow(f"tarea {n}", agents)
+
+    results = await asyncio.gather(*(run(n) for n in range(50)))
+
+    for n, result in results:
+        responses = result["agent_responses"]
+        assert [r["agent_id"] for r in responses] == [f"lg_{n}_first", f"lg_{n}_second"]
+        assert all(r["content"]["content"] == f"{r['agent_id']}:{n}" for r in responses)
+        assert f"Agent lg_{n}_first" in result["final_result"]
+    assert len({result["conversation_id"] for _, result in results}) == 50
@@ -0,0 +1,49 @@
+import pytest
+from src.infrastructure.adapters.external.llm_client_pool import LLMClientPool, fingerprint_api_key
+
+
+@pytest.mark.asyncio
+async def test_same_provider_reuses_client():
+    pool = LLMClientPool(max_clients=4)
+
+    async with pool.lease("groq", "key-a", "https://api.groq.com/openai/v1") as first:
+        pass
+    async with pool.lease("groq", "key-a", "https://api.groq.com/openai/v1/") as second:
+        pass
+
+    assert first is second
+    assert pool.hits == 1
+    assert pool.misses == 1
+    await pool.close_all()
+
+
+@pytest.mark.asyncio
+async def test_lru_bound_and_idle_eviction():
+    pool = LLMClientPool(max_clients=2, idle_ttl=3600)
+
+    for key in ("k1", "k2", "k3"):
+        async with pool.lease("openai", key) as _:
+            pass
+
+    stats = pool.get_stats()
+    assert stats["clients"] == 2
+    assert stats["evictions"] == 1
+    assert fingerprint_api_key("k1") not in [e["key_fingerprint"] for e in stats["entries"]]
+
+    pool.idle_ttl = 0
+    async with pool.lease("openai", "k4") as _:
+        pass
+    # Los inactivos se expulsan; el cliente en préstamo nunca
+    assert pool.get_stats()["clients"] == 1
+    await pool.close_all()
+
+
+@pytest.mark.asyncio
+async def test_in_flight_client_is_not_evicted():
+    pool = LLMClientPool(max_clients=1, idle_ttl=3600)
+
+    async with pool.lease("openai", "busy") as busy:
+        async with pool.lease("openai", "other") as _:
+            pass
+        assert busy in [e.client for e in pool._clients.values()]
+    await pool.close_all()
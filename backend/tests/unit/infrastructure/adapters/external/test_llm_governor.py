@@ -0,0 +1,114 @@
+import asyncio
+
+import pytest
+
+from src.infrastructure.adapters.external.llm_governor import (
+    LLMGovernor, TokenBucket, fingerprint_api_key, parse_duration,
+)
+
+LIMITS = {"default": {"rpm": 0, "tpm": 0, "key_rpm": 0, "key_tpm": 0,
+                      "min_concurrency": 1, "initial_concurrency": 1, "max_concurrency": 4}}
+
+
+class RateLimited(Exception):
+    status_code = 429
+
+    class response:
+        headers = {"retry-after": "0.05"}
+
+
+def test_parse_duration_formats():
+    assert parse_duration("6s") == 6
+    assert parse_duration("1m2.5s") == 62.5
+    assert parse_duration("120ms") == pytest.approx(0.12)
+    assert parse_duration("30") == 30
+    assert parse_duration(None) is None
+
+
+@pytest.mark.asyncio
+async def test_fair_queue_round_robins_between_users():
+    governor = LLMGovernor(LIMITS)
+    order = []
+    gate = asyncio.Event()
+
+    async def call(user, tag):
+        async with governor.slot("openai", "k", user_id=user):
+            order.append(tag)
+            await gate.wait()
+
+    # "heavy" ocupa el único hueco y encola 3 más; "light" llega después con 1
+    tasks = [asyncio.create_task(call("heavy", f"h{i}")) for i in range(4)]
+    await asyncio.sleep(0)
+    tasks.append(asyncio.create_task(call("light", "l0")))
+    await asyncio.sleep(0)
+    assert governor.get_stats()["total_queue_depth"] == 4
+
+    gate.set()
+    await asyncio.gather(*tasks)
+
+    # El usuario ligero no espera a que termine todo el lote del pesado
+    assert order.index("l0") <= 2
+
+
+@pytest.mark.asyncio
+async def test_429_halves_concurrency_and_pauses_lane():
+    governor = LLMGovernor({"default": dict(LIMITS["default"], initial_concurrency=4)})
+
+    with pytest.raises(RateLimited):
+        async with governor.slot("openai", "k"):
+            raise RateLimited()
+
+    lane = governor.get_stats()["lanes"][0]
+    assert lane["concurrency_limit"] == 2
+    assert lane["throttles"] == 1
+    assert lane["paused_for_seconds"] > 0
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    async with governor.slot("openai", "k"):
+        pass
+    assert loop.time() - started >= 0.04
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_waits_when_exhausted():
+    bucket = TokenBucket(per_minute=600)  # 10 por segundo
+    bucket.tokens = 0
+    waited = await bucket.acquire(1)
+    assert waited == pytest.approx(0.1, abs=0.05)
+
+
+@pytest.mark.asyncio
+async def test_waiting_for_tokens_does_not_hold_a_concurrency_slot():
+    governor = LLMGovernor({"default": dict(LIMITS["default"], key_tpm=6000)})  # 100 por segundo
+    governor._buckets_for("openai", fingerprint_api_key("k"))[3][1].tokens = 50
+    finished = []
+
+    async def call(user, tokens):
+        async with governor.slot("openai", "k", estimated_tokens=tokens, user_id=user):
+            finished.append(user)
+
+    big = asyncio.create_task(call("big", 100))
+    await asyncio.sleep(0)
+    await asyncio.wait_for(call("small", 10), timeout=0.2)
+
+    assert finished == ["small"]
+    await big
+    assert finished == ["small", "big"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_wait_refunds_acquired_buckets():
+    governor = LLMGovernor({"default": dict(LIMITS["default"], key_rpm=60, key_tpm=600)})
+    _, _, (_, rpm), (_, tpm) = governor._buckets_for("openai", fingerprint_api_key("k"))
+    tpm.tokens = 0
+
+    task = asyncio.create_task(governor.slot("openai", "k", estimated_tokens=100).__aenter__())
+    await asyncio.sleep(0.01)
+    assert rpm.level() == pytest.approx(59, abs=0.1)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert rpm.level() == 60
+    assert governor.get_stats()["total_in_flight"] == 0
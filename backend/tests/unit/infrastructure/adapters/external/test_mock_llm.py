@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from src.infrastructure.adapters.external import resilient_provider
+from src.infrastructure.adapters.external.llm_client_pool import LLMClientPool
+from src.infrastructure.adapters.external.llm_governor import LLMGovernor
+from src.infrastructure.adapters.external.llm_provider_factory import LLMProviderFactory
+from src.infrastructure.adapters.external.mock_llm import MockLLMConfig, MockLLMEngine
+from src.infrastructure.config.settings import MOCK_LLM_MAX_SECONDS
+
+MESSAGES = [{"role": "user", "content": "Analiza el mercado"}]
+
+
+@pytest.fixture(autouse=True)
+def fresh_breakers(monkeypatch):
+    monkeypatch.setattr(resilient_provider, "circuit_breakers", {})
+    monkeypatch.setattr(resilient_provider, "latency_trackers", {})
+
+
+@pytest_asyncio.fixture
+async def factory():
+    pool = LLMClientPool()
+    yield LLMProviderFactory(client_pool=pool, governor=LLMGovernor(), fallback_chains={})
+    await pool.close_all()
+
+
+def test_url_params_are_parsed_and_clamped():
+    config = MockLLMConfig.from_url("mock://local?ttft_ms=999999&tps=200&429_rate=0.5&output_tokens=12")
+    assert config.ttft_ms == MOCK_LLM_MAX_SECONDS * 1000 / 2
+    assert config.tokens_per_sec == 200
+    assert config.rate_limit_rate == 0.5
+    assert config.output_tokens == 12
+
+
+def test_url_params_cannot_hold_a_connection_beyond_the_cap():
+    config = MockLLMConfig.from_url("mock://local?ttft_ms=999999&tps=1&output_tokens=32768")
+    total = config.ttft_ms / 1000 + config.output_tokens / config.tokens_per_sec
+    assert total <= MOCK_LLM_MAX_SECONDS + 1e-6
+
+
+@pytest.mark.asyncio
+async def test_content_is_deterministic_per_prompt(factory):
+    provider = factory.create({"type": "mock", "base_url": "mock://local?ttft_ms=0&tps=100000&output_tokens=40"})
+    first = await provider.chat_completion(MESSAGES, model="mock-model")
+    second = await provider.chat_completion(MESSAGES, model="mock-model")
+    other = await provider.chat_completion([{"role": "user", "content": "Otra cosa"}], model="mock-model")
+    assert first == second
+    assert first != other
+    assert first.startswith("## Resumen")
+
+
+@pytest.mark.asyncio
+async def test_stream_honours_ttft_and_matches_full_completion(factory):
+    provider = factory.create({"type": "mock", "base_url": "mock://local?ttft_ms=100&tps=2000&output_tokens=60"})
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    stream = await provider.chat_completion(MESSAGES, model="mock-model", stream=True)
+    deltas = []
+    first_at = None
+    async for delta in stream:
+        first_at = first_at or loop.time()
+        deltas.append(delta)
+
+    assert first_at - started >= 0.09
+    assert len(deltas) > 1
+    assert "".join(deltas) == await provider.chat_completion(MESSAGES, model="mock-model")
+
+
+@pytest.mark.asyncio
+async def test_injected_429_pauses_governor_between_retries(factory):
+    provider = factory.create({"type": "mock", "base_url": "mock://local?ttft_ms=0&tps=100000&429_rate=1"})
+    provider.base_delay = 0.001
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    with pytest.raises(Exception) as exc_info:
+        await provider.chat_completion(MESSAGES, model="mock-model")
+    assert getattr(exc_info.value, "status_code", None) == 429
+    # Dos reintentos, cada uno tras el retry-after de 1s que respeta el gobernador
+    assert loop.time() - started >= 1.9
+    lane = next(l for l in factory.governor.get_stats()["lanes"] if l["provider"] == "mock")
+    assert lane["throttles"] == 3
+
+
+@pytest.mark.asyncio
+async def test_fault_rates_follow_seed():
+    engine = MockLLMEngine(config=MockLLMConfig(ttft_ms=0, tokens_per_sec=100000, error_rate=0.3, output_tokens=5, fault_seed=7))
+    statuses = [(await engine.complete({"model": "m", "messages": MESSAGES})).status for _ in range(200)]
+    assert 40 < statuses.count(503) < 80
+    again = MockLLMEngine(config=engine.config)
+    assert [(await again.complete({"model": "m", "messages": MESSAGES})).status for _ in range(200)] == statuses
@@ -0,0 +1,99 @@
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+from openai import AsyncOpenAI
+
+from src.infrastructure.adapters.external.llm_client_pool import LLMClientPool
+from src.infrastructure.adapters.external.openai_adapter import OpenAILLMAdapter
+
+LATENCY = 0.3
+
+
+def _completion_body(content):
+    return {
+        "id": "chatcmpl-test",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": "test-model",
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": content},
+            "finish_reason": "stop",
+        }],
+    }
+
+
+def _chunk(content):
+    return "data: " + json.dumps({
+        "id": "chatcmpl-test",
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": "test-model",
+        "choices": [{"index": 0, "delta": {"content": content}, "finish_reason": None}],
+    }) + "\n\n"
+
+
+async def _slow_handler(request: httpx.Request) -> httpx.Response:
+    # Simula un proveedor lento; sólo cede el control, nunca bloquea
+    await asyncio.sleep(LATENCY)
+    payload = json.loads(request.content)
+    if payload.get("stream"):
+        body = "".join(_chunk(t) for t in ["Hola", " ", "mundo"]) + "data: [DONE]\n\n"
+        return httpx.Response(200, text=body, headers={"content-type": "text/event-stream"})
+    return httpx.Response(200, json=_completion_body("respuesta"))
+
+
+class MockTransportPool(LLMClientPool):
+    def _build_client(self, api_key, base_url):
+        http_client = httpx.AsyncClient(transport=httpx.MockTransport(_slow_handler))
+        return AsyncOpenAI(api_key=api_key, base_url=base_url, http_client=http_client)
+
+
+@pytest.fixture
+def adapter():
+    return OpenAILLMAdapter(
+        api_key="test-key",
+        base_url="http://llm.test/v1",
+        client_pool=MockTransportPool(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_event_loop_stays_responsive_during_completion(adapter):
+    ticks = 0
+    done = asyncio.Event()
+
+    async def heartbeat():
+        nonlocal ticks
+        while not done.is_set():
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    beat = asyncio.create_task(heartbeat())
+    result = await adapter.chat_completion(
+        messages=[{"role": "user", "content": "hola"}],
+        model="test-model",
+    )
+    done.set()
+    await beat
+
+    assert result == "respuesta"
+    # Con un cliente síncrono el heartbeat no avanzaría mientras la petición está en vuelo
+    assert ticks >= (LATENCY / 0.01) * 0.5
+
+
+@pytest.mark.asyncio
+async def test_stream_returns_async_generator_of_deltas(adapter):
+    stream = await adapter.chat_completion(
+        messages=[{"role": "user", "content": "hola"}],
+        model="test-model",
+        stream=True,
+    )
+
+    deltas = [d async for d in stream]
+
+    assert deltas == ["Hola", " ", "mundo"]
+    assert adapter.client_pool.get_stats()["in_flight"] == 0
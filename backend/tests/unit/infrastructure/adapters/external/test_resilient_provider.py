@@ -0,0 +1,217 @@
+import asyncio
+
+import pytest
+
+from src.infrastructure.adapters.external import resilient_provider
+from src.infrastructure.adapters.external.resilient_provider import (
+    CircuitBreaker, ProviderTarget, ResilientLLMProvider, get_breaker,
+)
+
+
+class ProviderError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class ScriptedProvider:
+    """Proveedor falso que falla según un guion y luego responde."""
+
+    def __init__(self, name, failures=(), delay=0.0):
+        self.name = name
+        self.failures = list(failures)
+        self.delay = delay
+        self.calls = 0
+
+    async def chat_completion(self, messages, model, temperature=0.7, max_tokens=4000, stream=False):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.failures:
+            raise ProviderError(self.failures.pop(0))
+        if stream:
+            async def gen():
+                for part in [self.name, "-ok"]:
+                    yield part
+            return gen()
+        return f"{self.name}:{model}"
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    monkeypatch.setattr(resilient_provider, "circuit_breakers", {})
+    monkeypatch.setattr(resilient_provider, "latency_trackers", {})
+
+
+def _provider(primary, fallbacks=(), **kwargs):
+    kwargs.setdefault("base_delay", 0.001)
+    return ResilientLLMProvider(
+        primary=ProviderTarget(primary.name, primary),
+        fallback_resolver=lambda model: [ProviderTarget(f.name, f, model="fallback-model") for f in fallbacks],
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_transient_errors_are_retried():
+    groq = ScriptedProvider("groq", failures=[503, 429])
+    result = await _provider(groq, max_retries=2).chat_completion([], model="m")
+    assert result == "groq:m"
+    assert groq.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_non_transient_error_is_not_retried():
+    groq = ScriptedProvider("groq", failures=[400])
+    openrouter = ScriptedProvider("openrouter")
+    with pytest.raises(ProviderError):
+        await _provider(groq, [openrouter]).chat_completion([], model="m")
+    assert groq.calls == 1
+    assert openrouter.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_fails_over_in_chain_order_with_model_override():
+    groq = ScriptedProvider("groq", failures=[502, 502])
+    openrouter = ScriptedProvider("openrouter")
+    result = await _provider(groq, [openrouter], max_retries=1).chat_completion([], model="m")
+    assert result == "openrouter:fallback-model"
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_skips_provider_instantly():
+    groq = ScriptedProvider("groq")
+    openrouter = ScriptedProvider("openrouter")
+    breaker = get_breaker("groq")
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    result = await _provider(groq, [openrouter]).chat_completion([], model="m")
+
+    assert result == "openrouter:fallback-model"
+    assert groq.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_hedge_fires_after_p95_and_first_answer_wins():
+    groq = ScriptedProvider("groq", delay=0.5)
+    openrouter = ScriptedProvider("openrouter", delay=0.01)
+    tracker = resilient_provider.get_latency_tracker("groq")
+    for _ in range(30):
+        tracker.record(0.05)
+
+    started = asyncio.get_running_loop().time()
+    result = await _provider(groq, [openrouter], hedging=True).chat_completion([], model="m")
+
+    assert result == "openrouter:fallback-model"
+    assert asyncio.get_running_loop().time() - started < 0.4
+
+
+@pytest.mark.asyncio
+async def test_stream_fails_over_before_first_delta():
+    groq = ScriptedProvider("groq", failures=[500, 500, 500])
+    openrouter = ScriptedProvider("openrouter")
+    stream = await _provider(groq, [openrouter]).chat_completion([], model="m", stream=True)
+    assert [d async for d in stream] == ["openrouter", "-ok"]
+
+
+def _half_open(name):
+    breaker = get_breaker(name)
+    breaker.state = CircuitBreaker.OPEN
+    breaker.opened_at = 0.0
+    return breaker
+
+
+@pytest.mark.asyncio
+async def test_cancelled_half_open_trial_releases_breaker():
+    groq = ScriptedProvider("groq", delay=10)
+    breaker = _half_open("groq")
+
+    task = asyncio.create_task(_provider(groq).chat_completion([], model="m"))
+    await asyncio.sleep(0.01)
+    assert breaker.state == CircuitBreaker.HALF_OPEN and breaker.trial_in_flight
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert not breaker.trial_in_flight
+    assert breaker.allow()
+
+
+@pytest.mark.asyncio
+async def test_abandoned_half_open_stream_releases_breaker():
+    groq = ScriptedProvider("groq")
+    breaker = _half_open("groq")
+
+    stream = await _provider(groq).chat_completion([], model="m", stream=True)
+    assert await stream.__anext__() == "groq"
+    await stream.aclose()
+
+    assert not breaker.trial_in_flight
+    assert breaker.allow()
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_key_does_not_open_shared_breaker():
+    groq = ScriptedProvider("groq", failures=[429] * 10)
+    provider = _provider(groq, max_retries=0)
+    for _ in range(get_breaker("groq").failure_threshold + 1):
+        with pytest.raises(ProviderError):
+            await provider.chat_completion([], model="m")
+
+    assert get_breaker("groq").state == CircuitBreaker.CLOSED
+
+
+@pytest.mark.parametrize("status", [401, 429])
+@pytest.mark.asyncio
+async def test_rejected_user_key_does_not_fail_over_to_server_keys(status):
+    groq = ScriptedProvider("groq", failures=[status] * 6)
+    openrouter = ScriptedProvider("openrouter")
+    provider = ResilientLLMProvider(
+        primary=ProviderTarget("groq", groq, user_key=True),
+        fallback_resolver=lambda model: [ProviderTarget("openrouter", openrouter)],
+        base_delay=0.001,
+    )
+
+    with pytest.raises(ProviderError):
+        await provider.chat_completion([], model="m")
+    assert openrouter.calls == 0
+
+    provider.failover_from_user_key = True
+    assert await provider.chat_completion([], model="m") == "openrouter:m"
+
+
+def _slow_p95(name):
+    tracker = resilient_provider.get_latency_tracker(name)
+    for _ in range(30):
+        tracker.record(0.02)
+
+
+@pytest.mark.asyncio
+async def test_slow_user_key_is_not_hedged_to_server_keys():
+    groq = ScriptedProvider("groq", delay=0.1)
+    openrouter = ScriptedProvider("openrouter")
+    _slow_p95("groq")
+    provider = ResilientLLMProvider(
+        primary=ProviderTarget("groq", groq, user_key=True),
+        fallback_resolver=lambda model: [ProviderTarget("openrouter", openrouter)],
+        hedging=True,
+    )
+
+    assert await provider.chat_completion([], model="m") == "groq:m"
+    assert groq.calls == 2
+    assert openrouter.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_hedge_target_that_failed_is_not_retried_by_the_chain():
+    groq = ScriptedProvider("groq", failures=[503], delay=0.1)
+    openrouter = ScriptedProvider("openrouter", failures=[503, 503])
+    backup = ScriptedProvider("backup")
+    _slow_p95("groq")
+
+    provider = _provider(groq, [openrouter, backup], hedging=True, max_retries=0)
+    result = await provider.chat_completion([], model="m")
+
+    assert result == "backup:fallback-model"
+    assert openrouter.calls == 1
@@ -0,0 +1,57 @@
+from src.infrastructure.adapters.external import token_budget
+from src.infrastructure.adapters.external.token_budget import (
+    count_tokens, fit_entries, max_tokens_for, model_family, model_limits,
+    plan_budget, task_token_limit, truncate_to_tokens,
+)
+
+
+def test_model_lookup_strips_provider_prefix_and_matches_prefix():
+    assert model_limits("openai/gpt-4o-mini") == (128000, 16384)
+    assert model_limits("llama3-8b-8192")[0] == 8192
+    assert model_limits("gpt-4o-2024-08-06")[0] == 128000
+    assert model_limits("modelo-desconocido") == (8192, 4096)
+    assert model_family("openai/gpt-oss-120b") == "o200k"
+    assert model_family("mixtral-8x7b-32768") == "sentencepiece"
+
+
+def test_budget_reserves_output_within_small_windows():
+    small = plan_budget("llama3-8b-8192", system="s" * 300, task="t" * 3000)
+    assert small.output == 4096
+    assert small.system + small.task + small.context + small.output + small.margin == small.window
+
+    large = plan_budget("llama-3.3-70b-versatile", task="t" * 3000)
+    assert large.context > 100000
+    assert task_token_limit("llama-3.3-70b-versatile") > 10 * task_token_limit("llama3-8b-8192")
+
+
+def test_max_tokens_shrinks_when_prompt_fills_the_window():
+    short = [{"role": "user", "content": "hola"}]
+    assert max_tokens_for(short, "llama3-8b-8192") == 4096
+    assert max_tokens_for(short, "llama3-8b-8192", requested=1000) == 1000
+
+    long = [{"role": "user", "content": "x" * 20000}]
+    limited = max_tokens_for(long, "llama3-8b-8192")
+    assert limited < 4096
+    assert count_tokens("x" * 20000, "llama3-8b-8192") + limited <= 8192
+
+
+def test_truncation_respects_token_limit_and_side():
+    text = "inicio " + "palabra " * 2000 + "final"
+    head = truncate_to_tokens(text, 50, "gpt-4o-mini")
+    tail = truncate_to_tokens(text, 50, "gpt-4o-mini", keep="tail")
+    assert count_tokens(head, "gpt-4o-mini") <= 50
+    assert head.startswith("inicio")
+    assert tail.endswith("final")
+
+
+def test_fit_entries_keeps_short_entries_and_shares_the_rest():
+    entries = [("Corto", "ok"), ("Largo A", "a" * 4000), ("Largo B", "b" * 4000)]
+    fitted = fit_entries(entries, 400, "llama-3.3-70b-versatile")
+
+    assert count_tokens(fitted, "llama-3.3-70b-versatile") <= 400
+    assert "--- Corto ---\nok" in fitted
+    assert fitted.count(token_budget.TRUNCATION_MARK) == 2
+    assert abs(fitted.count("a") - fitted.count("b")) < 10
+
+    everything = fit_entries(entries, 100000, "llama-3.3-70b-versatile")
+    assert "a" * 4000 in everything
@@ -0,0 +1,81 @@
+import sqlite3
+
+from src.shared.a2a_message_store import A2AMessageStore
+from src.shared.a2a_protocol import A2AMessage, A2AProtocol
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def message(conversation_id, n):
+    return A2AMessage(
+        sender_id="orchestrator",
+        sender_capability="reasoning",
+        subject=f"msg {n}",
+        payload={"task": "x" * 100},
+        conversation_id=conversation_id,
+    )
+
+
+def test_ring_buffer_keeps_latest_messages_per_conversation():
+    store = A2AMessageStore(max_conversations=10, max_messages=3, ttl_seconds=0)
+    for n in range(5):
+        store.append(message("c1", n))
+
+    assert [m.subject for m in store["c1"]] == ["msg 2", "msg 3", "msg 4"]
+    stats = store.get_stats()
+    assert stats["messages"] == 3
+    assert stats["messages_dropped"] == 2
+    assert stats["payload_bytes"] == 3 * (len("task") + 100)
+
+
+def test_conversations_evicted_by_lru_and_ttl():
+    clock = FakeClock()
+    store = A2AMessageStore(max_conversations=2, max_messages=10, ttl_seconds=60, clock=clock)
+    store.append(message("a", 0))
+    store.append(message("b", 0))
+    store.get("a")  # "a" pasa a ser la más reciente
+    store.append(message("c", 0))
+
+    assert set(store) == {"a", "c"}
+    assert store.get_stats()["evicted_lru"] == 1
+
+    clock.now = 30
+    store.append(message("c", 1))
+    clock.now = 61
+    assert store.prune() == 1
+    assert set(store) == {"c"}
+    assert store.get("a", []) == []
+
+
+def test_evicted_messages_spill_to_sqlite(tmp_path):
+    path = str(tmp_path / "a2a.db")
+    store = A2AMessageStore(max_conversations=1, max_messages=1, ttl_seconds=0, spill_path=path)
+    store.append(message("a", 0))
+    store.append(message("a", 1))
+    store.append(message("b", 0))
+    store.close("b")
+
+    rows = sqlite3.connect(path).execute(
+        "SELECT conversation_id, subject, reason FROM a2a_messages ORDER BY id"
+    ).fetchall()
+    assert rows == [("a", "msg 0", "ring"), ("a", "msg 1", "lru"), ("b", "msg 0", "closed")]
+    assert store.get_stats()["spilled"] == 3
+    assert len(store) == 0
+
+
+def test_protocol_memory_stays_bounded_across_many_conversations():
+    protocol = A2AProtocol(A2AMessageStore(max_conversations=50, max_messages=5, ttl_seconds=0))
+    for n in range(1000):
+        protocol.create_message("orchestrator", "reasoning", "s", {"task": "x"}, conversation_id=f"run-{n}")
+
+    stats = protocol.get_memory_stats()
+    assert stats["conversations"] == 50
+    assert stats["messages_stored"] == 1000
+    assert len(protocol.get_conversation_history("run-999")) == 1
+    assert protocol.close_conversation("run-999")
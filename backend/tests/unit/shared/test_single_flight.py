@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+
+from src.shared.single_flight import SingleFlight
+
+
+MESSAGES = [{"role": "system", "content": "s"}, {"role": "user", "content": "hola"}]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_call():
+    flight = SingleFlight()
+    calls = 0
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.02)
+        return "respuesta"
+
+    key = flight.make_key("reasoning", "m", MESSAGES, {"type": "groq", "api_key": "a"})
+    results = await asyncio.gather(*(flight.run(key, call) for _ in range(5)))
+
+    assert results == ["respuesta"] * 5
+    assert calls == 1
+    stats = flight.get_stats()
+    assert stats["flights_started"] == 1
+    assert stats["attached"] == 4
+    assert stats["in_flight"] == 0
+
+
+def test_key_separates_credentials_and_prompts():
+    a = SingleFlight.make_key("reasoning", "m", MESSAGES, {"type": "groq", "api_key": "a"})
+    same = SingleFlight.make_key("reasoning", "m", MESSAGES, {"type": "groq", "api_key": "a"})
+    b = SingleFlight.make_key("reasoning", "m", MESSAGES, {"type": "groq", "api_key": "b"})
+    c = SingleFlight.make_key("reasoning", "m", MESSAGES[:1], {"type": "groq", "api_key": "a"})
+    assert a == same
+    # Un error de la key de un usuario no llega a otro con la suya
+    assert a != b
+    assert a != c
+
+
+@pytest.mark.asyncio
+async def test_late_stream_subscriber_replays_then_follows_live():
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def generate():
+        yield "uno "
+        await release.wait()
+        yield "dos"
+
+    key = ("a", "m", "h")
+    first = flight.stream(key, generate)
+    assert await first.__anext__() == "uno "
+
+    second_chunks = []
+
+    async def late():
+        async for chunk in flight.stream(key, generate):
+            second_chunks.append(chunk)
+
+    late_task = asyncio.create_task(late())
+    await asyncio.sleep(0)
+    release.set()
+    rest = [chunk async for chunk in first]
+    await late_task
+
+    assert rest == ["dos"]
+    assert second_chunks == ["uno ", "dos"]
+    assert flight.get_stats()["stream_attached"] == 1
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_subscriber():
+    flight = SingleFlight()
+
+    async def call():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("429")
+
+    key = ("a", "m", "h")
+    results = await asyncio.gather(flight.run(key, call), flight.run(key, call), return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_generation_is_cancelled_when_every_subscriber_leaves():
+    flight = SingleFlight()
+    cancelled = asyncio.Event()
+
+    async def call():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    task = asyncio.create_task(flight.run(("a", "m", "h"), call))
+    await asyncio.sleep(0.01)
+    task.cancel()
+    await asyncio.wait_for(cancelled.wait(), 1)
+
+    assert flight.get_stats()["abandoned"] == 1
+    assert flight.get_stats()["in_flight"] == 0
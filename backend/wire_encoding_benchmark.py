@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+AFW - Wire Encoding Benchmark
+=============================
+
+Mide el tamaño en la red de una respuesta de agente (`agent_response`) con
+cada codificación negociable del WebSocket (wire_codec), sin y con
+permessage-deflate (deflate crudo, como la extensión del handshake).
+
+Uso: python wire_encoding_benchmark.py [palabras]
+"""
+
+import os
+import sys
+import time
+import zlib
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+SENTENCES = [
+    "El equipo revisa los requisitos del cliente y prioriza las funcionalidades.",
+    "Cada entrega se estima con margen para imprevistos y se valida en una demo.",
+    "La arquitectura separa el dominio de los adaptadores de infraestructura.",
+    "Las pruebas automáticas cubren los casos críticos antes de cada despliegue.",
+    "Los riesgos se revisan cada semana con el responsable de producto.",
+    "La documentación técnica se actualiza junto con el código que describe.",
+]
+
+
+def build_raw(words: int) -> str:
+    lines = ["## Plan del proyecto 🚀", ""]
+    section = 0
+    while sum(len(line.split()) for line in lines) < words:
+        section += 1
+        lines += [f"## Fase {section}", "", SENTENCES[section % len(SENTENCES)], ""]
+        lines += [
+            f"{i}. {SENTENCES[(section * 4 + i) % len(SENTENCES)]} (fase {section}, tarea {i})"
+            for i in range(1, 5)
+        ]
+        lines += ["", f"- Riesgo {section}: {SENTENCES[(section + 3) % len(SENTENCES)].lower()}", ""]
+    lines.append("En resumen: empezar por el alcance y validar cada fase con el cliente.")
+    return "\n".join(lines)
+
+
+def deflate(payload) -> int:
+    if isinstance(payload, str):
+        payload = payload.encode("utf-8")
+    compressor = zlib.compressobj(wbits=-15)
+    return len(compressor.compress(payload) + compressor.flush(zlib.Z_SYNC_FLUSH))
+
+
+def main():
+    from app.formatters.human_formatter import HumanResponseFormatter
+    from app.wire_codec import WireCodec
+
+    words = int(sys.argv[1]) if len(sys.argv) > 1 else 800
+    raw = build_raw(words)
+    formatted = HumanResponseFormatter.format_agent_response(
+        raw, agent_id="project_manager", agent_name="Project Manager", level=1,
+        specialty="Planificación", step=1, total_steps=5
+    )
+    frame = {"type": "agent_response", "data": formatted, "timestamp": datetime.utcnow().isoformat()}
+
+    print("🚀 AFW - Wire Encoding Benchmark")
+    print("=" * 72)
+    print(f"📅 Fecha: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"📝 Respuesta: {len(raw.split())} palabras, {len(raw.encode('utf-8'))} bytes de raw_content")
+    print("=" * 72)
+
+    codecs = [WireCodec(encoding, frames) for encoding in ("json", "msgpack") for frames in ("full", "lean")]
+
+    baseline = None
+    for codec in codecs:
+        started = time.perf_counter()
+        for _ in range(200):
+            _, payload = codec.encode(frame)
+        encode_us = (time.perf_counter() - started) / 200 * 1e6
+        size = len(payload.encode("utf-8") if isinstance(payload, str) else payload)
+        baseline = baseline or size
+        label = f"{codec.encoding}/{codec.frames}"
+        print(
+            f"{label:.<20} {size:8d} B ({size / baseline:5.0%})  deflate {deflate(payload):7d} B"
+            f"  codificar {encode_us:7.1f} µs"
+        )
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    main()
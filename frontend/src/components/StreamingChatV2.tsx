@@ -61,6 +61,8 @@ interface Message {
   agentResponse?: any;
   agentName?: string;
   agentEmoji?: string;
+  agentId?: string;
+  streaming?: boolean;
 }
 
 interface AgentResponse {
@@ -369,10 +371,30 @@ export function StreamingChatV2({
         setCurrentProgress(data.progress);
         break;
 
+      case "agent_delta":
+        // Texto parcial del agente mientras el LLM genera la respuesta
+        setMessages(prev => {
+          const last = prev[prev.length - 1];
+          if (last && last.streaming && last.agentId === data.agent_id) {
+            return [...prev.slice(0, -1), { ...last, content: last.content + data.delta }];
+          }
+          return [...prev, {
+            role: "agent",
+            content: data.delta,
+            agentName: data.agent,
+            agentId: data.agent_id,
+            streaming: true,
+            timestamp: new Date()
+          }];
+        });
+        break;
+
       case "agent_response":
         const agentResponse: AgentResponse = data.data;
 
         setMessages(prev => {
+          // Reemplazar el borrador en streaming por la respuesta formateada
+          prev = prev.filter(m => !(m.streaming && m.agentId === agentResponse.agent_id));
           const newMessage: Message = {
             role: "agent",
             content: agentResponse.raw_content || agentResponse.summary || 'Sin contenido disponible.',